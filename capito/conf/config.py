@@ -6,6 +6,14 @@ from typing import Any
 from capito.core.asset.flows import FlowProvider
 
 
+def _mtime(config_file: str):
+    """Modification time in ns or None if the file doesn't exist."""
+    try:
+        return os.stat(config_file).st_mtime_ns
+    except OSError:
+        return None
+
+
 class Config:
     """Class to manage multiple json-based config files.
     Multiple config files can be loaded and given an alias.
@@ -26,26 +34,60 @@ class Config:
         self.alias = {}
         self.dict = {}
         self.source = {}
+        self.mtimes = {}
 
     def load(self, config_file: str, alias: str = None):
         """Load a config file. Optionally alias the given config file.
         If no alias is given, the created alias will be "layerX" where
         X is the number of the loaded configs. ("layer0", "layer1"...)
         """
-        cfg_path = Path(config_file)
-        with cfg_path.open("r", encoding="utf-8") as cfg_filepointer:
-            cfg = json.load(cfg_filepointer)
-        self.dict = {**self.dict, **cfg}
+        cfg = self._read(config_file)
         self.configs[config_file] = cfg
         self.alias[alias or f"layer{len(self.config_keys)}"] = config_file
         self.config_keys.insert(0, config_file)
-        self.source = {**self.source, **{key: config_file for key in cfg}}
+        self.dict.update(cfg)
+        self.source.update(dict.fromkeys(cfg, config_file))
+
+    def _read(self, config_file: str) -> dict:
+        """Read a config file and remember its modification time."""
+        cfg_path = Path(config_file)
+        mtime = _mtime(cfg_path)
+        with cfg_path.open("r", encoding="utf-8") as cfg_filepointer:
+            cfg = json.load(cfg_filepointer)
+        self.mtimes[config_file] = mtime
+        return cfg
+
+    def _merge(self):
+        """Rebuild the merged view (dict and source) from all layers.
+        Layers are applied oldest first so later loaded files shadow earlier ones.
+        """
+        self.dict = {}
+        self.source = {}
+        for config_file in reversed(self.config_keys):
+            cfg = self.configs[config_file]
+            self.dict.update(cfg)
+            self.source.update(dict.fromkeys(cfg, config_file))
 
     def reload(self):
         """Reload all currently registered config files."""
-        self.dict = {}
         for config_file in self.configs:
-            self.load(config_file)
+            self.configs[config_file] = self._read(config_file)
+        self._merge()
+
+    def changed_files(self) -> list:
+        """Config files whose modification time differs from the loaded state."""
+        return [f for f in self.configs if _mtime(f) != self.mtimes.get(f)]
+
+    def reload_if_changed(self) -> bool:
+        """Reload only the config files that changed on disk.
+        Returns True if anything was reloaded.
+        """
+        changed = self.changed_files()
+        for config_file in changed:
+            self.configs[config_file] = self._read(config_file)
+        if changed:
+            self._merge()
+        return bool(changed)
 
     def remove_override(self, key):
         """Removes key/value from the upper most layer (if key  exists)."""
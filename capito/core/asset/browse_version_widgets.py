@@ -230,7 +230,7 @@ class VersionsWidget(QWidget):
         vbox.addWidget(self.version_list)
         self.setLayout(vbox)
         capito_event.subscribe(
-            "version_changed", self.version_list._update_version_widget
+            "version_changed", self.version_list._update_version_widget, weak=True
         )
 
     def on_asset_selected(self, asset:Asset):
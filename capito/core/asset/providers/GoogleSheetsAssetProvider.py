@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict, List, Tuple, Union
 
 import capito.core.event as capito_event
@@ -34,11 +35,27 @@ class GoogleSheetsAssetProvider(AssetProvider):
             "uid": "K",
         }
         self.assets = {}
+        # version rows are added on the event worker thread,
+        # the sheet must not be appended to while it is sorted or read
+        self._sheet_lock = threading.RLock()
         capito_event.unsubscribe_by_qualname("version_created", "GoogleSheetsAssetProvider._add_version_row")
-        capito_event.subscribe("version_created", self._add_version_row)
+        capito_event.subscribe(
+            "version_created",
+            self._add_version_row,
+            mode=capito_event.ASYNC,
+            key=self._version_key,
+        )
         self.reload()
 
+    @staticmethod
+    def _version_key(version: Version):
+        return (version.asset.name, version.step.name, version.version)
+
     def _add_version_row(self, version: Version):
+        with self._sheet_lock:
+            self._append_version_row(version)
+
+    def _append_version_row(self, version: Version):
         self.asset_sheet.append_row(
             (
                 version.asset.name,
@@ -66,9 +83,10 @@ class GoogleSheetsAssetProvider(AssetProvider):
 
     def reload(self):
         """Reload"""
+        with self._sheet_lock:
+            self._sort_asset_sheet()
+            results = self.asset_sheet.get_all_records()
         self.assets = {}
-        self._sort_asset_sheet()
-        results = self.asset_sheet.get_all_records()
 
         current_asset_name = None
         current_step = None
@@ -115,39 +133,40 @@ class GoogleSheetsAssetProvider(AssetProvider):
             print("Asset already exists")
             return
 
-        # create the first asset line (without steps etc.)
-        self.asset_sheet.append_row(
-            (
-                asset.name,
-                asset.kind,
-                0,
-                0,
-                None,
-                None,
-                None,
-                None,
-                None,
-                None,
-                f"uid_{asset.name}_0_0",
-            )
-        )
-        # create the first step rows (with version number 0)
-        for step in asset.steps:
+        with self._sheet_lock:
+            # create the first asset line (without steps etc.)
             self.asset_sheet.append_row(
                 (
                     asset.name,
-                    None,
-                    step,
+                    asset.kind,
+                    0,
                     0,
                     None,
-                    "NONE",
                     None,
                     None,
                     None,
                     None,
-                    f"uid_{asset.name}_{step}_0",
+                    None,
+                    f"uid_{asset.name}_0_0",
                 )
             )
+            # create the first step rows (with version number 0)
+            for step in asset.steps:
+                self.asset_sheet.append_row(
+                    (
+                        asset.name,
+                        None,
+                        step,
+                        0,
+                        None,
+                        "NONE",
+                        None,
+                        None,
+                        None,
+                        None,
+                        f"uid_{asset.name}_{step}_0",
+                    )
+                )
 
         self.reload()
 
@@ -189,13 +208,17 @@ class GoogleSheetsAssetProvider(AssetProvider):
                         f"uid_{asset.name}_{step}_0",
                     )
                 )
-        self.asset_sheet.append_rows(rows)
+        with self._sheet_lock:
+            self.asset_sheet.append_rows(rows)
 
     def setattr(self, obj: Union[Asset, Step, Version], attr: str, value: Any):
         """Update the given attribute with the given value
         in asset, asset.step or asset.step.version"""
         super().setattr(obj, attr, value)
-        self.asset_sheet.update(self._cell(self._infer_uid(obj), attr), value)
+        # the row of a just created version is added asynchronously
+        capito_event.flush()
+        with self._sheet_lock:
+            self.asset_sheet.update(self._cell(self._infer_uid(obj), attr), value)
 
     def _infer_uid(self, obj: Union[Asset, Step, Version]):
         asset = None
@@ -0,0 +1,80 @@
+"""
+Compact encoding of component indices (eg. the faces of a shading assignment)
+as sorted, inclusive [start, end] ranges like Maya's "f[0:99]", independent of Maya.
+"""
+import re
+from typing import Iterable, List, Sequence, Tuple
+
+COMPONENT_PATTERN = re.compile(r"\.(\w+)\[(\d+)(?::(\d+))?\]$")
+
+
+def encode_ranges(indices: Iterable[int]) -> List[List[int]]:
+    """[[start, end], ...] (end inclusive) of the sorted, unique indices.
+
+    >>> encode_ranges([5, 0, 1, 2, 7, 6, 2])
+    [[0, 2], [5, 7]]
+    """
+    ranges = []
+    for index in sorted(set(indices)):
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    return ranges
+
+
+def merge_ranges(ranges: Iterable[Sequence[int]]) -> List[List[int]]:
+    """Sorted ranges with overlapping and adjacent ranges joined."""
+    merged = []
+    for start, end in sorted((int(s), int(e)) for s, e in ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def decode_ranges(ranges: Iterable[Sequence[int]]) -> List[int]:
+    """The indices of the ranges.
+
+    >>> decode_ranges([[0, 2], [5, 7]])
+    [0, 1, 2, 5, 6, 7]
+    """
+    return [i for start, end in ranges for i in range(start, end + 1)]
+
+
+def is_ranges(value: Sequence) -> bool:
+    """True for a list of [start, end] ranges, False for a list of single indices."""
+    return bool(value) and isinstance(value[0], (list, tuple))
+
+
+def count_ranges(ranges: Iterable[Sequence[int]]) -> int:
+    """Number of indices in the ranges."""
+    return sum(end - start + 1 for start, end in ranges)
+
+
+def parse_component(name: str) -> Tuple[str, str, List[int]]:
+    """(node, component type, [start, end]) of a component name like
+    "pSphere1.f[3:8]" or "pSphere1.f[3]". Raises ValueError for other names.
+
+    >>> parse_component("ns:pSphere1.f[3:8]")
+    ('ns:pSphere1', 'f', [3, 8])
+    """
+    match = COMPONENT_PATTERN.search(name)
+    if match is None:
+        raise ValueError(f"not a single indexed component: {name}")
+    start = int(match.group(2))
+    end = int(match.group(3)) if match.group(3) is not None else start
+    return name[: match.start()], match.group(1), [start, end]
+
+
+def component_names(node: str, ranges: Iterable[Sequence[int]], component: str = "f") -> List[str]:
+    """Component names for the ranges, eg. ["pSphere1.f[0:2]", "pSphere1.f[5]"].
+
+    >>> component_names("pSphere1", [[0, 2], [5, 5]])
+    ['pSphere1.f[0:2]', 'pSphere1.f[5]']
+    """
+    return [
+        f"{node}.{component}[{start}]" if start == end else f"{node}.{component}[{start}:{end}]"
+        for start, end in ranges
+    ]
@@ -0,0 +1,340 @@
+"""Adaptive number of concurrent background processes (mayapy, kick, ffmpeg...).
+
+ConcurrencyController samples the real memory (RSS) and CPU use of the
+running workers and the progress they make, and decides how many of them
+should run: more while there is memory and CPU left and more workers
+actually mean more throughput, fewer as soon as memory runs short or
+the system starts swapping.
+
+It is independent of how the workers are run. watch_pool() drives a
+WorkPool, anything else (eg. a queue of encoder processes) uses run()
+with its own callables.
+
+Measurements use psutil where it imports (it does not in every DCC
+environment) and fall back to /proc on Linux.
+"""
+import os
+import platform
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+try:
+    import psutil
+except Exception:  # eg. Prism ships a conflicting psutil
+    psutil = None
+
+GB = 1_000_000_000
+
+
+@dataclass
+class MemoryInfo:
+    total: int
+    available: int
+    swap_used: int = 0
+
+
+@dataclass
+class ProcessSample:
+    """Usage of a process including its child processes."""
+
+    pid: int
+    rss: int
+    cpu_time: float  # user + system seconds
+
+
+def _read_proc_meminfo() -> Dict[str, int]:
+    values = {}
+    for line in Path("/proc/meminfo").read_text().splitlines():
+        key, _, value = line.partition(":")
+        values[key] = int(value.split()[0]) * 1024
+    return values
+
+
+def _windows_memory() -> Optional[MemoryInfo]:
+    import ctypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        return None
+    return MemoryInfo(status.ullTotalPhys, status.ullAvailPhys)
+
+
+def memory_info() -> Optional[MemoryInfo]:
+    """Memory of the system, None if it can not be determined."""
+    if psutil is not None:
+        memory = psutil.virtual_memory()
+        return MemoryInfo(memory.total, memory.available, psutil.swap_memory().used)
+    try:
+        if platform.system() == "Linux":
+            values = _read_proc_meminfo()
+            available = values.get("MemAvailable", values["MemFree"] + values.get("Cached", 0))
+            swap_used = values.get("SwapTotal", 0) - values.get("SwapFree", 0)
+            return MemoryInfo(values["MemTotal"], available, swap_used)
+        if platform.system() == "Windows":
+            return _windows_memory()
+    except (OSError, KeyError, ValueError):
+        pass
+    return None
+
+
+def _proc_stat(pid: int) -> Tuple[int, float]:
+    """(parent pid, cpu seconds) of a process from /proc."""
+    text = Path(f"/proc/{pid}/stat").read_text()
+    # the command name may contain spaces, the fields start after its ')'
+    fields = text[text.rindex(")") + 2:].split()
+    ticks = os.sysconf("SC_CLK_TCK")
+    return int(fields[1]), (int(fields[11]) + int(fields[12])) / ticks
+
+
+def _proc_rss(pid: int) -> int:
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) * 1024
+    return 0
+
+
+def _sample_proc(pids: List[int]) -> Dict[int, ProcessSample]:
+    stats = {}
+    for entry in Path("/proc").iterdir():
+        if entry.name.isdigit():
+            try:
+                stats[int(entry.name)] = _proc_stat(int(entry.name))
+            except (OSError, ValueError, IndexError):
+                continue  # process ended meanwhile
+    children: Dict[int, List[int]] = {}
+    for pid, (parent, _) in stats.items():
+        children.setdefault(parent, []).append(pid)
+    samples = {}
+    for pid in pids:
+        if pid not in stats:
+            continue
+        rss, cpu_time, tree = 0, 0.0, [pid]
+        while tree:
+            member = tree.pop()
+            try:
+                rss += _proc_rss(member)
+            except OSError:
+                continue
+            cpu_time += stats[member][1]
+            tree.extend(children.get(member, []))
+        samples[pid] = ProcessSample(pid, rss, cpu_time)
+    return samples
+
+
+def _sample_psutil(pids: List[int]) -> Dict[int, ProcessSample]:
+    samples = {}
+    for pid in pids:
+        try:
+            process = psutil.Process(pid)
+            tree = [process] + process.children(recursive=True)
+        except psutil.Error:
+            continue
+        rss, cpu_time = 0, 0.0
+        for member in tree:
+            try:
+                rss += member.memory_info().rss
+                times = member.cpu_times()
+                cpu_time += times.user + times.system
+            except psutil.Error:
+                continue
+        samples[pid] = ProcessSample(pid, rss, cpu_time)
+    return samples
+
+
+def sample_processes(pids: List[int]) -> Dict[int, ProcessSample]:
+    """Usage of the given (alive) processes; empty if it can not be measured."""
+    pids = [pid for pid in pids if pid]
+    if not pids:
+        return {}
+    if psutil is not None:
+        return _sample_psutil(pids)
+    if Path("/proc/self/stat").exists():
+        return _sample_proc(pids)
+    return {}
+
+
+class ConcurrencyController:
+    """Decides how many workers should run concurrently.
+
+    Before launch, recommend() fits worker_memory per worker into the
+    available memory. While running, update() is called every few seconds
+    with the pids of the workers and the work done so far (any unit,
+    eg. frames). It returns the number of workers to run:
+      - fewer immediately, if less than memory_reserve is available or
+        the system started swapping: as many as the missing memory is
+        workers (at least one), then none fewer for window seconds,
+        as workers only stop after their current unit,
+      - never more than fit into memory at the highest RSS seen per worker,
+      - one more, if the CPUs are not saturated. If that did not raise the
+        throughput by min_gain (measured over window seconds after the
+        change) the step is undone and not tried again for a while.
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: int = None,
+        worker_memory: int = 2 * GB,
+        memory_reserve: int = None,
+        window: float = 30.0,
+        min_gain: float = 0.05,
+        cpu_target: float = 0.9,
+    ):
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers or os.cpu_count() or 1)
+        self.worker_memory = worker_memory
+        self.memory_reserve = memory_reserve
+        self.window = window
+        self.min_gain = min_gain
+        self.cpu_target = cpu_target
+        self.peak_rss = 0
+        self.cpu_usage = 0.0  # of all cores, by the workers
+        self.throughput: Optional[float] = None  # work done per second
+        self._progress: Deque[Tuple[float, float]] = deque()
+        self._cpu_times: Dict[int, Tuple[float, float]] = {}
+        self._last_change = 0.0
+        self._baseline: Optional[float] = None  # throughput before the last step up
+        self._ceiling: Optional[int] = None
+        self._ceiling_until = 0.0
+        self._swap_used: Optional[int] = None
+        self._last_decrease: Optional[float] = None
+
+    def _reserve(self, memory: MemoryInfo) -> int:
+        if self.memory_reserve is not None:
+            return self.memory_reserve
+        return max(GB, memory.total // 10)
+
+    def memory_per_worker(self) -> int:
+        return self.peak_rss or self.worker_memory
+
+    def recommend(self) -> int:
+        """Number of workers to start with."""
+        memory = memory_info()
+        if memory is None:
+            return self.min_workers
+        fit = (memory.available - self._reserve(memory)) // self.memory_per_worker()
+        return int(max(self.min_workers, min(self.max_workers, fit)))
+
+    def _measure(self, pids: List[int], done: float, now: float):
+        samples = sample_processes(pids)
+        cpu_seconds = 0.0
+        for pid, sample in samples.items():
+            self.peak_rss = max(self.peak_rss, sample.rss)
+            last = self._cpu_times.get(pid)
+            if last is not None:
+                cpu_seconds += (sample.cpu_time - last[1]) / max(now - last[0], 1e-6)
+            self._cpu_times[pid] = (now, sample.cpu_time)
+        for pid in set(self._cpu_times) - set(samples):
+            del self._cpu_times[pid]
+        self.cpu_usage = cpu_seconds / (os.cpu_count() or 1)
+        self._progress.append((now, done))
+        while len(self._progress) > 2 and now - self._progress[1][0] >= self.window:
+            self._progress.popleft()
+        first_time, first_done = self._progress[0]
+        if now - first_time >= self.window:
+            self.throughput = (done - first_done) / (now - first_time)
+        else:
+            self.throughput = None
+
+    def _change(self, current: int, target: int, now: float) -> int:
+        target = max(self.min_workers, min(self.max_workers, target))
+        if target != current:
+            self._last_change = now
+            # the throughput is measured anew for the new number of workers
+            self._progress = deque([self._progress[-1]]) if self._progress else deque()
+        return target
+
+    def update(self, current: int, pids: List[int], done: float, now: float = None) -> int:
+        """Number of workers that should run now."""
+        now = time.monotonic() if now is None else now
+        self._measure(pids, done, now)
+        memory = memory_info()
+        if memory is None:
+            return current
+
+        swapping = self._swap_used is not None and memory.swap_used - self._swap_used > 64_000_000
+        self._swap_used = memory.swap_used
+        headroom = memory.available - self._reserve(memory)
+        if headroom < 0 or swapping:
+            self._baseline = None
+            if self._last_decrease is not None and now - self._last_decrease < self.window:
+                return current  # the retiring workers did not free their memory yet
+            # the overshoot in workers, rounded up
+            steps = max(1, -(headroom // self.memory_per_worker())) if headroom < 0 else 1
+            self._last_decrease = now
+            self._ceiling, self._ceiling_until = current - steps, now + 10 * self.window
+            return self._change(current, current - steps, now)
+
+        fit = current + headroom // self.memory_per_worker()
+        if now - self._last_change < self.window or self.throughput is None:
+            return current  # let the last change settle
+        if now >= self._ceiling_until:
+            self._ceiling = None
+
+        if self._baseline is not None:
+            if self.throughput < self._baseline * (1 + self.min_gain):
+                # the last worker did not pay off
+                self._baseline = None
+                self._ceiling, self._ceiling_until = current - 1, now + 10 * self.window
+                return self._change(current, current - 1, now)
+            self._baseline = None
+
+        ceiling = min(fit, self.max_workers)
+        if self._ceiling is not None:
+            ceiling = min(ceiling, self._ceiling)
+        if current < ceiling and self.cpu_usage < self.cpu_target:
+            self._baseline = self.throughput
+            return self._change(current, current + 1, now)
+        return current
+
+    def run(
+        self,
+        current: Callable[[], int],
+        pids: Callable[[], List[int]],
+        done: Callable[[], float],
+        apply: Callable[[int], None],
+        finished: Callable[[], bool],
+        interval: float = 5.0,
+    ) -> threading.Thread:
+        """Control any kind of workers in a background thread until finished()."""
+
+        def loop():
+            while not finished():
+                workers = current()
+                target = self.update(workers, pids(), done())
+                if target != workers:
+                    apply(target)
+                time.sleep(interval)
+
+        thread = threading.Thread(target=loop, daemon=True)
+        thread.start()
+        return thread
+
+    def watch_pool(self, pool, interval: float = 5.0) -> threading.Thread:
+        """Resize a running WorkPool (capito.core.workpool) to the recommendation."""
+        return self.run(
+            current=lambda: pool.num_workers,
+            pids=pool.worker_pids,
+            done=lambda: pool.progress.done_weight,
+            apply=pool.resize,
+            finished=lambda: pool.progress.finished,
+            interval=interval,
+        )
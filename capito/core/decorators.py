@@ -6,6 +6,14 @@ from capito.conf.setup import get_project_conf, get_user_conf
 from capito.conf.config import Config, CONFIG
 
 
+_settings_cache = {}
+
+
+def clear_settings_cache():
+    """Drop all cached layered settings (they will be rebuilt on next access)."""
+    _settings_cache.clear()
+
+
 def layered_settings(layers=["default", "user"]):
     """Decorator for adding json based settings-management to a class.
     To use this decorator, a default json settings file must exist
@@ -19,8 +27,9 @@ def layered_settings(layers=["default", "user"]):
             """load the json settings files.
             The default json settings file is always loaded. It is read-only.
             If they exist, the capito project and -user settings are loaded.
-            If it exists, a settings file in the users home directory is loaded."""
-            _layered_settings = Config()
+            If it exists, a settings file in the users home directory is loaded.
+            The result is cached per class and layer files and shared by all instances.
+            Layers that changed on disk are reloaded on the next call."""
             json_filename = f"{cls.__name__}.json"
             capito_project_conf = CONFIG.alias.get("capito_project")
             capito_user_conf = CONFIG.alias.get("capito_user")
@@ -41,17 +50,32 @@ def layered_settings(layers=["default", "user"]):
                 "user": Path.home() / "capito_settings" / json_filename
             }
 
-            for alias in layers:
-                filename = settings_files[alias]
-                if filename is None:
-                    continue
+            layer_files = [
+                (alias, settings_files[alias]) for alias in layers
+                if settings_files[alias] is not None
+            ]
+            cache_key = (
+                cls.__module__, cls.__qualname__,
+                tuple((alias, str(filename)) for alias, filename in layer_files)
+            )
+            cached_settings = _settings_cache.get(cache_key)
+            if cached_settings is not None:
+                try:
+                    cached_settings.reload_if_changed()
+                    return cached_settings
+                except FileNotFoundError:
+                    del _settings_cache[cache_key]
+
+            _layered_settings = Config()
+            for alias, filename in layer_files:
                 if not filename.exists():
                     filename.parent.mkdir(parents=True, exist_ok=True)
                     with filename.open("w") as filepointer:
                         json.dump({}, filepointer)
                         
                 _layered_settings.load(filename, alias)
-            
+
+            _settings_cache[cache_key] = _layered_settings
             return _layered_settings
 
         setattr(cls, '_get_layered_settings', _get_layered_settings)
@@ -0,0 +1,243 @@
+"""Render and encode an image sequence at the same time.
+
+SequencePipeline starts the render command and the ffmpeg command together.
+ffmpeg reads the images from stdin (image2pipe), and a watcher feeds it
+every frame, in order, as soon as the frame is completely on disk. The encode
+therefore finishes shortly after the last frame is rendered instead of
+starting only then.
+
+A frame counts as complete when the renderer has moved on to the next frame,
+when its header check passes (png, exr, tiff, see capito.core.file.images),
+or when the render has ended. Frames older than the start of the pipeline
+(left over from an earlier render) are only used once the render has ended.
+
+Progress of both stages is reported to progress_callbacks from a worker
+thread. GUI callbacks have to hand it over to their main thread
+(eg. maya.utils.executeDeferred).
+"""
+from dataclasses import dataclass, field
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from capito.core.file.images import check_image
+
+
+def start_process(cmd: str, **kwargs) -> subprocess.Popen:
+    """Start the shell command cmd in its own process group, see kill_process_tree."""
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(cmd, shell=True, **kwargs)
+
+
+def kill_process_tree(process: subprocess.Popen):
+    """Kill a process started with start_process together with everything it started
+    (killing only the shell would leave eg. the renderer running)."""
+    if process.poll() is not None:
+        return
+    if os.name == "nt":
+        subprocess.call(
+            ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:  # ended meanwhile
+            pass
+
+
+@dataclass
+class StageProgress:
+    name: str
+    total: int
+    done: int = 0
+    finished: bool = False
+    error: Optional[str] = None
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+
+@dataclass
+class PipelineResult:
+    success: bool
+    seconds: float
+    stages: Dict[str, StageProgress] = field(default_factory=dict)
+
+
+class SequencePipeline:
+    """Render frames with render_cmd while encode_cmd encodes them from stdin.
+
+    render_cmd and encode_cmd are shell command strings (like for SubQ),
+    encode_cmd has to read the images from stdin, eg. "ffmpeg -f image2pipe
+    -c:v png -i - ..." and should write "-progress pipe:1" to stdout.
+    image_pattern is the %-pattern of the rendered files, eg. "/images/shot.%04d.png".
+    """
+
+    def __init__(
+        self,
+        render_cmd: str,
+        encode_cmd: str,
+        image_pattern: str,
+        frames: List[int],
+        log_file: str = None,
+        poll_interval: float = 0.2,
+    ):
+        self.render_cmd = render_cmd
+        self.encode_cmd = encode_cmd
+        self.image_pattern = image_pattern
+        self.frames = list(frames)
+        if log_file is None:
+            handle, log_file = tempfile.mkstemp(prefix="SequencePipeline_", suffix=".log")
+            os.close(handle)
+        self.log_file = log_file
+        self.poll_interval = poll_interval
+        self.stages = {
+            "render": StageProgress("render", len(self.frames)),
+            "encode": StageProgress("encode", len(self.frames)),
+        }
+        self.progress_callbacks: List[Callable[[Dict[str, StageProgress]], None]] = []
+        self.finished_callbacks: List[Callable[[PipelineResult], None]] = []
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._start_time = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def frame_path(self, frame: int) -> str:
+        return self.image_pattern % frame
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def cancel(self):
+        self._cancel.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """True if the pipeline has ended."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _report(self):
+        for callback in self.progress_callbacks:
+            callback(self.stages)
+
+    def _is_new(self, path: str) -> bool:
+        # one second tolerance for file systems with coarse timestamps
+        return os.path.getmtime(path) >= self._start_time - 1
+
+    def _is_complete(self, index: int, render_done: bool) -> bool:
+        path = self.frame_path(self.frames[index])
+        if not os.path.isfile(path):
+            return False
+        if render_done:
+            return True
+        if not self._is_new(path):
+            return False
+        if index + 1 < len(self.frames) and os.path.isfile(self.frame_path(self.frames[index + 1])):
+            return self._is_new(self.frame_path(self.frames[index + 1]))
+        check = check_image(path)
+        return check.ok and check.header is not None
+
+    def _count_rendered(self, start: int) -> int:
+        """Number of frames rendered, counting on from the first start frames."""
+        rendered = start
+        while rendered < len(self.frames):
+            path = self.frame_path(self.frames[rendered])
+            if not (os.path.isfile(path) and self._is_new(path)):
+                break
+            rendered += 1
+        return rendered
+
+    def _read_encoder_progress(self, stdout):
+        for line in iter(stdout.readline, b""):
+            key, _, value = line.decode("utf8", "replace").strip().partition("=")
+            if key == "frame" and value.isdigit():
+                with self._lock:
+                    self.stages["encode"].done = min(int(value), len(self.frames))
+                self._report()
+
+    def _feed(self, render: subprocess.Popen, encoder: subprocess.Popen):
+        render_stage = self.stages["render"]
+        for index, frame in enumerate(self.frames):
+            if self._cancel.is_set():
+                return
+            while not self._is_complete(index, render.poll() is not None):
+                if self._cancel.is_set():
+                    return
+                if render.poll() is not None and not os.path.isfile(self.frame_path(frame)):
+                    render_stage.error = f"frame {frame} was not rendered"
+                    return
+                rendered = self._count_rendered(max(index, render_stage.done))
+                if rendered != render_stage.done:
+                    render_stage.done = rendered
+                    self._report()
+                time.sleep(self.poll_interval)
+            if render_stage.done < index + 1:
+                render_stage.done = index + 1
+                self._report()
+            with open(self.frame_path(frame), "rb") as image:
+                shutil.copyfileobj(image, encoder.stdin)
+            encoder.stdin.flush()
+
+    def _run(self):
+        self._start_time = time.time()
+        start = time.perf_counter()
+        with open(self.log_file, "a") as log:
+            log.write(f"Started: {time.ctime()}\n{self.render_cmd}\n{self.encode_cmd}\n")
+            log.flush()
+            render = start_process(self.render_cmd, stdout=log, stderr=subprocess.STDOUT)
+            encoder = start_process(
+                self.encode_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=log,
+            )
+            reader = threading.Thread(
+                target=self._read_encoder_progress, args=(encoder.stdout,), daemon=True
+            )
+            reader.start()
+            try:
+                self._feed(render, encoder)
+            except OSError as error:  # eg. ffmpeg ended early (broken pipe)
+                self.stages["encode"].error = str(error)
+            finally:
+                try:
+                    encoder.stdin.close()
+                except OSError:
+                    pass
+            if self._cancel.is_set():
+                for process in (render, encoder):
+                    kill_process_tree(process)
+                self.stages["render"].error = self.stages["render"].error or "cancelled"
+            render_code = render.wait()
+            encode_code = encoder.wait()
+            reader.join()
+
+        render_stage, encode_stage = self.stages["render"], self.stages["encode"]
+        if render_code and not render_stage.error:
+            render_stage.error = f"render exited with code {render_code}"
+        if encode_code and not encode_stage.error:
+            encode_stage.error = f"ffmpeg exited with code {encode_code}"
+        render_stage.finished = encode_stage.finished = True
+        self._report()
+        result = PipelineResult(
+            success=not (render_stage.error or encode_stage.error),
+            seconds=time.perf_counter() - start,
+            stages=self.stages,
+        )
+        for callback in self.finished_callbacks:
+            callback(result)
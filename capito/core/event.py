@@ -1,47 +1,315 @@
+"""Simple publish/subscribe event bus.
+
+Subscribers are called synchronously in the posting thread by default.
+Per subscriber a different delivery mode can be chosen:
+
+SYNC:        call immediately in the thread that posts the event (default)
+ASYNC:       queue the call and run it on a background worker thread
+MAIN_THREAD: queue the call and run it on the Qt main thread
+             (falls back to maya.utils.executeDeferred or SYNC)
+
+Queued subscribers can coalesce bursts: if an identical call
+(same subscriber, same args) is still pending, the new post is dropped.
+Calls with unhashable args (eg. dataclass instances) need a key callable
+that returns what makes two posts identical.
+Subscribers can be held by weak reference so widgets and providers
+don't have to unsubscribe before they die.
+Pending ASYNC deliveries are flushed when the interpreter exits, so eg. a
+batch process does not drop them (waiting at most EXIT_FLUSH_TIMEOUT seconds).
+"""
+import atexit
+import inspect
+import logging
+import queue
+import threading
+import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+SYNC = "sync"
+ASYNC = "async"
+MAIN_THREAD = "main_thread"
+
+# seconds to wait for pending ASYNC deliveries when the interpreter exits
+EXIT_FLUSH_TIMEOUT = 60.0
+
 subscribers = {}
+_lock = threading.RLock()
+
+
+class Subscriber:
+    """Wraps a subscribed callable and records timing information."""
+
+    def __init__(
+        self, fn, mode: str = SYNC, weak: bool = False, coalesce: bool = False, key=None
+    ):
+        if mode not in (SYNC, ASYNC, MAIN_THREAD):
+            raise ValueError(f"Unknown delivery mode '{mode}'.")
+        if weak:
+            if inspect.ismethod(fn):
+                self._ref = weakref.WeakMethod(fn)
+            else:
+                self._ref = weakref.ref(fn)
+        else:
+            self._ref = lambda: fn
+        self.__name__ = getattr(fn, "__name__", repr(fn))
+        self.__qualname__ = getattr(fn, "__qualname__", self.__name__)
+        self.mode = mode
+        self.weak = weak
+        self.coalesce = coalesce or key is not None
+        self.key = key
+        self.calls = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def fn(self):
+        """The subscribed callable or None if a weak reference died."""
+        return self._ref()
+
+    @property
+    def alive(self) -> bool:
+        return self.fn is not None
+
+    def matches(self, fn) -> bool:
+        return self.fn == fn
+
+    def __call__(self, *args, **kwargs):
+        fn = self.fn
+        if fn is None:
+            return
+        start = time.perf_counter()
+        try:
+            fn(*args, **kwargs)
+        except Exception:
+            self.errors += 1
+            if self.mode == SYNC:
+                raise
+            logger.exception("Event subscriber '%s' failed.", self.__qualname__)
+        finally:
+            duration = time.perf_counter() - start
+            self.calls += 1
+            self.total_time += duration
+            self.max_time = max(self.max_time, duration)
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "avg_time": self.total_time / self.calls if self.calls else 0.0,
+            "max_time": self.max_time,
+        }
+
+
+class _Dispatcher:
+    """Delivers queued subscriber calls on a worker thread or the main thread."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+        self._worker = None
+        self._invoker = None
+
+    def _delivery_key(self, subscriber: Subscriber, event_type: str, args, kwargs):
+        if not subscriber.coalesce:
+            return None
+        if subscriber.key is not None:
+            key = (id(subscriber), event_type, subscriber.key(*args, **kwargs))
+        else:
+            key = (id(subscriber), event_type, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            logger.warning(
+                "Posts to '%s' are not coalesced, their args are not hashable (pass a key).",
+                subscriber.__qualname__,
+            )
+            return None
+        return key
+
+    def submit(self, subscriber: Subscriber, event_type: str, args, kwargs):
+        key = self._delivery_key(subscriber, event_type, args, kwargs)
+        if key is not None:
+            with self._pending_lock:
+                if key in self._pending:
+                    subscriber.coalesced += 1
+                    return
+                self._pending.add(key)
+        item = (key, subscriber, args, kwargs)
+        if subscriber.mode == MAIN_THREAD:
+            self._submit_main_thread(item)
+        else:
+            self._ensure_worker()
+            self._queue.put(item)
+
+    def _run(self, item):
+        key, subscriber, args, kwargs = item
+        if key is not None:
+            with self._pending_lock:
+                self._pending.discard(key)
+        subscriber(*args, **kwargs)
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(
+            target=self._work, name="capito-event-worker", daemon=True
+        )
+        self._worker.start()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                self._run(item)
+            finally:
+                self._queue.task_done()
+
+    def _submit_main_thread(self, item):
+        invoker = self._get_invoker()
+        if invoker is not None:
+            invoker.invoke.emit(lambda: self._run(item))
+            return
+        try:
+            import maya.utils  # pylint:disable=import-outside-toplevel
+
+            maya.utils.executeDeferred(self._run, item)
+            return
+        except ImportError:
+            pass
+        self._run(item)
+
+    def _get_invoker(self):
+        if self._invoker is not None:
+            return self._invoker
+        try:
+            from PySide6 import QtCore  # pylint:disable=import-outside-toplevel
+        except ImportError:
+            return None
+        app = QtCore.QCoreApplication.instance()
+        if app is None:
+            return None
+
+        class _Invoker(QtCore.QObject):
+            invoke = QtCore.Signal(object)
+
+        invoker = _Invoker()
+        invoker.moveToThread(app.thread())
+        invoker.invoke.connect(lambda fn: fn(), QtCore.Qt.QueuedConnection)
+        self._invoker = invoker
+        return invoker
+
+    def join(self, timeout: float = None) -> bool:
+        """Wait until the worker queue is drained. Returns False on timeout."""
+        if threading.current_thread() is self._worker:
+            # called by a subscriber: everything posted before it was delivered already
+            return True
+        if timeout is None:
+            self._queue.join()
+            return True
+        end = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() > end:
+                return False
+            time.sleep(0.005)
+        return True
+
+
+_dispatcher = _Dispatcher()
+
+
+def subscribe(
+    event_type: str, fn, mode: str = SYNC, weak: bool = False, coalesce: bool = False, key=None
+):
+    """Subscribe fn to event_type.
+    mode:     SYNC, ASYNC or MAIN_THREAD (see module docstring)
+    weak:     Only hold a weak reference to fn (bound methods are supported).
+    coalesce: Drop posts identical to a still pending one (queued modes only).
+    key:      key(*args, **kwargs) returns a hashable that identifies a post
+              for coalescing, instead of the args themselves. Implies coalesce.
+    """
+    with _lock:
+        event_subscribers = subscribers.setdefault(event_type, [])
+        if any(s.matches(fn) for s in event_subscribers):
+            return
+        event_subscribers.append(
+            Subscriber(fn, mode=mode, weak=weak, coalesce=coalesce, key=key)
+        )
+
+
+def _remove(event_type: str, predicate):
+    with _lock:
+        if event_type in subscribers:
+            subscribers[event_type] = [
+                s for s in subscribers[event_type] if not predicate(s)
+            ]
 
-def subscribe(event_type: str, fn):
-    if not event_type in subscribers:
-        subscribers[event_type] = []
-    if not fn in subscribers[event_type]:
-        subscribers[event_type].append(fn)
 
 def unsubscribe(event_type: str, fn):
-    if event_type in subscribers:
-        if fn in subscribers[event_type]:
-            subscribers[event_type].remove(fn)
+    _remove(event_type, lambda s: s.matches(fn))
+
 
 def unsubscribe_by_name(event_type: str, func_name: str):
-    if event_type in subscribers:
-        to_remove = []
-        for subscriber in subscribers[event_type]:
-            if subscriber.__name__ == func_name:
-                to_remove.append(subscriber)        
-        for func in to_remove:
-            subscribers[event_type].remove(func)
+    _remove(event_type, lambda s: s.__name__ == func_name)
+
 
 def unsubscribe_by_qualname(event_type: str, qualname: str):
-    if event_type in subscribers:
-        to_remove = []
-        for subscriber in subscribers[event_type]:
-            if subscriber.__qualname__ == qualname:
-                to_remove.append(subscriber)        
-        for func in to_remove:
-            subscribers[event_type].remove(func)
+    _remove(event_type, lambda s: s.__qualname__ == qualname)
+
 
 def post(event_type: str, *args, **kwargs):
-    if not event_type in subscribers:
-        return
-    for fn in subscribers[event_type]:
-        fn(*args, **kwargs)
+    with _lock:
+        if not event_type in subscribers:
+            return
+        event_subscribers = [s for s in subscribers[event_type] if s.alive]
+        subscribers[event_type] = event_subscribers
+    for subscriber in event_subscribers:
+        if subscriber.mode == SYNC:
+            subscriber(*args, **kwargs)
+        else:
+            _dispatcher.submit(subscriber, event_type, args, kwargs)
+
+
+def flush(timeout: float = None) -> bool:
+    """Block until all ASYNC deliveries are processed.
+    Returns False if they are not done after timeout seconds."""
+    return _dispatcher.join(timeout)
+
+
+@atexit.register
+def _flush_at_exit():
+    if not flush(EXIT_FLUSH_TIMEOUT):
+        logger.warning("Pending event deliveries dropped at exit after %ss.", EXIT_FLUSH_TIMEOUT)
+
 
 def list_events():
-    return list(subscribers.keys())
+    with _lock:
+        return list(subscribers.keys())
+
 
 def list_event_subscribers(event_type: str):
-    return [s.__name__ for s in subscribers[event_type]]
+    with _lock:
+        return [s.__name__ for s in subscribers[event_type]]
+
 
 def list_all():
-    return {
-        e: [s.__name__ for s in s_list] for e, s_list in subscribers.items()
-    }
+    with _lock:
+        return {
+            e: [s.__name__ for s in s_list] for e, s_list in subscribers.items()
+        }
+
+
+def statistics():
+    """Per subscriber timing: {event_type: {qualname: stats_dict}}"""
+    with _lock:
+        return {
+            e: {s.__qualname__: s.stats() for s in s_list}
+            for e, s_list in subscribers.items()
+        }
@@ -0,0 +1,293 @@
+"""
+Integrity checks for rendered images that only read their headers.
+
+The headers of EXR, TIFF and PNG files tell how long the file has to be:
+the chunk offset table of an EXR, the strip/tile tables of a TIFF and the
+IEND chunk ending a PNG. A file which is shorter (eg. an interrupted
+transfer) or whose tables are not filled in (an interrupted render)
+is reported, without reading the pixel data.
+Only the standard library is used, so this works outside of Maya too.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import math
+import os
+from pathlib import Path
+import struct
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+EXR_MAGIC = 20000630
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_IEND = b"\x00\x00\x00\x00IEND\xaeB`\x82"
+
+# scanlines per chunk by EXR compression (NO, RLE, ZIPS, ZIP, PIZ, PXR24, B44, B44A, DWAA, DWAB)
+EXR_LINES_PER_CHUNK = (1, 1, 1, 16, 32, 16, 32, 32, 32, 256)
+
+# struct formats of the TIFF field types used for sizes and offsets (BYTE, SHORT, LONG, LONG8)
+TIFF_INT_FORMATS = {1: "B", 3: "H", 4: "I", 16: "Q"}
+
+
+class ImageError(Exception):
+    """The image is truncated or corrupt."""
+
+
+class UnsupportedImageFormat(ImageError):
+    pass
+
+
+@dataclass
+class ImageHeader:
+    format: str
+    width: int
+    height: int
+    data_end: int  # the file has to be at least this long
+
+
+@dataclass
+class ImageCheck:
+    path: Path
+    header: Optional[ImageHeader] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _read(f: BinaryIO, offset: int, size: int) -> bytes:
+    f.seek(offset)
+    data = f.read(size)
+    if len(data) != size:
+        raise ImageError(f"truncated at byte {offset + len(data)}")
+    return data
+
+
+def _read_cstring(f: BinaryIO, offset: int) -> Tuple[str, int]:
+    """Null terminated string at offset, and the offset after it."""
+    data = b""
+    while b"\0" not in data:
+        chunk = f.read(64)
+        if not chunk:
+            raise ImageError("truncated header")
+        data += chunk
+    text = data[:data.index(b"\0")]
+    return text.decode("latin-1"), offset + len(text) + 1
+
+
+def _read_exr_headers(f: BinaryIO, multipart: bool) -> Tuple[List[Dict[str, bytes]], int]:
+    """Attributes (raw values) of all parts and the offset after the headers."""
+    headers = []
+    offset = 8
+    while True:
+        attributes = {}
+        while True:
+            f.seek(offset)
+            name, offset = _read_cstring(f, offset)
+            if not name:
+                break
+            f.seek(offset)
+            _, offset = _read_cstring(f, offset)
+            size = struct.unpack("<i", _read(f, offset, 4))[0]
+            attributes[name] = _read(f, offset + 4, size)
+            offset += 4 + size
+        if not attributes:
+            break  # the empty header ending the list of parts
+        headers.append(attributes)
+        if not multipart:
+            break
+    if not headers:
+        raise ImageError("no exr header")
+    return headers, offset
+
+
+def _level_size(size: int, level: int, round_up: bool) -> int:
+    level_size = size // (1 << level)
+    if round_up and level_size * (1 << level) < size:
+        level_size += 1
+    return max(level_size, 1)
+
+
+def _num_levels(size: int, round_up: bool) -> int:
+    log = int(math.log2(size))
+    if round_up and (1 << log) < size:
+        log += 1
+    return log + 1
+
+
+def _exr_chunk_count(attributes: Dict[str, bytes]) -> int:
+    if "chunkCount" in attributes:
+        return struct.unpack("<i", attributes["chunkCount"])[0]
+    x_min, y_min, x_max, y_max = struct.unpack("<4i", attributes["dataWindow"])
+    width, height = x_max - x_min + 1, y_max - y_min + 1
+    if "tiles" in attributes:
+        tile_x, tile_y, mode = struct.unpack("<IIB", attributes["tiles"])
+        level_mode, round_up = mode & 0x0F, bool(mode >> 4)
+        if level_mode == 0:
+            levels = [(0, 0)]
+        elif level_mode == 1:
+            levels = [(l, l) for l in range(_num_levels(max(width, height), round_up))]
+        else:
+            levels = [
+                (lx, ly)
+                for ly in range(_num_levels(height, round_up))
+                for lx in range(_num_levels(width, round_up))
+            ]
+        return sum(
+            math.ceil(_level_size(width, lx, round_up) / tile_x)
+            * math.ceil(_level_size(height, ly, round_up) / tile_y)
+            for lx, ly in levels
+        )
+    compression = attributes["compression"][0]
+    if compression >= len(EXR_LINES_PER_CHUNK):
+        raise ImageError(f"unknown exr compression {compression}")
+    return math.ceil(height / EXR_LINES_PER_CHUNK[compression])
+
+
+def _exr_chunk_end(f: BinaryIO, offset: int, attributes: Dict[str, bytes], multipart: bool) -> int:
+    """End of the chunk at offset, from its chunk header."""
+    if multipart:
+        offset += 4  # part number
+    part_type = attributes.get("type", b"").rstrip(b"\0")
+    tiled = "tiles" in attributes
+    coordinates = 16 if tiled else 4
+    if part_type.startswith(b"deep"):
+        table_size, sample_size, _ = struct.unpack("<3Q", _read(f, offset + coordinates, 24))
+        return offset + coordinates + 24 + table_size + sample_size
+    size = struct.unpack("<i", _read(f, offset + coordinates, 4))[0]
+    return offset + coordinates + 4 + size
+
+
+def read_exr_header(f: BinaryIO, file_size: int) -> ImageHeader:
+    magic, version = struct.unpack("<iI", _read(f, 0, 8))
+    if magic != EXR_MAGIC:
+        raise ImageError("not an exr file")
+    multipart = bool(version & 0x1000)
+    headers, offset = _read_exr_headers(f, multipart)
+    tables = []
+    for attributes in headers:
+        count = _exr_chunk_count(attributes)
+        tables.append(struct.unpack(f"<{count}Q", _read(f, offset, count * 8)))
+        offset += count * 8
+    last = (offset, None)
+    for part, table in enumerate(tables):
+        for chunk_offset in table:
+            if not offset <= chunk_offset < file_size:
+                raise ImageError(f"invalid chunk offset {chunk_offset}")
+            if chunk_offset >= last[0]:
+                last = (chunk_offset, part)
+    data_end = offset
+    if last[1] is not None:
+        if multipart:
+            part = struct.unpack("<i", _read(f, last[0], 4))[0]
+            if not 0 <= part < len(headers):
+                raise ImageError(f"invalid part number {part}")
+            last = (last[0], part)
+        data_end = _exr_chunk_end(f, last[0], headers[last[1]], multipart)
+    x_min, y_min, x_max, y_max = struct.unpack("<4i", headers[0]["dataWindow"])
+    return ImageHeader("exr", x_max - x_min + 1, y_max - y_min + 1, data_end)
+
+
+def _tiff_values(f: BinaryIO, order: str, entry: bytes, big: bool) -> Tuple[int, ...]:
+    field_type, count = struct.unpack(order + ("HQ" if big else "HI"), entry[2:12 if big else 8])
+    value_format = TIFF_INT_FORMATS.get(field_type)
+    if value_format is None:
+        return ()
+    value_format = f"{order}{count}{value_format}"
+    size = struct.calcsize(value_format)
+    inline = entry[12:20] if big else entry[8:12]
+    if size <= len(inline):
+        data = inline[:size]
+    else:
+        value_offset = struct.unpack(order + ("Q" if big else "I"), inline)[0]
+        data = _read(f, value_offset, size)
+    return struct.unpack(value_format, data)
+
+
+def read_tiff_header(f: BinaryIO, file_size: int) -> ImageHeader:
+    head = _read(f, 0, 16 if file_size >= 16 else 8)
+    order = {b"II": "<", b"MM": ">"}.get(head[:2])
+    if order is None:
+        raise ImageError("not a tiff file")
+    magic = struct.unpack(order + "H", head[2:4])[0]
+    if magic == 42:
+        big = False
+        ifd_offset = struct.unpack(order + "I", head[4:8])[0]
+        num_entries = struct.unpack(order + "H", _read(f, ifd_offset, 2))[0]
+        entries_offset, entry_size = ifd_offset + 2, 12
+    elif magic == 43:
+        big = True
+        ifd_offset = struct.unpack(order + "Q", head[8:16])[0]
+        num_entries = struct.unpack(order + "Q", _read(f, ifd_offset, 8))[0]
+        entries_offset, entry_size = ifd_offset + 8, 20
+    else:
+        raise ImageError("not a tiff file")
+    entries = _read(f, entries_offset, num_entries * entry_size)
+    tags = {}
+    for i in range(num_entries):
+        entry = entries[i * entry_size:(i + 1) * entry_size]
+        tag = struct.unpack(order + "H", entry[:2])[0]
+        if tag in (256, 257, 273, 279, 324, 325):
+            tags[tag] = _tiff_values(f, order, entry, big)
+    offsets, counts = tags.get(273) or tags.get(324), tags.get(279) or tags.get(325)
+    if not offsets or not counts or len(offsets) != len(counts):
+        raise ImageError("no strip or tile table")
+    if 0 in offsets:
+        raise ImageError("strip or tile table not filled in")
+    width, height = tags.get(256, (0,))[0], tags.get(257, (0,))[0]
+    return ImageHeader("tiff", width, height, max(o + c for o, c in zip(offsets, counts)))
+
+
+def read_png_header(f: BinaryIO, file_size: int) -> ImageHeader:
+    head = _read(f, 0, 24)
+    if head[:8] != PNG_SIGNATURE or head[12:16] != b"IHDR":
+        raise ImageError("not a png file")
+    width, height = struct.unpack(">II", head[16:24])
+    if file_size < 24 + len(PNG_IEND) or _read(f, file_size - len(PNG_IEND), len(PNG_IEND)) != PNG_IEND:
+        raise ImageError("png does not end with IEND")
+    return ImageHeader("png", width, height, file_size)
+
+
+HEADER_READERS = {
+    b"\x76\x2f\x31\x01": read_exr_header,
+    b"II*\0": read_tiff_header,
+    b"MM\0*": read_tiff_header,
+    b"II+\0": read_tiff_header,
+    b"MM\0+": read_tiff_header,
+    PNG_SIGNATURE[:4]: read_png_header,
+}
+
+
+def read_image_header(path: str) -> ImageHeader:
+    """Format, size and expected length of an exr, tiff or png file.
+    Raises ImageError if the header is unreadable."""
+    file_size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        reader = HEADER_READERS.get(f.read(4))
+        if reader is None:
+            raise UnsupportedImageFormat(f"unsupported image format: {path}")
+        try:
+            return reader(f, file_size)
+        except (struct.error, KeyError, IndexError, ValueError) as error:
+            raise ImageError(f"corrupt header ({error})") from error
+
+
+def check_image(path: str) -> ImageCheck:
+    """Check that the file is as long as its header says.
+    Other formats than exr, tiff and png pass unchecked (without header)."""
+    check = ImageCheck(Path(path))
+    try:
+        check.header = read_image_header(path)
+        file_size = os.path.getsize(path)
+        if check.header.data_end > file_size:
+            check.error = f"truncated: {file_size} of {check.header.data_end} bytes"
+    except UnsupportedImageFormat:
+        pass
+    except (OSError, ImageError) as error:
+        check.error = str(error) or type(error).__name__
+    return check
+
+
+def check_images(paths: Iterable[str], max_workers: int = 32) -> List[ImageCheck]:
+    """Check many images in parallel (the reads are small but slow on a share)."""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(check_image, paths))
@@ -1,3 +1,5 @@
+from .exceptions import PipeableLoadError
+from .manifest import PipeableDiagnostic, PipeableInfo
 from .models import Pipeable, PipeableCategory
 from .player import PipePlayer
 from .provider import PipeProvider
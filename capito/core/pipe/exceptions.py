@@ -0,0 +1,11 @@
+"""Module providing Exceptions for pipe specific operations."""
+
+
+class PipeableLoadError(Exception):
+    """Raised when a pipeable module can't be imported or instantiated.
+    The PipeableDiagnostic describing the failure is the first argument."""
+
+    @property
+    def diagnostic(self):
+        """The PipeableDiagnostic of the failed module."""
+        return self.args[0]
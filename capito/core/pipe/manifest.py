@@ -0,0 +1,156 @@
+"""Static metadata extraction for pipeable modules.
+
+The manifest describes every pipeable module (label, category, host,
+default parameters...) without importing it. Entries are read via 'ast'
+and cached by file path, mtime and size, so the (possibly expensive)
+import of a pipeable only happens when it is actually used.
+"""
+import ast
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .models import PipeableCategory
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class PipeableInfo:
+    """Metadata of a pipeable module, extracted without importing it."""
+
+    name: str
+    path: str
+    label: str = ""
+    category: str = ""
+    host: str = ""
+    doc: str = ""
+    parallel_safe: bool = False
+    # None if the defaults can't be evaluated statically.
+    parameters: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class PipeableDiagnostic:
+    """Describes why a pipeable module could not be read or imported."""
+
+    name: str
+    path: str
+    stage: str  # "manifest" or "import"
+    error_type: str
+    message: str
+    traceback: str = ""
+
+    def __str__(self):
+        return f"{self.name} ({self.stage}): {self.error_type}: {self.message}"
+
+
+def _eval_node(node: ast.AST):
+    """Evaluate a class attribute value. Supports literals and PipeableCategory.X."""
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "PipeableCategory"
+    ):
+        try:
+            return getattr(PipeableCategory, node.attr)
+        except AttributeError as error:
+            raise ValueError(f"Unknown category '{node.attr}'.") from error
+    return ast.literal_eval(node)
+
+
+def _default_parameters(func: ast.FunctionDef) -> Optional[Dict[str, Any]]:
+    """Return the literal dict returned by get_default_parameters (or None)."""
+    for node in ast.walk(func):
+        if isinstance(node, ast.Return) and node.value is not None:
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                return None
+            return value if isinstance(value, dict) else None
+    return None
+
+
+def read_pipeable_info(pyfile: Path) -> PipeableInfo:
+    """Statically read the metadata of the pipeable class in pyfile.
+    The class must have the same name as the module.
+    Raises SyntaxError, ValueError or LookupError if the file can't be read.
+    """
+    name = pyfile.stem
+    tree = ast.parse(pyfile.read_text(encoding="utf-8"), filename=str(pyfile))
+    class_def = next(
+        (n for n in tree.body if isinstance(n, ast.ClassDef) and n.name == name),
+        None,
+    )
+    if class_def is None:
+        raise LookupError(f"No class named '{name}' found in '{pyfile}'.")
+
+    info = PipeableInfo(
+        name=name, path=str(pyfile), doc=ast.get_docstring(class_def) or "",
+        parameters={}
+    )
+    for node in class_def.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name) and target.id in (
+                    "label", "category", "host", "parallel_safe"
+                ):
+                    setattr(info, target.id, _eval_node(node.value))
+        elif isinstance(node, ast.FunctionDef) and node.name == "get_default_parameters":
+            info.parameters = _default_parameters(node)
+    return info
+
+
+@dataclass
+class Manifest:
+    """Cache of PipeableInfos keyed by file path and validated by mtime and size."""
+
+    cache_file: Optional[Path] = None
+    entries: Dict[str, dict] = field(default_factory=dict)
+    dirty: bool = False
+
+    def __post_init__(self):
+        if self.cache_file is None or not self.cache_file.exists():
+            return
+        try:
+            with self.cache_file.open("r", encoding="utf-8") as json_file:
+                data = json.load(json_file)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("entries", {})
+
+    def get(self, pyfile: Path) -> PipeableInfo:
+        """Return the info for pyfile, read from cache if the file didn't change."""
+        stat = pyfile.stat()
+        key = str(pyfile)
+        entry = self.entries.get(key)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return PipeableInfo(**entry["info"])
+        info = read_pipeable_info(pyfile)
+        self.entries[key] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "info": asdict(info),
+        }
+        self.dirty = True
+        return info
+
+    def save(self):
+        """Write the manifest cache file if anything changed."""
+        if self.cache_file is None or not self.dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with self.cache_file.open("w", encoding="utf-8") as json_file:
+                json.dump(
+                    {"version": MANIFEST_VERSION, "entries": self.entries}, json_file
+                )
+            self.dirty = False
+        except OSError:
+            pass
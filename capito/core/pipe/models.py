@@ -1,7 +1,14 @@
 """Module containing base classes for pipable modules."""
 
 from dataclasses import dataclass, field
-from typing import Any, List
+from pathlib import Path
+from typing import Any, Hashable, List, Optional
+
+
+def file_fingerprint(path) -> tuple:
+    """Fingerprint of a file: path, mtime and size."""
+    stat = Path(path).stat()
+    return (str(path), stat.st_mtime_ns, stat.st_size)
 
 
 class PipeableCategory:
@@ -40,6 +47,16 @@ class Pipeable:
     failed: bool = False
     stop_on_failed: bool = True
     messages: list = field(default_factory=list)
+    duration: float = 0.0
+    item_count: int = 0
+    cached_count: int = 0
+
+    # Set to True if 'execute' only reads items and doesn't touch shared state
+    # (selection, scene, items list). Such CHECK pipeables may run concurrently.
+    parallel_safe = False
+    # Set to True if the pipeable implements 'execute_item'. The PipePlayer then
+    # caches the result per item fingerprint and skips unchanged items on re-run.
+    cacheable = False
 
     @property
     def name(self) -> str:  # pylint: disable=missing-function-docstring
@@ -70,7 +87,30 @@ class Pipeable:
         """Reset the pipeable."""
         self.failed = False
         self.messages = []
-
-    def execute(self, items: List[Any], exports: List[str]):
-        """do whatever the pipeable should do..."""
+        self.duration = 0.0
+        self.item_count = 0
+        self.cached_count = 0
+
+    def fingerprint(self, item: Any) -> Optional[Hashable]:
+        """Return a hashable describing everything the result for item depends on.
+        None disables result caching for this item.
+        Items may provide their own 'fingerprint()' method (eg. maya node wrappers),
+        files are fingerprinted by path, mtime and size."""
+        if hasattr(item, "fingerprint"):
+            return item.fingerprint()
+        if isinstance(item, Path):
+            try:
+                return file_fingerprint(item)
+            except OSError:
+                return None
+        return None
+
+    def execute_item(self, item: Any, exports: List[str], user_input: dict):
+        """Process a single item. Implement this for cacheable pipeables."""
         pass
+
+    def execute(self, items: List[Any], exports: List[str], user_input: dict):
+        """do whatever the pipeable should do...
+        The default implementation calls 'execute_item' for each item."""
+        for item in items:
+            self.execute_item(item, exports, user_input)
@@ -12,6 +12,7 @@ Fails if history is detected."""
     label = "History"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """The check method."""
@@ -10,6 +10,7 @@ Fails if rotate channels differ from (0, 0, 0)."""
     label = "Rotate = (0,0,0)"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """Check for Freeze Transforms: Rotate"""
@@ -10,6 +10,7 @@ Fails if scale is not (1, 1, 1)."""
     label = "Scale = (1,1,1)"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """Check for Freeze Transforms: Scale"""
@@ -10,6 +10,7 @@ Fails if translate channels are not (0, 0, 0)."""
     label = "Translate = (0,0,0)"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """Check for Freezed Translate Values"""
@@ -9,6 +9,7 @@ class CheckInitialShadingGroupApplied(Pipeable):
     label = "Initial Shading Group"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """Check for shadingEngines with name other than 'initialShadingGroup'."""
@@ -9,6 +9,7 @@ class CheckMultipleShapeNodes(Pipeable):
     label = "One shape node only"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """Check for mulitple Shape Nodes"""
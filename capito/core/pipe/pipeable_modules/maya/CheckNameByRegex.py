@@ -9,6 +9,8 @@ class CheckNameByRegex(Pipeable):
     label = "Naming Convention"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
+    cacheable = True
 
     def set_parameters(self, regex_pattern: str = None):
         """Set the parameters needed in 'execute'."""
@@ -18,13 +20,15 @@ class CheckNameByRegex(Pipeable):
         """A regular expression to match the items names against (eg '_(geo$|grp$)')."""
         return {"regex_pattern": "_(geo$|grp$)"}
 
-    def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
-        """Checks collected items follow the regex.
+    def fingerprint(self, item: Any):
+        """The result only depends on the name."""
+        return item.name()
+
+    def execute_item(self, item: Any, exports: List[str], user_input: Dict[str, Any]):
+        """Checks collected item follows the regex.
         This checker doesn't check if the postfix matches with object-type."""
-        regex = re.compile(rf"{self.regex_pattern}")
-        for item in items:
-            if not regex.findall(item.name()):
-                self.messages.append(
-                    f"Name '{item.name()}' doesn't follow regex '{self.regex_pattern}'"
-                )
-                self.failed = True
+        if not re.findall(rf"{self.regex_pattern}", item.name()):
+            self.messages.append(
+                f"Name '{item.name()}' doesn't follow regex '{self.regex_pattern}'"
+            )
+            self.failed = True
@@ -10,6 +10,7 @@ class CheckUVSets(Pipeable):
     label = "UV Sets"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     def execute(self, items: List[Any], exports: List[str], user_input: Dict[str, Any]):
         """The check method."""
@@ -10,6 +10,7 @@ class CheckUniqueNames(Pipeable):
     label = "Unique Names"
     category = PipeableCategory.CHECK
     host = "maya"
+    parallel_safe = True
 
     # def set_parameters(self, regex_pattern: str = None):
     #     """Set the parameters needed in 'execute'."""
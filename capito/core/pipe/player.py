@@ -1,10 +1,14 @@
 """Module providing PipelinePlayer class."""
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Callable, List
 
 from capito.conf.config import CONFIG
-from capito.core.pipe.models import Pipeable
+from capito.core.pipe.models import Pipeable, PipeableCategory
 from capito.core.pipe.provider import PipeProvider
 
 # def to_type(line):
@@ -45,10 +49,81 @@ def print_reporter(reportable: Pipeable):
     """Report by printing to console."""
     print(reportable.category, reportable.label)
     print("\t", "Failed" if reportable.failed else "Passed")
+    print("\t", f"{reportable.duration:.3f}s, {reportable.item_count} item(s)")
     for message in reportable.messages:
         print("\t", message)
 
 
+def is_parallel_check(pipeable: Pipeable) -> bool:
+    """True if pipeable is a CHECK that declared itself parallel safe."""
+    return pipeable.category == PipeableCategory.CHECK and pipeable.parallel_safe
+
+
+@dataclass
+class PipeableReport:
+    """Timing and result of one executed Pipeable."""
+
+    name: str
+    label: str
+    category: str
+    host: str
+    failed: bool
+    duration: float
+    item_count: int
+    parallel: bool
+    cached_count: int = 0
+    messages: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PlayReport:
+    """Structured report of one PipePlayer.play() run."""
+
+    title: str
+    duration: float = 0.0
+    stopped: bool = False
+    entries: List[PipeableReport] = field(default_factory=list)
+
+    def add(self, pipeable: Pipeable, parallel: bool = False):
+        """Add the result of an executed pipeable."""
+        self.entries.append(
+            PipeableReport(
+                name=pipeable.name,
+                label=pipeable.label,
+                category=pipeable.category,
+                host=pipeable.host,
+                failed=pipeable.failed,
+                duration=pipeable.duration,
+                item_count=pipeable.item_count,
+                parallel=parallel,
+                cached_count=pipeable.cached_count,
+                messages=list(pipeable.messages),
+            )
+        )
+
+    def as_dict(self) -> dict:
+        """Return the report as python dict (eg. for json export)."""
+        return asdict(self)
+
+    def as_text(self) -> str:
+        """Human readable one line per pipeable summary."""
+        lines = [f"{self.title}: {self.duration:.3f}s"]
+        for entry in self.entries:
+            status = "Failed" if entry.failed else "Passed"
+            parallel = " (parallel)" if entry.parallel else ""
+            cached = f", {entry.cached_count} cached" if entry.cached_count else ""
+            lines.append(
+                f"{entry.category}: {entry.label} - {status} - "
+                f"{entry.duration:.3f}s, {entry.item_count} item(s){cached}{parallel}"
+            )
+        return "\n".join(lines)
+
+    def save(self, report_file: Path):
+        """Save the report as json."""
+        with Path(report_file).open("w") as json_file:
+            json.dump(self.as_dict(), json_file, indent=4)
+
+
 class PipePlayer:
     """Manages a playlist of Pipeables.
     The playlist can be run.
@@ -66,6 +141,11 @@ class PipePlayer:
         self.title = "New Playlist"
         self.description = "No description available."
         self.user_input = {}
+        self.report = PlayReport(self.title)
+        self.max_workers = min(32, (os.cpu_count() or 1) + 4)
+        # {(pipeable name, parameters, item fingerprint): (failed, messages)}
+        self.result_cache = {}
+        self.use_result_cache = True
 
         self.reporter_callbacks = [print_reporter]
         if reporter_callbacks is not None:
@@ -92,18 +172,121 @@ class PipePlayer:
         for reporter in self.reporter_callbacks:
             reporter(reportable)
 
+    def phases(self) -> List[List[Pipeable]]:
+        """Split the playlist into phases.
+        Consecutive parallel safe CHECK pipeables share one phase,
+        every other pipeable is a phase of its own.
+        """
+        phases = []
+        for class_instance in self.playlist:
+            if (
+                phases
+                and is_parallel_check(class_instance)
+                and is_parallel_check(phases[-1][-1])
+            ):
+                phases[-1].append(class_instance)
+            else:
+                phases.append([class_instance])
+        return phases
+
+    def execute(self, class_instance: Pipeable):
+        """Reset and execute a single pipeable while recording its timing."""
+        class_instance.reset()
+        start = time.perf_counter()
+        try:
+            if class_instance.cacheable and self.use_result_cache:
+                self.execute_cached(class_instance)
+            else:
+                class_instance.execute(self.items, self.exports, self.user_input)
+        finally:
+            class_instance.duration = time.perf_counter() - start
+            class_instance.item_count = len(self.items)
+
+    def execute_cached(self, class_instance: Pipeable):
+        """Execute a cacheable pipeable item by item.
+        Items whose fingerprint (and the pipeable parameters) didn't change
+        since an earlier run are not executed again, their result is replayed.
+        """
+        parameters = json.dumps(class_instance.get_parameters(), sort_keys=True, default=str)
+        for item in self.items:
+            fingerprint = class_instance.fingerprint(item)
+            key = None
+            if fingerprint is not None:
+                key = (class_instance.name, parameters, fingerprint)
+                cached = self.result_cache.get(key)
+                if cached is not None:
+                    class_instance.failed = class_instance.failed or cached[0]
+                    class_instance.messages.extend(cached[1])
+                    class_instance.cached_count += 1
+                    continue
+            failed = class_instance.failed
+            num_messages = len(class_instance.messages)
+            class_instance.failed = False
+            class_instance.execute_item(item, self.exports, self.user_input)
+            item_failed = class_instance.failed
+            class_instance.failed = failed or item_failed
+            if key is not None:
+                self.result_cache[key] = (
+                    item_failed, tuple(class_instance.messages[num_messages:])
+                )
+
+    def clear_result_cache(self):
+        """Forget all cached item results."""
+        self.result_cache.clear()
+
+    def finish(self, class_instance: Pipeable, parallel: bool = False):
+        """Report an executed pipeable and stop the play if it failed and has to stop."""
+        self.report.add(class_instance, parallel=parallel)
+        self.call_reporters(class_instance)
+        if class_instance.failed and class_instance.stop_on_failed:
+            self.stopped = True
+
+    def execute_parallel(self, phase: List[Pipeable]):
+        """Execute a phase of parallel safe checks.
+        System checks run in a thread pool, host checks (eg. maya)
+        are run in sequence on the calling (main) thread meanwhile and
+        are reported one by one, like outside of a phase.
+        Pooled checks are reported on the calling thread once the host checks are done,
+        the ones not started yet are skipped if the play was stopped.
+        """
+        pooled = [p for p in phase if p.host == "system"]
+        on_main_thread = [p for p in phase if p.host != "system"]
+        if not pooled:
+            for class_instance in on_main_thread:
+                if self.stopped:
+                    return
+                self.execute(class_instance)
+                self.finish(class_instance)
+            return
+        with ThreadPoolExecutor(max_workers=min(len(pooled), self.max_workers)) as pool:
+            futures = [(p, pool.submit(self.execute, p)) for p in pooled]
+            for class_instance in on_main_thread:
+                if self.stopped:
+                    break
+                self.execute(class_instance)
+                self.finish(class_instance)
+            for class_instance, future in futures:
+                if self.stopped and future.cancel():
+                    continue
+                future.result()
+                self.finish(class_instance, parallel=True)
+
     def play(self):
         """The collect, check, export, process... function."""
         self.stopped = False
         self.items = []
-        for class_instance in self.playlist:
+        self.report = PlayReport(self.title)
+        start = time.perf_counter()
+        for phase in self.phases():
             if self.stopped:
                 break
-            class_instance.reset()
-            class_instance.execute(self.items, self.exports, self.user_input)
-            self.call_reporters(class_instance)
-            if class_instance.failed and class_instance.stop_on_failed:
-                self.stopped = True
+            if len(phase) > 1:
+                self.execute_parallel(phase)
+            else:
+                self.execute(phase[0])
+                self.finish(phase[0])
+        self.report.duration = time.perf_counter() - start
+        self.report.stopped = self.stopped
 
     def reset(self):
         """Reset the playlist."""
@@ -1,13 +1,18 @@
 """Module providing the core publishing class."""
 import importlib
 import sys
+import traceback
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
 
 from capito.conf.config import CONFIG
 
+from .exceptions import PipeableLoadError
+from .manifest import Manifest, PipeableDiagnostic, PipeableInfo
 from .models import Pipeable, PipeableCategory
 
+MANIFEST_FILE = Path.home() / "capito_settings" / "pipeable_manifest.json"
+
 
 def get_pipeable_project_modules():
     """Get pipeable_module folders for each host
@@ -31,13 +36,22 @@ def get_pipeable_project_modules():
 
 
 class PipeProvider:
-    """PipeProvider loads and provides pipeable modules."""
+    """PipeProvider lists and provides pipeable modules.
+    Modules are described by a statically read manifest and only
+    imported when an instance is requested via 'get_instance'.
+    """
 
-    def __init__(self, hosts: List = None, module_folders: List[str] = None):
+    def __init__(
+        self, hosts: List = None, module_folders: List[str] = None,
+        manifest_file: Path = MANIFEST_FILE
+    ):
         self.hosts = ["system"]
         self.module_folders = []
 
-        self.modules: Dict[str, Tuple[Any, Pipeable]] = {}
+        self.modules: Dict[str, PipeableInfo] = {}
+        self.loaded_modules: Dict[str, Any] = {}
+        self.diagnostics: Dict[str, PipeableDiagnostic] = {}
+        self.manifest = Manifest(manifest_file)
 
         if hosts is not None:
             self.hosts.extend(hosts)
@@ -63,44 +77,91 @@ class PipeProvider:
                 self.module_folders.append(str(module_folder))
 
     def load_modules(self):
-        """initiate module loading in given folders and host subfolders."""
+        """initiate module discovery in given folders and host subfolders."""
         for folder in self.module_folders:
-            if folder not in sys.path:
-                sys.path.append(folder)
             self.load_modules_in_folder(folder)
+        self.manifest.save()
 
     def load_modules_in_folder(self, folder):
-        """load all detected modules in folder"""
+        """Register all detected modules in folder (without importing them)."""
         path = Path(folder)
         for pyfile in path.glob("*.py"):
-            modname = pyfile.name[:-3]
+            modname = pyfile.stem
             try:
-                pipe_module = importlib.import_module(f"{modname}")
-                class_instance = getattr(pipe_module, modname)()
-                class_instance.set_default_parameters()
-                self.modules[modname] = (pipe_module, class_instance)
-            except AttributeError as error:
-                print(f"Module '{modname}' could not be loaded: AttributeError")
-                print(error.__traceback__)
-            except:
-                print(f"An error occured while loading module '{modname}'.")
-
-    def get_instance(self, module_name: str):
-        """Given a pipeable module name the function returns an instance of the pipeable."""
-        class_instance = getattr(self.modules[module_name][0], module_name)()
-        class_instance.set_default_parameters()
+                info = self.manifest.get(pyfile)
+            except (OSError, SyntaxError, ValueError, LookupError) as error:
+                self._add_diagnostic(modname, pyfile, "manifest", error)
+                # Not statically readable: fall back to importing it.
+                try:
+                    info = self._info_from_import(modname, pyfile)
+                except PipeableLoadError:
+                    continue
+            self.modules[modname] = info
+
+    def _add_diagnostic(self, modname: str, pyfile: Path, stage: str, error: Exception):
+        self.diagnostics[modname] = PipeableDiagnostic(
+            name=modname,
+            path=str(pyfile),
+            stage=stage,
+            error_type=type(error).__name__,
+            message=str(error),
+            traceback="".join(
+                traceback.format_exception(type(error), error, error.__traceback__)
+            ),
+        )
+
+    def _import(self, modname: str, pyfile: Path):
+        """Import the pipeable module. Raises PipeableLoadError on failure."""
+        if modname in self.loaded_modules:
+            return self.loaded_modules[modname]
+        folder = str(pyfile.parent)
+        if folder not in sys.path:
+            sys.path.append(folder)
+        try:
+            pipe_module = importlib.import_module(modname)
+            getattr(pipe_module, modname)
+        except Exception as error:  # pylint: disable=broad-except
+            self._add_diagnostic(modname, pyfile, "import", error)
+            raise PipeableLoadError(self.diagnostics[modname]) from error
+        self.loaded_modules[modname] = pipe_module
+        return pipe_module
+
+    def _info_from_import(self, modname: str, pyfile: Path) -> PipeableInfo:
+        pipe_cls = getattr(self._import(modname, pyfile), modname)
+        return PipeableInfo(
+            name=modname,
+            path=str(pyfile),
+            label=getattr(pipe_cls, "label", modname),
+            category=getattr(pipe_cls, "category", ""),
+            host=getattr(pipe_cls, "host", ""),
+            doc=pipe_cls.__doc__ or "",
+            parallel_safe=getattr(pipe_cls, "parallel_safe", False),
+        )
+
+    def get_instance(self, module_name: str) -> Pipeable:
+        """Given a pipeable module name the function returns an instance of the pipeable.
+        The module is imported on first use. Raises PipeableLoadError if that fails.
+        """
+        info = self.modules[module_name]
+        pipe_module = self._import(module_name, Path(info.path))
+        try:
+            class_instance = getattr(pipe_module, module_name)()
+            class_instance.set_default_parameters()
+        except Exception as error:  # pylint: disable=broad-except
+            self._add_diagnostic(module_name, Path(info.path), "import", error)
+            raise PipeableLoadError(self.diagnostics[module_name]) from error
         return class_instance
 
     def list_categories(self):
         """Return a list of all categories that are currently in provider list"""
-        return list(set([mod[1].category for mod in self.modules.values()]))
+        return list(set([info.category for info in self.modules.values()]))
 
     def list_filtered_modules(
         self, categories: List[PipeableCategory] = None, hosts: list = None
-    ):
+    ) -> List[PipeableInfo]:
         """Retrun a filtered list by category and host."""
         return [
-            mod
-            for mod in self.modules.values()
-            if mod[1].host in hosts and mod[1].category in categories
+            info
+            for info in self.modules.values()
+            if info.host in hosts and info.category in categories
         ]
@@ -2,7 +2,9 @@
 from functools import partial
 from pathlib import Path
 
-from capito.core.pipe import Pipeable, PipeableCategory, PipePlayer, PipeProvider
+from capito.core.pipe import (
+    Pipeable, PipeableCategory, PipeableLoadError, PipePlayer, PipeProvider
+)
 from capito.core.ui.decorators import bind_to_host
 from capito.core.ui.constants import *
 
@@ -181,15 +183,15 @@ class CategorizedModulesListWidget(QListWidget):
                 )
                 type_item.setIcon(QIcon(f"icons:{mod_category.lower()}.svg"))
                 self.addItem(type_item)
-                for mod in provider.list_filtered_modules(
+                for info in provider.list_filtered_modules(
                     categories=[mod_category], hosts=[host]
                 ):
-                    class_instance = mod[1]
                     item = QListWidgetItem()
-                    item.setText(f"        {class_instance.label}")
+                    item.setText(f"        {info.label}")
+                    item.setToolTip(info.doc)
                     item.setBackgroundColor(QColor(40, 40, 40))
                     # item.setBackgroundColor(PipeColors.get(mod_type, PipeColors["default"]))
-                    item.setData(Qt.UserRole, class_instance)
+                    item.setData(Qt.UserRole, info)
                     self.addItem(item)
 
     def mousePressEvent(self, event):  # pylint: disable=invalid-name
@@ -275,6 +277,10 @@ class PipeManager(QMainWindow):
         play_button.setIcon(QIcon("icons:play.svg"))
         play_button.clicked.connect(self.play)
         hbox.addWidget(play_button)
+        save_report_button = QPushButton("Save Report")
+        save_report_button.setIcon(QIcon("icons:save.svg"))
+        save_report_button.clicked.connect(self.save_report)
+        hbox.addWidget(save_report_button)
 
         self.edit_layout_container = QVBoxLayout()
         self.edit_layout = QVBoxLayout()
@@ -340,6 +346,15 @@ class PipeManager(QMainWindow):
         self.create_playlist()
         self.player.save(Path(filename[0]))
 
+    def save_report(self):
+        """Save the report of the last play as json file."""
+        filename = QFileDialog.getSaveFileName(
+            self, "Save Report as", filter="JSON (*.json)"
+        )
+        if not filename[0]:
+            return
+        self.player.report.save(Path(filename[0]))
+
     def load_edit_layout(self):
         """Gets called if playlist item is selected to change the edit layout."""
         self.clear_edit_layout()
@@ -432,10 +447,14 @@ class PipeManager(QMainWindow):
     def add_modules(self, selected_items):
         """Called from the AddModulesWindow with one or more or zero."""
         for selected_item in selected_items:
+            try:
+                pipeable_instance = self.provider.get_instance(
+                    selected_item.data(Qt.UserRole).name
+                )
+            except PipeableLoadError as error:
+                print(error.diagnostic)
+                continue
             item = QListWidgetItem()
-            pipeable_instance = self.provider.get_instance(
-                selected_item.data(Qt.UserRole).name
-            )
             item.setData(Qt.UserRole, pipeable_instance)
             item.setBackground(
                 PipeColors.get(pipeable_instance.category, PipeColors["default"])
@@ -462,6 +481,10 @@ class PipeManager(QMainWindow):
         """Update the icons while playing the PipeablePlayer playlist."""
         for item in self.module_list_widget.iterAllItems():
             if item.data(Qt.UserRole) is current_item:
+                item.setToolTip(
+                    f"{current_item.duration:.3f}s, {current_item.item_count} item(s), "
+                    f"{current_item.cached_count} cached"
+                )
                 if current_item.failed:
                     if current_item.stop_on_failed:
                         item.setIcon(QIcon("icons:failed.svg"))
@@ -474,3 +497,4 @@ class PipeManager(QMainWindow):
         """Reset all icons to 'neutral'."""
         for item in self.module_list_widget.iterAllItems():
             item.setIcon(QIcon("icons:pending.svg"))
+            item.setToolTip("")
@@ -0,0 +1,273 @@
+"""
+Binary library of NURBS curve shapes (rig icons, curve font glyphs),
+independent of Maya.
+
+A library file holds any number of entries (eg. one per icon or glyph).
+Each entry is a JSON-like structure in which every curve
+{"cvs": [[x, y, z], ...], "knots": [...], "degree": d, ...} has its
+cvs and knots packed as float64 arrays. An index at the start of the
+file lists the entries with their position and a small info dict
+(eg. the tooltip of an icon or the width of a glyph), so opening a
+library only reads the index and every entry is read on first access.
+
+File layout:
+    header: magic, version, size of the index
+    index: JSON {"entries": [[key, offset, meta size, data size, info], ...],
+                 "source": sha1 of the converted source file}
+    entries: JSON structure (cvs and knots replaced by their counts),
+             followed by the packed floats of all its curves
+
+Convert the sources of the tools with:
+    python -m capito.core.shapelib icons capito/maya/rig/RigIcons/icons.json capito/maya/rig/RigIcons/icons.shapes
+    python -m capito.core.shapelib font capito/maya/geo/curve_fonts/INPUT.py capito/maya/geo/curve_fonts/INPUT.shapes
+"""
+import argparse
+import ast
+from array import array
+import hashlib
+import json
+from pathlib import Path
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+MAGIC = b"CSHL"
+VERSION = 1
+# magic, version, index size
+HEADER = struct.Struct("<4sHxxI")
+
+
+class ShapeLibraryError(Exception):
+    pass
+
+
+def _is_curve(value: Any) -> bool:
+    return isinstance(value, dict) and "cvs" in value and "knots" in value
+
+
+def _iter_curves(value: Any) -> Iterator[dict]:
+    """All curve dicts in value, depth first in the order they are stored."""
+    if _is_curve(value):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_curves(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_curves(item)
+
+
+def _strip_curves(value: Any) -> Any:
+    """A copy of value with the cvs and knots of all curves replaced by their counts."""
+    if _is_curve(value):
+        stripped = dict(value)
+        stripped["cvs"] = len(value["cvs"])
+        stripped["knots"] = len(value["knots"])
+        return stripped
+    if isinstance(value, dict):
+        return {key: _strip_curves(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_strip_curves(item) for item in value]
+    return value
+
+
+def pack_entry(entry: Any) -> Tuple[bytes, bytes]:
+    """(meta, data) of an entry: its structure as JSON and the floats of its curves."""
+    floats = array("d")
+    for curve in _iter_curves(entry):
+        for cv in curve["cvs"]:
+            if len(cv) != 3:
+                raise ShapeLibraryError(f"cv with {len(cv)} coordinates: {cv}")
+            floats.extend(cv)
+        floats.extend(curve["knots"])
+    if sys.byteorder != "little":
+        floats.byteswap()
+    meta = json.dumps(_strip_curves(entry), separators=(",", ":")).encode("utf8")
+    return meta, floats.tobytes()
+
+
+def unpack_entry(meta: bytes, data: bytes) -> Any:
+    floats = array("d")
+    floats.frombytes(data)
+    if sys.byteorder != "little":
+        floats.byteswap()
+    entry = json.loads(meta.decode("utf8"))
+    position = 0
+    for curve in _iter_curves(entry):
+        num_cvs, num_knots = curve["cvs"], curve["knots"]
+        end = position + num_cvs * 3
+        if end + num_knots > len(floats):
+            raise ShapeLibraryError("entry data is truncated")
+        curve["cvs"] = [floats[i:i + 3].tolist() for i in range(position, end, 3)]
+        curve["knots"] = floats[end:end + num_knots].tolist()
+        position = end + num_knots
+    return entry
+
+
+def source_hash(path: Union[str, Path]) -> str:
+    """SHA-1 of the file with normalized line endings, so a checkout
+    with CRLF line endings still matches the shipped libraries."""
+    return hashlib.sha1(Path(path).read_bytes().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def write_library(
+    path: Union[str, Path],
+    entries: Dict[str, Any],
+    info: Dict[str, dict] = None,
+    source: str = None,
+):
+    """Write entries {key: entry} (in their order) with an optional info dict per key.
+    source is the hash of the file the entries were converted from."""
+    info = info or {}
+    packed = [(key, *pack_entry(entry)) for key, entry in entries.items()]
+    index_entries = []
+    offset = 0
+    for key, meta, data in packed:
+        index_entries.append([key, offset, len(meta), len(data), info.get(key, {})])
+        offset += len(meta) + len(data)
+    # offsets are relative to the end of the index, which depends on their length
+    index = json.dumps(
+        {"entries": index_entries, "source": source}, separators=(",", ":")
+    ).encode("utf8")
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".part")
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for _, meta, data in packed:
+            f.write(meta)
+            f.write(data)
+    temp_path.replace(path)
+
+
+class ShapeLibrary:
+    """Read access to a library file. Only the index is read on creation,
+    entries are read and unpacked on first access and cached.
+
+    lib = ShapeLibrary("icons.shapes")
+    lib.keys()          # in the order they were written
+    lib.info("circle")  # the info dict of an entry
+    lib["circle"]       # the entry, lib[3] is the fourth entry
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) != HEADER.size:
+                raise ShapeLibraryError(f"not a shape library: {self.path}")
+            magic, version, index_size = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ShapeLibraryError(f"not a shape library: {self.path}")
+            if version > VERSION:
+                raise ShapeLibraryError(f"unsupported shape library version {version}: {self.path}")
+            index = json.loads(f.read(index_size).decode("utf8"))
+        self.source: Optional[str] = index.get("source")
+        self._data_start = HEADER.size + index_size
+        self._keys: List[str] = [e[0] for e in index["entries"]]
+        self._index: Dict[str, list] = {e[0]: e for e in index["entries"]}
+        self._cache: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def _key(self, key: Union[str, int]) -> str:
+        return self._keys[key] if isinstance(key, int) else key
+
+    def info(self, key: Union[str, int]) -> dict:
+        return self._index[self._key(key)][4]
+
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        key = self._key(key)
+        if key not in self._cache:
+            _, offset, meta_size, data_size, _ = self._index[key]
+            with open(self.path, "rb") as f:
+                f.seek(self._data_start + offset)
+                meta = f.read(meta_size)
+                data = f.read(data_size)
+            if len(data) != data_size:
+                raise ShapeLibraryError(f"{self.path} is truncated")
+            self._cache[key] = unpack_entry(meta, data)
+        return self._cache[key]
+
+    def get(self, key: Union[str, int], default: Any = None) -> Any:
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+
+def load_library(library_path: Union[str, Path], source_path: Union[str, Path] = None) -> Optional[ShapeLibrary]:
+    """The library at library_path, None if it does not exist, is unreadable
+    or was not converted from the current state of source_path."""
+    try:
+        library = ShapeLibrary(library_path)
+        if source_path is not None and Path(source_path).is_file():
+            if library.source != source_hash(source_path):
+                return None
+        return library
+    except (OSError, ValueError, ShapeLibraryError):
+        return None
+
+
+ICON_INFO_KEYS = ("name", "tooltip", "thumbnail")
+
+
+def convert_rig_icons(json_path: Union[str, Path], library_path: Union[str, Path]):
+    """Convert a RigIcons icons.json, keyed by icon name.
+    The name, tooltip and thumbnail of the icons are in the index."""
+    icons = json.loads(Path(json_path).read_text(encoding="utf8"))
+    entries = {icon["name"]: icon for icon in icons}
+    if len(entries) != len(icons):
+        raise ShapeLibraryError(f"icon names in {json_path} are not unique")
+    info = {icon["name"]: {k: icon.get(k) for k in ICON_INFO_KEYS} for icon in icons}
+    write_library(library_path, entries, info, source_hash(json_path))
+
+
+def read_font_source(py_path: Union[str, Path]) -> Dict[str, List[dict]]:
+    """The glyph dict {character: [curve, ...]} of a curve font python file
+    (a module with a single dict literal), without importing it."""
+    tree = ast.parse(Path(py_path).read_text(encoding="utf8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict):
+            return ast.literal_eval(node.value)
+    raise ShapeLibraryError(f"no font dict in {py_path}")
+
+
+def glyph_width(curves: List[dict]) -> float:
+    """Highest x of the cvs of a glyph."""
+    return max((cv[0] for curve in curves for cv in curve["cvs"]), default=0.0)
+
+
+def convert_curve_font(py_path: Union[str, Path], library_path: Union[str, Path]):
+    """Convert a curve font, keyed by character, with the width of each glyph in the index."""
+    glyphs = read_font_source(py_path)
+    info = {char: {"width": glyph_width(curves)} for char, curves in glyphs.items()}
+    write_library(library_path, glyphs, info, source_hash(py_path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert curve shape sources to shape libraries.")
+    parser.add_argument("kind", choices=["icons", "font"], help="RigIcons json or curve font py file")
+    parser.add_argument("source", type=str)
+    parser.add_argument("target", type=str)
+    args = parser.parse_args()
+    if args.kind == "icons":
+        convert_rig_icons(args.source, args.target)
+    else:
+        convert_curve_font(args.source, args.target)
+    library = ShapeLibrary(args.target)
+    print(f"Wrote {len(library)} entries to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
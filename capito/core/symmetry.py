@@ -0,0 +1,217 @@
+"""Positional mirror maps of point clouds (mesh vertices), independent of Maya.
+
+mirror_map() finds for every point the index of the point at its mirrored
+position (within tolerance) with a grid hash: the points are sorted by their
+grid cell, mirrored points look up their own cell (which resolves almost all
+points of a symmetric mesh in one vectorised pass) and, if that fails, the
+8 cells around them that could hold a point within tolerance.
+Points on the mirror plane map to themselves. Points without a partner
+(eg. after an asymmetric sculpt) can be matched by topology from their
+matched neighbours (topological_fill).
+
+Needs numpy (part of mayapy since Maya 2022).
+"""
+import hashlib
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+AXES = {"x": 0, "y": 1, "z": 2}
+UNMATCHED = -1
+
+_cache: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+CACHE_SIZE = 16
+
+
+def _cell_keys(cells: np.ndarray, origin: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    """One int64 key per 3d cell index."""
+    c = cells - origin
+    return (c[:, 0] * dims[1] + c[:, 1]) * dims[2] + c[:, 2]
+
+
+def _search(sorted_keys, order, sorted_points, keys, queries, tolerance, best, best_dist):
+    """Update best/best_dist with the points in the cells of keys."""
+    # sorted lookups are many times faster than random ones
+    key_order = np.argsort(keys)
+    ordered_keys = keys[key_order]
+    left = np.empty_like(keys)
+    right = np.empty_like(keys)
+    left[key_order] = np.searchsorted(sorted_keys, ordered_keys, side="left")
+    right[key_order] = np.searchsorted(sorted_keys, ordered_keys, side="right")
+    counts = right - left
+    for k in range(int(counts.max(initial=0))):
+        hit = np.nonzero(counts > k)[0]
+        candidates = left[hit] + k
+        dist = np.einsum("ij,ij->i", sorted_points[candidates] - queries[hit], sorted_points[candidates] - queries[hit])
+        better = (dist <= tolerance * tolerance) & (dist < best_dist[hit])
+        best[hit[better]] = order[candidates[better]]
+        best_dist[hit[better]] = dist[better]
+
+
+def mirror_map(
+    points: Sequence[Sequence[float]],
+    axis: str = "x",
+    tolerance: float = 0.001,
+    mid_tolerance: float = None,
+) -> np.ndarray:
+    """Index of the mirrored point for every point, UNMATCHED (-1) if none.
+    points: N x 3 (or N x 4, eg. from MFnMesh.getPoints).
+    Points closer than mid_tolerance (default: tolerance) to the mirror
+    plane map to themselves."""
+    points = np.asarray(points, dtype=np.float64)[:, :3]
+    axis_index = AXES[axis] if isinstance(axis, str) else int(axis)
+    mid_tolerance = tolerance if mid_tolerance is None else mid_tolerance
+    count = len(points)
+    result = np.full(count, UNMATCHED, dtype=np.int64)
+    if not count:
+        return result
+
+    mirrored = points.copy()
+    mirrored[:, axis_index] *= -1
+    cell_size = 2.0 * tolerance
+    # cells are centered on multiples of cell_size, where snapped points lie
+    cells = np.floor(points / cell_size + 0.5).astype(np.int64)
+    query_cells = np.floor(mirrored / cell_size + 0.5).astype(np.int64)
+    origin = np.minimum(cells.min(axis=0), query_cells.min(axis=0)) - 1
+    dims = np.maximum(cells.max(axis=0), query_cells.max(axis=0)) - origin + 2
+    keys = _cell_keys(cells, origin, dims)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    sorted_points = points[order]
+
+    best = result
+    best_dist = np.full(count, np.inf)
+    # the own cell of the mirrored position first: this is where the partner usually is
+    _search(sorted_keys, order, sorted_points, _cell_keys(query_cells, origin, dims),
+            mirrored, tolerance, best, best_dist)
+    # a partner within tolerance may lie in a neighbour cell on the near side of each axis
+    open_queries = np.nonzero(best == UNMATCHED)[0]
+    if len(open_queries):
+        queries = mirrored[open_queries]
+        base = query_cells[open_queries]
+        near = np.where(queries / cell_size + 0.5 - base >= 0.5, 1, -1)
+        sub_best = np.full(len(open_queries), UNMATCHED, dtype=np.int64)
+        sub_dist = np.full(len(open_queries), np.inf)
+        for dx in (0, 1):
+            for dy in (0, 1):
+                for dz in (0, 1):
+                    if not (dx or dy or dz):
+                        continue
+                    neighbour = base + near * np.array([dx, dy, dz])
+                    _search(sorted_keys, order, sorted_points, _cell_keys(neighbour, origin, dims),
+                            queries, tolerance, sub_best, sub_dist)
+        best[open_queries] = sub_best
+
+    mid = np.abs(points[:, axis_index]) <= mid_tolerance
+    best[mid] = np.nonzero(mid)[0]
+    # only keep pairs that agree from both sides
+    matched = best != UNMATCHED
+    agree = np.zeros(count, dtype=bool)
+    agree[matched] = best[best[matched]] == np.nonzero(matched)[0]
+    best[~agree] = UNMATCHED
+    return best
+
+
+def _adjacency(count: int, face_counts: Sequence[int], face_vertices: Sequence[int]):
+    """CSR neighbour lists (offsets, neighbours) from per face vertex lists."""
+    face_counts = np.asarray(face_counts, dtype=np.int64)
+    face_vertices = np.asarray(face_vertices, dtype=np.int64)
+    starts = np.repeat(np.cumsum(face_counts) - face_counts, face_counts)
+    positions = np.arange(len(face_vertices))
+    next_positions = positions + 1
+    face_ends = starts + np.repeat(face_counts, face_counts)
+    next_positions[next_positions == face_ends] = starts[next_positions == face_ends]
+    a, b = face_vertices, face_vertices[next_positions]
+    edges = np.concatenate([a * count + b, b * count + a])
+    edges.sort()
+    edges = edges[np.concatenate([[True], edges[1:] != edges[:-1]])]
+    offsets = np.searchsorted(edges // count, np.arange(count + 1))
+    return offsets, edges % count
+
+
+def topological_fill(
+    mapping: np.ndarray, face_counts: Sequence[int], face_vertices: Sequence[int]
+) -> np.ndarray:
+    """Match unmatched points by topology: the partner of a point is the
+    only unmatched point adjacent to the partners of all its matched neighbours.
+    Matches spread from the border into asymmetric regions."""
+    if not (mapping == UNMATCHED).any():
+        return mapping.copy()
+    offsets, neighbours = _adjacency(len(mapping), face_counts, face_vertices)
+    offsets, neighbours = offsets.tolist(), neighbours.tolist()
+    mapping_list = mapping.tolist()
+
+    def adjacent(vertex):
+        return neighbours[offsets[vertex]:offsets[vertex + 1]]
+
+    # a point can be decided once one of its neighbours got a partner
+    queue = deque(np.nonzero(mapping == UNMATCHED)[0].tolist())
+    while queue:
+        vertex = queue.popleft()
+        if mapping_list[vertex] != UNMATCHED:
+            continue
+        mirrored_neighbours = [mapping_list[n] for n in adjacent(vertex) if mapping_list[n] != UNMATCHED]
+        if not mirrored_neighbours:
+            continue
+        candidates = None
+        for mirrored in mirrored_neighbours:
+            around = {c for c in adjacent(mirrored) if mapping_list[c] == UNMATCHED}
+            candidates = around if candidates is None else candidates & around
+        if len(candidates) != 1:
+            continue
+        partner = candidates.pop()
+        mapping_list[vertex], mapping_list[partner] = partner, vertex
+        queue.extend(adjacent(vertex))
+        queue.extend(adjacent(partner))
+    return np.array(mapping_list, dtype=np.int64)
+
+
+def topology_hash(face_counts: Sequence[int], face_vertices: Sequence[int]) -> str:
+    sha = hashlib.sha1(np.asarray(face_counts, dtype=np.int32).tobytes())
+    sha.update(np.asarray(face_vertices, dtype=np.int32).tobytes())
+    return sha.hexdigest()
+
+
+def points_hash(points: Sequence[Sequence[float]]) -> str:
+    return hashlib.sha1(np.ascontiguousarray(points, dtype=np.float64).tobytes()).hexdigest()
+
+
+def cached_mirror_map(
+    points: Sequence[Sequence[float]],
+    face_counts: Sequence[int] = None,
+    face_vertices: Sequence[int] = None,
+    axis: str = "x",
+    tolerance: float = 0.001,
+    mid_tolerance: float = None,
+    topological: bool = True,
+    topology: Optional[str] = None,
+) -> np.ndarray:
+    """mirror_map (plus topological_fill if faces are given and topological),
+    cached per topology (hash of the faces, or the given topology key) and
+    points, so a moved or reshaped mesh gets a new map.
+    Don't modify the returned array."""
+    if topology is None and face_counts is not None:
+        topology = topology_hash(face_counts, face_vertices)
+    key = (topology, points_hash(points), axis, tolerance, mid_tolerance, topological)
+    if topology is not None and key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+    mapping = mirror_map(points, axis, tolerance, mid_tolerance)
+    if topological and face_counts is not None:
+        mapping = topological_fill(mapping, face_counts, face_vertices)
+    if topology is not None:
+        _cache[key] = mapping
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return mapping
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def as_dict(mapping: np.ndarray) -> Dict[int, int]:
+    """{index: mirrored index} of the matched points."""
+    matched = np.nonzero(mapping != UNMATCHED)[0]
+    return dict(zip(matched.tolist(), mapping[matched].tolist()))
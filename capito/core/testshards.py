@@ -0,0 +1,467 @@
+"""
+Run a unittest suite split into shards in parallel processes.
+
+The tests are distributed over the shards by their duration in earlier runs
+(longest first, each to the shard with the least work so far). Every shard
+process runs its tests and appends a JSON record to its report as each test
+finishes, so a crashing shard only loses the tests it did not get to. The
+reports are merged into one JSON and/or JUnit XML report, and the measured
+durations are saved for the next run.
+
+Nothing in here needs Maya: capito.maya.test.mayaunittest runs the shards
+in mayapy, plain unittest suites can be run with the default worker command:
+    python -m capito.core.testshards <test directory> --processes 4 --junit report.xml
+"""
+import argparse
+from dataclasses import asdict, dataclass, field
+import heapq
+import json
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+import unittest
+import xml.etree.ElementTree as ET
+
+# weight of the latest run in the saved durations, older runs make up the rest
+TIMING_WEIGHT = 0.5
+FAILED_OUTCOMES = ("failure", "error", "unexpectedSuccess")
+# name of the placeholder unittest reports errors of class and module fixtures for
+FIXTURE_ID = re.compile(r"^(setUpClass|tearDownClass|setUpModule|tearDownModule) \((.+)\)$")
+
+
+@dataclass
+class TestRecord:
+    __test__ = False  # not a test class for pytest
+
+    id: str
+    outcome: str  # success, failure, error, skipped, expectedFailure, unexpectedSuccess
+    duration: float = 0.0
+    message: str = ""
+    shard: int = 0
+
+
+@dataclass
+class ShardInfo:
+    index: int
+    tests: List[str]
+    expected_duration: float = 0.0
+    duration: float = 0.0
+    exit_code: Optional[int] = None
+
+
+@dataclass
+class Report:
+    records: List[TestRecord] = field(default_factory=list)
+    shards: List[ShardInfo] = field(default_factory=list)
+    duration: float = 0.0  # wall clock time of the whole run
+
+    def count(self, outcome: str) -> int:
+        return sum(1 for r in self.records if r.outcome == outcome)
+
+    @property
+    def successful(self) -> bool:
+        return not any(r.outcome in FAILED_OUTCOMES for r in self.records)
+
+    def summary(self) -> Dict[str, int]:
+        outcomes = {}
+        for record in self.records:
+            outcomes[record.outcome] = outcomes.get(record.outcome, 0) + 1
+        return outcomes
+
+
+def iter_tests(suite: unittest.TestSuite) -> Iterable[unittest.TestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test
+
+
+def test_ids(suite: unittest.TestSuite) -> List[str]:
+    return [test.id() for test in iter_tests(suite)]
+
+
+def load_timings(path: str) -> Dict[str, float]:
+    try:
+        with open(path) as f:
+            return {k: float(v) for k, v in json.load(f).items()}
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def update_timings(path: str, records: Iterable[TestRecord]):
+    """Blend the durations of records into the timings saved at path."""
+    timings = load_timings(path)
+    for record in records:
+        if record.outcome == "skipped":
+            continue
+        old = timings.get(record.id)
+        timings[record.id] = (
+            record.duration
+            if old is None
+            else TIMING_WEIGHT * record.duration + (1 - TIMING_WEIGHT) * old
+        )
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    temp_path = f"{path}.part"
+    with open(temp_path, "w") as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def expected_duration(test_id: str, timings: Dict[str, float], default: float) -> float:
+    if test_id in timings:
+        return timings[test_id]
+    # a new test of a known test case probably takes as long as its siblings
+    case = test_id.rpartition(".")[0]
+    siblings = [t for k, t in timings.items() if k.rpartition(".")[0] == case]
+    return sum(siblings) / len(siblings) if siblings else default
+
+
+def split_tests(
+    ids: Sequence[str], timings: Dict[str, float], num_shards: int, default: float = None
+) -> List[ShardInfo]:
+    """Distribute ids over at most num_shards shards with about equal duration.
+    Unknown tests are assumed to take default (the median known duration if None).
+    The tests of a shard keep their original order."""
+    num_shards = max(1, min(num_shards, len(ids)))
+    if default is None:
+        known = sorted(timings.values())
+        default = known[len(known) // 2] if known else 1.0
+    durations = {test_id: expected_duration(test_id, timings, default) for test_id in ids}
+    shards = [ShardInfo(i, []) for i in range(num_shards)]
+    heap = [(0.0, i) for i in range(num_shards)]
+    order = {test_id: i for i, test_id in enumerate(ids)}
+    for test_id in sorted(ids, key=lambda t: (-durations[t], order[t])):
+        load, index = heapq.heappop(heap)
+        shards[index].tests.append(test_id)
+        shards[index].expected_duration = load + durations[test_id]
+        heapq.heappush(heap, (shards[index].expected_duration, index))
+    for shard in shards:
+        shard.tests.sort(key=order.get)
+    return [shard for shard in shards if shard.tests]
+
+
+class RecordingResultMixin:
+    """Mixin for unittest.TestResult classes that records outcome and duration of every test.
+
+    With a report_file every record is appended to it as soon as the test finished, so the
+    records survive a crash of the process. Errors of setUpClass/setUpModule are recorded
+    for the tests of the class/module that could not run, errors of
+    tearDownClass/tearDownModule for its last test (if the ids of the tests are known).
+    """
+
+    tests: Sequence[str] = ()
+    report_file: Optional[str] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records: List[TestRecord] = []
+        self._recorded: Dict[str, int] = {}
+        self._started: Dict[str, float] = {}
+        self._outcomes: Dict[str, tuple] = {}
+
+    def startTest(self, test):
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def _add_record(self, record: TestRecord):
+        index = self._recorded.get(record.id)
+        if index is None:
+            self._recorded[record.id] = len(self.records)
+            self.records.append(record)
+        else:
+            record = self.records[index] = merge_records(self.records[index], record)
+        if self.report_file:
+            with open(self.report_file, "a") as f:
+                f.write(json.dumps(asdict(record)) + "\n")
+
+    def _fixture_tests(self, test) -> List[str]:
+        """Ids of the tests affected by an error of a class or module fixture,
+        reported for a placeholder named eg. "setUpClass (test_module.TestCase)"."""
+        match = FIXTURE_ID.match(test.id())
+        if not match:
+            return []
+        prefix = match.group(2) + "."
+        tests = [t for t in self.tests if t.startswith(prefix)]
+        if match.group(1).startswith("setUp"):
+            return [t for t in tests if t not in self._recorded]
+        return [t for t in tests if t in self._recorded][-1:]
+
+    def _record_outcome(self, test, outcome, message=""):
+        if test.id() not in self._started:
+            # an error of a fixture, reported without startTest/stopTest
+            for test_id in self._fixture_tests(test) or [test.id()]:
+                self._add_record(TestRecord(test_id, outcome, 0.0, message))
+            return
+        # the worst outcome of a test (and its subtests) counts
+        if self._outcomes.get(test.id(), ("success",))[0] in ("success", "skipped"):
+            self._outcomes[test.id()] = (outcome, message)
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._outcomes.setdefault(test.id(), ("success", ""))
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record_outcome(test, "failure", self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record_outcome(test, "error", self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record_outcome(test, "skipped", reason)
+
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            outcome = "failure" if issubclass(err[0], test.failureException) else "error"
+            self._record_outcome(test, outcome, self._exc_info_to_string(err, test))
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record_outcome(test, "expectedFailure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record_outcome(test, "unexpectedSuccess")
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        start = self._started.pop(test.id(), None)
+        duration = time.perf_counter() - start if start is not None else 0.0
+        outcome, message = self._outcomes.pop(test.id(), ("success", ""))
+        self._add_record(TestRecord(test.id(), outcome, duration, message))
+
+
+class RecordingTestResult(RecordingResultMixin, unittest.TextTestResult):
+    pass
+
+
+class ShardTestRunner(unittest.TextTestRunner):
+    """TextTestRunner that passes the test ids and the report file of a shard
+    to its result (a RecordingResultMixin)."""
+
+    def __init__(self, tests: Sequence[str], report_file: str, **kwargs):
+        super().__init__(**kwargs)
+        self.tests = tests
+        self.report_file = report_file
+
+    def _makeResult(self):
+        result = super()._makeResult()
+        result.tests = self.tests
+        result.report_file = self.report_file
+        return result
+
+
+def merge_records(old: TestRecord, new: TestRecord) -> TestRecord:
+    """A record of the same test reported again (eg. for a failed tearDownClass)
+    fails the test if it failed, its message is added."""
+    outcome = new.outcome if new.outcome in FAILED_OUTCOMES and old.outcome not in FAILED_OUTCOMES else old.outcome
+    message = "\n".join(m for m in (old.message, new.message) if m)
+    return TestRecord(old.id, outcome, old.duration + new.duration, message, old.shard)
+
+
+def read_shard_report(path: str, shard: int) -> Optional[List[TestRecord]]:
+    """The records of a shard report (one JSON record per line, the last one of a test counts)."""
+    try:
+        with open(path) as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    records = {}
+    for line in lines:
+        try:
+            record = TestRecord(**dict(json.loads(line), shard=shard))
+        except (ValueError, TypeError):
+            continue  # cut off by a crash
+        records[record.id] = record
+    return list(records.values())
+
+
+def run_shard(
+    ids_file: str,
+    report_file: str,
+    result_class: type = RecordingTestResult,
+    verbosity: int = 1,
+    buffer: bool = False,
+) -> bool:
+    """Run the tests listed in ids_file (written by ShardedRunner) in this process,
+    their records are appended to report_file as they finish."""
+    with open(ids_file) as f:
+        shard = json.load(f)
+    for directory in reversed(shard["directories"]):
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+    open(report_file, "w").close()
+    suite = unittest.TestLoader().loadTestsFromNames(shard["tests"])
+    runner = ShardTestRunner(
+        shard["tests"], report_file, verbosity=verbosity, resultclass=result_class, buffer=buffer
+    )
+    return runner.run(suite).wasSuccessful()
+
+
+def default_worker_command(ids_file: str, report_file: str) -> List[str]:
+    return [sys.executable, "-m", "capito.core.testshards", "--worker", ids_file, report_file]
+
+
+class ShardedRunner:
+    """Runs tests in num_processes parallel processes.
+
+    worker_command(ids_file, report_file) returns the command line of a
+    process that runs the tests listed in ids_file and writes the report
+    (see run_shard). directories are added to sys.path by the workers so
+    the test ids can be imported.
+    """
+
+    def __init__(
+        self,
+        num_processes: int = None,
+        timings_file: str = None,
+        worker_command: Callable[[str, str], List[str]] = default_worker_command,
+        work_dir: str = None,
+        env: Dict[str, str] = None,
+    ):
+        self.num_processes = num_processes or os.cpu_count() or 1
+        self.timings_file = timings_file
+        self.worker_command = worker_command
+        self.work_dir = work_dir
+        self.env = env
+
+    def run(self, ids: Sequence[str], directories: Sequence[str] = ()) -> Report:
+        timings = load_timings(self.timings_file) if self.timings_file else {}
+        report = Report(shards=split_tests(ids, timings, self.num_processes))
+        work_dir = self.work_dir or tempfile.mkdtemp(prefix="testshards_")
+        os.makedirs(work_dir, exist_ok=True)
+        start = time.perf_counter()
+        processes = []
+        for shard in report.shards:
+            ids_file = os.path.join(work_dir, f"shard_{shard.index}.json")
+            report_file = os.path.join(work_dir, f"shard_{shard.index}_report.json")
+            log_file = os.path.join(work_dir, f"shard_{shard.index}.log")
+            with open(ids_file, "w") as f:
+                json.dump({"directories": list(directories), "tests": shard.tests}, f)
+            with open(log_file, "w") as log:
+                process = subprocess.Popen(
+                    self.worker_command(ids_file, report_file),
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    env=self.env,
+                )
+            processes.append((shard, process, report_file, log_file, time.perf_counter()))
+
+        measured = []
+        for shard, process, report_file, log_file, shard_start in processes:
+            shard.exit_code = process.wait()
+            shard.duration = time.perf_counter() - shard_start
+            records = read_shard_report(report_file, shard.index) or []
+            measured.extend(r for r in records if r.id in shard.tests)
+            # tests the shard did not get to (eg. it crashed) count as errors
+            ran = {r.id for r in records}
+            message = f"not run, shard {shard.index} exited with code {shard.exit_code}, see {log_file}"
+            records += [TestRecord(t, "error", 0.0, message, shard.index) for t in shard.tests if t not in ran]
+            report.records.extend(records)
+        report.duration = time.perf_counter() - start
+
+        if self.timings_file:
+            update_timings(self.timings_file, measured)
+        return report
+
+
+def write_json_report(path: str, report: Report):
+    data = {
+        "duration": report.duration,
+        "summary": report.summary(),
+        "shards": [asdict(s) for s in report.shards],
+        "tests": [asdict(r) for r in report.records],
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+
+
+def write_junit_report(path: str, report: Report, name: str = "tests"):
+    failures = report.count("failure") + report.count("unexpectedSuccess")
+    root = ET.Element(
+        "testsuites",
+        name=name,
+        tests=str(len(report.records)),
+        failures=str(failures),
+        errors=str(report.count("error")),
+        time=f"{report.duration:.3f}",
+    )
+    for shard in report.shards:
+        records = [r for r in report.records if r.shard == shard.index]
+        suite = ET.SubElement(
+            root,
+            "testsuite",
+            name=f"{name}.shard{shard.index}",
+            tests=str(len(records)),
+            failures=str(sum(r.outcome in ("failure", "unexpectedSuccess") for r in records)),
+            errors=str(sum(r.outcome == "error" for r in records)),
+            skipped=str(sum(r.outcome == "skipped" for r in records)),
+            time=f"{shard.duration:.3f}",
+        )
+        for record in records:
+            classname, _, test_name = record.id.rpartition(".")
+            case = ET.SubElement(
+                suite, "testcase", classname=classname, name=test_name, time=f"{record.duration:.3f}"
+            )
+            if record.outcome in ("failure", "unexpectedSuccess"):
+                element = ET.SubElement(case, "failure", message=record.message.splitlines()[-1] if record.message else record.outcome)
+                element.text = record.message
+            elif record.outcome == "error":
+                element = ET.SubElement(case, "error", message=record.message.splitlines()[-1] if record.message else "error")
+                element.text = record.message
+            elif record.outcome == "skipped":
+                ET.SubElement(case, "skipped", message=record.message)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def print_summary(report: Report, stream=None):
+    stream = stream or sys.stdout
+    for record in report.records:
+        if record.outcome in FAILED_OUTCOMES:
+            stream.write(f"{record.outcome.upper()}: {record.id} (shard {record.shard})\n{record.message}\n")
+    for shard in report.shards:
+        stream.write(
+            f"Shard {shard.index}: {len(shard.tests)} tests in {shard.duration:.1f}s "
+            f"(expected {shard.expected_duration:.1f}s), exit code {shard.exit_code}\n"
+        )
+    outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(report.summary().items()))
+    stream.write(f"Ran {len(report.records)} tests in {report.duration:.1f}s ({outcomes})\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run unittest suites in parallel shards.")
+    parser.add_argument("directories", nargs="*", help="Directories to discover tests in.")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--timings", default=None, help="JSON file with the durations of earlier runs.")
+    parser.add_argument("--json", default=None, help="Write a JSON report.")
+    parser.add_argument("--junit", default=None, help="Write a JUnit XML report.")
+    parser.add_argument("--worker", nargs=2, metavar=("IDS_FILE", "REPORT_FILE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        sys.exit(0 if run_shard(*args.worker) else 1)
+
+    directories = [os.path.abspath(d) for d in args.directories or ["."]]
+    suite = unittest.TestSuite()
+    for directory in directories:
+        suite.addTests(unittest.TestLoader().discover(directory))
+    report = ShardedRunner(args.processes, args.timings).run(test_ids(suite), directories)
+    print_summary(report)
+    if args.json:
+        write_json_report(args.json, report)
+    if args.junit:
+        write_junit_report(args.junit, report)
+    sys.exit(0 if report.successful else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Deformer weights as contiguous arrays, independent of Maya.
+
+Weights holds the indices (eg. vertex ids) and their weights as two numpy
+arrays, sorted by index. Thresholding, mirroring with a symmetry map
+(capito.core.symmetry) and remapping to other indices work on the whole
+arrays at once, instead of one {index: weight} dict entry at a time.
+
+Weights can be saved to a small binary file (zlib compressed index deltas
+and float32 weights) and loaded onto another rig with the same topology.
+
+Needs numpy (part of mayapy since Maya 2022).
+"""
+from dataclasses import dataclass
+from pathlib import Path
+import struct
+from typing import Dict, Mapping, Sequence, Union
+import zlib
+
+import numpy as np
+
+from capito.core.symmetry import UNMATCHED
+
+FILE_MAGIC = b"CWGT"
+FILE_VERSION = 1
+# magic, version, number of weights, point count of the mesh (0 if unknown)
+FILE_HEADER = struct.Struct("<4sHxxII")
+
+
+@dataclass
+class Weights:
+    indices: np.ndarray
+    values: np.ndarray
+    point_count: int = 0  # of the mesh the weights belong to, 0 if unknown
+
+    def __post_init__(self):
+        self.indices = np.asarray(self.indices, dtype=np.int64).reshape(-1)
+        self.values = np.asarray(self.values, dtype=np.float32).reshape(-1)
+        if len(self.indices) != len(self.values):
+            raise ValueError(f"{len(self.indices)} indices but {len(self.values)} weights")
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @classmethod
+    def from_pairs(cls, indices: Sequence[int], values: Sequence[float], point_count: int = 0) -> "Weights":
+        """Sorted by index; of duplicate indices the highest weight is kept."""
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        values = np.asarray(values, dtype=np.float32).reshape(-1)
+        # sort by index, then by weight: the last of equal indices has the highest weight
+        order = np.lexsort((values, indices))
+        indices, values = indices[order], values[order]
+        last = np.ones(len(indices), dtype=bool)
+        last[:-1] = indices[1:] != indices[:-1]
+        return cls(indices[last], values[last], point_count)
+
+    @classmethod
+    def from_dict(cls, weight_dict: Mapping[int, float], point_count: int = 0) -> "Weights":
+        return cls.from_pairs(
+            np.fromiter(weight_dict.keys(), dtype=np.int64, count=len(weight_dict)),
+            np.fromiter(weight_dict.values(), dtype=np.float32, count=len(weight_dict)),
+            point_count,
+        )
+
+    @classmethod
+    def from_dense(cls, values: Sequence[float], threshold: float = 0.0) -> "Weights":
+        """From one weight per point, keeping the weights above threshold."""
+        values = np.asarray(values, dtype=np.float32).reshape(-1)
+        indices = np.nonzero(values > threshold)[0]
+        return cls(indices, values[indices], len(values))
+
+    def to_dict(self) -> Dict[int, float]:
+        return dict(zip(self.indices.tolist(), self.values.tolist()))
+
+    def dense(self, count: int = None, default: float = 0.0) -> np.ndarray:
+        """One weight per point (count defaults to point_count or the highest index + 1)."""
+        if count is None:
+            count = self.point_count or (int(self.indices.max()) + 1 if len(self) else 0)
+        result = np.full(count, default, dtype=np.float32)
+        inside = self.indices < count
+        result[self.indices[inside]] = self.values[inside]
+        return result
+
+    def threshold(self, min_weight: float) -> "Weights":
+        """Only the weights above min_weight."""
+        keep = self.values > min_weight
+        return Weights(self.indices[keep], self.values[keep], self.point_count)
+
+    def remap(self, index_map: Sequence[int], keep_unmatched: bool = False) -> "Weights":
+        """Move the weight of index i to index_map[i].
+        Weights of indices mapped to UNMATCHED (-1) are dropped or,
+        with keep_unmatched, stay where they are."""
+        index_map = np.asarray(index_map, dtype=np.int64)
+        if len(self) and self.indices.max() >= len(index_map):
+            raise ValueError(f"index {self.indices.max()} is not in the map of {len(index_map)} points")
+        targets = index_map[self.indices]
+        unmatched = targets == UNMATCHED
+        if keep_unmatched:
+            targets = np.where(unmatched, self.indices, targets)
+            return Weights.from_pairs(targets, self.values, self.point_count)
+        return Weights.from_pairs(targets[~unmatched], self.values[~unmatched], self.point_count)
+
+    def mirror(self, symmetry_map: Sequence[int]) -> "Weights":
+        """Weights moved to the mirrored points (capito.core.symmetry.mirror_map).
+        Points without a partner keep their weight."""
+        return self.remap(symmetry_map, keep_unmatched=True)
+
+    def peak(self) -> int:
+        """Index with the highest weight."""
+        if not len(self):
+            raise ValueError("no weights")
+        return int(self.indices[np.argmax(self.values)])
+
+    def to_bytes(self) -> bytes:
+        deltas = np.diff(self.indices, prepend=0).astype(np.uint32)
+        payload = deltas.tobytes() + self.values.astype("<f4").tobytes()
+        header = FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, len(self), self.point_count)
+        return header + zlib.compress(payload)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Weights":
+        if len(data) < FILE_HEADER.size:
+            raise ValueError("not a weights file")
+        magic, version, count, point_count = FILE_HEADER.unpack_from(data)
+        if magic != FILE_MAGIC:
+            raise ValueError("not a weights file")
+        if version > FILE_VERSION:
+            raise ValueError(f"unsupported weights file version {version}")
+        payload = zlib.decompress(data[FILE_HEADER.size:])
+        if len(payload) != count * 8:
+            raise ValueError("corrupt weights file")
+        deltas = np.frombuffer(payload, dtype="<u4", count=count)
+        values = np.frombuffer(payload, dtype="<f4", count=count, offset=count * 4)
+        return cls(np.cumsum(deltas, dtype=np.int64), values, point_count)
+
+    def save(self, path: Union[str, Path]):
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Weights":
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def as_weights(weights: Union["Weights", Mapping[int, float]]) -> Weights:
+    """Weights from Weights or an {index: weight} dict."""
+    if isinstance(weights, Weights):
+        return weights
+    return Weights.from_dict(weights)
@@ -0,0 +1,428 @@
+"""Pool of long-lived worker processes pulling work units from a shared queue.
+
+The scheduling (WorkPool) is independent of how workers are run:
+every worker is reached through a WorkerChannel. ProcessChannel talks to a
+subprocess (eg. a mayapy that opened a scene once) via json lines on its
+stdin/stdout, the worker side of which is worker_loop(). LocalChannel runs
+a handler in-process, for tests with fake workers or a single process mode.
+
+Idle workers take the next unit from the queue, so a slow unit only delays
+itself. Failed units are retried (on any worker) up to max_attempts times,
+crashed worker processes are restarted. The number of workers can be
+changed while running (resize), eg. by a ConcurrencyController.
+"""
+import itertools
+import json
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+PROTOCOL_PREFIX = "@capito-workpool "
+
+
+@dataclass
+class WorkUnit:
+    """A piece of work. payload is sent to the worker as json."""
+
+    id: int
+    payload: Dict[str, Any]
+    weight: int = 1  # eg. number of frames, for the progress
+    attempts: int = 0
+    status: str = "pending"  # pending, running, done, failed
+    worker: Optional[int] = None
+    duration: float = 0.0
+    result: Optional[Dict[str, Any]] = None
+    errors: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Progress:
+    """Aggregated progress of a WorkPool, in units and weight."""
+
+    total: int = 0
+    total_weight: int = 0
+    done: int = 0
+    done_weight: int = 0
+    failed: int = 0
+    running: int = 0
+    retries: int = 0
+    workers: int = 0
+    start_time: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        return self.done + self.failed == self.total
+
+    @property
+    def fraction(self) -> float:
+        return self.done_weight / self.total_weight if self.total_weight else 1.0
+
+    def eta(self) -> Optional[float]:
+        """Estimated seconds until all units are done (None if unknown)."""
+        if not self.done_weight:
+            return None
+        elapsed = time.time() - self.start_time
+        return elapsed / self.done_weight * (self.total_weight - self.done_weight)
+
+    def as_text(self) -> str:
+        eta = self.eta()
+        eta_text = f", ~{eta:.0f}s left" if eta is not None and not self.finished else ""
+        return (
+            f"{self.done_weight}/{self.total_weight} ({self.fraction:.0%}) done, "
+            f"{self.running} running, {self.failed} failed, {self.retries} retried, "
+            f"{self.workers} worker(s){eta_text}"
+        )
+
+
+class WorkerChannel:
+    """Connection to one worker. receive() blocks and returns None if the worker died."""
+
+    def send(self, message: Dict[str, Any]):
+        raise NotImplementedError
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    @property
+    def pid(self) -> Optional[int]:
+        """Process id of the worker, None if it runs in this process."""
+        return None
+
+
+class LocalChannel(WorkerChannel):
+    """Runs handler(payload) -> result dict in the calling thread."""
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        self.handler = handler
+        self._pending: Deque[Dict[str, Any]] = deque([{"type": "ready"}])
+
+    def send(self, message: Dict[str, Any]):
+        if message["type"] == "unit":
+            self._pending.append(_handle(self.handler, message))
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        return self._pending.popleft() if self._pending else None
+
+
+class ProcessChannel(WorkerChannel):
+    """Worker subprocess speaking the worker_loop() protocol.
+    Output lines that are not protocol messages are passed to output_callback.
+    """
+
+    def __init__(self, command: List[str], output_callback: Callable[[str], None] = None, **popen_kwargs):
+        self.output_callback = output_callback
+        self.process = subprocess.Popen(
+            [str(c) for c in command],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            **popen_kwargs,
+        )
+
+    def send(self, message: Dict[str, Any]):
+        try:
+            self.process.stdin.write(json.dumps(message) + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            pass  # the worker died, receive() will tell
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        for line in self.process.stdout:
+            if line.startswith(PROTOCOL_PREFIX):
+                return json.loads(line[len(PROTOCOL_PREFIX):])
+            if self.output_callback is not None:
+                self.output_callback(line.rstrip("\n"))
+        self.process.wait()
+        return None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def close(self):
+        self.send({"type": "stop"})
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+
+
+def _handle(handler: Callable, message: Dict[str, Any]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    try:
+        result = handler(message["payload"])
+        reply = {"type": "result", "id": message["id"], "ok": True, "result": result}
+    except Exception as error:  # reported back to the pool, which may retry
+        reply = {
+            "type": "result", "id": message["id"], "ok": False,
+            "error": f"{type(error).__name__}: {error}",
+            "traceback": traceback.format_exc(),
+        }
+    reply["duration"] = time.perf_counter() - start
+    return reply
+
+
+def worker_loop(handler: Callable[[Dict[str, Any]], Dict[str, Any]], stdin=None, stdout=None):
+    """Serve work units to handler until the pool stops us.
+    To be called by the worker script after its (expensive) setup.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    def reply(message):
+        stdout.write(PROTOCOL_PREFIX + json.dumps(message) + "\n")
+        stdout.flush()
+
+    reply({"type": "ready"})
+    for line in stdin:
+        if not line.strip():
+            continue
+        message = json.loads(line)
+        if message["type"] == "stop":
+            break
+        reply(_handle(handler, message))
+
+
+class WorkPool:
+    """Runs WorkUnits on num_workers workers created by channel_factory(worker_index).
+
+    Callbacks (lists, like BGTask):
+      unit_callbacks(unit) after a unit is done or finally failed,
+      progress_callbacks(progress) after every change,
+      finish_callbacks(units) once all units are through.
+    Callbacks run in the worker threads.
+    """
+
+    def __init__(
+        self,
+        channel_factory: Callable[[int], WorkerChannel],
+        num_workers: int,
+        max_attempts: int = 3,
+        max_restarts: int = 2,
+    ):
+        self.channel_factory = channel_factory
+        self.num_workers = max(1, num_workers)
+        self.max_attempts = max_attempts
+        self.max_restarts = max_restarts
+        self.units: List[WorkUnit] = []
+        self.progress = Progress()
+        self.unit_callbacks: List[Callable[[WorkUnit], None]] = []
+        self.progress_callbacks: List[Callable[[Progress], None]] = []
+        self.finish_callbacks: List[Callable[[List[WorkUnit]], None]] = []
+        self._queue: Deque[WorkUnit] = deque()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._channels: Dict[int, WorkerChannel] = {}
+        self._indices = itertools.count()
+        self._retiring = 0
+        self._cancelled = False
+        self._finished = threading.Event()
+
+    def add(self, payload: Dict[str, Any], weight: int = 1) -> WorkUnit:
+        """Queue a unit, before or while the pool runs."""
+        with self._condition:
+            unit = WorkUnit(id=len(self.units), payload=payload, weight=weight)
+            self.units.append(unit)
+            self._queue.append(unit)
+            self.progress.total += 1
+            self.progress.total_weight += weight
+            self._finished.clear()
+            self._condition.notify()
+        return unit
+
+    def start(self):
+        """Start the worker threads and return immediately."""
+        self.progress.start_time = time.time()
+        if not self._queue:
+            self._check_finished()
+            return
+        self._spawn()
+
+    def resize(self, num_workers: int):
+        """Change the number of workers while running.
+        Surplus workers stop after their current unit."""
+        with self._condition:
+            self.num_workers = max(1, num_workers)
+        if self._threads:
+            self._spawn()
+
+    def worker_pids(self) -> List[int]:
+        """Process ids of the running workers (for resource sampling)."""
+        with self._condition:
+            return [c.pid for c in self._channels.values() if c.pid is not None]
+
+    def _spawn(self):
+        """Start threads up to num_workers, as long as there is work for them."""
+        with self._condition:
+            active = self.progress.workers - self._retiring
+            num_threads = min(self.num_workers - active, len(self._queue))
+            if num_threads <= 0:
+                return
+            self.progress.workers += num_threads
+            indices = [next(self._indices) for _ in range(num_threads)]
+        for index in indices:
+            thread = threading.Thread(target=self._work, args=(index,), daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until all units are through. False on timeout."""
+        return self._finished.wait(timeout)
+
+    def run(self) -> List[WorkUnit]:
+        """Run all units and block until they are through."""
+        self.start()
+        self.wait()
+        return self.units
+
+    def cancel(self):
+        """Fail all pending units; running units are still completed."""
+        with self._condition:
+            self._cancelled = True
+            failed = [self._fail(self._queue.popleft(), "cancelled") for _ in range(len(self._queue))]
+            self._condition.notify_all()
+        for unit in failed:
+            self._notify_unit(unit)
+        self._check_finished()
+
+    def failed_units(self) -> List[WorkUnit]:
+        return [unit for unit in self.units if unit.status == "failed"]
+
+    def _retire(self) -> bool:
+        """True if this worker is surplus after a resize and should stop."""
+        with self._condition:
+            if self.progress.workers - self._retiring > self.num_workers:
+                self._retiring += 1
+                return True
+            return False
+
+    def _next_unit(self) -> Optional[WorkUnit]:
+        """The next pending unit; None once nothing is pending or running anymore."""
+        with self._condition:
+            while True:
+                if self._queue:
+                    unit = self._queue.popleft()
+                    unit.status = "running"
+                    unit.attempts += 1
+                    self.progress.running += 1
+                    return unit
+                if self._cancelled or not self.progress.running:
+                    self._condition.notify_all()
+                    return None
+                # a running unit may still fail and come back
+                self._condition.wait()
+
+    def _fail(self, unit: WorkUnit, error: str) -> WorkUnit:
+        """Mark a unit failed, with the lock held. Notify (without the lock) after."""
+        unit.status = "failed"
+        unit.errors.append(error)
+        self.progress.failed += 1
+        return unit
+
+    def _notify_unit(self, unit: WorkUnit):
+        for callback in self.unit_callbacks:
+            callback(unit)
+        for callback in self.progress_callbacks:
+            callback(self.progress)
+
+    def _finish_unit(self, unit: WorkUnit, reply: Optional[Dict[str, Any]]):
+        with self._condition:
+            self.progress.running -= 1
+            unit.duration += reply.get("duration", 0.0) if reply else 0.0
+            if reply is not None and reply.get("ok"):
+                unit.status = "done"
+                unit.result = reply.get("result")
+                self.progress.done += 1
+                self.progress.done_weight += unit.weight
+                finished_unit = unit
+            else:
+                error = reply.get("error", "unknown error") if reply else "worker died"
+                unit.errors.append(error)
+                if unit.attempts < self.max_attempts and not self._cancelled:
+                    unit.status = "pending"
+                    self.progress.retries += 1
+                    self._queue.append(unit)
+                    finished_unit = None
+                else:
+                    unit.status = "failed"
+                    self.progress.failed += 1
+                    finished_unit = unit
+            self._condition.notify_all()
+        if finished_unit is not None:
+            self._notify_unit(finished_unit)
+        else:
+            for callback in self.progress_callbacks:
+                callback(self.progress)
+
+    def _open_channel(self, index: int) -> Optional[WorkerChannel]:
+        channel = self.channel_factory(index)
+        with self._condition:
+            self._channels[index] = channel
+        ready = channel.receive()
+        if ready is None or ready.get("type") != "ready":
+            channel.close()
+            return None
+        return channel
+
+    def _work(self, index: int):
+        restarts = 0
+        channel = None
+        retired = False
+        failed = []
+        try:
+            while True:
+                if channel is None:
+                    if restarts > self.max_restarts:
+                        break
+                    channel = self._open_channel(index)
+                    if channel is None:
+                        restarts += 1
+                        continue
+                retired = self._retire()
+                unit = None if retired else self._next_unit()
+                if unit is None:
+                    break
+                unit.worker = index
+                channel.send({"type": "unit", "id": unit.id, "payload": unit.payload})
+                reply = channel.receive()
+                if reply is None:
+                    channel.close()
+                    channel = None
+                    restarts += 1
+                self._finish_unit(unit, reply)
+        finally:
+            if channel is not None:
+                channel.close()
+            with self._condition:
+                self._channels.pop(index, None)
+                self.progress.workers -= 1
+                if retired:
+                    self._retiring -= 1
+                last_worker = not self.progress.workers
+                if last_worker:
+                    # nobody left to work on what is still queued
+                    while self._queue:
+                        failed.append(self._fail(self._queue.popleft(), "no worker left"))
+            for unit in failed:
+                self._notify_unit(unit)
+            self._check_finished()
+
+    def _check_finished(self):
+        with self._condition:
+            if not self.progress.finished or self._finished.is_set():
+                return
+            self._finished.set()
+        for callback in self.finish_callbacks:
+            callback(self.units)
@@ -9,6 +9,13 @@ WORKSPACE_PATH=$7
 
 touch $STATUS/PUSHING
 
+# a streaming export still commits scene and job files: push what is there,
+# the next cycle pushes again until the export is done
+EXPORTING=0
+if [ -e $STATUS/EXPORTING ] && [ ! -e $STATUS/ALL_FILES_EXPORTED ]; then
+    EXPORTING=1
+fi
+
 NOW=$( date '+%F_%H-%M-%S' )
 if [ -e $IPC/rsync/pushlog_dryrun.log ]; then
     mv $IPC/rsync/pushlog_dryrun.log "$IPC/rsync/pushlog_dryrun_$NOW.log"
@@ -18,6 +25,7 @@ if [ -e $IPC/rsync/pushlog.log ]; then
 fi 
 
 rsync -ar --ignore-missing-args \
+      --exclude='*.part' \
       --files-from=$IPC/rsync/files_to_push.txt \
       --dry-run \
       --itemize-changes \
@@ -26,13 +34,16 @@ rsync -ar --ignore-missing-args \
       >> $IPC/rsync/pushlog_dryrun.log
 
 rsync -ar --ignore-missing-args \
+      --exclude='*.part' \
       --files-from=$IPC/rsync/files_to_push.txt \
       --log-file=$IPC/rsync/pushlog.log \
       $MOUNT_POINT \
       $HLRS_REMOTE_PATH
 
 if [ $? -eq 0 ]; then
-    touch $STATUS/ALL_FILES_PUSHED
+    if [ $EXPORTING -eq 0 ]; then
+        touch $STATUS/ALL_FILES_PUSHED
+    fi
     touch $STATUS/READY_TO_RENDER
 fi
 
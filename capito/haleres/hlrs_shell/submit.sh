@@ -10,6 +10,8 @@ PBS_ID_DIR="${IPC_DIR}/pbs_ids"
 SUBMIT_LOG_FILE="${IPC_DIR}/submit.log"
 ALL_JOBS_SUBMITTED="${STATUS_DIR}/ALL_JOBS_SUBMITTED"
 READY_TO_RENDER="${STATUS_DIR}/READY_TO_RENDER"
+EXPORTING="${STATUS_DIR}/EXPORTING"
+ALL_FILES_EXPORTED="${STATUS_DIR}/ALL_FILES_EXPORTED"
 
 STREAMS="${IPC_DIR}/streams"
 OUT_STREAM="${STREAMS}/out"
@@ -77,6 +79,11 @@ done
 NUM_JOBS_SUBMITTED=$(find $SUBMITTED_DIR/* | wc -l)
 NUMBER_OF_JOBS=$(find $JOBS_DIR/* | wc -l)
 
+# a streaming export may still add job files
+if [ -e $EXPORTING ] && [ ! -e $ALL_FILES_EXPORTED ]; then
+    exit 0
+fi
+
 if [ $NUM_JOBS_SUBMITTED == $NUMBER_OF_JOBS ]; then
     echo "DONE: $NUMBER_OF_JOBS JOB FILES SUBMITTED." >> $SUBMIT_LOG_FILE
     touch $ALL_JOBS_SUBMITTED
@@ -4,12 +4,18 @@ import json
 from pathlib import Path
 import platform
 import shutil
-from typing import List
+from typing import List, Tuple
 
+from capito.core.file.images import check_images
 from capito.haleres.settings import Settings
 from capito.haleres.utils import count_lines, create_frame_tuple_list, replace
 from capito.haleres.renderer import Renderer
 
+# files being written into the packet; excluded from the push (see push_single.sh)
+PART_SUFFIX = ".part"
+# an image found corrupt this often after pulling is corrupt at HLRS too: it is not pulled again
+MAX_CORRUPT_PULLS = 2
+
 
 class JobStatus(Enum):
     ready_to_push = "READY_TO_PUSH"
@@ -26,6 +32,8 @@ class JobStatus(Enum):
     flagged_for_deletion = "FLAGGED_FOR_DELETION"
     deleted = "DELETED"
     aborted = "ABORTED"
+    exporting = "EXPORTING"
+    all_files_exported = "ALL_FILES_EXPORTED"
 
 
 class Job:
@@ -52,6 +60,7 @@ class Job:
         "stream_out": "ipc/streams/out",
         "stream_err": "ipc/streams/err",
         "pbs_ids": "ipc/pbs_ids",
+        "images_corrupt": "output/images_corrupt",
     }
     # Altering job_folders dict may break backwards compatibility!
     
@@ -146,7 +155,8 @@ class Job:
 
     @property
     def scene_files(self):
-        return list((self.jobfolder / self.job_folders["scenes"]).glob("*"))
+        scenes = (self.jobfolder / self.job_folders["scenes"]).glob("*")
+        return [f for f in scenes if f.suffix != PART_SUFFIX]
 
     def save_renderer_config(self):
         if not self._renderer:
@@ -225,19 +235,28 @@ class Job:
             with open(str(job_file), mode="w", encoding="UTF-8", newline="\n") as jf:
                 jf.write(per_job_string)
     
-    def write_job_files(self) -> None:
+    def write_job_files(self, frame_tuples: List[Tuple[int, int]] = None) -> None:
         """write the jobfiles.sh for PBS Rendering at HLRS
+        Only for the given (start, end) tuples of the jobsize split, if given
+        (eg. for the chunks committed so far while the export is streaming).
         TODO: untangle responsibilities of self.renderer and this function
         """
         per_job_string = ""
         replacement_dict = self._get_replacement_dict()  # --> 'rpd' prefix below
-        scene_files = self.scene_files
+        scene_files = sorted(self.scene_files)
         framelist = self.framelist
         tuple_list = create_frame_tuple_list(framelist, self.jobsize)
+        if frame_tuples is not None:
+            frame_tuples = set(frame_tuples)
+            tuple_list = [t for t in tuple_list if t in frame_tuples]
+        # scene files of single frame renderers ("name_layer.0001.ass") by
+        # (name_layer, frame), as a streaming export only committed some so far
+        frame_scene_files = {}
+        for scene_file in scene_files:
+            layer = scene_file.stem[:-(self.frame_padding+1)]
+            frame_scene_files[(layer, scene_file.stem[-self.frame_padding:])] = scene_file
+        layers = sorted({layer for layer, _ in frame_scene_files})
 
-        job_texts = []
-
-        i = 0
         for start, end in tuple_list:
             per_frame_list = []
             pre_render = []
@@ -258,10 +277,20 @@ class Job:
 
                 if self.renderer.single_frame_renderer:
                     # Hacky. Maybe better overall design could fix this
-                    per_frame_rpd["scenefile_name"] = scene_files[i].name
-                    per_frame_rpd["jobfile_name"] = scene_files[i].stem
-                    per_frame_rpd["image_name"] = scene_files[i].stem
-                    render_commands.append(replace(self.renderer.get_render_command(), per_frame_rpd))
+                    # one render command per layer
+                    for layer in layers:
+                        scene_file = frame_scene_files.get((layer, padded_frame_number))
+                        if scene_file is None:
+                            raise FileNotFoundError(
+                                f"No scene file of {layer} for frame {padded_frame_number} in {self.get_folder('scenes')}"
+                            )
+                        per_frame_rpd["scenefile_name"] = scene_file.name
+                        per_frame_rpd["jobfile_name"] = scene_file.stem
+                        per_frame_rpd["image_name"] = scene_file.stem
+                        render_commands.append(replace(self.renderer.get_render_command(), per_frame_rpd))
+                        if layer != image_name:
+                            (Path(self.get_folder("images_expected")) / scene_file.stem).touch()
+                    per_frame_rpd["image_name"] = image_name
                 # local:
                 (Path(self.get_folder("images_expected")) / f"{image_name}.{padded_frame_number}").touch()
                 # for multiple expected images per render command (output drivers):
@@ -272,7 +301,6 @@ class Job:
                     per_frame_rpd["image_name"] = img
                     pre_render.append(replace(self.renderer.pre_render_template, per_frame_rpd))
                     post_render.append(replace(self.renderer.post_render_template, per_frame_rpd))                                
-                i += 1
             
             if not self.renderer.single_frame_renderer:
                 batch_rdp = {
@@ -310,9 +338,29 @@ class Job:
             per_job_string = self.renderer.get_per_job_string()
             jobfile_text = replace(per_job_string, combined_rdp)
 
+            # the submit may pick up job files any time, so they appear complete:
             job_file = self.get_folder("jobs") / f"{combined_rdp['jobfile_name']}.sh"
-            with open(str(job_file), mode="w", encoding="UTF-8", newline="\n") as jf:
+            part_file = job_file.with_name(job_file.name + PART_SUFFIX)
+            with open(str(part_file), mode="w", encoding="UTF-8", newline="\n") as jf:
                 jf.write(jobfile_text)
+            part_file.replace(job_file)
+        self._num_jobs = None
+
+    def commit_scene_files(self, files: List[Path]) -> List[Path]:
+        """Move exported files into the scenes folder of the packet.
+        Files are copied under a temporary name (not pushed) and renamed,
+        so a push running meanwhile only ever sees complete scene files.
+        """
+        scenes = self.get_folder("scenes")
+        committed = []
+        for file in map(Path, files):
+            target = scenes / file.name
+            part_file = scenes / (file.name + PART_SUFFIX)
+            shutil.copyfile(str(file), str(part_file))
+            part_file.replace(target)
+            file.unlink()
+            committed.append(target)
+        return committed
 
     def create_rsync_push_file(self) -> None:
         """Write a linux & rsync compatible file for rsync --files_from flag."""
@@ -355,6 +403,8 @@ class Job:
         status, color = "Unknown", "333333"
         if self.get_status(JobStatus.ready_to_push):
             status, color = "Pending", "224466"
+        if self.is_exporting():
+            status, color = "Exporting", "6a4f9c"
         if self.get_status(JobStatus.pushing):
             status, color = "Pushing", "ca7828"
         if self.get_status(JobStatus.ready_to_render):
@@ -417,6 +467,19 @@ class Job:
     def set_ready_to_push(self, ready:bool):
         self.set_status(JobStatus.ready_to_push, ready)
 
+    def is_exporting(self):
+        """True while the scene files of a streaming export are still being committed.
+        Status files are never deleted remotely, so the end of the export
+        is marked by a second status instead of removing EXPORTING."""
+        return self.get_status(JobStatus.exporting) and not self.get_status(JobStatus.all_files_exported)
+
+    def set_exporting(self, exporting:bool):
+        if exporting:
+            self.set_status(JobStatus.all_files_exported, False)
+            self.set_status(JobStatus.exporting, True)
+        else:
+            self.set_status(JobStatus.all_files_exported, True)
+
     def set_deleted(self):
         self.set_status(JobStatus.deleted, True)
     
@@ -446,8 +509,10 @@ class Job:
         remote_images = [
             img for img in list(self.get_folder("images_rendered").glob("*"))
         ]
+        corrupt = self._load_image_checks()["corrupt"]
         files_to_pull = [
-            f"{self.get_relative_path('images')}/{img.name}" for img in remote_images if img.stem not in local_images
+            f"{self.get_relative_path('images')}/{img.name}" for img in remote_images
+            if img.stem not in local_images and corrupt.get(img.stem, 0) < MAX_CORRUPT_PULLS
         ]
         files_to_pull.append(self.get_relative_path("logs"))
         return files_to_pull
@@ -458,6 +523,43 @@ class Job:
 
     def resubmit_missing_frames(self):
         self._purge_folder("jobs")
+        # rerendered images are pulled again
+        checks = self._load_image_checks()
+        checks["corrupt"] = {}
+        self._save_image_checks(checks)
+
+    def verify_pulled_images(self) -> List[Path]:
+        """Check the headers of the pulled images that were not checked yet.
+        Truncated or corrupt images are moved to output/images_corrupt,
+        so they count as missing and get pulled (or rendered) again.
+        Returns the moved images."""
+        checks = self._load_image_checks()
+        verified = checks["verified"]
+        to_check = []
+        for image in self.get_folder("images").glob("*"):
+            if image.name.startswith("."):
+                continue  # rsync's temporary file of an ongoing pull
+            with contextlib.suppress(FileNotFoundError):
+                stat = image.stat()
+                if verified.get(image.name) != [stat.st_size, stat.st_mtime_ns]:
+                    to_check.append((image, [stat.st_size, stat.st_mtime_ns]))
+        if not to_check:
+            return []
+
+        corrupt_folder = self.get_folder("images_corrupt")
+        corrupt_folder.mkdir(parents=True, exist_ok=True)
+        moved = []
+        for (image, key), check in zip(to_check, check_images([str(i) for i, _ in to_check])):
+            if check.ok:
+                verified[image.name] = key
+                continue
+            print(f"Corrupt image {image.name}: {check.error}")
+            verified.pop(image.name, None)
+            checks["corrupt"][image.stem] = checks["corrupt"].get(image.stem, 0) + 1
+            image.replace(corrupt_folder / image.name)
+            moved.append(corrupt_folder / image.name)
+        self._save_image_checks(checks)
+        return moved
 
     def are_files_to_pull(self):
         num_local_images = len(list(self.get_folder("images").glob("*")))
@@ -465,7 +567,10 @@ class Job:
         return num_local_images < num_remote_images
     
     def update_status(self):
-        if self.is_ready_to_render() and (self.num_expected_renders() == self.num_pulled()):
+        if self.is_ready_to_render() and not self.is_finished():
+            self.verify_pulled_images()
+        # while exporting, more images will be expected
+        if self.is_ready_to_render() and not self.is_exporting() and (self.num_expected_renders() == self.num_pulled()):
             self.set_status(JobStatus.all_files_pulled, True)
             self.set_status(JobStatus.finished, True)
 
@@ -541,6 +646,18 @@ class Job:
         """Number of already pulled images."""
         return sum(1 for _ in self.get_folder('images').glob("*"))
 
+    def _load_image_checks(self) -> dict:
+        """Results of verify_pulled_images: verified images {name: [size, mtime]}
+        and how often an image was found corrupt {stem: count}."""
+        checks_file = self.get_folder("ipc") / "image_checks.json"
+        if checks_file.exists():
+            return json.loads(checks_file.read_text())
+        return {"verified": {}, "corrupt": {}}
+
+    def _save_image_checks(self, checks: dict):
+        checks_file = self.get_folder("ipc") / "image_checks.json"
+        checks_file.write_text(json.dumps(checks))
+
     def _purge_folder(self, folder:str):
         if self.job_folders.get(folder, False):
             for file in self.get_folder(folder).glob("*"):
@@ -1,8 +1,11 @@
 from maya.api import OpenMaya as om
 from random import uniform
+import numpy as np
 import pymel.core as pc
 from collections import Counter
 
+from capito.core import symmetry
+
 
 def pole_counter(shape:pc.nodetypes.Mesh):
     """Returns a Counter object listing how many verts with a certain number of
@@ -110,19 +113,33 @@ def set_unrenderable(shapes):
                 shp.setAttr(attr, 0)
 
 
-def get_symmetry_dict_slow(shape):
-    sym_status = pc.symmetricModelling(q=True, symmetry=True)
-    pc.symmetricModelling(symmetry=True)
-    sym_dict = {}
-    for i in range(shape.numVertices()):
-        pc.select(shape.vtx[i], symmetry=True)
-        pair = [v.index() for v in pc.selected()]
-        if len(pair) == 1:
-            sym_dict[i] = i
-        else:
-            sym_dict[i] = [v for v in pair if v != i][0]
-    pc.symmetricModelling(symmetry=sym_status)
-    return sym_dict
+def get_mesh_arrays(mesh, space="object"):
+    """Points (N x 3 array), face vertex counts and face vertex indices of a mesh."""
+    mSel = om.MSelectionList()
+    mSel.add(str(mesh))
+    fn = om.MFnMesh(mSel.getDagPath(0))
+    points = fn.getPoints(om.MSpace.kWorld if space == "world" else om.MSpace.kObject)
+    face_counts, face_vertices = fn.getVertices()
+    return (
+        np.array(points, dtype=np.float64).reshape(-1, 4)[:, :3],
+        np.array(face_counts, dtype=np.int64),
+        np.array(face_vertices, dtype=np.int64),
+    )
+
+
+def get_symmetry_map(mesh, axis="x", tolerance=0.001, mid_tolerance=0.005, topological=True, space="object"):
+    """Array with the index of the symmetric vertex for every vertex of mesh
+    (symmetry.UNMATCHED if there is none). Vertices which have no positional
+    partner get one by topology if topological is set.
+    The points are mirrored in object space by default, so the mesh may be
+    moved off the origin.
+    Cached per topology and points, see capito.core.symmetry.
+    """
+    points, face_counts, face_vertices = get_mesh_arrays(mesh, space)
+    return symmetry.cached_mirror_map(
+        points, face_counts, face_vertices,
+        axis=axis, tolerance=tolerance, mid_tolerance=mid_tolerance, topological=topological,
+    )
 
 
 def get_symmetry_dict(transform, mid_tolerance=0.005):
@@ -132,59 +149,9 @@ def get_symmetry_dict(transform, mid_tolerance=0.005):
 
     It will also work with topological symmetry.
     """
-    # For the function to work symmetry in the viewport must be turned on
-    sym_status = pc.symmetricModelling(q=True, symmetry=True)
-    pc.symmetricModelling(symmetry=True)
-    # converting selected object into MObject and MFnMesh functionset
-    mSel = om.MSelectionList()
-    mSel.add(transform.name())
-    mObj = mSel.getDagPath(0)
-    mfnMesh = om.MFnMesh(mObj)
-    baseShape = mfnMesh.getPoints()  # getting our basePoints
-    # this function can be used to revert the object back to the baseShape
-    mfnMesh.setPoints(baseShape)
-    # getting l and r verts
-    mid_tolerance = 0.005  # this will be our mid tolerance, if the mesh is not completely symmetric on the mid
-    lVerts = []  # for storing left Verts
-    corrVerts = {}  # for storing correspondign verts
-
-    for i in range(mfnMesh.numVertices):  # iteratign through all the verts on the mesh
-        thisPoint = mfnMesh.getPoint(i)  # getting current point position
-        if thisPoint.x > mid_tolerance:  # if pointValue on x axis is bigger than midTolerance
-            # append to left vert storage list(i = vert index, thisPoint = vert Mpoint position)
-            lVerts.append((i, thisPoint))
-        elif not thisPoint.x < -mid_tolerance:
-            # these are the symmetry-edge-verts
-            corrVerts[i] = i
-
-    # selecting our verts with symmetry on
-    pc.select(["%s.vtx[%s]" % (mObj, i) for i, v in lVerts], sym=True)
-    # getting the rich selection. it will store the symmetry iformation for us
-    mRichBase = om.MGlobal.getRichSelection()
-    # this will store our lSide verts as an MSelectionList
-    lCor = mRichBase.getSelection()
-    rCor = mRichBase.getSymmetry()  # this will symmetry verts as an MSelectionList
-    # creating iterative lists so we can get the components
-    mitL = om.MItSelectionList(lCor)
-    mitR = om.MItSelectionList(rCor)
-
-    while not mitL.isDone():  # iterating through the left list
-        mitLComp = mitL.getComponent()  # getting dag path and components of leftside
-        mitRComp = mitR.getComponent()  # getting dag path and components of rightside
-        # creating our iterative vertex lists
-        mitLCorVert = om.MItMeshVertex(mitLComp[0], mitLComp[1])
-        mitRCorVert = om.MItMeshVertex(mitRComp[0], mitRComp[1])
-
-        while not mitLCorVert.isDone():  # iterating through our verts
-            # adding corresponding verts to our dictionary
-            corrVerts[mitLCorVert.index()] = mitRCorVert.index()
-            corrVerts[mitRCorVert.index()] = mitLCorVert.index()
-            mitLCorVert.next()  # go to nextb vert. needed to stop loop
-            mitRCorVert.next()  # go to next vert. needed to stop loop
-        mitL.next()  # go to next selection in list if more. needed to stop loop
-        mitR.next()  # go to next selection in list if more. needed to stop loop
-    pc.select(cl=1)  # deseleting our verts
-    
-    #now the corrVerts will have stored the corresponding vertices from left to right
-    pc.symmetricModelling(symmetry=sym_status)
-    return corrVerts
+    return symmetry.as_dict(get_symmetry_map(transform, mid_tolerance=mid_tolerance))
+
+
+def get_symmetry_dict_slow(shape):
+    """Kept for compatibility, same as get_symmetry_dict."""
+    return get_symmetry_dict(shape)
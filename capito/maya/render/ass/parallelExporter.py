@@ -1,58 +1,47 @@
-import shutil
+"""Background mayapy worker for parallel_ass_export (see tools.py).
+Opens the scene once, then exports the work units it gets from the pool:
+{"layer": render layer name, "start": first frame, "end": last frame}
+"""
 import sys
 from pathlib import Path
 
+file_to_open = sys.argv[1]
+worker_export_dir = Path(sys.argv[2])
+job_name = sys.argv[3]
+job_share = sys.argv[4]
+capito_base_dir = sys.argv[5]
+
+sys.path.append(capito_base_dir)
+
 import pymel.core as pc
 
-file_to_open = sys.argv[1]
-startframe = int(sys.argv[2])
-endframe = int(sys.argv[3])
-rl_names = sys.argv[4].split(",")
-temp_export_dir = sys.argv[5]
-job_name = sys.argv[6]
-job_share = sys.argv[7]
-temp_status_dir = Path(sys.argv[8])
-num_exports_total = int(sys.argv[9])
-capito_base_dir = sys.argv[10]
-haleres_settings_file = sys.argv[11]
+from capito.core.workpool import worker_loop
 
 pc.openFile(file_to_open, force=True)
-render_layers = [l for l in pc.ls(type='renderLayer') if l.name() in rl_names]
+render_layers = {l.name(): l for l in pc.ls(type='renderLayer')}
 # set images dir in case of additional arnold output drivers:
 pc.workspace.fileRules["images"] = f"{job_share}/hlrs/{job_name}/output/images"
-# first export the specified frames...
-for rl in render_layers:
-    rl.setCurrent()
+
+
+def _file_times():
+    return {f: f.stat().st_mtime_ns for f in worker_export_dir.glob("*")}
+
+
+def export(unit: dict) -> dict:
+    """Export the frames of one unit, return the written files."""
+    layer = render_layers[unit["layer"]]
+    if pc.nodetypes.RenderLayer.currentLayer() != layer:
+        layer.setCurrent()
+    before = _file_times()
     pc.other.arnoldExportAss(
-        f=f"{temp_export_dir}/{job_name}_<RenderLayer>.ass",
-        startFrame=startframe, endFrame=endframe,
+        f=f"{worker_export_dir}/{job_name}_<RenderLayer>.ass",
+        startFrame=unit["start"], endFrame=unit["end"],
         preserveReferences=True
     )
-    for i in range(startframe, endframe + 1):
-        (temp_status_dir / f"{job_name}_{rl.name()}_{i}").touch()
-
-# ...then only if all images have been written
-# copy them back in one go to reduce network bandwidth competition
-if num_exports_total == len(list(temp_status_dir.glob("*"))):
-    sys.path.append(capito_base_dir)
-
-    from capito.haleres.settings import Settings
-    from capito.haleres.job import Job
-
-    settings = Settings(haleres_settings_file)
-    job = Job(job_share, job_name, settings)
-
-    for file in Path(temp_export_dir).glob("*"):
-        shutil.move(str(file), str(job.get_folder("scenes") / file.name))
-    
-    job.write_job_files()
-    job.set_ready_to_push(True)
-    
-    try:
-        for file in temp_status_dir.glob("*"):
-            file.unlink()
-        temp_status_dir.rmdir()
-        Path(temp_export_dir).rmdir()
-        temp_status_dir.parent.rmdir()
-    except:
-        pass
+    files = [str(f) for f, mtime in _file_times().items() if before.get(f) != mtime]
+    if not files:
+        raise RuntimeError(f"No ass files written for {unit}.")
+    return {"files": sorted(files)}
+
+
+worker_loop(export)
@@ -1,104 +1,234 @@
+from collections import defaultdict
 import json
 from pathlib import Path
-from shutil import copy
+import shutil
 import tempfile
 from typing import Tuple, List, Set, Dict
-from subprocess import TimeoutExpired, check_output
 import sys
+import threading
 import math
 import os
 import uuid
 
-from plumbum import local
 import platform
 
 import pymel.core as pc
 
+from capito.core.concurrency import GB, ConcurrencyController
+from capito.core.workpool import ProcessChannel, WorkPool, WorkUnit
 from capito.haleres.job import Job
 from capito.haleres.utils import create_flat_frame_list, create_frame_tuple_list
 
 
-def get_free_mem():
-    """Notloesung wegen Prism psutil import-Konflikt."""
+def create_export_units(framelist: str, renderlayer_names: List[str],
+                        jobsize: int, chunk_size: int) -> List[Dict]:
+    """Split the export into units of at most chunk_size consecutive frames
+    of one render layer. Units never cross the frame tuples of the HLRS job
+    files ("chunk"), so a job file can be written as soon as its units are done.
+    Units are ordered by frames, then layers.
+    """
+    return [
+        {"layer": layer, "start": start, "end": end, "chunk": [chunk_start, chunk_end]}
+        for chunk_start, chunk_end in create_frame_tuple_list(framelist, jobsize)
+        for start, end in create_frame_tuple_list(f"{chunk_start}-{chunk_end}", chunk_size)
+        for layer in renderlayer_names
+    ]
+
+
+def get_mayapy() -> Path:
+    """Path to the mayapy next to the running maya."""
+    name = "mayapy.exe" if platform.system() == "Windows" else "mayapy"
+    return Path(sys.executable).parent / name
+
+
+def report(message: str):
+    """Print message in the main thread (worker threads must not write to the
+    script editor of the Maya GUI)."""
     try:
-        import psutil
-        return psutil.virtual_memory()[4]
-    except:
-        if platform.system() == 'Windows':
-            systeminfo = check_output(["systeminfo"], encoding="437", universal_newlines=True).split("\n")
-            memline = [l for l in systeminfo if l.startswith("Verfügbarer physischer Speicher:")][0]
-            mem = int("".join([c for c in memline if c.isnumeric()])) * 1000000
-            return mem
-    return 0
-
-
-def get_recommended_parallel_mayapys():
-    """Will return the estimated number of parallel runable mayapy instances.
-    The recommended number is either the number of cores
-    or the number of mayapys (+ scene) that will fit into the availible memory.
+        import maya.utils  # pylint:disable=import-outside-toplevel
+    except ImportError:
+        print(message)
+        return
+    maya.utils.executeDeferred(print, message)
+
+
+class PacketCommitter:
+    """Streams the exports into the job packet while the export is running.
+    Once all units of a chunk are done its files are committed to the scenes
+    folder and its job file is written. The first chunk makes the job ready
+    to push; push and submit go on with the chunks that follow
+    until the export is finished (see Job.set_exporting).
+    Chunks that failed can be exported again (retry_failed) or the export
+    can be given up (abort).
     """
-    free_mem = get_free_mem()
-    ma_size = Path(pc.sceneName()).stat().st_size
-    maya_mem = 2_000_000_000
-    return min(
-        os.cpu_count(),
-        math.floor(free_mem / (ma_size + maya_mem))
-    )
+
+    def __init__(self, job: Job, temp_job_dir: Path, pool: WorkPool):
+        self.job = job
+        self.temp_job_dir = temp_job_dir
+        self.pool = pool
+        self.committed: List[Tuple[int, int]] = []
+        self.failed: List[Tuple[int, int]] = []
+        self.finished = False
+        self.aborted = False
+        self._lock = threading.Lock()
+        self._remaining: Dict[Tuple[int, int], int] = defaultdict(int)
+        self._files: Dict[Tuple[int, int], List[str]] = defaultdict(list)
+        for unit in pool.units:
+            self._remaining[tuple(unit.payload["chunk"])] += 1
+        pool.unit_callbacks.append(self.unit_finished)
+        pool.finish_callbacks.append(self.finish)
+
+    def unit_finished(self, unit: WorkUnit):
+        """WorkPool unit callback (runs in the worker threads)."""
+        chunk = tuple(unit.payload["chunk"])
+        with self._lock:
+            if self.aborted:
+                return
+            if unit.status != "done":
+                report(f"Export of {unit.payload} failed: {unit.errors[-1]}")
+                if chunk not in self.failed:
+                    self.failed.append(chunk)
+                return
+            self._files[chunk].extend(unit.result["files"])
+            self._remaining[chunk] -= 1
+            if self._remaining[chunk] or chunk in self.failed:
+                return
+            try:
+                self.job.commit_scene_files(self._files.pop(chunk))
+                self.job.write_job_files([chunk])
+            except Exception as error:  # the chunk fails, the export goes on
+                report(f"Could not commit frames {chunk[0]}-{chunk[1]} to job {self.job.name}: {error}")
+                self.failed.append(chunk)
+                return
+            self.committed.append(chunk)
+            if len(self.committed) == 1:
+                self.job.set_ready_to_push(True)
+
+    def finish(self, units: List[WorkUnit]):
+        """WorkPool finish callback: ends the export if every chunk got committed."""
+        with self._lock:
+            self.finished = True
+            aborted = self.aborted
+            if self.failed and not aborted:
+                report(
+                    f"{len(self.failed)} chunk(s) of job {self.job.name} failed, "
+                    f"{len(self.committed)} are committed. The job stays in export state "
+                    "until the failed chunks are exported again or the export is aborted."
+                )
+                return
+            if not aborted:
+                self.job.set_exporting(False)
+        # the workers of an aborted export were writing to it until now
+        shutil.rmtree(self.temp_job_dir, ignore_errors=True)
+        if not aborted:
+            report(f"Export of job {self.job.name} completed.")
+
+    def retry_failed(self) -> int:
+        """Export all units of the failed chunks again. Returns the number of units."""
+        with self._lock:
+            if not self.finished or not self.failed or self.aborted:
+                return 0
+            chunks = set(self.failed)
+            self.failed.clear()
+            self.finished = False
+            retry = [u for u in self.pool.units if tuple(u.payload["chunk"]) in chunks]
+            # a unit can be in the list more than once when it was retried before
+            payloads = {(u.payload["layer"], u.payload["start"]): u for u in retry}
+            for chunk in chunks:
+                self._files.pop(chunk, None)
+                self._remaining[chunk] = 0
+            for unit in payloads.values():
+                self._remaining[tuple(unit.payload["chunk"])] += 1
+        for unit in payloads.values():
+            self.pool.add(unit.payload, weight=unit.weight)
+        report(f"Exporting {len(payloads)} unit(s) of {len(chunks)} failed chunk(s) again.")
+        self.pool.start()
+        return len(payloads)
+
+    def abort(self):
+        """Give up the export: pending units are cancelled and the job is marked aborted.
+        Running units still finish, the temp dir is removed when the pool is done."""
+        with self._lock:
+            if self.aborted:
+                return
+            self.aborted = True
+            self.job.set_aborted(True)
+            self.job.set_exporting(False)
+            finished = self.finished
+        if finished:
+            shutil.rmtree(self.temp_job_dir, ignore_errors=True)
+        else:
+            self.pool.cancel()
+        report(f"Export of job {self.job.name} aborted.")
 
 
 def parallel_ass_export(file_to_open: Path, job: Job,
                         renderlayers: List[pc.nodetypes.RenderLayer],
-                        temp_dir: str):
-    """Exports ass files in background processes.
+                        temp_dir: str, num_workers: int = None,
+                        chunk_size: int = None) -> PacketCommitter:
+    """Exports ass files in background mayapy processes.
+    Every worker opens the scene once and then exports units of a few frames
+    of one layer, taken from a shared queue, until all are done.
+    Without num_workers, the number of workers follows their actual memory
+    use and throughput (see ConcurrencyController).
+    Failed units are retried. Finished chunks are committed to the job
+    packet right away. Returns the PacketCommitter of the export,
+    its pool is the running WorkPool.
     """
-    num_maya_instances = get_recommended_parallel_mayapys()
-    
-    renderlayer_string = ",".join([l.name() for l in renderlayers])
-    
-    flat_frame_list = create_flat_frame_list(job.framelist)
-    num_frames_total = len(flat_frame_list)
-    jobsize = math.ceil(num_frames_total / num_maya_instances)
-    frame_tuples = create_frame_tuple_list(job.framelist, jobsize)
-    num_exports_total = num_frames_total * len(renderlayers)
+    renderlayer_names = [l.name() for l in renderlayers]
+    # every mayapy holds the scene, the controller adapts to what they really use
+    controller = ConcurrencyController(
+        max_workers=os.cpu_count(),
+        worker_memory=Path(file_to_open).stat().st_size + 2 * GB,
+    )
+    adaptive = not num_workers
+    num_workers = num_workers or controller.recommend()
+    num_frames = len(create_flat_frame_list(job.framelist))
+    if chunk_size is None:
+        # small units keep all workers busy until the end
+        chunk_size = max(1, min(10, math.ceil(num_frames / (num_workers * 4))))
+    units = create_export_units(job.framelist, renderlayer_names, job.jobsize, chunk_size)
 
     job_id = f"{job.name}_{str(uuid.uuid4())[:8]}"
-    temp_status_dir = Path(temp_dir) / job_id / "status"
-    print("Creating temp dirs for status/export:")
-    temp_export_dir = Path(temp_dir) / job_id / "export"
-    temp_status_dir.mkdir(parents=True)
-    print(f"Status: {temp_status_dir}")
+    temp_job_dir = Path(temp_dir) / job_id
+    temp_export_dir = temp_job_dir / "export"
     temp_export_dir.mkdir(parents=True)
     print(f"Export: {temp_export_dir}")
 
-    mayapy = local[str(Path(sys.executable).parent / "mayapy.exe")]
-    processes = []
+    mayapy = get_mayapy()
     python_script = str(Path(__file__).parent / 'parallelExporter.py')
-
     capito_base = str(Path(__file__).parent.parent.parent.parent.parent)
-    
-    for start, end in frame_tuples:
-        params = [
+
+    def channel_factory(index: int) -> ProcessChannel:
+        worker_dir = temp_export_dir / f"worker_{index}"
+        worker_dir.mkdir(exist_ok=True)
+        report(f"Spawning background Maya instance {index}.")
+        return ProcessChannel([
+            mayapy,
             python_script,
             str(file_to_open),
-            start,
-            end,
-            renderlayer_string,
-            str(temp_export_dir),
+            str(worker_dir),
             job.name,
             job.share,
-            str(temp_status_dir),
-            num_exports_total,
             capito_base.replace("\\", "/"),
-            job.haleres_settings.settings_file
-        ]
-        p = mayapy.popen(params)
-        processes.append(p)
-        
-        try:
-            p.communicate(timeout=0)
-        except TimeoutExpired:
-            pass
-        print(f"Spawning background Maya instance for frames {start} to {end}.")
+        ])
+
+    def report_unit(unit: WorkUnit):
+        layer, start, end = unit.payload["layer"], unit.payload["start"], unit.payload["end"]
+        report(f"{unit.status}: {layer} {start}-{end} - {pool.progress.as_text()}")
+
+    pool = WorkPool(channel_factory, min(num_workers, len(units)))
+    for unit in units:
+        pool.add(unit, weight=unit["end"] - unit["start"] + 1)
+    pool.unit_callbacks.append(report_unit)
+    committer = PacketCommitter(job, temp_job_dir, pool)
+    job.set_exporting(True)
+    print(f"Exporting {len(units)} unit(s) of up to {chunk_size} frame(s) with {pool.num_workers} worker(s).")
+    pool.start()
+    if adaptive:
+        controller.max_workers = min(controller.max_workers, len(units))
+        controller.watch_pool(pool)
+    return committer
 
 
 def get_links_in_ass(ass_file: str) -> List[str]:
@@ -119,6 +119,7 @@ class AssExporter(QMainWindow):
         self.settings = settings
         self.update_status = True
         self.job:Job = None
+        self.export = None
         self.current_jobsize = 2
         self.current_walltime = 20
 
@@ -145,6 +146,9 @@ class AssExporter(QMainWindow):
         if not only_one_cam:
             self.statusBar().showMessage("Please mark only one camera as renderable.")
         self.export_button.setEnabled(only_one_cam and checks_ok)    
+        export_failed = bool(self.export and self.export.finished and self.export.failed)
+        self.retry_button.setEnabled(export_failed)
+        self.abort_button.setEnabled(export_failed)
 
     def _create_widgets(self):
         self.job_lineedit = QLineEdit()
@@ -187,11 +191,17 @@ class AssExporter(QMainWindow):
 
         self.export_button = QPushButton("Export")
         self.export_button.setEnabled(False)
+        self.retry_button = QPushButton("Retry Failed Chunks")
+        self.retry_button.setEnabled(False)
+        self.abort_button = QPushButton("Abort Export")
+        self.abort_button.setEnabled(False)
  
     def _connect_widgets(self):
         self.choose_job_button.clicked.connect(self._choose_job)
         self.choose_folder_button.clicked.connect(self._set_cache_folder)
         self.export_button.clicked.connect(self._export)
+        self.retry_button.clicked.connect(self._retry_export)
+        self.abort_button.clicked.connect(self._abort_export)
         self.hlrs_walltime_lineedit.textChanged.connect(self._validate_walltime)
         self.hlrs_walltime_lineedit.editingFinished.connect(self._approve_walltime)
         self.hlrs_jobsize_lineedit.textChanged.connect(self._validate_jobsize)
@@ -274,6 +284,10 @@ class AssExporter(QMainWindow):
         vbox.addWidget(QHLine())
         vbox.addWidget(QLabel("Before clicking export, make sure to check your render settings\n(Samples etc.) and save the scene!"))
         vbox.addWidget(self.export_button)
+        hbox = QHBoxLayout()
+        hbox.addWidget(self.retry_button)
+        hbox.addWidget(self.abort_button)
+        vbox.addLayout(hbox)
         #vbox.addWidget(QHLine())
 
         central_widget = QWidget()
@@ -382,10 +396,18 @@ class AssExporter(QMainWindow):
         print("Created pathmap.json.")
         if self.parallel_export_checkbox.isChecked():
             self.statusBar().showMessage("Subprocess export... See Script Editor.")
-            parallel_ass_export(pc.sceneName(), self.job, renderlayers, cache_dir)
+            self.export = parallel_ass_export(pc.sceneName(), self.job, renderlayers, cache_dir)
             return
         self._single_core_export(renderlayers, cache_dir)
 
+    def _retry_export(self):
+        if self.export.retry_failed():
+            self.statusBar().showMessage("Exporting the failed chunks again... See Script Editor.")
+
+    def _abort_export(self):
+        self.export.abort()
+        self.statusBar().showMessage(f"Export of job {self.export.job.name} aborted.")
+
     def _single_core_export(self, renderlayers, cache_dir):
         self.update_status = False
         flat_frame_list = create_flat_frame_list(self.framelist_textedit.text())
@@ -7,10 +7,19 @@ their assignment to a polygonal model or faces of a polygonal model.
 """
 import json
 from collections import defaultdict
-from typing import Any, List
+from typing import Any, Dict, List
 
+from maya import cmds
 import pymel.core as pc
 
+from capito.core.components import (
+    component_names,
+    encode_ranges,
+    is_ranges,
+    merge_ranges,
+    parse_component,
+)
+
 
 def get_visible_shape(obj: pc.nodetypes.Transform):
     if not hasattr(obj, 'getShapes'):
@@ -37,6 +46,29 @@ def list_look_nodes() -> List[pc.nodetypes.Network]:
     return[node for node in pc.ls(type="network") if node.hasAttr("lookName")]
 
 
+def read_assignment(shading_group: str, shape_names: Dict[str, str]) -> Dict[str, list]:
+    """Members of shading_group among the shapes in shape_names
+    {long shape name: object name} as {object name: [[first_face, last_face], ...]},
+    an empty list if the whole object is assigned.
+    """
+    assignment = defaultdict(list)
+    for member in cmds.sets(shading_group, q=True) or []:
+        shape = (cmds.ls(member, objectsOnly=True, long=True) or [None])[0]
+        if shape not in shape_names:
+            continue
+        name = shape_names[shape]
+        if "." not in member:
+            assignment[name] = []
+            continue
+        try:
+            _, component, face_range = parse_component(member)
+        except ValueError:
+            continue
+        if component == "f" and (name not in assignment or assignment[name]):
+            assignment[name].append(face_range)
+    return {name: merge_ranges(ranges) for name, ranges in assignment.items()}
+
+
 class Look:
     """Class representing the Look of specific objects in Maya"""
 
@@ -98,26 +130,15 @@ class Look:
         )
 
         # get assignment info for each shading_group.
-        # [objectname: [face1, face2...]
+        # [objectname: [[first_face, last_face], ...]
         # empty list = whole object / all faces are assigned
+        shape_names = {
+            s.longName(): s.getParent().name(stripNamespace=True, long=None) for s in shapes
+        }
         for shading_group in set(shading_groups):
             if shading_group.name() == "initialShadingGroup":
                 continue
-            members = shading_group.members()
-            sg_dict = {}
-            for member in members:
-                if member.node() in shapes:
-                    if isinstance(member, pc.nodetypes.Mesh):
-                        sg_dict[
-                            member.getParent().name(stripNamespace=True, long=None)
-                        ] = []
-                    elif isinstance(member, pc.general.MeshFace):
-                        facelist = [
-                            int(f.split("[")[-1][:-1]) for f in pc.ls(member, flatten=True)
-                        ]
-                        sg_dict[
-                            member.node().getParent().name(stripNamespace=True, long=None)
-                        ] = facelist
+            sg_dict = read_assignment(shading_group.name(), shape_names)
             index = self.look_node.sg.numElements()
             self.look_node.attr(f"sg[{index}]") >> shading_group.sg
             self.look_node.attr(f"sg[{index}]").set(json.dumps(sg_dict))
@@ -142,7 +163,8 @@ class Look:
                 stripNamespace=True, long=None)].append(shape)
 
         # iterate over the sg-multi-channel-attribute (connected to shading groups)
-        # load the contained json and assign the faces/shapes to the shading group
+        # load the contained json and assign the faces/shapes of all objects
+        # to the shading group at once
         for i in range(self.look_node.sg.numElements()):
             sg_attr = self.look_node.attr(f"sg[{i}]")
             faces_dict = json.loads(sg_attr.get())
@@ -152,17 +174,17 @@ class Look:
                 pc.warning(f"Skipped missing connection '{i}' for {self.look_node}.")
                 continue
             # assign faces, or whole object if list is empty
+            members = []
             for transform, faces in faces_dict.items():
-                for shape in transform_shape_map.get(transform, []):
-                    print(shape)
-                    if shape is None:
-                        print(
-                            f"Node {transform} not found in list of supplied transforms.")
-                        continue
-                    if faces:
-                        pc.sets(shading_group, forceElement=shape.f[faces])
-                    else:
-                        pc.sets(shading_group, forceElement=shape)
+                shape_names = [s.longName() for s in transform_shape_map.get(transform, [])]
+                if not faces:
+                    members.extend(shape_names)
+                    continue
+                ranges = faces if is_ranges(faces) else encode_ranges(faces)
+                for shape_name in shape_names:
+                    members.extend(component_names(shape_name, ranges))
+            if members:
+                cmds.sets(members, forceElement=shading_group.name())
 
     def select_shading_groups(self):
         """Select all associated shading groups."""
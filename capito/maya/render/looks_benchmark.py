@@ -0,0 +1,91 @@
+"""
+Benchmark of reading and transferring a Look on a synthetic asset.
+
+Builds num_objects planes, each with its faces split in alternating rows
+between shaders_per_object of num_shaders shading groups, reads the Look
+and assigns it to a copy of the objects in the namespace "target".
+
+Run in Maya or mayapy (after maya.standalone.initialize()):
+    from capito.maya.render import looks_benchmark
+    looks_benchmark.run()
+"""
+import time
+from typing import Dict, List
+
+from maya import cmds
+import pymel.core as pc
+
+from capito.maya.render.looks import Look
+
+
+def create_shading_groups(num_shaders: int) -> List[str]:
+    shading_groups = []
+    for i in range(num_shaders):
+        shader = cmds.shadingNode("lambert", asShader=True, name=f"bench_{i}_mtl")
+        shading_group = cmds.sets(
+            renderable=True, noSurfaceShader=True, empty=True, name=f"bench_{i}_sg"
+        )
+        cmds.connectAttr(f"{shader}.outColor", f"{shading_group}.surfaceShader")
+        shading_groups.append(shading_group)
+    return shading_groups
+
+
+def create_objects(num_objects: int, subdivisions: int, namespace: str = "") -> List[str]:
+    prefix = f"{namespace}:" if namespace else ""
+    if namespace and not cmds.namespace(exists=namespace):
+        cmds.namespace(add=namespace)
+    return [
+        cmds.polyPlane(
+            name=f"{prefix}bench_obj_{i}", sx=subdivisions, sy=subdivisions, ch=False
+        )[0]
+        for i in range(num_objects)
+    ]
+
+
+def assign_rows(objects: List[str], shading_groups: List[str], subdivisions: int, shaders_per_object: int):
+    """Assign the face rows of every object round robin to shaders_per_object shading groups."""
+    for i, obj in enumerate(objects):
+        for row in range(subdivisions):
+            shading_group = shading_groups[(i + row % shaders_per_object) % len(shading_groups)]
+            first = row * subdivisions
+            cmds.sets(f"{obj}.f[{first}:{first + subdivisions - 1}]", forceElement=shading_group)
+
+
+def run(
+    num_objects: int = 200,
+    num_shaders: int = 50,
+    subdivisions: int = 40,
+    shaders_per_object: int = 4,
+    new_scene: bool = True,
+) -> Dict[str, float]:
+    """Seconds taken by Look.read and Look.assign."""
+    if new_scene:
+        cmds.file(new=True, force=True)
+    shading_groups = create_shading_groups(num_shaders)
+    source = create_objects(num_objects, subdivisions)
+    assign_rows(source, shading_groups, subdivisions, shaders_per_object)
+    target = create_objects(num_objects, subdivisions, namespace="target")
+
+    look = Look("bench")
+    start = time.perf_counter()
+    look.read([pc.PyNode(obj) for obj in source])
+    read_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    look.assign([pc.PyNode(obj) for obj in target])
+    assign_time = time.perf_counter() - start
+
+    for src, dst in zip(source, target):
+        for shading_group in shading_groups:
+            src_faces = cmds.sets(shading_group, q=True) or []
+            if any(m.startswith(f"{src}.") for m in src_faces) != any(
+                m.startswith(f"{dst}.") for m in src_faces
+            ):
+                raise RuntimeError(f"{dst} is not assigned like {src}")
+
+    result = {"read": read_time, "assign": assign_time}
+    print(
+        f"Look of {num_objects} objects with {num_shaders} shaders: "
+        f"read {read_time:.2f}s, assign {assign_time:.2f}s"
+    )
+    return result
@@ -1,8 +1,10 @@
 from pathlib import Path
 import os
 
+import maya.utils
 import pymel.core as pc
 
+from capito.core.encoder.pipeline import SequencePipeline
 from capito.maya.ui.widgets import file_chooser_button
 from capito.maya.environ.vars import FRAME_RATE_MAP
 from capito.conf.settings import SettingsManagerMixin
@@ -26,6 +28,7 @@ class BackgroundPlayblast(SettingsManagerMixin):
     def __init__(self):
         self.window_name = "bg_playblast_win"
         self.burnin_cols = {"left": None, "center": None, "right": None}
+        self.pipeline = None
         self.init_settings()
         self.gui()
         default_preset = self.settings.get("default_preset", "CA Stupro")
@@ -182,6 +185,11 @@ class BackgroundPlayblast(SettingsManagerMixin):
                                         "cat": (1, "right", 0),
                                     },
                                 )
+                            self.pipelined_checkBox = pc.checkBox(
+                                label="Encode while rendering (Render + Encode)",
+                                value=self.settings.get("pipelined", True),
+                                cc=self.save_pipelined,
+                            )
                     pc.separator(h=1, style="none")
                     with pc.frameLayout(
                         label="Burn Ins",
@@ -268,6 +276,14 @@ class BackgroundPlayblast(SettingsManagerMixin):
                         )
                         pc.menuItem("50%", c=pc.Callback(self.set_half_resolution))
                     pc.separator(h=2)
+                    with pc.rowLayout(nc=5, adj=5):
+                        pc.text(label="Render", align="left", w=45)
+                        self.render_progressBar = pc.progressBar(w=120, h=12)
+                        pc.text(label=" Encode", align="left", w=45)
+                        self.encode_progressBar = pc.progressBar(w=120, h=12)
+                        self.cancel_button = pc.button(
+                            label="Cancel", en=False, c=self.cancel_pipeline
+                        )
                 with pc.horizontalLayout(ratios=(1, 1, 2)) as button_hl:
                     pc.button(
                         label="Render",
@@ -415,20 +431,35 @@ class BackgroundPlayblast(SettingsManagerMixin):
             pc.menuItem("Project Name", c=pc.Callback(line.setText, "<projectname>"))
             pc.menuItem("Camera Name", c=pc.Callback(line.setText, "<camera>"))
 
-    def get_encode_cmd(self):
-        ff = Ffmpeg(exe=self.ffmpeg_exe_tfg.getText())
-
-        ff.box_opacity = 0.5
-
+    def get_image_pattern(self):
         img_path = self.renderdir_tfg.getText()
         img_name = self.image_name_textFieldGrp.getText()
         img_pad = self.padding_intField.getValue()
         img_ext = self.file_format_optionMenuGrp.getValue()
-        ff.input = f"{img_path}/{img_name}.%0{img_pad}d.{img_ext}"
+        return f"{img_path}/{img_name}.%0{img_pad}d.{img_ext}"
+
+    def get_frames(self):
+        return list(
+            range(
+                self.start_intField.getValue(),
+                self.end_intField.getValue() + 1,
+                max(1, self.step_intField.getValue()),
+            )
+        )
+
+    def get_encode_cmd(self, pipe=False):
+        """The ffmpeg command, reading the images from stdin if pipe is True."""
+        ff = Ffmpeg(exe=self.ffmpeg_exe_tfg.getText())
+
+        ff.box_opacity = 0.5
+
+        ff.input = self.get_image_pattern()
 
         ff.output = self.mp4_tfg.getText()
         ff.quality = self.get_quality()
         ff.framerate = self.fps_intField.getValue()
+        if pipe:
+            ff.set_pipe_input(self.file_format_optionMenuGrp.getValue())
 
         for line in self.burnin_cols["left"].getChildren():
             t = self.preprocess_drawtext(line.getChildren()[0].getText())
@@ -498,7 +529,18 @@ class BackgroundPlayblast(SettingsManagerMixin):
     def set_drawtext_menu_option(self, value):
         self.burnin_presets_MenuGrp.getChildren()[1].setValue(value)
 
+    def save_pipelined(self, value):
+        self.settings.pipelined = bool(value)
+        self.settings.save()
+
     def run(self, actions):
+        if (
+            "render" in actions
+            and "encode" in actions
+            and self.pipelined_checkBox.getValue()
+        ):
+            self.run_pipelined()
+            return
         sq = SubQ()
         if "render" in actions:
             sq.add(self.get_render_cmd())
@@ -515,6 +557,60 @@ class BackgroundPlayblast(SettingsManagerMixin):
         if sq.length():
             sq.run()
 
+    def run_pipelined(self):
+        """Render and encode at the same time, see SequencePipeline."""
+        if not self.ffmpeg_exe_tfg.getText():
+            pc.confirmDialog(
+                title="Info missing",
+                message="Please specify where to find 'ffmpeg.exe'.",
+            )
+            return
+        if self.pipeline is not None and not self.pipeline.wait(0):
+            pc.warning("A playblast is still running.")
+            return
+        self.pipeline = SequencePipeline(
+            render_cmd=self.get_render_cmd(),
+            encode_cmd=self.get_encode_cmd(pipe=True),
+            image_pattern=self.get_image_pattern(),
+            frames=self.get_frames(),
+        )
+        # the callbacks run in the pipeline thread, the ui has to be updated in the main thread
+        self.pipeline.progress_callbacks.append(
+            lambda stages: maya.utils.executeDeferred(self.show_progress, stages)
+        )
+        self.pipeline.finished_callbacks.append(
+            lambda result: maya.utils.executeDeferred(self.pipeline_finished, result)
+        )
+        for progress_bar in (self.render_progressBar, self.encode_progressBar):
+            progress_bar.setMaxValue(len(self.pipeline.frames))
+            progress_bar.setProgress(0)
+        self.cancel_button.setEnable(True)
+        print(f"Render + Encode started. Log: '{self.pipeline.log_file}'")
+        self.pipeline.start()
+
+    def show_progress(self, stages):
+        if not pc.window(self.window_name, exists=True):
+            return
+        self.render_progressBar.setProgress(stages["render"].done)
+        self.encode_progressBar.setProgress(stages["encode"].done)
+
+    def pipeline_finished(self, result):
+        if pc.window(self.window_name, exists=True):
+            self.show_progress(result.stages)
+            self.cancel_button.setEnable(False)
+        if result.success:
+            pc.warning(f"Rendering and encoding finished in {result.seconds:.0f}s.")
+        else:
+            errors = [s.error for s in result.stages.values() if s.error]
+            pc.warning(
+                f"Render + Encode failed: {', '.join(errors)}. "
+                f"See '{self.pipeline.log_file}'."
+            )
+
+    def cancel_pipeline(self, *args):
+        if self.pipeline is not None:
+            self.pipeline.cancel()
+
     def get_render_cmd(self):
         renderer = RENDERER_MAP[self.renderer_optionMenuGrp.getValue()]
 
@@ -6,6 +6,9 @@ from dataclasses import dataclass
 
 import pymel.core as pc
 
+# ffmpeg decoders for images read from stdin (image2pipe) by file format
+PIPE_CODECS = {"png": "png", "jpg": "mjpeg", "exr": "exr", "tif": "tiff"}
+
 
 class DrawText:
     """
@@ -146,6 +149,18 @@ class Ffmpeg:
             exe = Path(os.environ.get("ffmpeg"))
         self.exe = exe if " " not in str(exe) else f"\"{exe}\""
 
+    def set_pipe_input(self, image_format):
+        """
+        Read the images from stdin instead of a file sequence
+        and write the progress to stdout (for SequencePipeline).
+        """
+        self.input_flags["-nostats"] = ""
+        self.input_flags["-progress"] = "pipe:1"
+        self.input_flags["-f"] = "image2pipe"
+        self.input_flags["-framerate"] = self.framerate
+        self.input_flags["-c:v"] = PIPE_CODECS[image_format]
+        self.input = "-"
+
     def get_drawtext(self):
         drawtext = []
         for dt in self.text.values():
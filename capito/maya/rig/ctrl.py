@@ -1,11 +1,14 @@
 import pymel.core as pc
 
 from capito.maya.util.names import legalize_text, get_legal_character
-from capito.maya.geo.shapes import get_symmetry_dict
+from capito.maya.geo.shapes import get_symmetry_map
 from capito.maya.rig.deformers import (
-    get_soft_selection_values,
+    get_soft_selection_weights,
     create_soft_cluster,
     edit_soft_cluster_weights,
+    get_cluster_weights,
+    save_cluster_weights,
+    load_cluster_weights,
     list_inputs_of_type,
     duplicate_orig_shape,
     get_orig_shape,
@@ -420,7 +423,7 @@ class StickyControl:
         self.manager = manager
 
         if weight_dict is None:
-            weight_dict = get_soft_selection_values()
+            weight_dict = get_soft_selection_weights()
 
         if initial_pin_pos is None:
             vtx = pc.selected()[0]
@@ -497,6 +500,17 @@ class StickyControl:
     def edit_weights(self, weight_dict=None):
         edit_soft_cluster_weights(self.cluster_handle, weight_dict)
 
+    def save_weights(self, path):
+        save_cluster_weights(self.cluster_handle, path)
+
+    def load_weights(self, path, mirror=False):
+        symmetry_map = None
+        if mirror:
+            symmetry_map = get_symmetry_map(
+                self.manager.transform, axis=self.manager.grp.symmetry_direction.get()
+            )
+        load_cluster_weights(self.cluster_handle, path, symmetry_map)
+
     def is_connected(self, channel):
         """channel must be "t", "r" or "s" """
         return pc.isConnected(
@@ -524,24 +538,11 @@ class StickyControl:
             pc.orientConstraint(obj, self.output_pin, maintainOffset=True)
 
     def get_symmetry_weights(self, weight_threshold=0.001):
-        weights = {}
-        for i, w in enumerate(self.cluster.attr("weightList[0].weights").get()):
-            if w > weight_threshold:
-                weights[i] = w
-
-        sym_status = pc.symmetricModelling(q=True, symmetry=True)
-        pc.symmetricModelling(symmetry=True)
-        sym_weights = {}
-        for i, w in weights.items():
-            pc.select(self.manager.transform.vtx[i], symmetry=True)
-            pair = [v.index() for v in pc.selected()]
-            if len(pair) == 1:
-                j = i
-            else:
-                j = [v for v in pair if v != i][0]
-            sym_weights[j] = w
-        pc.symmetricModelling(symmetry=sym_status)
-        return sym_weights
+        weights = get_cluster_weights(self.cluster).threshold(weight_threshold)
+        sym_map = get_symmetry_map(
+            self.manager.transform, axis=self.manager.grp.symmetry_direction.get()
+        )
+        return weights.mirror(sym_map)
 
     def create_symmetry_control(self, name, sym_matrix=None):
         sym_matrix = sym_matrix or [-1, 1, 1]
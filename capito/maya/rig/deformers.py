@@ -1,8 +1,11 @@
-from typing import Any, List
-import maya.OpenMaya as om1
+from pathlib import Path
+from typing import Any, List, Mapping, Union
+from maya import cmds
 import maya.api.OpenMaya as om
+import numpy as np
 import pymel.core as pc
 
+from capito.core.weights import Weights, as_weights
 from capito.maya.geo.shapes import get_used_shapes
 
 
@@ -70,12 +73,10 @@ def duplicate_orig_shape(transform: pc.nodetypes.Transform):
     return dup[0]
 
 
-def get_soft_selection_values():
-    """Returns a dict based on current soft vertex selection.
-    Dict-Key is representing the vertex-index and is of type int.
-    Dict-Value is representing the selection weight and is of type float.
+def get_soft_selection_weights() -> Weights:
+    """Returns the weights of the current soft vertex selection as arrays.
 
-    :rtype: dict{vertindex (int): weight (float)}
+    :rtype: :class:`capito.core.weights.Weights`
     :raises: None
     """
     rich_selection = om.MGlobal.getRichSelection()
@@ -83,17 +84,35 @@ def get_soft_selection_values():
     sel_iter = om.MItSelectionList(
         rich_selection.getSelection(), om.MFn.kMeshVertComponent
     )
-    weight_dict = {}
+    indices, values = [], []
 
     while not sel_iter.isDone():
         _, verts = sel_iter.getComponent()
         fn_comp = om.MFnSingleIndexedComponent(verts)
-
-        for i in range(fn_comp.elementCount):
-            weight_dict[fn_comp.element(i)] = fn_comp.weight(i).influence
+        indices.append(np.array(fn_comp.getElements(), dtype=np.int64))
+        values.append(
+            np.fromiter(
+                (fn_comp.weight(i).influence for i in range(fn_comp.elementCount)),
+                dtype=np.float32,
+                count=fn_comp.elementCount,
+            )
+        )
         sel_iter.next()
 
-    return weight_dict
+    if not indices:
+        return Weights([], [])
+    return Weights.from_pairs(np.concatenate(indices), np.concatenate(values))
+
+
+def get_soft_selection_values():
+    """Returns a dict based on current soft vertex selection.
+    Dict-Key is representing the vertex-index and is of type int.
+    Dict-Value is representing the selection weight and is of type float.
+
+    :rtype: dict{vertindex (int): weight (float)}
+    :raises: None
+    """
+    return get_soft_selection_weights().to_dict()
 
 
 def set_cluster_pivots_to_pos(cluster_handle: pc.nodetypes.Transform, pos: List[float]):
@@ -124,8 +143,8 @@ def create_soft_cluster(name=None, shape=None, weight_dict=None, pivot_pos=None)
     :type name: str
     :param shape: A mesh node on which the cluster will be acting.
     :type shape: :class:`pymel.core.nodetypes.Mesh`
-    :param weight_dict: A list of Tuples (vertex-index, weight).
-    :type weight_dict: list((int, float))
+    :param weight_dict: The weights per vertex-index.
+    :type weight_dict: :class:`capito.core.weights.Weights` or dict{int: float}
     :param pivot_pos: The world x,y,z for the cluster pivot.
     :type pivot_pos: list of three floats
 
@@ -133,49 +152,113 @@ def create_soft_cluster(name=None, shape=None, weight_dict=None, pivot_pos=None)
     :rtype: pymel.nodetypes.Transform
     :raises: None
     """
-    weight_dict = weight_dict or get_soft_selection_values()
+    weights = as_weights(weight_dict) if weight_dict else get_soft_selection_weights()
 
     if shape is None:
         shape = pc.selected(fl=True)[0].node()
-    # if not specified the max value in the dict will be used
+    # if not specified the vertex with the highest weight will be used
     if pivot_pos is None:
-        highest_weight_index = max(weight_dict, key=lambda key: weight_dict[key])
-        pivot_pos = shape.vtx[highest_weight_index].getPosition(space="world")
+        pivot_pos = shape.vtx[weights.peak()].getPosition(space="world")
 
     name = name or f"{shape.name()}_{len(shape.listHistory(type='cluster')) + 1}"
 
     pc.select(shape.getParent(), r=True)
     cluster, cluster_handle = pc.cluster(relative=True, name=f"{name}_cl")
-    # initialize whole shape with one.
-    # Otherwise editing via edit_soft_cluster_weights will not be possible
-    pc.percent(cluster, shape, v=1)
 
     set_cluster_pivots_to_pos(cluster_handle, pivot_pos)
 
-    edit_soft_cluster_weights(cluster_handle, weight_dict)
+    # all vertices of the shape get a weight (zero outside of the soft selection)
+    set_cluster_weights(cluster, weights, count=shape.numVertices())
 
     return cluster_handle
 
 
+def get_cluster(cluster_handle: pc.nodetypes.Transform):
+    """Returns the cluster deformer driven by cluster_handle."""
+    return cluster_handle.attr("worldMatrix").listConnections(type="cluster")[0]
+
+
+def get_deformed_point_count(cluster) -> int:
+    """Returns the vertex count of the (first) shape deformed by cluster.
+
+    :param cluster: The deformer node.
+    :type cluster: :class:`pymel.core.nodetypes.Cluster` or str
+    :rtype: int
+    """
+    shapes = cmds.deformer(str(cluster), q=True, geometry=True) or []
+    if not shapes:
+        raise ValueError(f"{cluster} does not deform any geometry")
+    return pc.PyNode(shapes[0]).numVertices()
+
+
+def get_cluster_weights(cluster, point_count: int = None) -> Weights:
+    """Reads all weights of a cluster (or any weightGeometryFilter) at once.
+
+    :param cluster: The deformer node.
+    :type cluster: :class:`pymel.core.nodetypes.Cluster` or str
+    :param point_count: Vertex count of the deformed shape, queried if not given.
+    :type point_count: int
+    :rtype: :class:`capito.core.weights.Weights`
+    """
+    if point_count is None:
+        point_count = get_deformed_point_count(cluster)
+    plug = f"{cluster}.weightList[0].weights"
+    indices = cmds.getAttr(plug, multiIndices=True) or []
+    values = cmds.getAttr(plug) if indices else []
+    return Weights(indices, np.atleast_1d(values), point_count)
+
+
+def set_cluster_weights(cluster, weights: Union[Weights, Mapping[int, float]], count: int = None):
+    """Writes the weights of the first count vertices of a cluster
+    (or any weightGeometryFilter) with a single setAttr.
+    Vertices without a weight are set to 0.
+
+    :param cluster: The deformer node.
+    :type cluster: :class:`pymel.core.nodetypes.Cluster` or str
+    :param weights: The weights per vertex-index.
+    :type weights: :class:`capito.core.weights.Weights` or dict{int: float}
+    :param count: Number of vertices, defaults to the vertex count of the deformed shape.
+    :type count: int
+    """
+    weights = as_weights(weights)
+    plug = f"{cluster}.weightList[0].weights"
+    if count is None:
+        count = get_deformed_point_count(cluster)
+    dense = weights.dense(count)
+    if not len(dense):
+        return
+    cmds.setAttr(f"{plug}[0:{len(dense) - 1}]", *dense.tolist(), size=len(dense))
+
+
 def edit_soft_cluster_weights(cluster_handle, weight_dict=None):
-    """Edit the weights of an existing cluster based on a weight_dict created by
-    function 'get_soft_selection_values()'.
+    """Edit the weights of an existing cluster based on Weights (or a weight dict)
+    created by 'get_soft_selection_weights()'.
+    If none are given the current soft selection is used.
     """
-    weight_dict = weight_dict or get_soft_selection_values()
+    weights = as_weights(weight_dict) if weight_dict else get_soft_selection_weights()
+    set_cluster_weights(get_cluster(cluster_handle), weights)
 
-    cluster = cluster_handle.attr("worldMatrix").listConnections(type="cluster")[0]
 
-    weight_plug = om1.MPlug()
-    sel = om1.MSelectionList()
-    sel.add(f"{cluster.name()}.weightList[0].weights")
-    sel.getPlug(0, weight_plug)
+def save_cluster_weights(cluster_handle, path: Union[str, Path]):
+    """Saves the weights of the cluster to a binary weights file."""
+    get_cluster_weights(get_cluster(cluster_handle)).save(path)
 
-    ids = om1.MIntArray()
-    weight_plug.getExistingArrayAttributeIndices(ids)
-    count = ids.length()
 
-    for i in range(count):
-        weight_plug.elementByLogicalIndex(ids[i]).setFloat(weight_dict.get(i, 0.0))
+def load_cluster_weights(cluster_handle, path: Union[str, Path], symmetry_map=None):
+    """Loads weights saved with 'save_cluster_weights()' onto a cluster,
+    mirrored if a symmetry map (capito.maya.geo.shapes.get_symmetry_map) is given.
+    Raises ValueError if the weights were saved for a different vertex count.
+    """
+    weights = Weights.load(path)
+    cluster = get_cluster(cluster_handle)
+    count = get_deformed_point_count(cluster)
+    if weights.point_count and weights.point_count != count:
+        raise ValueError(
+            f"{path} holds weights of {weights.point_count} vertices, {cluster} deforms {count}"
+        )
+    if symmetry_map is not None:
+        weights = weights.mirror(symmetry_map)
+    set_cluster_weights(cluster, weights, count=count)
 
 
 def copy_weights(source_geo:pc.nodetypes.Transform, target_geo:pc.nodetypes.Transform, vertex_set:pc.nodetypes.ObjectSet):
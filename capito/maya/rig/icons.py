@@ -5,6 +5,7 @@ import json
 
 import pymel.core as pc
 
+from capito.core.shapelib import ShapeLibrary, load_library
 from capito.maya.viewport.wireframe import colorize
 from capito.maya.geo.shapes import rotate_shapes, set_unrenderable, add_shapes
 import capito.maya.geo.curves as curves
@@ -120,13 +121,26 @@ class RigIcons:
             return False
 
     def load_icons(self):
-        with open(
-            os.path.join(self.config["icons_folder"], "icons.json"), mode="r"
-        ) as icf:
+        """Uses the shape library 'icons.shapes' (read lazily per icon) if it is
+        converted from the current 'icons.json', otherwise 'icons.json'.
+        Convert with: python -m capito.core.shapelib icons icons.json icons.shapes
+        """
+        if this.icons is None:
+            icons_json = os.path.join(self.config["icons_folder"], "icons.json")
+            this.icons = load_library(
+                os.path.join(self.config["icons_folder"], "icons.shapes"), icons_json
+            )
             if this.icons is None:
-                print("Loading icon.json...")
-                this.icons = json.load(icf)
-            self.icons = this.icons
+                print("Loading icons.json...")
+                with open(icons_json, mode="r") as icf:
+                    this.icons = json.load(icf)
+        self.icons = this.icons
+
+    def icon_info(self, i):
+        """Name, tooltip and thumbnail of an icon, without loading its shapes."""
+        if isinstance(self.icons, ShapeLibrary):
+            return self.icons.info(i)
+        return self.icons[i]
 
     def gui(self):
         if pc.window(self.window_name, query=True, exists=True):
@@ -347,7 +361,7 @@ class RigIcons:
         thumbnail = os.path.join(
             self.config["icons_folder"],
             "thumbnails",
-            self.icons[i]["thumbnail"] or "temp.bmp",
+            self.icon_info(i)["thumbnail"] or "temp.bmp",
         )
         button = pc.iconTextButton(
             width=self.config["thumbnail_w"],
@@ -356,7 +370,7 @@ class RigIcons:
             flat=1,
             image1=thumbnail,
             c=pc.Callback(self.create_rig_icons, i),
-            ann="{}\nRightcklick for options.".format(self.icons[i]["tooltip"]),
+            ann="{}\nRightcklick for options.".format(self.icon_info(i)["tooltip"]),
         )
         #     dragCallback=self.dragCallback,
         #     dropCallback=self.dropCallbackSwap
@@ -406,7 +420,7 @@ class RigIcons:
         pc.select(transforms)
 
     def create_rig_icon(self, i, name=None, group=True, snap_to=None, *args):
-        name = name or self.icons[i]["name"]
+        name = name or self.icon_info(i)["name"]
         name = name + self.config["ctrl"]
         top_transform = self.create_curve_hirarchy(self.icons[i]["transforms"], name)
         if snap_to and snap_to.hasAttr("tx"):
@@ -444,10 +458,10 @@ class RigIcons:
     def create_curve_hirarchy(self, transforms, name):
         t = None
         for transform in transforms:
-            crvs = []
-            for shape in transform["shapes"]:
-                crvs.append(curves.create_curve(shape, name=shape.get("name", name)))
-            t = curves.combine_shapes(crvs)
+            shapes = transform["shapes"]
+            t = curves.create_combined_curve(
+                shapes, names=[shape.get("name", name) for shape in shapes]
+            )
             t.rename(name or transform.get("name"))
             children = transform.get("children", [])
             for child in children:
@@ -549,7 +563,7 @@ class RigIcons:
     def list(self):
         print(
             "\n".join(
-                "{}: {}".format(i, icon["name"]) for i, icon in enumerate(this.icons)
+                "{}: {}".format(i, self.icon_info(i)["name"]) for i in range(len(self.icons))
             )
         )
 
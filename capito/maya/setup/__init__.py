@@ -4,8 +4,12 @@ from pathlib import Path
 
 from capito.maya.environ.set_env_vars import set_env_vars
 from maya.utils import executeDeferred
+from pymel import startuptrace
 
 # Beware: The following statements will be executed in reversed order!
+if startuptrace.isActive():
+    # write the startup trace (PYMEL_STARTUP_TRACE) once the deferred setup ran
+    executeDeferred(startuptrace.save)
 executeDeferred("import capito.maya.setup.add_toolbox_buttons")
 executeDeferred("import capito.maya.setup.conform_maya_settings")
 executeDeferred("import capito.maya.setup.add_shelfes")
@@ -29,3 +33,4 @@ envvars.append(
 )
 
 set_env_vars(envvars)
+startuptrace.mark("capito.maya.setup")
@@ -29,6 +29,9 @@ cmt.test.run_tests(test='test_sample.SampleTests.test_create_sphere')
 
 # To run all tests
 cmt.test.run_tests()
+
+# To run all tests in 4 mayapy processes from the commandline, with reports
+mayapy mayaunittest.py --processes 4 --junit results.xml --json results.json
 """
 import os
 import shutil
@@ -37,8 +40,18 @@ import unittest
 import tempfile
 import uuid
 import logging
+import argparse
 import maya.cmds as cmds
 
+from capito.core.testshards import (
+    RecordingResultMixin,
+    ShardedRunner,
+    print_summary,
+    run_shard,
+    test_ids,
+    write_json_report,
+    write_junit_report,
+)
 from capito.maya.env.vars import getenv
 
 # The environment variable that signifies tests are being run with the custom TestResult class.
@@ -99,6 +112,56 @@ def get_tests(directories=None, test=None, test_suite=None):
     return test_suite
 
 
+def run_tests_sharded(
+    directories=None,
+    test=None,
+    processes=None,
+    json_report=None,
+    junit_report=None,
+    timings_file=None,
+):
+    """Run the tests split across parallel mayapy processes.
+
+    The tests are split by their durations of earlier runs (stored in timings_file) so the
+    processes finish at about the same time.
+
+    @param directories: Optional list of directories with which to search for tests.
+    @param test: Optional name of a specific test to run.
+    @param processes: Number of mayapy processes, the number of cpus if omitted.
+    @param json_report: Optional path of a JSON report of all tests.
+    @param junit_report: Optional path of a JUnit XML report of all tests.
+    @param timings_file: Optional path of the timings, Settings.timings_file if omitted.
+    @return: The testshards.Report of the run.
+    """
+    directories = list(maya_module_tests() if directories is None else directories)
+    test_suite = get_tests(directories, test)
+    mayapy = mayapy_executable()
+    script = os.path.abspath(__file__)
+
+    def worker_command(ids_file, report_file):
+        return [mayapy, script, "--shard", ids_file, report_file]
+
+    runner = ShardedRunner(
+        processes, timings_file or Settings.timings_file, worker_command=worker_command
+    )
+    report = runner.run(test_ids(test_suite), directories)
+    print_summary(report)
+    if json_report:
+        write_json_report(json_report, report)
+    if junit_report:
+        write_junit_report(junit_report, report, name="mayaunittest")
+    return report
+
+
+def mayapy_executable():
+    """The mayapy executable of the running Maya."""
+    executable = os.path.basename(sys.executable).lower()
+    if executable.startswith("mayapy"):
+        return sys.executable
+    name = "mayapy.exe" if sys.platform == "win32" else "mayapy"
+    return os.path.join(os.path.dirname(sys.executable), name)
+
+
 def maya_module_tests():
     """Generator function to iterate over all the Maya module tests directories."""
     modules = os.environ["MAYA_MODULE_PATH"].split(os.pathsep)
@@ -113,7 +176,18 @@ def run_tests_from_commandline():
     """Runs the tests in Maya standalone mode.
 
     This is called when running cmt/bin/runmayatests.py from the commandline.
+    With --processes the tests are run in parallel mayapy processes (see run_tests_sharded),
+    which each run their share of the tests with --shard.
     """
+    parser = argparse.ArgumentParser(description="Run the Maya unit tests.")
+    parser.add_argument("--test", default=None, help="Name of a specific test to run.")
+    parser.add_argument("--processes", type=int, default=None, help="Run in parallel processes.")
+    parser.add_argument("--json", default=None, help="Write a JSON report (with --processes).")
+    parser.add_argument("--junit", default=None, help="Write a JUnit XML report (with --processes).")
+    parser.add_argument("--timings", default=None, help="Test durations file (with --processes).")
+    parser.add_argument("--shard", nargs=2, metavar=("IDS_FILE", "REPORT_FILE"), help=argparse.SUPPRESS)
+    args, _ = parser.parse_known_args()
+
     import maya.standalone
 
     maya.standalone.initialize()
@@ -122,6 +196,7 @@ def run_tests_from_commandline():
     # When a maya module is loaded, the scripts folder is added to PYTHONPATH, but it doesn't seem
     # to be added to sys.path. So we are unable to import any of the python files that are in the
     # module/scripts folder. To workaround this, we simply add the paths to sys ourselves.
+    # (needed before collecting the tests of the shards too)
     realsyspath = [os.path.realpath(p) for p in sys.path]
     pythonpath = os.environ.get("PYTHONPATH", "")
     for p in pythonpath.split(os.pathsep):
@@ -129,12 +204,33 @@ def run_tests_from_commandline():
         if p not in realsyspath:
             sys.path.insert(0, p)
 
-    run_tests()
+    if args.processes:
+        report = run_tests_sharded(
+            test=args.test,
+            processes=args.processes,
+            json_report=args.json,
+            junit_report=args.junit,
+            timings_file=args.timings,
+        )
+        success = report.successful
+    elif args.shard:
+        success = run_shard(
+            *args.shard,
+            result_class=ShardTestResult,
+            verbosity=2,
+            buffer=Settings.buffer_output,
+        )
+    else:
+        run_tests(test=args.test)
+        success = True
 
     # Starting Maya 2016, we have to call uninitialize
     if float(cmds.about(v=True)) >= 2016.0:
         maya.standalone.uninitialize()
 
+    if args.processes or args.shard:
+        sys.exit(0 if success else 1)
+
 
 class Settings(object):
     """Contains options for running tests."""
@@ -155,6 +251,9 @@ class Settings(object):
     # Controls whether we should do a file new between each test case
     file_new = True
 
+    # Durations of earlier runs, used to split the tests when running them in parallel processes
+    timings_file = os.path.join(tempfile.gettempdir(), "mayaunittest", "timings.json")
+
 
 def set_temp_dir(directory):
     """Set where files generated from tests should be stored.
@@ -339,6 +438,12 @@ class TestResult(unittest.TextTestResult):
         self.successes.append(test)
 
 
+class ShardTestResult(RecordingResultMixin, TestResult):
+    """TestResult that also records the outcome and duration of every test for the report
+    of a shard (see run_tests_sharded).
+    """
+
+
 class ScriptEditorState(object):
     """Provides methods to suppress and restore script editor output."""
 
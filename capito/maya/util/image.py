@@ -1,6 +1,8 @@
 import struct
 import imghdr
 
+from capito.core.file.images import ImageError, read_image_header
+
 
 def test_jpeg(h, f):
     # SOI APP2 + ICC_PROFILE
@@ -20,7 +22,7 @@ imghdr.tests.append(test_jpeg)
 
 def get_image_size(fname):
     """Get width/height of an image without 3rd party module.
-    Supported file formats: png, gif, jpeg"""
+    Supported file formats: png, gif, jpeg, exr, tiff"""
     with open(fname, 'rb') as fhandle:
         head = fhandle.read(24)
         if len(head) != 24:
@@ -31,6 +33,12 @@ def get_image_size(fname):
             if check != 0x0d0a1a0a:
                 return
             width, height = struct.unpack('>ii', head[16:24])
+        elif what in ('exr', 'tiff'):
+            try:
+                header = read_image_header(fname)
+            except ImageError:
+                return
+            width, height = header.width, header.height
         elif what == 'gif':
             width, height = struct.unpack('<HH', head[6:10])
         elif what == 'jpeg':
@@ -28,3 +28,7 @@ __versiontuple__ = (1, 7, 1)
 __version_suffix__ = 'rc1'
 __version__ = '.'.join(str(x) for x in __versiontuple__) + __version_suffix__
 __authors__ = ['Chad Dombrova', 'Paul Molodowitch', 'Olivier Renouard', 'Ofer Koren']
+
+# trace the rest of the startup if PYMEL_STARTUP_TRACE is set
+from . import startuptrace
+startuptrace.startFromEnv()
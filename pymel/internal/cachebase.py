@@ -2,13 +2,19 @@ from builtins import zip
 from builtins import object
 import os.path
 import sys
+import time
 import pprint
 
 import pymel.util
+from pymel import startuptrace
 
 
 from pymel.util import picklezip, universalmethod
 from collections import namedtuple
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 from . import plogging
 
@@ -23,7 +29,7 @@ except:
 TYPE_CHECKING = False
 
 if TYPE_CHECKING:
-    from typing import Dict, List, Optional, Tuple, Type
+    from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 
 def _moduleJoin(*args):
@@ -99,9 +105,45 @@ def _pycodeload(code):
     return globs['data']
 
 
+class StreamingPrettyPrinter(NoStringWrappingPrettyPrinter):
+    """
+    Gives the same output as NoStringWrappingPrettyPrinter, but doesn't build
+    the one-line repr of large containers just to find out they are too wide.
+
+    A dict, list or tuple with more than width / 3 items can never fit on a
+    line (every item needs at least one char plus a ', ' separator), so it is
+    split directly.  Together with a stream this means the formatted text
+    of a huge cache is never held in memory as a whole.
+    """
+    def _format(self, object, stream, indent, allowance, context, level):
+        if (isinstance(object, (dict, list, tuple))
+                and len(object) * 3 > self._width
+                and id(object) not in context):
+            p = self._dispatch.get(type(object).__repr__, None)
+            if p is not None:
+                objid = id(object)
+                context[objid] = 1
+                p(self, object, stream, indent, allowance, context, level + 1)
+                del context[objid]
+                return
+        super()._format(object, stream, indent, allowance, context, level)
+
+
+def _pystreamdump(data, file):
+    """Write data in the .py cache format to an open binary file"""
+    import io
+    stream = io.TextIOWrapper(file, encoding='utf-8', newline='\n')
+    try:
+        stream.write('version = {!r}\n\ndata = '.format(PY_CACHE_FORMAT_VERSION))
+        StreamingPrettyPrinter()._format(data, stream, 0, 0, {}, 0)
+        stream.flush()
+    finally:
+        stream.detach()
+
+
 def _pydump(data, filename):
     with open(filename, mode='wb') as file:
-        file.write(_pyformatdump(data))
+        _pystreamdump(data, file)
 
 
 def _pyload(filename):
@@ -157,6 +199,308 @@ def _pyzipload(filename):
     return _pycodeload(importer.get_code(moduleName))
 
 
+# Indexed cache format (.pmi)
+#
+# Layout:
+#   magic (8 bytes) | index offset (8 bytes, little endian) | index size (8)
+#   value blobs...
+#   index
+#
+# Every value is stored on its own as a one byte codec tag followed by the
+# zlib compressed marshal (or, for non-builtin types, pickle) dump, so values
+# can be decoded individually.  The index is a marshalled dict:
+#   {'version': INDEXED_CACHE_FORMAT_VERSION,
+#    'kind': 'mapping' | 'sequence' | 'value',
+#    'keys': {key: (offset, size)}      # kind == 'mapping'
+#    'items': [(offset, size), ...]     # kind == 'sequence'
+#    'value': (offset, size)}           # kind == 'value'
+# A top level mapping is read as a lazy, read-only IndexedCacheMapping
+# backed by a memory map, so only the keys actually accessed are decoded.
+# PymelCache.read only returns it with lazy=True, otherwise it converts it to
+# a dict, as most callers modify what they read.
+INDEXED_CACHE_MAGIC = b'PMCIDX\x00\x01'
+INDEXED_CACHE_FORMAT_VERSION = (1, 0)
+_INDEXED_HEADER_SIZE = len(INDEXED_CACHE_MAGIC) + 16
+
+
+def _encodeValue(value):
+    # type: (Any) -> bytes
+    import marshal
+    import zlib
+    try:
+        return b'm' + zlib.compress(marshal.dumps(value))
+    except ValueError:
+        return b'p' + zlib.compress(pickle.dumps(value, -1))
+
+
+def _decodeValue(blob):
+    # type: (bytes) -> Any
+    import marshal
+    import zlib
+    codec = blob[:1]
+    raw = zlib.decompress(blob[1:])
+    if codec == b'm':
+        return marshal.loads(raw)
+    elif codec == b'p':
+        return pickle.loads(raw)
+    raise ValueError("unknown indexed cache codec %r" % codec)
+
+
+class IndexedCacheMapping(Mapping):
+    """
+    Read-only mapping over a memory mapped indexed cache file.
+
+    Keys are available immediately; values are decoded on first access and
+    then kept.  The memory map (and with it the file, which matters on
+    Windows) is closed once every value is decoded, by close(), or when the
+    mapping is garbage collected.
+    """
+
+    def __init__(self, buffer, keys, path=None):
+        # type: (Any, Dict[Any, Tuple[int, int]], Optional[str]) -> None
+        import weakref
+        self._buffer = buffer
+        self._keys = keys
+        self._decoded = {}
+        self.path = path
+        self._closer = weakref.finalize(self, buffer.close)
+
+    def __getitem__(self, key):
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        offset, size = self._keys[key]
+        if not self._closer.alive:
+            raise ValueError("%r is closed" % self)
+        value = _decodeValue(self._buffer[offset:offset + size])
+        self._decoded[key] = value
+        if len(self._decoded) == len(self._keys):
+            self.close()
+        return value
+
+    def close(self):
+        # type: () -> None
+        """Close the memory map; values not decoded yet can't be read anymore"""
+        self._closer()
+
+    @property
+    def closed(self):
+        # type: () -> bool
+        return not self._closer.alive
+
+    def toDict(self):
+        # type: () -> Dict[Any, Any]
+        """A dict of all keys and values; closes the memory map"""
+        data = dict((key, self[key]) for key in self._keys)
+        self.close()
+        return data
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def decodedCount(self):
+        # type: () -> int
+        """Number of values decoded so far"""
+        return len(self._decoded)
+
+    def __repr__(self):
+        return '%s(%r, %d keys, %d decoded)' % (type(self).__name__, self.path,
+                                               len(self), len(self._decoded))
+
+
+def _indexEntries(data, writeValue):
+    # type: (Any, Callable[[Any], Tuple[int, int]]) -> Dict[str, Any]
+    """The index of data; writeValue writes one value and returns its location"""
+    if isinstance(data, Mapping):
+        return {'kind': 'mapping',
+                'keys': dict((key, writeValue(value)) for key, value in data.items())}
+    elif isinstance(data, (tuple, list)):
+        return {'kind': 'sequence', 'items': [writeValue(value) for value in data]}
+    return {'kind': 'value', 'value': writeValue(data)}
+
+
+def _indexeddump(data, filename):
+    import marshal
+    import struct
+
+    with open(filename, mode='wb') as file:
+        file.write(INDEXED_CACHE_MAGIC + b'\x00' * 16)
+        offset = _INDEXED_HEADER_SIZE
+
+        def writeValue(value):
+            nonlocal offset
+            blob = _encodeValue(value)
+            file.write(blob)
+            offset += len(blob)
+            return (offset - len(blob), len(blob))
+
+        index = {'version': INDEXED_CACHE_FORMAT_VERSION}
+        index.update(_indexEntries(data, writeValue))
+        indexBytes = marshal.dumps(index)
+        file.write(indexBytes)
+        file.seek(len(INDEXED_CACHE_MAGIC))
+        file.write(struct.pack('<QQ', offset, len(indexBytes)))
+
+
+def _readIndexed(filename, magic=INDEXED_CACHE_MAGIC):
+    # type: (str, bytes) -> Tuple[Any, dict]
+    import marshal
+    import mmap
+    import struct
+
+    with open(filename, mode='rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if buffer[:len(magic)] != magic:
+        buffer.close()
+        raise ValueError("%r is not an indexed pymel cache" % filename)
+    indexOffset, indexSize = struct.unpack(
+        '<QQ', buffer[len(magic):_INDEXED_HEADER_SIZE])
+    index = marshal.loads(buffer[indexOffset:indexOffset + indexSize])
+    return buffer, index
+
+
+def _indexedload(filename):
+    buffer, index = _readIndexed(filename)
+    return _loadIndexEntries(buffer, index, filename)
+
+
+def _loadIndexEntries(buffer, index, filename):
+    # a mapping keeps the buffer open, anything else is decoded right away
+    kind = index['kind']
+    if kind == 'mapping':
+        return IndexedCacheMapping(buffer, index['keys'], path=filename)
+    try:
+        if kind == 'sequence':
+            return tuple(_decodeValue(buffer[offset:offset + size])
+                         for offset, size in index['items'])
+        offset, size = index['value']
+        return _decodeValue(buffer[offset:offset + size])
+    finally:
+        buffer.close()
+
+
+def convertCache(srcPath, dstPath=None):
+    # type: (str, Optional[str]) -> str
+    """
+    Convert a cache file in any of the PymelCache.FORMATS into the indexed
+    format.  If no dstPath is given, the source extension is replaced by
+    '.pmi'.  Returns the written path.
+    """
+    srcExt = _cacheExtension(srcPath)
+    if dstPath is None:
+        dstPath = srcPath[:-len(srcExt)] + '.pmi'
+    data = PymelCache.EXTENSIONS[srcExt].reader(srcPath)
+    _indexeddump(data, dstPath)
+    return dstPath
+
+
+# Multi version cache store (.pmv)
+#
+# Holds every version of one cache (ie, mayaCmdsExamples2024..2027) in one
+# file.  The layout is that of the indexed format, but each distinct value
+# blob is only stored once and shared by all versions that have it, so a new
+# version only adds the values that changed.  The index is a marshalled dict:
+#   {'version': MULTI_VERSION_FORMAT_VERSION,
+#    'versions': {version: index of that version, as in the indexed format}}
+# PymelCache.read falls back to the store of its NAME when there is no cache
+# file for the version, and returns the same lazy mapping as for '.pmi'.
+MULTI_VERSION_MAGIC = b'PMCMVS\x00\x01'
+MULTI_VERSION_FORMAT_VERSION = (1, 0)
+MULTI_VERSION_EXT = '.pmv'
+
+
+def writeMultiVersion(versions, filename):
+    # type: (Mapping[str, Any], str) -> Dict[str, int]
+    """
+    Write the data of every version in versions into the store filename.
+    Returns the number of values, of distinct (stored) values and bytes written.
+    """
+    import marshal
+    import struct
+
+    stats = {'values': 0, 'stored': 0}
+    blobs = {}  # type: Dict[bytes, Tuple[int, int]]
+    tmpPath = filename + '.tmp'
+    with open(tmpPath, mode='wb') as file:
+        file.write(MULTI_VERSION_MAGIC + b'\x00' * 16)
+        offset = _INDEXED_HEADER_SIZE
+
+        def writeValue(value):
+            nonlocal offset
+            stats['values'] += 1
+            blob = _encodeValue(value)
+            location = blobs.get(blob)
+            if location is None:
+                file.write(blob)
+                location = blobs[blob] = (offset, len(blob))
+                offset += len(blob)
+            return location
+
+        index = {'version': MULTI_VERSION_FORMAT_VERSION,
+                 'versions': dict((str(version), _indexEntries(versions[version], writeValue))
+                                  for version in sorted(versions))}
+        indexBytes = marshal.dumps(index)
+        file.write(indexBytes)
+        file.seek(len(MULTI_VERSION_MAGIC))
+        file.write(struct.pack('<QQ', offset, len(indexBytes)))
+    os.replace(tmpPath, filename)
+    stats['stored'] = len(blobs)
+    stats['size'] = os.path.getsize(filename)
+    return stats
+
+
+def multiVersionVersions(filename):
+    # type: (str) -> List[str]
+    """The versions held in the store filename"""
+    buffer, index = _readIndexed(filename, MULTI_VERSION_MAGIC)
+    buffer.close()
+    return sorted(index['versions'])
+
+
+def readMultiVersion(filename, version):
+    # type: (str, str) -> Any
+    """The data of version in the store filename; raises KeyError if it has none"""
+    buffer, index = _readIndexed(filename, MULTI_VERSION_MAGIC)
+    try:
+        versionIndex = index['versions'][str(version)]
+    except KeyError:
+        buffer.close()
+        raise KeyError("version %s not in %r" % (version, filename))
+    return _loadIndexEntries(buffer, versionIndex, filename)
+
+
+def addMultiVersion(filename, versions):
+    # type: (str, Mapping[str, Any]) -> Dict[str, int]
+    """
+    Add (or replace) versions in the store filename, creating it if needed.
+    Values already stored for other versions are shared, not stored again.
+    """
+    allVersions = {}  # type: Dict[str, Any]
+    if os.path.isfile(filename):
+        for version in multiVersionVersions(filename):
+            data = readMultiVersion(filename, version)
+            allVersions[version] = data.toDict() if isinstance(data, IndexedCacheMapping) else data
+    allVersions.update((str(version), data) for version, data in versions.items())
+    return writeMultiVersion(allVersions, filename)
+
+
+def _cacheExtension(path):
+    # type: (str) -> str
+    """Longest known cache extension of path (ie, '.pyc.zip' not '.zip')"""
+    lowered = path.lower()
+    matches = [ext for ext in PymelCache.EXTENSIONS if lowered.endswith(ext)]
+    if not matches:
+        raise ValueError("unknown cache format: %r" % path)
+    return max(matches, key=len)
+
+
 CacheFormat = namedtuple('CacheFormat', ['ext', 'reader', 'writer'])
 
 
@@ -170,6 +514,7 @@ class PymelCache(object):
     DESC = ''   # ie, 'the API cache' - used in error messages, etc
 
     FORMATS = [
+        CacheFormat('.pmi', _indexedload, _indexeddump),
         CacheFormat('.py', _pyload, _pydump),
         CacheFormat('.pyc.zip', _pyzipload, _pyczipdump),
         CacheFormat('.py.zip', _pyzipload, _pyzipdump),
@@ -182,6 +527,10 @@ class PymelCache(object):
     # whether to add the version to the filename when writing out the cache
     USE_VERSION = True
 
+    # whether write() needs to deepcopy the data first; None means only if
+    # toRawData is overridden (as that may modify the data in place)
+    SNAPSHOT_ON_WRITE = None  # type: Optional[bool]
+
     _lastReadPath = None
     _lastWritePath = None
 
@@ -196,7 +545,17 @@ class PymelCache(object):
         # ToDo: No need for toRawData
         return data
 
-    def read(self, path=None, ext=None, ignoreError=False):
+    def read(self, path=None, ext=None, ignoreError=False, lazy=False):
+        """
+        Read the cache from path, or the first existing file of FORMATS (or the
+        multi version store).  An indexed (.pmi) file is only used if it is at
+        least as new as the files of all other formats, so an outdated index
+        doesn't hide a rewritten cache.
+
+        lazy : bool
+            return indexed and multi version mappings as the read-only
+            IndexedCacheMapping that decodes values on access, instead of a dict
+        """
         if path is not None and ext is None:
             ext = os.path.splitext(path)[1]
             if not ext:
@@ -219,25 +578,95 @@ class PymelCache(object):
                 _logger.debug(self._actionMessage(
                     'Unable to open', 'from nonexistant path', formatPath))
                 continue
+            if path is None and ext is None and format.ext == '.pmi' \
+                    and not self._isIndexCurrent(formatPath):
+                _logger.debug(self._actionMessage(
+                    'Skipping outdated', 'at', formatPath))
+                continue
 
             func = format.reader
             _logger.debug(self._actionMessage('Loading', 'from', formatPath))
+            start = time.perf_counter()
             try:
-                finalData = self.fromRawData(func(formatPath))
+                finalData = self.fromRawData(self._loaded(func(formatPath), lazy))
             except Exception as e:
                 self._errorMsg('read', 'from', formatPath, e)
                 if not ignoreError:
                     raise
             else:
+                startuptrace.record('cache', os.path.basename(formatPath),
+                                    time.perf_counter() - start, format=format.ext)
                 self._lastReadPath = formatPath
                 return finalData
 
-    def write(self, data, path=None, ext=None, ignoreError=False):
-        # type: (T, Optional[str], Optional[str], bool) -> None
-        import copy
-        # when writing data, we dont' actually want to modify the passed in
-        # data, as it may be in use... so we make a deepcopy
-        data = copy.deepcopy(data)
+        if path is None and ext is None and self.USE_VERSION:
+            return self._readMultiVersion(ignoreError=ignoreError, lazy=lazy)
+
+    @staticmethod
+    def _loaded(data, lazy):
+        if not lazy and isinstance(data, IndexedCacheMapping):
+            return data.toDict()
+        return data
+
+    def _isIndexCurrent(self, indexPath):
+        # type: (str) -> bool
+        """Whether indexPath is at least as new as the files of the other formats"""
+        indexTime = os.path.getmtime(indexPath)
+        for format in self.FORMATS:
+            if format.ext == '.pmi':
+                continue
+            formatPath = self.path(ext=format.ext)
+            if os.path.isfile(formatPath) and os.path.getmtime(formatPath) > indexTime:
+                return False
+        return True
+
+    def _readMultiVersion(self, ignoreError=False, lazy=False):
+        storePath = self.multiVersionPath()
+        if not os.path.isfile(storePath):
+            return None
+        version = self.versionName()
+        start = time.perf_counter()
+        try:
+            finalData = self.fromRawData(
+                self._loaded(readMultiVersion(storePath, version), lazy))
+        except KeyError:
+            _logger.debug(self._actionMessage(
+                'No version %s of' % version, 'in', storePath))
+            return None
+        except Exception as e:
+            self._errorMsg('read', 'from', storePath, e)
+            if not ignoreError:
+                raise
+        else:
+            startuptrace.record('cache', '%s[%s]' % (os.path.basename(storePath), version),
+                                time.perf_counter() - start, format=MULTI_VERSION_EXT)
+            self._lastReadPath = storePath
+            return finalData
+
+    @classmethod
+    def needsSnapshot(cls):
+        # type: () -> bool
+        """Whether write has to deepcopy the data before serialising it"""
+        if cls.SNAPSHOT_ON_WRITE is not None:
+            return cls.SNAPSHOT_ON_WRITE
+        # only toRawData modifies data in place - the writers don't
+        return cls.toRawData is not PymelCache.toRawData
+
+    def write(self, data, path=None, ext=None, ignoreError=False,
+              snapshot=None):
+        # type: (T, Optional[str], Optional[str], bool, Optional[bool]) -> None
+        """
+        snapshot : Optional[bool]
+            deepcopy data before writing it.  Defaults to needsSnapshot();
+            pass False if data is not in use elsewhere or immutable
+        """
+        if snapshot is None:
+            snapshot = self.needsSnapshot()
+        if snapshot:
+            import copy
+            # when writing data, we dont' actually want to modify the passed
+            # in data, as it may be in use... so we make a deepcopy
+            data = copy.deepcopy(data)
 
         if path is not None and ext is None:
             ext = os.path.splitext(path)[1]
@@ -258,25 +687,36 @@ class PymelCache(object):
         else:
             self._lastWritePath = path
 
+    @universalmethod
+    def versionName(self, version=None):
+        # type: (Optional[str]) -> str
+        """The version in the file names: version, self.version or the maya version"""
+        if version is not None:
+            return str(version)
+        elif hasattr(self, 'version'):
+            return str(self.version)
+        import pymel.versions
+        return pymel.versions.shortName()
+
     @universalmethod
     def path(self, version=None, ext=None):
         # type: (Optional[str], Optional[str]) -> str
         if ext is None:
             ext = self.DEFAULT_EXT
         if self.USE_VERSION:
-            if version is not None:
-                short_version = str(version)
-            elif hasattr(self, 'version'):
-                short_version = str(self.version)
-            else:
-                import pymel.versions
-                short_version = pymel.versions.shortName()
+            short_version = self.versionName(version)
         else:
             short_version = ''
 
         newPath = _moduleJoin('cache', self.NAME + short_version)
         return newPath + ext
 
+    @classmethod
+    def multiVersionPath(cls):
+        # type: () -> str
+        """The store holding several versions of this cache (see writeMultiVersion)"""
+        return _moduleJoin('cache', cls.NAME + MULTI_VERSION_EXT)
+
     @classmethod
     def allVersions(cls, allowEmpty=False):
         # type: (bool) -> List[str]
@@ -305,7 +745,9 @@ class PymelCache(object):
                 version = match.group(1)
                 if allowEmpty or version != '':
                     versions.append(version)
-        return sorted(versions)
+        if cls.USE_VERSION and os.path.isfile(cls.multiVersionPath()):
+            versions.extend(multiVersionVersions(cls.multiVersionPath()))
+        return sorted(set(versions))
 
     @classmethod
     def _actionMessage(cls, action, direction, location):
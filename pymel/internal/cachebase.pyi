@@ -2,15 +2,43 @@ import pprint
 from . import plogging as plogging
 from _typeshed import Incomplete
 from pymel.util import picklezip as picklezip, universalmethod as universalmethod
-from typing import Dict, List, NamedTuple, Optional, Tuple, Type
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type
 
 TYPE_CHECKING: bool
 PY_CACHE_FORMAT_VERSION: Incomplete
 
 class NoStringWrappingPrettyPrinter(pprint.PrettyPrinter): ...
+class StreamingPrettyPrinter(NoStringWrappingPrettyPrinter): ...
 
 py_pformat: Incomplete
 
+INDEXED_CACHE_MAGIC: bytes
+INDEXED_CACHE_FORMAT_VERSION: Tuple[int, int]
+
+class IndexedCacheMapping(Mapping):
+    path: Optional[str]
+    def __init__(self, buffer, keys: Dict[Any, Tuple[int, int]], path: Optional[str] = ...) -> None: ...
+    def __getitem__(self, key): ...
+    def __contains__(self, key) -> bool: ...
+    def __iter__(self): ...
+    def __len__(self) -> int: ...
+    def decodedCount(self) -> int: ...
+    def close(self) -> None: ...
+    @property
+    def closed(self) -> bool: ...
+    def toDict(self) -> Dict[Any, Any]: ...
+
+def convertCache(srcPath: str, dstPath: Optional[str] = ...) -> str: ...
+
+MULTI_VERSION_MAGIC: bytes
+MULTI_VERSION_FORMAT_VERSION: Tuple[int, int]
+MULTI_VERSION_EXT: str
+
+def writeMultiVersion(versions: Mapping[str, Any], filename: str) -> Dict[str, int]: ...
+def multiVersionVersions(filename: str) -> List[str]: ...
+def readMultiVersion(filename: str, version: str) -> Any: ...
+def addMultiVersion(filename: str, versions: Mapping[str, Any]) -> Dict[str, int]: ...
+
 class CacheFormat(NamedTuple):
     ext: Incomplete
     reader: Incomplete
@@ -23,12 +51,18 @@ class PymelCache:
     EXTENSIONS: Incomplete
     DEFAULT_EXT: str
     USE_VERSION: bool
+    SNAPSHOT_ON_WRITE: Optional[bool]
+    @classmethod
+    def needsSnapshot(cls) -> bool: ...
     def fromRawData(self, rawData): ...
     def toRawData(self, data): ...
-    def read(self, path: Incomplete | None = ..., ext: Incomplete | None = ..., ignoreError: bool = ...): ...
-    def write(self, data: T, path: Optional[str] = ..., ext: Optional[str] = ..., ignoreError: bool = ...) -> None: ...
+    def read(self, path: Incomplete | None = ..., ext: Incomplete | None = ..., ignoreError: bool = ..., lazy: bool = ...): ...
+    def write(self, data: T, path: Optional[str] = ..., ext: Optional[str] = ..., ignoreError: bool = ..., snapshot: Optional[bool] = ...) -> None: ...
+    def versionName(self, version: Optional[str] = ...) -> str: ...
     def path(self, version: Optional[str] = ..., ext: Optional[str] = ...) -> str: ...
     @classmethod
+    def multiVersionPath(cls) -> str: ...
+    @classmethod
     def allVersions(cls, allowEmpty: bool = ...) -> List[str]: ...
 
 class SubItemCache(PymelCache):
@@ -4,6 +4,7 @@ import os
 import re
 import inspect
 import keyword
+import threading
 
 # PyMEL imports
 import pymel.util as util
@@ -1255,6 +1256,83 @@ class CmdProcessedExamplesCache(CmdExamplesCache):
     USE_VERSION = False
 
 
+class CmdExamplesProvider(object):
+    """
+    Per command access to the command examples, for the docstrings.
+
+    Nothing is read until the first example is requested. The processed
+    examples are used if they exist, the examples of the current maya version
+    otherwise. They are read from an indexed (.pmi) cache or the multi version
+    store (.pmv), so only the examples actually requested are decoded; if there
+    is only a source cache file, it is read once and (if writeIndex is True)
+    converted to a .pmi for the next session.
+    """
+
+    def __init__(self, caches=None, writeIndex=True):
+        # type: (Optional[Iterable[Type[cachebase.PymelCache]]], bool) -> None
+        if caches is None:
+            caches = (CmdProcessedExamplesCache, CmdExamplesCache)
+        self.caches = tuple(caches)
+        self.writeIndex = writeIndex
+        self._examples = None  # type: Optional[Mapping[str, str]]
+        self._lock = threading.Lock()
+
+    def _read(self, cacheCls):
+        # type: (Type[cachebase.PymelCache]) -> Optional[Mapping[str, str]]
+        cache = cacheCls()
+        indexPath = cache.path(ext='.pmi')
+        sources = [(cache.path(ext=fmt.ext), fmt.ext) for fmt in cache.FORMATS
+                   if fmt.ext != '.pmi']
+        sources = [(path, ext) for path, ext in sources if os.path.isfile(path)]
+        if not sources or (os.path.isfile(indexPath) and cache._isIndexCurrent(indexPath)):
+            # a current index, or no file for this version - maybe in the
+            # multi version store
+            return cache.read(ignoreError=True, lazy=True)
+        data = cache.read(path=sources[0][0], ext=sources[0][1], ignoreError=True)
+        if data and self.writeIndex:
+            tmpPath = '%s.%d.tmp' % (indexPath, os.getpid())
+            try:
+                cache.EXTENSIONS['.pmi'].writer(data, tmpPath)
+                os.replace(tmpPath, indexPath)
+            except (IOError, OSError) as e:
+                _logger.debug("could not write %s: %s" % (indexPath, e))
+                if os.path.exists(tmpPath):
+                    os.remove(tmpPath)
+        return data
+
+    def examples(self):
+        # type: () -> Mapping[str, str]
+        """The examples of all commands (read on first call)"""
+        if self._examples is None:
+            with self._lock:
+                if self._examples is None:
+                    examples = {}  # type: Mapping[str, str]
+                    for cacheCls in self.caches:
+                        data = self._read(cacheCls)
+                        if data:
+                            examples = data
+                            break
+                    self._examples = examples
+        return self._examples
+
+    def get(self, cmdName, default=None):
+        # type: (str, Optional[str]) -> Optional[str]
+        """The example of cmdName, or default if there is none"""
+        return self.examples().get(cmdName, default) or default
+
+    def __contains__(self, cmdName):
+        return bool(self.examples().get(cmdName))
+
+    def isLoaded(self):
+        # type: () -> bool
+        return self._examples is not None
+
+    def clear(self):
+        # type: () -> None
+        """Drop the examples read so far; they are read again on next use"""
+        self._examples = None
+
+
 # data type:: SparseCommandInfo
 class CmdDocsCache(cachebase.PymelCache):
     NAME = 'mayaCmdsDocs'
@@ -35,6 +35,16 @@ class CmdExamplesCache(cachebase.PymelCache):
 class CmdProcessedExamplesCache(CmdExamplesCache):
     USE_VERSION: bool
 
+class CmdExamplesProvider:
+    caches: Tuple[Type[cachebase.PymelCache], ...]
+    writeIndex: bool
+    def __init__(self, caches: Optional[Iterable[Type[cachebase.PymelCache]]] = ..., writeIndex: bool = ...) -> None: ...
+    def examples(self) -> Mapping[str, str]: ...
+    def get(self, cmdName: str, default: Optional[str] = ...) -> Optional[str]: ...
+    def __contains__(self, cmdName) -> bool: ...
+    def isLoaded(self) -> bool: ...
+    def clear(self) -> None: ...
+
 class CmdDocsCache(cachebase.PymelCache):
     NAME: str
     DESC: str
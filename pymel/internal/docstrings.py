@@ -174,11 +174,16 @@ class RstDocstringBuilder(DocstringBuilder):
     def addFooter(self):
         footer = super(RstDocstringBuilder, self).addFooter()
 
-        if self.cmdInfo.get('example', None):
+        example = self.cmdInfo.get('example', None)
+        if not example:
+            import pymel.internal.factories as factories
+            # examples aren't crucial, the provider doesn't error if they can't be read
+            example = factories.cmdExamples.get(self.cmdName)
+        if example:
             # docstring = ".. |create| image:: /images/create.gif\n.. |edit| image::
             # /images/edit.gif\n.. |query| image:: /images/query.gif\n\n" + docstring
             footer += ('\n\n' + self.section('Example') + '\n::\n' +
-                       self.cmdInfo['example'])
+                       example)
         return footer
 
 
@@ -24,6 +24,7 @@ import pymel.api as api
 import pymel.util as util
 from pymel.util.conditions import Always, Condition
 import pymel.versions as versions
+from pymel import startuptrace
 from pymel.internal.pwarnings import deprecated, maya_deprecated
 
 # Module imports
@@ -135,6 +136,7 @@ def loadApiCache():
 
     _elapsed = time.time() - _start
     _logger.debug("Initialized API Cache in in %.2f sec" % _elapsed)
+    startuptrace.record('cache', 'loadApiCache', _elapsed)
 
 
 def _setApiCacheGlobals():
@@ -175,6 +177,7 @@ def loadCmdCache():
 
     _elapsed = time.time() - _start
     _logger.debug("Initialized Cmd Cache in in %.2f sec" % _elapsed)
+    startuptrace.record('cache', 'loadCmdCache', _elapsed)
 
 
 def saveApiCache():
@@ -535,16 +538,9 @@ simpleCommandWraps = {
 }
 # ---------------------------------------------------------------
 
-if docstringMode == 'html':
-    # examples aren't crucial, don't error if can't be read
-    examples = cmdcache.CmdProcessedExamplesCache().read(ignoreError=True)
-    if examples:
-        for cmd, example in examples.items():
-            try:
-                cmdlist[cmd]['example'] = example
-            except KeyError:
-                print("found an example for an unknown command:", cmd)
-                pass
+#: command examples for the docstrings, only read when a docstring that shows
+#: them is first built (ie, in 'html' docstringMode)
+cmdExamples = cmdcache.CmdExamplesProvider()
 
 
 def _getApiOverrideData(classname, pymelName):
@@ -76,7 +76,7 @@ class Flag(Condition):
     def eval(self, kwargs): ...
 
 simpleCommandWraps: Incomplete
-examples: Incomplete
+cmdExamples: cmdcache.CmdExamplesProvider
 
 def getUncachedCmds(): ...
 
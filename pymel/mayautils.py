@@ -295,9 +295,10 @@ def recurseMayaScriptPath(roots=[], verbose=False, excludeRegex=None,
         if re.match(includeRegex, root.name) and root.exists():
             _logger.debug("Searching for all valid script directories "
                           "below %s" % rootVar)
-            for f in root.walkdirs(errors=errors, regex=includeRegex):
+            for f in root.scanwalk(errors=errors, regex=includeRegex,
+                                   kind='dirs', prune=True):
                 try:
-                    if len(f.files("*.mel")):
+                    if next(f.iterfiles("*.mel"), None) is not None:
                         addDir(str(f))
                 except OSError:
                     pass
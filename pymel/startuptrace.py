@@ -0,0 +1,321 @@
+"""
+Opt-in tracer for the cost of starting pymel (and whatever is imported after it).
+
+Set the environment variable ``PYMEL_STARTUP_TRACE`` before starting maya or
+mayapy to record:
+
+- the import time of every module imported after ``pymel``: the time spent
+  finding it on ``sys.path``, its inclusive time and its own (self) time
+  without the modules it imports
+- the pymel cache loads (``loadApiCache``, ``loadCmdCache`` and every cache
+  file read)
+- the first use of every `LazyLoadModule` attribute
+
+The value of the variable is the report file; ``1`` writes
+``pymel_startup_<pid>.json`` in the temp directory, a directory writes the
+same name in that directory, and ``{pid}`` in a file name is replaced with the
+process id (for worker processes sharing an environment).  The report is
+written at exit, or earlier with `save`.
+
+Reports are compared with ``mayapy -m pymel.tools.startuptool diff a.json b.json``.
+
+This module only uses the standard library, so it can be imported before the
+rest of pymel.
+"""
+from __future__ import print_function
+
+import atexit
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Iterator, List, Optional
+
+ENV_VAR = 'PYMEL_STARTUP_TRACE'
+REPORT_VERSION = 1
+
+_tracer = None  # type: Optional[StartupTracer]
+
+
+class _TracingLoader(object):
+    """Wraps the loader of a module spec to time the execution of the module"""
+
+    def __init__(self, tracer, loader):
+        self._tracer = tracer
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._tracer._enter(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._tracer._exit()
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class _TracingFinder(object):
+    """
+    Meta path finder which asks the other finders for the spec, timing the
+    search, and wraps its loader.
+    """
+
+    def __init__(self, tracer):
+        self._tracer = tracer
+
+    def find_spec(self, fullname, path=None, target=None):
+        start = time.perf_counter()
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            findSpec = getattr(finder, 'find_spec', None)
+            if findSpec is None:
+                continue
+            spec = findSpec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        self._tracer._finds[fullname] = time.perf_counter() - start
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TracingLoader(self._tracer, spec.loader)
+        return spec
+
+
+class StartupTracer(object):
+    """Collects the module and event records of one process"""
+
+    def __init__(self, reportFile=None):
+        # type: (Optional[str]) -> None
+        self.reportFile = reportFile
+        self.startTime = time.time()
+        self._t0 = time.perf_counter()
+        self.modules = []  # type: List[Dict[str, Any]]
+        self.events = []  # type: List[Dict[str, Any]]
+        self._finds = {}  # type: Dict[str, float]
+        self._local = threading.local()
+        self._finder = _TracingFinder(self)
+
+    def install(self):
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        stack = self._stack()
+        record = {'name': name, 'start': now - self._t0,
+                  'find': self._finds.pop(name, 0.0), 'depth': len(stack),
+                  'parent': stack[-1][0]['name'] if stack else None}
+        if threading.current_thread() is not threading.main_thread():
+            record['thread'] = threading.current_thread().name
+        if stack:
+            # the search for this module is part of the parent's children time
+            stack[-1][1] += record['find']
+        stack.append([record, 0.0, now])
+
+    def _exit(self):
+        now = time.perf_counter()
+        stack = self._stack()
+        record, childTime, start = stack.pop()
+        record['inclusive'] = now - start
+        record['self'] = record['inclusive'] - childTime
+        if stack:
+            stack[-1][1] += record['inclusive']
+        self.modules.append(record)
+
+    def record(self, kind, name, duration, **info):
+        # type: (str, str, float, **Any) -> None
+        stack = self._stack()
+        event = {'kind': kind, 'name': name, 'duration': duration,
+                 'start': time.perf_counter() - self._t0 - duration,
+                 'module': stack[-1][0]['name'] if stack else None}
+        event.update(info)
+        self.events.append(event)
+
+    def report(self):
+        # type: () -> Dict[str, Any]
+        modules = sorted(self.modules, key=lambda r: r['start'])
+        packages = {}  # type: Dict[str, float]
+        for record in modules:
+            package = record['name'].split('.')[0]
+            packages[package] = packages.get(package, 0.0) + record['self'] + record['find']
+        kinds = {}  # type: Dict[str, float]
+        for event in self.events:
+            kinds[event['kind']] = kinds.get(event['kind'], 0.0) + event['duration']
+        return {
+            'version': REPORT_VERSION,
+            'executable': sys.executable,
+            'argv': list(sys.argv),
+            'pid': os.getpid(),
+            'startTime': self.startTime,
+            'elapsed': time.perf_counter() - self._t0,
+            'summary': {
+                'modules': len(modules),
+                'importTime': sum(r['inclusive'] + r['find'] for r in modules
+                                  if r['depth'] == 0),
+                'packages': packages,
+                'events': kinds,
+            },
+            'modules': modules,
+            'events': self.events,
+        }
+
+    def save(self, reportFile=None):
+        # type: (Optional[str]) -> str
+        reportFile = _reportPath(reportFile or self.reportFile)
+        with open(reportFile, 'w') as f:
+            json.dump(self.report(), f, indent=1)
+        return reportFile
+
+
+def _reportPath(value):
+    # type: (Optional[str]) -> str
+    name = 'pymel_startup_%d.json' % os.getpid()
+    if not value or value.lower() in ('1', 'true', 'on', 'yes'):
+        return os.path.join(tempfile.gettempdir(), name)
+    if os.path.isdir(value):
+        return os.path.join(value, name)
+    return value.replace('{pid}', str(os.getpid()))
+
+
+def _saveAtExit():
+    if _tracer is not None:
+        try:
+            path = _tracer.save()
+        except (IOError, OSError) as e:
+            print('pymel: could not write the startup trace: %s' % e, file=sys.stderr)
+        else:
+            print('pymel: startup trace written to %s' % path, file=sys.stderr)
+
+
+def start(reportFile=None):
+    # type: (Optional[str]) -> StartupTracer
+    """Start tracing imports; the report is written to reportFile at exit"""
+    global _tracer
+    if _tracer is None:
+        _tracer = StartupTracer(reportFile)
+        _tracer.install()
+        atexit.register(_saveAtExit)
+    return _tracer
+
+
+def startFromEnv():
+    # type: () -> Optional[StartupTracer]
+    """Start tracing if the PYMEL_STARTUP_TRACE environment variable is set"""
+    value = os.environ.get(ENV_VAR)
+    if not value or value.lower() in ('0', 'false', 'off', 'no'):
+        return None
+    return start(value)
+
+
+def stop():
+    # type: () -> None
+    """Stop tracing new imports (the records so far are kept)"""
+    if _tracer is not None:
+        _tracer.uninstall()
+
+
+def isActive():
+    # type: () -> bool
+    return _tracer is not None
+
+
+def record(kind, name, duration, **info):
+    # type: (str, str, float, **Any) -> None
+    """Record an event of duration seconds which just ended; no-op if not tracing"""
+    if _tracer is not None:
+        _tracer.record(kind, name, duration, **info)
+
+
+@contextlib.contextmanager
+def span(kind, name, **info):
+    # type: (str, str, **Any) -> Iterator[None]
+    """Record the time spent in the with block as an event"""
+    if _tracer is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _tracer.record(kind, name, time.perf_counter() - start, **info)
+
+
+def mark(name, **info):
+    # type: (str, **Any) -> None
+    """Record a point in time (ie, the end of a setup step)"""
+    record('mark', name, 0.0, **info)
+
+
+def save(reportFile=None):
+    # type: (Optional[str]) -> Optional[str]
+    """Write the report now; returns the path, or None if not tracing"""
+    if _tracer is None:
+        return None
+    return _tracer.save(reportFile)
+
+
+def loadReport(path):
+    # type: (str) -> Dict[str, Any]
+    with open(path, 'r') as f:
+        report = json.load(f)
+    if report.get('version') != REPORT_VERSION:
+        raise ValueError('%s is not a startup trace report (version %s)'
+                         % (path, report.get('version')))
+    return report
+
+
+def _totals(report, what):
+    # type: (Dict[str, Any], str) -> Dict[str, float]
+    totals = {}  # type: Dict[str, float]
+    if what == 'modules':
+        for record in report['modules']:
+            totals[record['name']] = totals.get(record['name'], 0.0) + record['self'] + record['find']
+    elif what == 'packages':
+        totals.update(report['summary']['packages'])
+    else:
+        for event in report['events']:
+            if event['kind'] == what:
+                totals[event['name']] = totals.get(event['name'], 0.0) + event['duration']
+    return totals
+
+
+def diffReports(before, after, what='modules'):
+    # type: (Dict[str, Any], Dict[str, Any], str) -> List[Dict[str, Any]]
+    """
+    Compare two reports. what is 'modules' (self + find time of every module),
+    'packages' (the same summed per top level package), or an event kind
+    ('cache', 'lazy', 'mark').
+
+    Returns rows with name, before, after and delta (in seconds, None where
+    the entry is missing in a report), the largest change first.
+    """
+    a = _totals(before, what)
+    b = _totals(after, what)
+    rows = []
+    for name in set(a) | set(b):
+        rows.append({'name': name, 'before': a.get(name), 'after': b.get(name),
+                     'delta': b.get(name, 0.0) - a.get(name, 0.0)})
+    rows.sort(key=lambda row: (-abs(row['delta']), row['name']))
+    return rows
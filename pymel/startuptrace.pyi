@@ -0,0 +1,27 @@
+from typing import *
+
+ENV_VAR: str
+REPORT_VERSION: int
+
+class StartupTracer:
+    reportFile: Optional[str]
+    startTime: float
+    modules: List[Dict[str, Any]]
+    events: List[Dict[str, Any]]
+    def __init__(self, reportFile: Optional[str] = ...) -> None: ...
+    def install(self) -> None: ...
+    def uninstall(self) -> None: ...
+    def record(self, kind: str, name: str, duration: float, **info: Any) -> None: ...
+    def report(self) -> Dict[str, Any]: ...
+    def save(self, reportFile: Optional[str] = ...) -> str: ...
+
+def start(reportFile: Optional[str] = ...) -> StartupTracer: ...
+def startFromEnv() -> Optional[StartupTracer]: ...
+def stop() -> None: ...
+def isActive() -> bool: ...
+def record(kind: str, name: str, duration: float, **info: Any) -> None: ...
+def span(kind: str, name: str, **info: Any) -> ContextManager[None]: ...
+def mark(name: str, **info: Any) -> None: ...
+def save(reportFile: Optional[str] = ...) -> Optional[str]: ...
+def loadReport(path: str) -> Dict[str, Any]: ...
+def diffReports(before: Dict[str, Any], after: Dict[str, Any], what: str = ...) -> List[Dict[str, Any]]: ...
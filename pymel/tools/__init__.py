@@ -8,6 +8,10 @@ Tool Modules
   - `pymel.tools.mel2py`
   - `pymel.tools.py2mel`
   - `pymel.tools.envparse`
+  - `pymel.tools.cachetool`
+  - `pymel.tools.nameparsetool`
+  - `pymel.tools.pathtool`
+  - `pymel.tools.startuptool`
 
 """
 from builtins import *
@@ -0,0 +1,396 @@
+"""
+Command line tools for the pymel cache files.
+
+Usage::
+
+    mayapy -m pymel.tools.cachetool convert [paths...]
+    mayapy -m pymel.tools.cachetool bench [paths...]
+    mayapy -m pymel.tools.cachetool convert-all [--to .pmi] [--jobs N] [--name NAME]
+    mayapy -m pymel.tools.cachetool validate [--jobs N] [--name NAME]
+    mayapy -m pymel.tools.cachetool pack NAME [--remove]
+    mayapy -m pymel.tools.cachetool add-version NAME VERSION [--from PATH] [--remove]
+    mayapy -m pymel.tools.cachetool store-info [NAME...]
+
+``convert`` writes an indexed ``.pmi`` file next to each given cache file
+(default: every ``.py``/``.bin``/``.zip`` cache in ``pymel/cache``).
+
+``bench`` loads each cache file and its ``.pmi`` counterpart in a fresh
+interpreter and reports cold-load time and peak RSS, once loading only and
+once accessing a handful of keys.
+
+``convert-all`` converts every version of every cache (as found by
+``PymelCache.allVersions``) into another format in a process pool and
+validates the result by reading it back.  ``validate`` only reads every
+version in every available format and checks they hold the same data.
+
+``pack`` moves every version of a cache (ie, ``mayaCmdsExamples2024..2027``)
+into its multi version store ``NAME.pmv``, where values that are the same in
+several versions are only stored once.  ``add-version`` adds one version to
+the store (by default from its cache file, ie after a cache rebuild), storing
+only the values that differ from the versions already in it.  With
+``--remove`` the per version files are deleted once they are in the store;
+``PymelCache.read`` falls back to the store when there is no file for a
+version.  ``store-info`` lists the versions and sizes of the stores.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+from pymel.internal import cachebase
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional
+
+SOURCE_EXTENSIONS = ('.py', '.pyc.zip', '.py.zip', '.bin', '.zip')
+
+# executed in a fresh interpreter by benchLoad
+_BENCH_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+from pymel.internal import cachebase
+importTime = time.perf_counter() - start
+path, ext, touch = sys.argv[1], sys.argv[2], int(sys.argv[3])
+start = time.perf_counter()
+data = cachebase.PymelCache.EXTENSIONS[ext].reader(path)
+loadTime = time.perf_counter() - start
+start = time.perf_counter()
+if touch and hasattr(data, 'keys'):
+    for key in sorted(data.keys())[:touch]:
+        data[key]
+touchTime = time.perf_counter() - start
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != 'darwin':
+        rss *= 1024
+except ImportError:
+    rss = None
+print(json.dumps({'load': loadTime, 'touch': touchTime, 'import': importTime,
+                  'maxRss': rss}))
+'''
+
+
+def defaultCacheFiles(extensions=SOURCE_EXTENSIONS):
+    # type: (tuple) -> List[str]
+    """All cache files of the given extensions in the pymel cache dir"""
+    cacheDir = cachebase._moduleJoin('cache')
+    paths = []
+    for filename in sorted(os.listdir(cacheDir)):
+        path = os.path.join(cacheDir, filename)
+        if filename.startswith('__') or not os.path.isfile(path):
+            continue
+        if filename.lower().endswith(extensions):
+            paths.append(path)
+    return paths
+
+
+def benchLoad(path, touch=0):
+    # type: (str, int) -> Dict[str, Optional[float]]
+    """Load path in a fresh interpreter; returns timings (s) and max RSS (bytes)"""
+    ext = cachebase._cacheExtension(path)
+    pymelRoot = os.path.dirname(cachebase._moduleJoin())
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [pymelRoot] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    output = subprocess.check_output(
+        [sys.executable, '-c', _BENCH_SCRIPT, path, ext, str(touch)], env=env)
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def _formatRss(rss):
+    if rss is None:
+        return 'n/a'
+    return '%.1f MB' % (rss / (1024.0 * 1024.0))
+
+
+def convert(paths):
+    # type: (List[str]) -> List[str]
+    written = []
+    for path in paths:
+        dstPath = cachebase.convertCache(path)
+        print('%s -> %s (%d -> %d bytes)' % (
+            os.path.basename(path), os.path.basename(dstPath),
+            os.path.getsize(path), os.path.getsize(dstPath)))
+        written.append(dstPath)
+    return written
+
+
+def bench(paths, touch=10, repeat=3):
+    # type: (List[str], int, int) -> None
+    """Compare cold loads of each path and its .pmi conversion"""
+    row = '%-32s %-6s %10s %10s %10s'
+    print(row % ('file', 'format', 'load', 'touch', 'maxRss'))
+    for path in paths:
+        ext = cachebase._cacheExtension(path)
+        pmiPath = path[:-len(ext)] + '.pmi'
+        if not os.path.isfile(pmiPath):
+            cachebase.convertCache(path, pmiPath)
+        for candidate in (path, pmiPath):
+            results = [benchLoad(candidate, touch=touch) for _ in range(repeat)]
+            best = min(results, key=lambda r: r['load'] + r['touch'])
+            print(row % (os.path.basename(path)[:32],
+                         cachebase._cacheExtension(candidate),
+                         '%.1f ms' % (best['load'] * 1000),
+                         '%.1f ms' % (best['touch'] * 1000),
+                         _formatRss(best['maxRss'])))
+
+
+def cacheClass(name):
+    """A minimal PymelCache subclass for the cache files called name<version>"""
+    return type(str(name), (cachebase.PymelCache,), {'NAME': name})
+
+
+def cacheNames():
+    # type: () -> List[str]
+    """Names of all caches in the pymel cache dir (version suffix removed)"""
+    names = set()
+    for path in defaultCacheFiles():
+        basename = os.path.basename(path)
+        basename = basename[:-len(cachebase._cacheExtension(basename))]
+        names.add(re.sub(r'\d+$', '', basename))
+    for filename in os.listdir(cachebase._moduleJoin('cache')):
+        if filename.endswith(cachebase.MULTI_VERSION_EXT):
+            names.add(filename[:-len(cachebase.MULTI_VERSION_EXT)])
+    return sorted(names)
+
+
+def allCachePaths(names=None, ext='.py'):
+    # type: (Optional[List[str]], str) -> List[str]
+    """Paths of every version of the named caches in format ext"""
+    paths = []
+    for name in names or cacheNames():
+        cls = cacheClass(name)
+        for version in cls.allVersions(allowEmpty=True):
+            path = cls.path(version=version, ext=ext)
+            if os.path.isfile(path):
+                paths.append(path)
+    return paths
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def convertJob(srcPath, dstExt, validate=True):
+    # type: (str, str, bool) -> Dict
+    """Convert one cache file; runs in a worker process"""
+    result = {'src': srcPath, 'ok': False, 'error': None}
+    try:
+        srcExt = cachebase._cacheExtension(srcPath)
+        dstPath = srcPath[:-len(srcExt)] + dstExt
+        result['dst'] = dstPath
+        data, result['read'] = _timed(cachebase.PymelCache.EXTENSIONS[srcExt].reader, srcPath)
+        _, result['write'] = _timed(cachebase.PymelCache.EXTENSIONS[dstExt].writer, data, dstPath)
+        if validate:
+            reread, result['verify'] = _timed(cachebase.PymelCache.EXTENSIONS[dstExt].reader, dstPath)
+            if reread != data:
+                raise ValueError('data read back from %s differs' % dstPath)
+        result['ok'] = True
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    return result
+
+
+def validateJob(paths):
+    # type: (List[str]) -> Dict
+    """Read the same cache in several formats and compare; runs in a worker"""
+    result = {'src': paths[0], 'ok': False, 'error': None, 'read': 0.0}
+    try:
+        reference = None
+        for path in paths:
+            reader = cachebase.PymelCache.EXTENSIONS[cachebase._cacheExtension(path)].reader
+            data, duration = _timed(reader, path)
+            result['read'] += duration
+            if reference is None:
+                reference = data
+            elif data != reference:
+                raise ValueError('%s differs from %s' % (path, paths[0]))
+        result['ok'] = True
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    return result
+
+
+def _runPool(func, jobArgs, jobs=None):
+    # type: (...) -> List[Dict]
+    from concurrent.futures import ProcessPoolExecutor
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for result in pool.map(func, *zip(*jobArgs)):
+            timings = ', '.join('%s %.1f ms' % (key, result[key] * 1000)
+                                for key in ('read', 'write', 'verify') if key in result)
+            status = 'ok' if result['ok'] else 'FAILED (%s)' % result['error']
+            print('%-40s %s  %s' % (os.path.basename(result['src']), status, timings))
+            results.append(result)
+    failed = len([r for r in results if not r['ok']])
+    print('%d cache file(s), %d failed, %.2f s total' % (
+        len(results), failed, time.perf_counter() - start))
+    return results
+
+
+def convertAll(names=None, dstExt='.pmi', srcExt='.py', jobs=None, validate=True):
+    # type: (Optional[List[str]], str, str, Optional[int], bool) -> List[Dict]
+    paths = allCachePaths(names, ext=srcExt)
+    return _runPool(convertJob, [(p, dstExt, validate) for p in paths], jobs=jobs)
+
+
+def validateAll(names=None, jobs=None):
+    # type: (Optional[List[str]], Optional[int]) -> List[Dict]
+    groups = []
+    for name in names or cacheNames():
+        cls = cacheClass(name)
+        for version in cls.allVersions(allowEmpty=True):
+            paths = [cls.path(version=version, ext=fmt.ext) for fmt in cls.FORMATS]
+            paths = [p for p in paths if os.path.isfile(p)]
+            if paths:
+                groups.append((paths,))
+    return _runPool(validateJob, groups, jobs=jobs)
+
+
+def _versionFiles(cls, version):
+    # type: (type, str) -> List[str]
+    """The cache files of version of cls, in every format"""
+    paths = [cls.path(version=version, ext=fmt.ext) for fmt in cls.FORMATS]
+    return [p for p in paths if os.path.isfile(p)]
+
+
+def _printStoreStats(storePath, stats):
+    print('%s: %d value(s), %d stored, %d bytes' % (
+        os.path.basename(storePath), stats['values'], stats['stored'], stats['size']))
+
+
+def addVersions(name, versions=None, srcPath=None, remove=False):
+    # type: (str, Optional[List[str]], Optional[str], bool) -> Dict[str, int]
+    """
+    Add versions of the named cache to its multi version store; by default
+    every version that has a cache file.  srcPath can only be given with a
+    single version.
+    """
+    cls = cacheClass(name)
+    storePath = cls.multiVersionPath()
+    if versions is None:
+        versions = [v for v in cls.allVersions() if _versionFiles(cls, v)]
+    if srcPath is not None and len(versions) != 1:
+        raise ValueError('a source path can only be given for one version')
+    data = {}
+    for version in versions:
+        path = srcPath
+        if path is None:
+            files = _versionFiles(cls, version)
+            if not files:
+                raise ValueError('no %s cache file for version %s' % (name, version))
+            path = files[0]
+        print('reading %s' % path)
+        versionData = cachebase.PymelCache.EXTENSIONS[cachebase._cacheExtension(path)].reader(path)
+        if isinstance(versionData, cachebase.IndexedCacheMapping):
+            versionData = versionData.toDict()
+        data[version] = versionData
+    stats = cachebase.addMultiVersion(storePath, data)
+    _printStoreStats(storePath, stats)
+    for version in versions:
+        stored = cachebase.readMultiVersion(storePath, version)
+        if isinstance(stored, cachebase.IndexedCacheMapping):
+            stored = stored.toDict()
+        if stored != data[version]:
+            raise ValueError('version %s read back from %s differs' % (version, storePath))
+        if remove:
+            for path in _versionFiles(cls, version):
+                print('removing %s' % path)
+                os.remove(path)
+    return stats
+
+
+def storeInfo(names=None):
+    # type: (Optional[List[str]]) -> None
+    for name in names or cacheNames():
+        storePath = cacheClass(name).multiVersionPath()
+        if not os.path.isfile(storePath):
+            continue
+        versions = cachebase.multiVersionVersions(storePath)
+        print('%s: %d bytes, versions %s' % (
+            os.path.basename(storePath), os.path.getsize(storePath), ', '.join(versions)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='cachetool', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    convertParser = subparsers.add_parser(
+        'convert', help='convert cache files to the indexed .pmi format')
+    convertParser.add_argument('paths', nargs='*')
+    benchParser = subparsers.add_parser(
+        'bench', help='compare cold-load time and RSS against the .pmi format')
+    benchParser.add_argument('paths', nargs='*')
+    benchParser.add_argument('--touch', type=int, default=10,
+                             help='number of keys to access after loading')
+    benchParser.add_argument('--repeat', type=int, default=3)
+    convertAllParser = subparsers.add_parser(
+        'convert-all', help='convert every version of every cache in a process pool')
+    convertAllParser.add_argument('--to', default='.pmi', dest='dstExt',
+                                  choices=sorted(cachebase.PymelCache.EXTENSIONS))
+    convertAllParser.add_argument('--from', default='.py', dest='srcExt',
+                                  choices=sorted(cachebase.PymelCache.EXTENSIONS))
+    convertAllParser.add_argument('--no-validate', action='store_false', dest='validate')
+    validateParser = subparsers.add_parser(
+        'validate', help='check all formats of every cache version hold the same data')
+    for poolParser in (convertAllParser, validateParser):
+        poolParser.add_argument('--jobs', type=int, default=None)
+        poolParser.add_argument('--name', action='append', dest='names',
+                                help='cache name (ie, mayaCmdsExamples); default: all')
+    packParser = subparsers.add_parser(
+        'pack', help='move every version of a cache into its multi version store')
+    packParser.add_argument('name')
+    addVersionParser = subparsers.add_parser(
+        'add-version', help='add one version of a cache to its multi version store')
+    addVersionParser.add_argument('name')
+    addVersionParser.add_argument('version')
+    addVersionParser.add_argument('--from', default=None, dest='srcPath',
+                                  help='cache file to read (default: the file of the version)')
+    for storeParser in (packParser, addVersionParser):
+        storeParser.add_argument('--remove', action='store_true',
+                                 help='delete the per version files once stored')
+    storeInfoParser = subparsers.add_parser(
+        'store-info', help='list the versions in the multi version stores')
+    storeInfoParser.add_argument('names', nargs='*')
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+    if args.command == 'convert-all':
+        results = convertAll(args.names, dstExt=args.dstExt, srcExt=args.srcExt,
+                             jobs=args.jobs, validate=args.validate)
+        return 0 if all(r['ok'] for r in results) else 1
+    if args.command == 'validate':
+        results = validateAll(args.names, jobs=args.jobs)
+        return 0 if all(r['ok'] for r in results) else 1
+    if args.command == 'pack':
+        addVersions(args.name, remove=args.remove)
+        return 0
+    if args.command == 'add-version':
+        addVersions(args.name, [args.version], srcPath=args.srcPath, remove=args.remove)
+        return 0
+    if args.command == 'store-info':
+        storeInfo(args.names)
+        return 0
+    paths = args.paths or defaultCacheFiles()
+    if args.command == 'convert':
+        convert(paths)
+    elif args.command == 'bench':
+        bench(paths, touch=args.touch, repeat=args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
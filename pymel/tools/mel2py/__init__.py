@@ -163,7 +163,6 @@ over non-sequence'. just email me with commands that are giving you problems and
 quickly as i can.
 
 """
-from . import melparse
 try:
     from pymel.util.external.ply.lex import LexError
 except ImportError:
@@ -171,16 +170,66 @@ except ImportError:
 
 import pymel.util as util
 import pymel.internal as internal
-import pymel.internal.factories as _factories
 import pymel
-import pymel.core as pm
+import hashlib
+import importlib
+import json
 import os
+import sys
+import time
 
 if False:
     from typing import *
 
 log = internal.getLogger(__name__)
 
+
+class _LazyModule(object):
+    """
+    Stand-in for a module that is only imported on first attribute access.
+
+    melparse and pymel.core need a running maya, the lexer, scanner and
+    `melindex` don't: importing them must not pull in maya.
+    """
+
+    def __init__(self, name):
+        object.__setattr__(self, '_name', name)
+
+    def _module(self):
+        return importlib.import_module(self._name)
+
+    def __getattr__(self, attr):
+        return getattr(self._module(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._module(), attr, value)
+
+
+melparse = _LazyModule(__name__ + '.melparse')
+pm = _LazyModule('pymel.core')
+
+# optional melindex.MelIndex used to locate procs and scripts before asking maya
+_melIndex = None
+
+
+def setMelIndex(index):
+    """
+    Use a `melindex.MelIndex` to resolve procedure and script names (and to
+    get `melInfo` of indexed files) without querying maya. Pass None to go
+    back to always using maya's whatIs.
+    """
+    global _melIndex
+    _melIndex = index
+
+
+def _whatIs(name):
+    """ file defining proc or script `name`, from the mel index or maya """
+    if _melIndex is not None:
+        found = _melIndex.whatIs(name)
+        if found and _melIndex.isCurrent(found):
+            return 'Script found in: %s' % found
+    return pm.mel.whatIs(name)
+
 """
 This is a dictionary for custom remappings of mel procedures into python functions, classes, etc. If you are like me you probably have a
 library of helper mel scripts to make your life a bit easier. you will probably find that python has a built-in equivalent for many of
@@ -212,8 +261,7 @@ custom_proc_remap = {
     'getRefFileFromObject': ('string', lambda args, t: '%s.referenceFile()' % (args[0]))
 }
 
-# do not change the following line !!!
-melparse.proc_remap.update(custom_proc_remap)
+# custom_proc_remap is added to melparse.proc_remap when melparse is imported
 
 
 def resolvePath(melobj, recurse=False, exclude=(), melPathOnly=False, basePackage=''):
@@ -249,7 +297,7 @@ def resolvePath(melobj, recurse=False, exclude=(), melPathOnly=False, basePackag
     else:
         # see if it's a procedure that we can derive a path from
         try:
-            info = pm.mel.whatIs(melobj).split(': ')[-1]
+            info = _whatIs(melobj).split(': ')[-1]
             assert info != 'Unknown', "If providing a procedure or a short file name, ensure the appropriate script is sourced"
             melfile = util.path(info)
             files = [melfile.truepath()]
@@ -284,7 +332,7 @@ def fileOnMelPath(file):
     Return True if this file is on the mel path.
     """
     file = util.path(file)
-    info = pm.mel.whatIs(file.basename()).split(': ', 1)
+    info = _whatIs(file.basename()).split(': ', 1)
     if len(info) < 2:
         # If there wasn't a ':' character, the result was probably 'Unknown, or something similar -
         # anyway, not what we're looking for
@@ -388,6 +436,11 @@ def melInfo(input):
         raise ValueError("input must be a mel script or a known procedure from a sourced mel script.")
     f = res[0][1]
 
+    if _melIndex is not None:
+        info = _melIndex.melInfo(f)
+        if info is not None:
+            return info
+
     cbParser = melparse.MelScanner()
     cbParser.build()
     return cbParser.parse(f.bytes())
@@ -434,6 +487,25 @@ def mel2pyStr(data, currentModule=None, pymelNamespace='', forceCompatibility=Fa
     return results
 
 
+def _convertedHeader(melfile):
+    return """%s from mel file:
+# %s
+
+""" % (melparse.tag, melfile)
+
+
+def _pyFileFor(moduleName, melfile, outputDir):
+    """ the python file moduleName (converted from melfile) is written to """
+    splitModule = moduleName.split('.')
+    if outputDir is None:
+        currOutDir = melfile.parent
+    else:
+        currOutDir = outputDir
+        if len(splitModule) > 1:
+            currOutDir = currOutDir.joinpath(*splitModule[:-1])
+    return currOutDir.joinpath(splitModule[-1] + '.py')
+
+
 def mel2py(input, outputDir=None,
            pymelNamespace='', forceCompatibility=False,
            verbosity=0, test=False,
@@ -515,22 +587,9 @@ def mel2py(input, outputDir=None,
                     e.file = melfile
                 raise
 
-        header = """%s from mel file:
-# %s
-
-""" % (melparse.tag, melfile)
-
-        converted = header + converted
-
-        splitModule = moduleName.split('.')
-        if outputDir is None:
-            currOutDir = melfile.parent
-        else:
-            currOutDir = outputDir
-            if len(splitModule) > 1:
-                currOutDir = currOutDir.joinpath(*splitModule[:-1])
+        converted = _convertedHeader(melfile) + converted
 
-        pyfile = currOutDir.joinpath(splitModule[-1] + '.py')
+        pyfile = _pyFileFor(moduleName, melfile, outputDir)
         print("Writing converted python script: %s" % pyfile)
         pyfile.write_bytes(converted)
         succeeded.append(pyfile)
@@ -567,3 +626,191 @@ def mel2py(input, outputDir=None,
     succCnt = 0
 
 
+# --- Batch mode
+
+def _batchInit(state):
+    """ set up melparse.batchData in a batch worker process """
+    batchData = melparse.BatchData()
+    batchData.currentModules = util.TwoWayDict(
+        (moduleName, util.path(melfile)) for moduleName, melfile in state['currentModules'])
+    batchData.proc_to_module = dict(state['proc_to_module'])
+    batchData.basePackage = state['basePackage']
+    batchData.outputDir = util.path(state['outputDir']) if state['outputDir'] else None
+    melparse.batchData = batchData
+
+
+def _batchConvert(moduleName, melfile, options):
+    """ translate one mel file, runs in a batch worker process """
+    start = time.perf_counter()
+    result = {'module': moduleName, 'melfile': melfile, 'error': None, 'converted': None}
+    try:
+        data = util.path(melfile).bytes()
+        result['converted'] = mel2pyStr(data, moduleName, **options)
+    except Exception as e:
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+    result['time'] = time.perf_counter() - start
+    return result
+
+
+def _batchDependencies(index, melfile, moduleForFile):
+    """
+    What the translation of melfile depends on besides its own content: the
+    modules its global procs and the procs it calls resolve to, and the
+    modules of the scripts it sources.
+    """
+    entry = index.entry(melfile) or {}
+    proc_to_module = melparse.batchData.proc_to_module
+    procs = set(entry.get('calls', [])) | set(entry.get('globalProcs', {}))
+    resolved = [(proc, proc_to_module.get(proc)) for proc in sorted(procs)]
+    sources = []
+    for name in sorted(entry.get('sources', [])):
+        found = index.whatIs(name) or index.whatIs(os.path.basename(name))
+        sources.append((name, moduleForFile.get(index.key(found)) if found else None))
+    return [resolved, sources]
+
+
+def _batchCacheKey(data, moduleName, options, translatorDigest, dependencies):
+    key = hashlib.sha1(data)
+    key.update(json.dumps([moduleName, options, translatorDigest, dependencies],
+                          sort_keys=True).encode('utf-8'))
+    return key.hexdigest()
+
+
+def mel2pyBatch(input, outputDir=None,
+                pymelNamespace='', forceCompatibility=False, verbosity=0,
+                recurse=False, exclude=(), melPathOnly=False, basePackage=None,
+                jobs=None, cacheDir=None, index=None, reportFile=None):
+    # type: (Any, Optional[str], str, bool, int, bool, Iterable[str], bool, Optional[str], Optional[int], Optional[str], Any, Optional[str]) -> List[Dict[str, Any]]
+    """
+    Batch convert mel files in parallel, re-using the results of unchanged files.
+
+    Takes the same arguments as `mel2py`, plus:
+
+    jobs : Optional[int]
+        Number of worker processes (default: number of cpus), 0 to convert in
+        this process.
+    cacheDir : Optional[str]
+        Directory for the cached translations, keyed by mel file content, module
+        name, the translator options and the modules of the procs and scripts the
+        file uses (see `_batchDependencies`). Default is
+        mel2py_cache next to the default `melindex` file.
+    index : Optional[melindex.MelIndex]
+        Index used to find the procs of every file (it is updated and saved).
+        Default is the index set with `setMelIndex` or the default index file.
+    reportFile : Optional[str]
+        If given, the report is also written there as json.
+
+    The global procs of all files are read from the index first, so each file
+    can be translated independently; the files are then converted in stages
+    of files that don't depend on each other (see `MelIndex.plan`).
+
+    Returns the report, a list of dicts with the module, mel file, python file,
+    status ('cached', 'converted' or 'failed'), error, stage and time of every file.
+    """
+    from . import melindex
+    start = time.perf_counter()
+    if basePackage is None:
+        basePackage = ''
+    melparse.batchData = melparse.BatchData()
+    batchData = melparse.batchData
+    batchData.basePackage = basePackage
+    if outputDir is not None:
+        outputDir = util.path(outputDir)
+    batchData.outputDir = outputDir
+    if outputDir and not os.path.exists(outputDir):
+        os.makedirs(outputDir)
+
+    currentFiles = _getInputFiles(input, recurse=recurse, exclude=exclude, melPathOnly=melPathOnly, basePackage=basePackage)
+    if not currentFiles:
+        raise ValueError("Could not find any scripts to operate on. Please pass a directory, a list of directories, the name of a mel file, a list of mel files, or the name of a sourced procedure")
+    _updateCurrentModules(currentFiles)
+    _makePackages()
+    modules = list(batchData.currentModules.items())
+
+    # plan: collect the global procs of every file up front
+    if index is None:
+        index = _melIndex or melindex.MelIndex(melindex.defaultIndexFile())
+    index.update([str(melfile) for _, melfile in modules], jobs=jobs)
+    index.save()
+    for moduleName, melfile in modules:
+        entry = index.entry(melfile) or {}
+        for proc, procInfo in entry.get('globalProcs', {}).items():
+            batchData.proc_to_module.setdefault(proc, (moduleName, procInfo['returnType']))
+    stages = index.plan([str(melfile) for _, melfile in modules])
+
+    options = {'pymelNamespace': pymelNamespace, 'forceCompatibility': forceCompatibility,
+               'verbosity': verbosity}
+    # a change to the translator invalidates the whole cache, a change to the
+    # module layout only the files calling the moved procs (see _batchDependencies)
+    with open(melparse.__file__, 'rb') as f:
+        translatorDigest = hashlib.sha1(f.read()).hexdigest()
+    keyOptions = dict(options, basePackage=basePackage)
+    if cacheDir is None:
+        cacheDir = os.path.join(os.path.dirname(melindex.defaultIndexFile()), 'mel2py_cache')
+    cacheDir = util.path(cacheDir)
+    if not cacheDir.isdir():
+        cacheDir.makedirs()
+
+    state = {'currentModules': [(m, str(f)) for m, f in modules],
+             'proc_to_module': list(batchData.proc_to_module.items()),
+             'basePackage': basePackage,
+             'outputDir': str(outputDir) if outputDir else None}
+    moduleForFile = dict((index.key(str(f)), m) for m, f in modules)
+    report = []
+    pool = None
+    try:
+        for stageNum, stage in enumerate(stages):
+            todo = []
+            for melfile in stage:
+                moduleName = moduleForFile[index.key(melfile)]
+                dependencies = _batchDependencies(index, melfile, moduleForFile)
+                melfile = util.path(melfile)
+                cacheFile = cacheDir / (_batchCacheKey(melfile.bytes(), moduleName, keyOptions,
+                                                       translatorDigest, dependencies) + '.py')
+                entry = {'module': moduleName, 'melfile': str(melfile), 'stage': stageNum,
+                         'pyfile': str(_pyFileFor(moduleName, melfile, outputDir)),
+                         'error': None, 'time': 0.0, 'cacheFile': cacheFile}
+                if cacheFile.isfile():
+                    entry['status'] = 'cached'
+                    entry['converted'] = cacheFile.text(encoding='utf-8')
+                    report.append(entry)
+                else:
+                    todo.append(entry)
+            if todo and jobs != 0 and pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+                pool = ProcessPoolExecutor(max_workers=jobs, mp_context=melindex.mayapyContext(),
+                                           initializer=_batchInit, initargs=(state,))
+            if todo:
+                args = [(e['module'], e['melfile'], options) for e in todo]
+                if pool is None:
+                    results = [_batchConvert(*a) for a in args]
+                else:
+                    results = pool.map(_batchConvert, *zip(*args))
+                for entry, result in zip(todo, results):
+                    entry.update(error=result['error'], time=result['time'],
+                                 converted=result['converted'],
+                                 status='failed' if result['error'] else 'converted')
+                    if entry['converted'] is not None:
+                        entry['cacheFile'].write_text(entry['converted'], encoding='utf-8')
+                    report.append(entry)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for entry in report:
+        del entry['cacheFile']
+        converted = entry.pop('converted', None)
+        if converted is not None:
+            pyfile = util.path(entry['pyfile'])
+            pyfile.write_text(_convertedHeader(entry['melfile']) + converted, encoding='utf-8')
+        status = entry['status'] if not entry['error'] else 'FAILED (%s)' % entry['error']
+        print('%-50s %-10s %7.1f ms' % (entry['module'], status, entry['time'] * 1000))
+
+    counts = dict((s, len([e for e in report if e['status'] == s])) for s in ('cached', 'converted', 'failed'))
+    print("%d files in %d stages: %d converted, %d cached, %d failed in %.2f s" % (
+        len(report), len(stages), counts['converted'], counts['cached'], counts['failed'],
+        time.perf_counter() - start))
+    if reportFile:
+        with open(reportFile, 'w') as f:
+            json.dump(report, f, indent=2)
+    return report
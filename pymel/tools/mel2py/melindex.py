@@ -0,0 +1,433 @@
+"""
+Offline index of the procedures defined in mel scripts.
+
+Scans mel files with the `mellex` lexer and `melscan` grammar (no maya
+needed) and records, per file, its global and local procedures with their
+signatures, the procedures and commands it calls and the scripts it sources.
+The index is saved as json and entries are reused as long as the file's
+mtime and size, or failing that its content hash, didn't change.
+
+    >>> index = MelIndex('melindex.json')           # doctest: +SKIP
+    >>> index.update(['/path/to/scripts'])          # doctest: +SKIP
+    >>> index.whatIs('myGlobalProc')                # doctest: +SKIP
+    '/path/to/scripts/myGlobalProc.mel'
+
+Command line::
+
+    mayapy -m pymel.tools.mel2py.melindex build DIR [DIR...] [--index FILE] [--jobs N]
+    mayapy -m pymel.tools.mel2py.melindex whatis PROC [--index FILE]
+    mayapy -m pymel.tools.mel2py.melindex deps FILE [--index FILE]
+"""
+from __future__ import print_function
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from . import mellex
+from . import melscan
+
+try:
+    from pymel.util.external.ply import lex, yacc
+except ImportError:
+    from ply import lex, yacc
+
+from pymel.util.path import path as _path
+
+if False:
+    from typing import *
+
+INDEX_VERSION = 1
+
+# created on first use, once per process
+_lexer = None
+_scanner = None
+
+
+def defaultIndexFile():
+    # type: () -> str
+    """The index used when none is given: pymel/melindex.json in MAYA_APP_DIR,
+    or ~/.pymel/melindex.json (pymel.mayautils would import maya)"""
+    appDir = os.environ.get('MAYA_APP_DIR')
+    if appDir:
+        return os.path.join(appDir, 'pymel', 'melindex.json')
+    return os.path.join(os.path.expanduser('~'), '.pymel', 'melindex.json')
+
+
+def mayapyContext():
+    """
+    multiprocessing context for worker processes: they must run mayapy,
+    not the maya gui executable when called from within maya.
+    """
+    import multiprocessing
+    context = multiprocessing.get_context('spawn')
+    exe = os.path.basename(sys.executable).lower()
+    if exe.startswith('maya') and not exe.startswith('mayapy'):
+        mayapy = os.path.join(os.path.dirname(sys.executable), 'mayapy')
+        if os.name == 'nt':
+            mayapy += '.exe'
+        context.set_executable(mayapy)
+    return context
+
+
+class _RecordingLexer(object):
+    """
+    Wraps the mel lexer for the melscan grammar, and records the identifiers
+    used as commands / procedure calls and the scripts that are sourced.
+    """
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.proc_list = []
+        self.global_procs = {}
+        self.local_procs = {}
+        self.calls = set()
+        self.sources = []
+        self._previous = None
+        self._sourcing = False
+
+    def input(self, data):
+        self.lexer.input(data)
+
+    def token(self):
+        tok = self.lexer.token()
+        if tok is not None:
+            if self._sourcing and tok.type in ('SCONST', 'ID'):
+                self.sources.append(tok.value.strip('"'))
+            self._sourcing = tok.type == 'ID' and tok.value == 'source'
+            # ie, ignore the flag in 'ls -sl'
+            if tok.type == 'ID' and not (self._previous and self._previous.type == 'MINUS'):
+                self.calls.add(tok.value)
+            self._previous = tok
+        return tok
+
+    def __getattr__(self, attr):
+        return getattr(self.lexer, attr)
+
+
+def scanData(data):
+    # type: (Union[str, bytes]) -> Dict[str, Any]
+    """Scan mel code, returns a dict with the procs, calls and sources"""
+    global _lexer, _scanner
+    if _scanner is None:
+        _lexer = lex.lex(module=mellex, errorlog=lex.NullLogger())
+        _scanner = melscan.buildScanner(errorlog=yacc.NullLogger())
+    if not isinstance(data, str):
+        data = data.decode('utf-8', 'ignore')
+    data = data.replace('\r', '\n')
+
+    lexer = _RecordingLexer(_lexer.clone())
+    _scanner.parse(data, lexer=lexer)
+    defined = set(lexer.proc_list)
+    return {
+        'procs': lexer.proc_list,
+        'globalProcs': lexer.global_procs,
+        'localProcs': lexer.local_procs,
+        'calls': sorted(lexer.calls - defined - set(['source'])),
+        'sources': lexer.sources,
+    }
+
+
+def fileHash(data):
+    # type: (bytes) -> str
+    return hashlib.sha1(data).hexdigest()
+
+
+def scanFile(melfile, knownHash=None):
+    # type: (str, Optional[str]) -> Dict[str, Any]
+    """
+    Scan one mel file, runs in a worker process. If the content hash equals
+    knownHash the file isn't parsed again and 'unchanged' is set instead.
+    """
+    entry = {'path': melfile, 'error': None}
+    start = time.perf_counter()
+    try:
+        stat = os.stat(melfile)
+        with open(melfile, 'rb') as f:
+            data = f.read()
+        entry.update(mtime=stat.st_mtime_ns, size=stat.st_size, hash=fileHash(data))
+        if knownHash is not None and entry['hash'] == knownHash:
+            entry['unchanged'] = True
+        else:
+            entry.update(scanData(data))
+    except Exception as e:
+        entry['error'] = '%s: %s' % (type(e).__name__, e)
+    entry['scanTime'] = time.perf_counter() - start
+    return entry
+
+
+class MelIndex(object):
+    """
+    Index of the procedures in mel files, persisted as json.
+
+    Entries are keyed by normalized file path. Global procs defined in more
+    than one file resolve to the first file scanned, like on the script path.
+    """
+
+    def __init__(self, indexFile=None):
+        # type: (Optional[str]) -> None
+        self.indexFile = indexFile
+        self.entries = {}  # type: Dict[str, Dict[str, Any]]
+        self.dirty = False
+        self._procs = None
+        self._scripts = None
+        if indexFile and os.path.isfile(indexFile):
+            try:
+                with open(indexFile, 'r') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('entries', {})
+
+    @staticmethod
+    def key(melfile):
+        # type: (str) -> str
+        return os.path.normcase(os.path.abspath(melfile))
+
+    @staticmethod
+    def melFiles(dirs, recurse=True):
+        # type: (Iterable[str], bool) -> List[str]
+        """The .mel files in dirs (in order, and in their subdirectories if recurse)"""
+        files = []
+        for d in dirs:
+            d = _path(d)
+            if d.isfile():
+                files.append(str(d))
+            elif recurse:
+                files.extend(str(f) for f in d.scanwalk('*.mel', kind='files', errors='ignore'))
+            elif d.isdir():
+                files.extend(str(f) for f in d.iterfiles('*.mel'))
+        return files
+
+    def update(self, dirs, recurse=True, jobs=None, prune=False, mp_context=None):
+        # type: (Iterable[str], bool, Optional[int], bool, Any) -> Dict[str, Any]
+        """
+        Scan the mel files in dirs, only parsing files that changed since
+        they were last indexed. Parsing is done in a pool of `jobs` processes
+        (0 to scan in this process), started with mp_context (`mayapyContext()`
+        if None). If prune is True, entries of files that are not found anymore
+        are removed.
+
+        Returns statistics: number of files found, reused, scanned, failed
+        and removed, and the total time.
+        """
+        start = time.perf_counter()
+        found = self.melFiles(dirs, recurse=recurse)
+        stats = {'files': len(found), 'reused': 0, 'scanned': 0, 'failed': 0,
+                 'removed': 0, 'errors': {}}
+        todo = []
+        for melfile in found:
+            entry = self.entries.get(self.key(melfile))
+            try:
+                stat = os.stat(melfile)
+            except OSError:
+                continue
+            if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                stats['reused'] += 1
+            else:
+                todo.append((melfile, entry['hash'] if entry else None))
+
+        if todo:
+            if jobs == 0 or len(todo) == 1:
+                results = [scanFile(*args) for args in todo]
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=jobs,
+                                         mp_context=mp_context or mayapyContext()) as pool:
+                    results = list(pool.map(scanFile, *zip(*todo)))
+            for result in results:
+                self._add(result, stats)
+
+        if prune:
+            keep = set(self.key(f) for f in found)
+            for key in list(self.entries):
+                if key not in keep:
+                    del self.entries[key]
+                    stats['removed'] += 1
+            self.dirty = self.dirty or bool(stats['removed'])
+        # keep the scan order, it decides which of duplicate procs wins
+        order = dict((self.key(f), i) for i, f in enumerate(found))
+        self.entries = dict(sorted(self.entries.items(),
+                                   key=lambda item: order.get(item[0], len(order))))
+        self._procs = self._scripts = None
+        stats['time'] = time.perf_counter() - start
+        return stats
+
+    def _add(self, result, stats):
+        key = self.key(result['path'])
+        if result['error']:
+            stats['failed'] += 1
+            stats['errors'][result['path']] = result['error']
+            return
+        scanTime = result.pop('scanTime')
+        if result.pop('unchanged', False):
+            # touched but identical: only refresh the stat info
+            self.entries[key].update(mtime=result['mtime'], size=result['size'])
+            stats['reused'] += 1
+        else:
+            result['scanTime'] = scanTime
+            self.entries[key] = result
+            stats['scanned'] += 1
+        self.dirty = True
+
+    def save(self, indexFile=None):
+        # type: (Optional[str]) -> None
+        indexFile = indexFile or self.indexFile
+        if indexFile is None or not (self.dirty or indexFile != self.indexFile):
+            return
+        indexDir = os.path.dirname(indexFile)
+        if indexDir and not os.path.isdir(indexDir):
+            os.makedirs(indexDir)
+        tmpFile = indexFile + '.tmp'
+        with open(tmpFile, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'entries': self.entries}, f)
+        os.replace(tmpFile, indexFile)
+        self.dirty = False
+
+    # --- queries
+
+    def _procMap(self):
+        if self._procs is None:
+            self._procs = {}
+            for key, entry in self.entries.items():
+                for proc in entry.get('globalProcs', {}):
+                    self._procs.setdefault(proc, entry['path'])
+        return self._procs
+
+    def _scriptMap(self):
+        if self._scripts is None:
+            self._scripts = {}
+            for entry in self.entries.values():
+                name = os.path.basename(entry['path'])
+                self._scripts.setdefault(name, entry['path'])
+                self._scripts.setdefault(os.path.splitext(name)[0], entry['path'])
+        return self._scripts
+
+    def entry(self, melfile):
+        # type: (str) -> Optional[Dict[str, Any]]
+        return self.entries.get(self.key(melfile))
+
+    def isCurrent(self, melfile):
+        # type: (str) -> bool
+        """True if melfile is indexed and didn't change since"""
+        entry = self.entry(melfile)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(melfile)
+        except OSError:
+            return False
+        return entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+
+    def whatIs(self, name):
+        # type: (str) -> Optional[str]
+        """
+        The file defining the global proc `name`, or the script file named
+        `name` (with or without .mel), like the whatIs mel command.
+        """
+        return self._procMap().get(name) or self._scriptMap().get(name)
+
+    def procInfo(self, proc):
+        # type: (str) -> Optional[Dict[str, Any]]
+        """returnType and args of a global proc"""
+        melfile = self._procMap().get(proc)
+        if melfile is None:
+            return None
+        return self.entry(melfile)['globalProcs'][proc]
+
+    def melInfo(self, melfile):
+        # type: (str) -> Optional[Tuple[List[str], dict, dict]]
+        """Same result as mel2py.melInfo, if melfile is indexed and current"""
+        if not self.isCurrent(melfile):
+            return None
+        entry = self.entry(melfile)
+
+        def procs(procDict):
+            return dict((name, {'returnType': info['returnType'],
+                                'args': [tuple(arg) for arg in info['args']]})
+                        for name, info in procDict.items())
+        return list(entry['procs']), procs(entry['globalProcs']), procs(entry['localProcs'])
+
+    def dependencies(self, melfile):
+        # type: (str) -> List[str]
+        """Indexed files defining procs called or sourced by melfile"""
+        entry = self.entry(melfile)
+        if entry is None:
+            return []
+        result = []
+        names = list(entry.get('calls', [])) + list(entry.get('sources', []))
+        for name in names:
+            found = self.whatIs(name) or self.whatIs(os.path.basename(name))
+            if found and self.key(found) != self.key(melfile) and found not in result:
+                result.append(found)
+        return result
+
+    def plan(self, melfiles):
+        # type: (Iterable[str]) -> List[List[str]]
+        """
+        Group melfiles in stages: files in a stage only depend on files of
+        earlier stages (or on files not in melfiles) and can be processed in
+        parallel. Cyclic dependencies end up together in the last stage.
+        """
+        melfiles = list(melfiles)
+        keys = dict((self.key(f), f) for f in melfiles)
+        deps = dict((self.key(f), set(self.key(d) for d in self.dependencies(f)) & set(keys))
+                    for f in melfiles)
+        stages = []
+        done = set()
+        while len(done) < len(keys):
+            stage = [k for k in keys if k not in done and deps[k] <= done]
+            if not stage:
+                stage = [k for k in keys if k not in done]
+                stages.append([keys[k] for k in stage])
+                break
+            stages.append([keys[k] for k in stage])
+            done.update(stage)
+        return stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='melindex', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--index', default=None,
+                        help='index file (default: %s)' % defaultIndexFile())
+    subparsers = parser.add_subparsers(dest='command')
+    buildParser = subparsers.add_parser('build', help='scan mel files and update the index')
+    buildParser.add_argument('dirs', nargs='+')
+    buildParser.add_argument('--jobs', type=int, default=None)
+    buildParser.add_argument('--no-recurse', action='store_false', dest='recurse')
+    buildParser.add_argument('--prune', action='store_true',
+                             help='drop entries of files that are not found anymore')
+    whatisParser = subparsers.add_parser('whatis', help='file defining a global proc')
+    whatisParser.add_argument('name')
+    depsParser = subparsers.add_parser('deps', help='indexed files a mel file depends on')
+    depsParser.add_argument('melfile')
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+    index = MelIndex(args.index or defaultIndexFile())
+    if args.command == 'build':
+        stats = index.update(args.dirs, recurse=args.recurse, jobs=args.jobs, prune=args.prune)
+        index.save()
+        for melfile, error in sorted(stats['errors'].items()):
+            print('FAILED %s: %s' % (melfile, error))
+        print('%(files)d files: %(scanned)d scanned, %(reused)d unchanged, '
+              '%(failed)d failed, %(removed)d removed in %(time).2f s' % stats)
+        return 0 if not stats['failed'] else 1
+    if args.command == 'whatis':
+        found = index.whatIs(args.name)
+        print(found or 'Unknown')
+        return 0 if found else 1
+    for dep in index.dependencies(args.melfile):
+        print(dep)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3148,9 +3148,13 @@ class MelParser(object):
         finally:
             self.lexer.raw_parse_data = None
 
-scanner = yacc.yacc(method='''LALR''', debug=0, module=melscan, outputdir=_outputdir)
+scanner = melscan.buildScanner()
 
 
+# the package's custom remappings (see mel2py.custom_proc_remap)
+from . import custom_proc_remap
+proc_remap.update(custom_proc_remap)
+
 #simple = SimpleMelGrammar()
 #standard = MelGrammar()
 #parser = standard.parser
@@ -9,11 +9,6 @@ try:
 except ImportError:
     from ply import *
 
-from pymel.util import unescape
-import pymel
-import pymel.util as util
-import pymel.internal.factories as factories
-
 tokens = mellex.tokens
 
 
@@ -270,3 +265,15 @@ def p_empty(t):
 # def p_error(t):
 #    print "error"
 #    pass
+
+
+def buildScanner(**kwargs):
+    """
+    Build the yacc parser for this grammar. Its tables are shipped in the
+    melscantab module (rewritten by yacc if the grammar changes).
+    """
+    kwargs.setdefault('debug', 0)
+    return yacc.yacc(method='LALR', module=sys.modules[__name__],
+                     tabmodule='melscantab',
+                     outputdir=os.path.dirname(os.path.abspath(__file__)),
+                     **kwargs)
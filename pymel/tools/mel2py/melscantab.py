@@ -0,0 +1,123 @@
+
+# melscantab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'BREAK CAPTURE CASE COLON COMMA COMMENT COMMENT_BLOCK COMPONENT CONDOP CONTINUE CROSS CROSSEQUAL DEFAULT DIVEQUAL DIVIDE DO ELLIPSIS ELSE EQ EQUALS FALSE FCONST FLOAT FOR GE GLOBAL GT ICONST ID IF IN INT LAND LBRACE LBRACKET LE LOR LPAREN LT LVEC MATRIX MINUS MINUSEQUAL MINUSMINUS MOD MODEQUAL NE NO NOT OFF ON PLUS PLUSEQUAL PLUSPLUS PROC RBRACE RBRACKET RETURN RPAREN RVEC SCONST SEMI STRING SWITCH TIMES TIMESEQUAL TRUE VAR VECTOR WHILE YEStranslation_unit : external_declaration\n                        | translation_unit external_declarationexternal_declaration : function_definition\n                            | groupfunction_definition :  function_declarator function_specifiers_opt ID LPAREN function_arg_list_opt RPAREN groupfunction_declarator : GLOBAL PROC\n                           | PROCtype_specifier : INT\n                      | FLOAT\n                      | STRING\n                      | VECTOR\n                      | MATRIX\n                      function_specifiers_opt : type_specifier\n                                  | type_specifier LBRACKET RBRACKET\n                                  | emptyfunction_arg : type_specifier VAR\n                    | type_specifier VAR LBRACKET RBRACKETfunction_arg_list : function_arg\n                        | function_arg_list COMMA function_argfunction_arg_list_opt : function_arg_list\n                        |  emptydeclaration_specifiers : type_specifier\n                              | GLOBAL type_specifiergroup_list_opt : group_list\n                | empty\n                group_list : group_list group\n            | groupgroup : element\n            | LBRACE group_list_opt RBRACEelement : declaration_specifiers\n            | BREAK\n            | CASE\n            | CONTINUE\n            | DEFAULT\n            | DO\n            | ELSE\n            | FALSE\n            | FOR\n            | IF\n            | IN\n            | NO\n            | ON\n            | OFF\n            | RETURN\n            | SWITCH\n            | TRUE\n            | WHILE\n            | YES\n            | ID\n            | VAR\n            | ICONST\n            | FCONST\n            | SCONST\n            | PLUS\n            | MINUS\n            | TIMES\n            | DIVIDE\n            | MOD\n            | NOT\n            | CROSS\n            | LOR\n            | LAND\n            | LT\n            | LE\n            | GT\n            | GE\n            | EQ\n            | NE\n            | EQUALS\n            | TIMESEQUAL\n            | DIVEQUAL\n            | MODEQUAL\n            | PLUSEQUAL\n            | MINUSEQUAL\n            | CROSSEQUAL\n            | COMPONENT\n            | PLUSPLUS\n            | MINUSMINUS\n            | CONDOP\n            | LPAREN\n            | RPAREN\n            | LBRACKET\n            | RBRACKET\n            | COMMA\n            | SEMI\n            | COLON\n            | CAPTURE\n            | LVEC\n            | RVEC\n            | COMMENT\n            | COMMENT_BLOCK\n            | ELLIPSIS\n\n            empty : '
+    
+_lr_action_items = {'LBRACE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[10,10,-1,-3,-4,-49,-80,-81,-28,10,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,10,-27,-23,-29,-26,10,-5,]),'GLOBAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[11,11,-1,-3,-4,-49,-80,-81,-28,87,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,87,-27,-23,-29,-26,87,-5,]),'PROC':([0,1,2,3,4,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,89,92,104,],[12,12,-1,-3,-4,-49,-80,-81,-28,88,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,-23,-29,-5,]),'BREAK':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[14,14,-1,-3,-4,-49,-80,-81,-28,14,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,14,-27,-23,-29,-26,14,-5,]),'CASE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[15,15,-1,-3,-4,-49,-80,-81,-28,15,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,15,-27,-23,-29,-26,15,-5,]),'CONTINUE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[16,16,-1,-3,-4,-49,-80,-81,-28,16,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,16,-27,-23,-29,-26,16,-5,]),'DEFAULT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[17,17,-1,-3,-4,-49,-80,-81,-28,17,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,17,-27,-23,-29,-26,17,-5,]),'DO':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[18,18,-1,-3,-4,-49,-80,-81,-28,18,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,18,-27,-23,-29,-26,18,-5,]),'ELSE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[19,19,-1,-3,-4,-49,-80,-81,-28,19,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,19,-27,-23,-29,-26,19,-5,]),'FALSE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[20,20,-1,-3,-4,-49,-80,-81,-28,20,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,20,-27,-23,-29,-26,20,-5,]),'FOR':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[21,21,-1,-3,-4,-49,-80,-81,-28,21,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,21,-27,-23,-29,-26,21,-5,]),'IF':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[22,22,-1,-3,-4,-49,-80,-81,-28,22,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,22,-27,-23,-29,-26,22,-5,]),'IN':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[23,23,-1,-3,-4,-49,-80,-81,-28,23,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,23,-27,-23,-29,-26,23,-5,]),'NO':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[24,24,-1,-3,-4,-49,-80,-81,-28,24,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,24,-27,-23,-29,-26,24,-5,]),'ON':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[25,25,-1,-3,-4,-49,-80,-81,-28,25,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,25,-27,-23,-29,-26,25,-5,]),'OFF':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[26,26,-1,-3,-4,-49,-80,-81,-28,26,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,26,-27,-23,-29,-26,26,-5,]),'RETURN':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[27,27,-1,-3,-4,-49,-80,-81,-28,27,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,27,-27,-23,-29,-26,27,-5,]),'SWITCH':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[28,28,-1,-3,-4,-49,-80,-81,-28,28,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,28,-27,-23,-29,-26,28,-5,]),'TRUE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[29,29,-1,-3,-4,-49,-80,-81,-28,29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,29,-27,-23,-29,-26,29,-5,]),'WHILE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[30,30,-1,-3,-4,-49,-80,-81,-28,30,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,30,-27,-23,-29,-26,30,-5,]),'YES':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[31,31,-1,-3,-4,-49,-80,-81,-28,31,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,31,-27,-23,-29,-26,31,-5,]),'ID':([0,1,2,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,84,86,88,89,92,93,95,101,104,],[6,6,-1,-3,-4,-93,-49,-80,-81,-28,6,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,90,-13,-15,6,-27,-6,-23,-29,-26,-14,6,-5,]),'VAR':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,100,101,104,],[32,32,-1,-3,-4,-49,-80,-81,-28,32,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,32,-27,-23,-29,-26,103,32,-5,]),'ICONST':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[33,33,-1,-3,-4,-49,-80,-81,-28,33,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,33,-27,-23,-29,-26,33,-5,]),'FCONST':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[34,34,-1,-3,-4,-49,-80,-81,-28,34,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,34,-27,-23,-29,-26,34,-5,]),'SCONST':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[35,35,-1,-3,-4,-49,-80,-81,-28,35,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,35,-27,-23,-29,-26,35,-5,]),'PLUS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[36,36,-1,-3,-4,-49,-80,-81,-28,36,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,36,-27,-23,-29,-26,36,-5,]),'MINUS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[37,37,-1,-3,-4,-49,-80,-81,-28,37,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,37,-27,-23,-29,-26,37,-5,]),'TIMES':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[38,38,-1,-3,-4,-49,-80,-81,-28,38,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,38,-27,-23,-29,-26,38,-5,]),'DIVIDE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[39,39,-1,-3,-4,-49,-80,-81,-28,39,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,39,-27,-23,-29,-26,39,-5,]),'MOD':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[40,40,-1,-3,-4,-49,-80,-81,-28,40,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,40,-27,-23,-29,-26,40,-5,]),'NOT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[41,41,-1,-3,-4,-49,-80,-81,-28,41,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,41,-27,-23,-29,-26,41,-5,]),'CROSS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[42,42,-1,-3,-4,-49,-80,-81,-28,42,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,42,-27,-23,-29,-26,42,-5,]),'LOR':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[43,43,-1,-3,-4,-49,-80,-81,-28,43,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,43,-27,-23,-29,-26,43,-5,]),'LAND':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[44,44,-1,-3,-4,-49,-80,-81,-28,44,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,44,-27,-23,-29,-26,44,-5,]),'LT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[45,45,-1,-3,-4,-49,-80,-81,-28,45,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,45,-27,-23,-29,-26,45,-5,]),'LE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[46,46,-1,-3,-4,-49,-80,-81,-28,46,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,46,-27,-23,-29,-26,46,-5,]),'GT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[47,47,-1,-3,-4,-49,-80,-81,-28,47,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,47,-27,-23,-29,-26,47,-5,]),'GE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[48,48,-1,-3,-4,-49,-80,-81,-28,48,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,48,-27,-23,-29,-26,48,-5,]),'EQ':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[49,49,-1,-3,-4,-49,-80,-81,-28,49,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,49,-27,-23,-29,-26,49,-5,]),'NE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[50,50,-1,-3,-4,-49,-80,-81,-28,50,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,50,-27,-23,-29,-26,50,-5,]),'EQUALS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[51,51,-1,-3,-4,-49,-80,-81,-28,51,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,51,-27,-23,-29,-26,51,-5,]),'TIMESEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[52,52,-1,-3,-4,-49,-80,-81,-28,52,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,52,-27,-23,-29,-26,52,-5,]),'DIVEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[53,53,-1,-3,-4,-49,-80,-81,-28,53,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,53,-27,-23,-29,-26,53,-5,]),'MODEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[54,54,-1,-3,-4,-49,-80,-81,-28,54,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,54,-27,-23,-29,-26,54,-5,]),'PLUSEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[55,55,-1,-3,-4,-49,-80,-81,-28,55,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,55,-27,-23,-29,-26,55,-5,]),'MINUSEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[56,56,-1,-3,-4,-49,-80,-81,-28,56,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,56,-27,-23,-29,-26,56,-5,]),'CROSSEQUAL':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[57,57,-1,-3,-4,-49,-80,-81,-28,57,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,57,-27,-23,-29,-26,57,-5,]),'COMPONENT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[58,58,-1,-3,-4,-49,-80,-81,-28,58,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,58,-27,-23,-29,-26,58,-5,]),'PLUSPLUS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[59,59,-1,-3,-4,-49,-80,-81,-28,59,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,59,-27,-23,-29,-26,59,-5,]),'MINUSMINUS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[60,60,-1,-3,-4,-49,-80,-81,-28,60,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,60,-27,-23,-29,-26,60,-5,]),'CONDOP':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[61,61,-1,-3,-4,-49,-80,-81,-28,61,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,61,-27,-23,-29,-26,61,-5,]),'LPAREN':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,90,92,93,101,104,],[7,7,-1,-3,-4,-49,-80,-81,-28,7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,7,-27,-23,94,-29,-26,7,-5,]),'RPAREN':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,94,96,97,98,99,101,103,104,105,107,],[8,8,-1,-3,-4,-49,-80,-81,-28,8,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,8,-27,-23,-29,-26,-93,101,-20,-21,-18,8,-16,-5,-19,-17,]),'LBRACKET':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,81,84,86,89,92,93,101,103,104,],[62,62,-1,-3,-4,-49,-80,-81,-28,62,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,91,62,-27,-23,-29,-26,62,106,-5,]),'RBRACKET':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,91,92,93,101,104,106,],[63,63,-1,-3,-4,-49,-80,-81,-28,63,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,63,-27,-23,95,-29,-26,63,-5,107,]),'COMMA':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,97,99,101,103,104,105,107,],[64,64,-1,-3,-4,-49,-80,-81,-28,64,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,64,-27,-23,-29,-26,102,-18,64,-16,-5,-19,-17,]),'SEMI':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[65,65,-1,-3,-4,-49,-80,-81,-28,65,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,65,-27,-23,-29,-26,65,-5,]),'COLON':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[66,66,-1,-3,-4,-49,-80,-81,-28,66,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,66,-27,-23,-29,-26,66,-5,]),'CAPTURE':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[67,67,-1,-3,-4,-49,-80,-81,-28,67,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,67,-27,-23,-29,-26,67,-5,]),'LVEC':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[68,68,-1,-3,-4,-49,-80,-81,-28,68,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,68,-27,-23,-29,-26,68,-5,]),'RVEC':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[69,69,-1,-3,-4,-49,-80,-81,-28,69,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,69,-27,-23,-29,-26,69,-5,]),'COMMENT':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[70,70,-1,-3,-4,-49,-80,-81,-28,70,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,70,-27,-23,-29,-26,70,-5,]),'COMMENT_BLOCK':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[71,71,-1,-3,-4,-49,-80,-81,-28,71,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,71,-27,-23,-29,-26,71,-5,]),'ELLIPSIS':([0,1,2,3,4,6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,89,92,93,101,104,],[72,72,-1,-3,-4,-49,-80,-81,-28,72,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,72,-27,-23,-29,-26,72,-5,]),'INT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,92,93,94,101,102,104,],[74,74,-1,-3,-4,74,-49,-80,-81,-28,74,74,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,74,-27,74,-6,-23,-29,-26,74,74,74,-5,]),'FLOAT':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,92,93,94,101,102,104,],[75,75,-1,-3,-4,75,-49,-80,-81,-28,75,75,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,75,-27,75,-6,-23,-29,-26,75,75,75,-5,]),'STRING':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,92,93,94,101,102,104,],[76,76,-1,-3,-4,76,-49,-80,-81,-28,76,76,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,76,-27,76,-6,-23,-29,-26,76,76,76,-5,]),'VECTOR':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,92,93,94,101,102,104,],[77,77,-1,-3,-4,77,-49,-80,-81,-28,77,77,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,77,-27,77,-6,-23,-29,-26,77,77,77,-5,]),'MATRIX':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,84,86,87,88,89,92,93,94,101,102,104,],[78,78,-1,-3,-4,78,-49,-80,-81,-28,78,78,-7,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,78,-27,78,-6,-23,-29,-26,78,78,78,-5,]),'$end':([1,2,3,4,6,7,8,9,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,89,92,104,],[0,-1,-3,-4,-49,-80,-81,-28,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,-2,-23,-29,-5,]),'RBRACE':([6,7,8,9,10,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,83,84,85,86,89,92,93,],[-49,-80,-81,-28,-93,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-22,-8,-9,-10,-11,-12,92,-24,-25,-27,-23,-29,-26,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'translation_unit':([0,],[1,]),'external_declaration':([0,1,],[2,79,]),'function_definition':([0,1,],[3,3,]),'group':([0,1,10,84,101,],[4,4,86,93,104,]),'function_declarator':([0,1,],[5,5,]),'element':([0,1,10,84,101,],[9,9,9,9,9,]),'declaration_specifiers':([0,1,10,84,101,],[13,13,13,13,13,]),'type_specifier':([0,1,5,10,11,84,87,94,101,102,],[73,73,81,73,89,73,89,100,73,100,]),'function_specifiers_opt':([5,],[80,]),'empty':([5,10,94,],[82,85,98,]),'group_list_opt':([10,],[83,]),'group_list':([10,],[84,]),'function_arg_list_opt':([94,],[96,]),'function_arg_list':([94,],[97,]),'function_arg':([94,102,],[99,105,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> translation_unit","S'",1,None,None,None),
+  ('translation_unit -> external_declaration','translation_unit',1,'p_translation_unit','melscan.py',16),
+  ('translation_unit -> translation_unit external_declaration','translation_unit',2,'p_translation_unit','melscan.py',17),
+  ('external_declaration -> function_definition','external_declaration',1,'p_external_declaration','melscan.py',27),
+  ('external_declaration -> group','external_declaration',1,'p_external_declaration','melscan.py',28),
+  ('function_definition -> function_declarator function_specifiers_opt ID LPAREN function_arg_list_opt RPAREN group','function_definition',7,'p_function_definition','melscan.py',39),
+  ('function_declarator -> GLOBAL PROC','function_declarator',2,'p_function_declarator','melscan.py',59),
+  ('function_declarator -> PROC','function_declarator',1,'p_function_declarator','melscan.py',60),
+  ('type_specifier -> INT','type_specifier',1,'p_type_specifier','melscan.py',73),
+  ('type_specifier -> FLOAT','type_specifier',1,'p_type_specifier','melscan.py',74),
+  ('type_specifier -> STRING','type_specifier',1,'p_type_specifier','melscan.py',75),
+  ('type_specifier -> VECTOR','type_specifier',1,'p_type_specifier','melscan.py',76),
+  ('type_specifier -> MATRIX','type_specifier',1,'p_type_specifier','melscan.py',77),
+  ('function_specifiers_opt -> type_specifier','function_specifiers_opt',1,'p_function_specifiers_opt','melscan.py',86),
+  ('function_specifiers_opt -> type_specifier LBRACKET RBRACKET','function_specifiers_opt',3,'p_function_specifiers_opt','melscan.py',87),
+  ('function_specifiers_opt -> empty','function_specifiers_opt',1,'p_function_specifiers_opt','melscan.py',88),
+  ('function_arg -> type_specifier VAR','function_arg',2,'p_function_arg','melscan.py',101),
+  ('function_arg -> type_specifier VAR LBRACKET RBRACKET','function_arg',4,'p_function_arg','melscan.py',102),
+  ('function_arg_list -> function_arg','function_arg_list',1,'p_function_arg_list','melscan.py',111),
+  ('function_arg_list -> function_arg_list COMMA function_arg','function_arg_list',3,'p_function_arg_list','melscan.py',112),
+  ('function_arg_list_opt -> function_arg_list','function_arg_list_opt',1,'p_function_arg_list_opt','melscan.py',123),
+  ('function_arg_list_opt -> empty','function_arg_list_opt',1,'p_function_arg_list_opt','melscan.py',124),
+  ('declaration_specifiers -> type_specifier','declaration_specifiers',1,'p_declaration_specifiers','melscan.py',134),
+  ('declaration_specifiers -> GLOBAL type_specifier','declaration_specifiers',2,'p_declaration_specifiers','melscan.py',135),
+  ('group_list_opt -> group_list','group_list_opt',1,'p_group_list_opt','melscan.py',144),
+  ('group_list_opt -> empty','group_list_opt',1,'p_group_list_opt','melscan.py',145),
+  ('group_list -> group_list group','group_list',2,'p_group_list','melscan.py',152),
+  ('group_list -> group','group_list',1,'p_group_list','melscan.py',153),
+  ('group -> element','group',1,'p_group','melscan.py',163),
+  ('group -> LBRACE group_list_opt RBRACE','group',3,'p_group','melscan.py',164),
+  ('element -> declaration_specifiers','element',1,'p_element','melscan.py',191),
+  ('element -> BREAK','element',1,'p_element','melscan.py',192),
+  ('element -> CASE','element',1,'p_element','melscan.py',193),
+  ('element -> CONTINUE','element',1,'p_element','melscan.py',194),
+  ('element -> DEFAULT','element',1,'p_element','melscan.py',195),
+  ('element -> DO','element',1,'p_element','melscan.py',196),
+  ('element -> ELSE','element',1,'p_element','melscan.py',197),
+  ('element -> FALSE','element',1,'p_element','melscan.py',198),
+  ('element -> FOR','element',1,'p_element','melscan.py',199),
+  ('element -> IF','element',1,'p_element','melscan.py',200),
+  ('element -> IN','element',1,'p_element','melscan.py',201),
+  ('element -> NO','element',1,'p_element','melscan.py',202),
+  ('element -> ON','element',1,'p_element','melscan.py',203),
+  ('element -> OFF','element',1,'p_element','melscan.py',204),
+  ('element -> RETURN','element',1,'p_element','melscan.py',205),
+  ('element -> SWITCH','element',1,'p_element','melscan.py',206),
+  ('element -> TRUE','element',1,'p_element','melscan.py',207),
+  ('element -> WHILE','element',1,'p_element','melscan.py',208),
+  ('element -> YES','element',1,'p_element','melscan.py',209),
+  ('element -> ID','element',1,'p_element','melscan.py',210),
+  ('element -> VAR','element',1,'p_element','melscan.py',211),
+  ('element -> ICONST','element',1,'p_element','melscan.py',212),
+  ('element -> FCONST','element',1,'p_element','melscan.py',213),
+  ('element -> SCONST','element',1,'p_element','melscan.py',214),
+  ('element -> PLUS','element',1,'p_element','melscan.py',215),
+  ('element -> MINUS','element',1,'p_element','melscan.py',216),
+  ('element -> TIMES','element',1,'p_element','melscan.py',217),
+  ('element -> DIVIDE','element',1,'p_element','melscan.py',218),
+  ('element -> MOD','element',1,'p_element','melscan.py',219),
+  ('element -> NOT','element',1,'p_element','melscan.py',220),
+  ('element -> CROSS','element',1,'p_element','melscan.py',221),
+  ('element -> LOR','element',1,'p_element','melscan.py',222),
+  ('element -> LAND','element',1,'p_element','melscan.py',223),
+  ('element -> LT','element',1,'p_element','melscan.py',224),
+  ('element -> LE','element',1,'p_element','melscan.py',225),
+  ('element -> GT','element',1,'p_element','melscan.py',226),
+  ('element -> GE','element',1,'p_element','melscan.py',227),
+  ('element -> EQ','element',1,'p_element','melscan.py',228),
+  ('element -> NE','element',1,'p_element','melscan.py',229),
+  ('element -> EQUALS','element',1,'p_element','melscan.py',230),
+  ('element -> TIMESEQUAL','element',1,'p_element','melscan.py',231),
+  ('element -> DIVEQUAL','element',1,'p_element','melscan.py',232),
+  ('element -> MODEQUAL','element',1,'p_element','melscan.py',233),
+  ('element -> PLUSEQUAL','element',1,'p_element','melscan.py',234),
+  ('element -> MINUSEQUAL','element',1,'p_element','melscan.py',235),
+  ('element -> CROSSEQUAL','element',1,'p_element','melscan.py',236),
+  ('element -> COMPONENT','element',1,'p_element','melscan.py',237),
+  ('element -> PLUSPLUS','element',1,'p_element','melscan.py',238),
+  ('element -> MINUSMINUS','element',1,'p_element','melscan.py',239),
+  ('element -> CONDOP','element',1,'p_element','melscan.py',240),
+  ('element -> LPAREN','element',1,'p_element','melscan.py',241),
+  ('element -> RPAREN','element',1,'p_element','melscan.py',242),
+  ('element -> LBRACKET','element',1,'p_element','melscan.py',243),
+  ('element -> RBRACKET','element',1,'p_element','melscan.py',244),
+  ('element -> COMMA','element',1,'p_element','melscan.py',245),
+  ('element -> SEMI','element',1,'p_element','melscan.py',246),
+  ('element -> COLON','element',1,'p_element','melscan.py',247),
+  ('element -> CAPTURE','element',1,'p_element','melscan.py',248),
+  ('element -> LVEC','element',1,'p_element','melscan.py',249),
+  ('element -> RVEC','element',1,'p_element','melscan.py',250),
+  ('element -> COMMENT','element',1,'p_element','melscan.py',251),
+  ('element -> COMMENT_BLOCK','element',1,'p_element','melscan.py',252),
+  ('element -> ELLIPSIS','element',1,'p_element','melscan.py',253),
+  ('empty -> <empty>','empty',0,'p_empty','melscan.py',261),
+]
@@ -0,0 +1,130 @@
+"""
+Command line tools for the maya name parsers of `pymel.util.nameparse`.
+
+Usage::
+
+    mayapy -m pymel.tools.nameparsetool regen
+    mayapy -m pymel.tools.nameparsetool check
+    mayapy -m pymel.tools.nameparsetool bench [--count N] [--repeat N]
+
+``regen`` deletes and rebuilds the yacc tables shipped in
+``pymel.util.parsertabs``.  Run it after changing any of the grammars, the
+tables are only rebuilt at runtime (and written back if possible) when they
+don't match.
+
+``check`` exits with a non-zero status if a shipped table is missing or no
+longer matches its grammar, for use in tests or release scripts.
+
+``bench`` parses a corpus of node, attribute and component names, once with
+an empty and once with a warm parse cache, and reports timings per name.
+"""
+from __future__ import print_function
+
+import argparse
+import sys
+import time
+
+from pymel.util import nameparse
+from pymel.util import objectParser
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Dict, List
+
+# node path, namespace and attribute patterns that occur in typical scenes
+_NODES = ['pCube%d', 'group%d|pSphere%d', '|char:root|char:spine%d|char:spine%dShape',
+          'set%d:ctrl_%d_L', 'lambert%d', 'file%d']
+_ATTRS = ['translateX', 'visibility', 'worldMatrix[%d]', 'uvSet[%d].uvSetName',
+          'colorEntryList[%d].color', 'outColor']
+
+
+def corpus(count=1000):
+    # type: (int) -> List[str]
+    """count names of nodes and node.attributes, with repeats like in a real scene"""
+    names = []
+    i = 0
+    while len(names) < count:
+        node = _NODES[i % len(_NODES)]
+        node = node % ((i % 50,) * node.count('%d'))
+        attr = _ATTRS[(i // len(_NODES)) % len(_ATTRS)]
+        attr = attr % ((i % 7,) * attr.count('%d'))
+        names.append(node)
+        names.append(node + '.' + attr)
+        i += 1
+    return names[:count]
+
+
+def regen():
+    # type: () -> int
+    results = objectParser.regenerateParserTables(nameparse)
+    failed = 0
+    for tabname, error in sorted(results.items()):
+        if error is None:
+            print('%-45s ok' % tabname)
+        else:
+            # some of the intermediate grammars can't be built on their own
+            print('%-45s skipped (%s: %s)' % (tabname, type(error).__name__, error))
+            failed += 1
+    print('%d table(s) written, %d skipped' % (len(results) - failed, failed))
+    return 0
+
+
+def check():
+    # type: () -> int
+    stale = objectParser.checkParserTables(nameparse)
+    for tabname in stale:
+        print('%s is missing or outdated' % tabname)
+    if stale:
+        print('run: mayapy -m pymel.tools.nameparsetool regen')
+        return 1
+    print('all parser tables are up to date')
+    return 0
+
+
+def bench(count=1000, repeat=3):
+    # type: (int, int) -> Dict[str, float]
+    names = corpus(count)
+    results = {}
+    for label, clear in (('cold', True), ('memoized', False)):
+        best = None
+        for _ in range(repeat):
+            if clear:
+                nameparse.clearParseCache()
+            start = time.perf_counter()
+            for name in names:
+                nameparse.parse(name)
+            duration = time.perf_counter() - start
+            best = duration if best is None else min(best, duration)
+        results[label] = best
+        print('%-9s %8.1f ms total %8.1f us/name' % (
+            label, best * 1000, best * 1e6 / len(names)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='nameparsetool', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('regen', help='rebuild the shipped yacc tables')
+    subparsers.add_parser('check', help='verify the shipped yacc tables match the grammars')
+    benchParser = subparsers.add_parser(
+        'bench', help='time parsing a name corpus with and without the parse cache')
+    benchParser.add_argument('--count', type=int, default=1000,
+                             help='number of names to parse')
+    benchParser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+    if args.command == 'regen':
+        return regen()
+    if args.command == 'check':
+        return check()
+    bench(count=args.count, repeat=args.repeat)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Benchmarks for the directory listing and walking methods of `pymel.util.path`.
+
+Usage::
+
+    mayapy -m pymel.tools.pathtool bench [--entries 100000] [--root DIR] [--workers 8]
+
+``bench`` builds a synthetic tree of empty files (in a temporary directory
+unless ``--root`` is given, ie on a network share) and times the list based
+``walk``/``walkfiles``/``files`` against the ``os.scandir`` based
+``scanwalk``/``iterfiles``, with and without parallel traversal.
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from pymel.util.path import path
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional
+
+
+def makeTree(root, entries=100000, filesPerDir=50, dirsPerDir=8):
+    # type: (str, int, int, int) -> int
+    """Create a tree of about `entries` empty files and directories under root"""
+    count = 0
+    queue = [root]
+    while queue and count < entries:
+        parent = queue.pop(0)
+        for i in range(filesPerDir):
+            if count >= entries:
+                break
+            ext = '.mel' if i % 5 == 0 else '.txt'
+            open(os.path.join(parent, 'file%03d%s' % (i, ext)), 'w').close()
+            count += 1
+        for i in range(dirsPerDir):
+            if count >= entries:
+                break
+            child = os.path.join(parent, 'dir%02d' % i)
+            os.mkdir(child)
+            queue.append(child)
+            count += 1
+    return count
+
+
+def _timed(func, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best, result
+
+
+def bench(root, workers=8, repeat=3):
+    # type: (str, int, int) -> Dict[str, float]
+    root = path(root)
+    cases = [
+        ('walk', lambda: sum(1 for _ in root.walk())),
+        ('scanwalk', lambda: sum(1 for _ in root.scanwalk())),
+        ('scanwalk workers=%d' % workers,
+         lambda: sum(1 for _ in root.scanwalk(workers=workers))),
+        ('walkfiles *.mel', lambda: sum(1 for _ in root.walkfiles('*.mel'))),
+        ('scanwalk *.mel files',
+         lambda: sum(1 for _ in root.scanwalk('*.mel', kind='files'))),
+        ('scanwalk *.mel files workers=%d' % workers,
+         lambda: sum(1 for _ in root.scanwalk('*.mel', kind='files', workers=workers))),
+        ('listdir + isfile', lambda: len([p for p in root.listdir() if p.isfile()])),
+        ('iterfiles', lambda: sum(1 for _ in root.iterfiles())),
+    ]
+    results = {}
+    print('%-36s %10s %10s' % ('method', 'time', 'items'))
+    for label, func in cases:
+        duration, count = _timed(func, repeat)
+        results[label] = duration
+        print('%-36s %7.1f ms %10d' % (label, duration * 1000, count))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='pathtool', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    benchParser = subparsers.add_parser(
+        'bench', help='compare list based and scandir based tree walks')
+    benchParser.add_argument('--entries', type=int, default=100000,
+                             help='number of files and directories to create')
+    benchParser.add_argument('--root', default=None,
+                             help='existing directory to create the tree in')
+    benchParser.add_argument('--workers', type=int, default=8)
+    benchParser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+    root = tempfile.mkdtemp(prefix='pathbench', dir=args.root)
+    try:
+        count = makeTree(root, args.entries)
+        print('created %d entries in %s' % (count, root))
+        bench(root, workers=args.workers, repeat=args.repeat)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+Command line tools for the startup traces of `pymel.startuptrace`.
+
+Usage::
+
+    mayapy -m pymel.tools.startuptool record OUT.json [--module pymel.core ...]
+    mayapy -m pymel.tools.startuptool show REPORT.json [--top N]
+    mayapy -m pymel.tools.startuptool diff BEFORE.json AFTER.json [--by modules] [--top N]
+
+``record`` imports the given modules (default: ``pymel.core``) in a fresh
+interpreter with ``PYMEL_STARTUP_TRACE`` set and writes the report to OUT.json.
+Traces of a maya session or a mayapy worker are made by setting the variable
+in their environment instead.
+
+``show`` prints the summary of a report and its most expensive modules,
+cache loads and lazy attributes.
+
+``diff`` compares two reports by module, by top level package ('packages')
+or by event kind ('cache', 'lazy', 'mark'), largest change first.  It exits
+with a non-zero status if the total import time grew by more than
+``--fail-over`` seconds, for use in release scripts.
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+from pymel import startuptrace
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional
+
+
+def _ms(seconds):
+    # type: (Optional[float]) -> str
+    if seconds is None:
+        return '-'
+    return '%.1f ms' % (seconds * 1000)
+
+
+def record(reportFile, modules=('pymel.core',)):
+    # type: (str, Any) -> Dict[str, Any]
+    """Import modules in a fresh interpreter with tracing on; returns the report"""
+    pymelRoot = os.path.dirname(os.path.dirname(os.path.abspath(startuptrace.__file__)))
+    env = dict(os.environ)
+    env[startuptrace.ENV_VAR] = os.path.abspath(reportFile)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [pymelRoot] + [p for p in env.get('PYTHONPATH', '').split(os.pathsep) if p])
+    # pymel has to come first to trace the other imports
+    script = 'import pymel\n' + ''.join('import %s\n' % m for m in modules)
+    subprocess.check_call([sys.executable, '-c', script], env=env)
+    return startuptrace.loadReport(reportFile)
+
+
+def show(report, top=20):
+    # type: (Dict[str, Any], int) -> None
+    summary = report['summary']
+    print('%s (pid %d): %d modules, %s importing, %s elapsed' % (
+        report['executable'], report['pid'], summary['modules'],
+        _ms(summary['importTime']), _ms(report['elapsed'])))
+    for kind, total in sorted(summary['events'].items()):
+        print('  %-10s %s' % (kind, _ms(total)))
+    print('\npackages (self + find):')
+    for name, total in sorted(summary['packages'].items(), key=lambda i: -i[1])[:top]:
+        print('  %-40s %10s' % (name, _ms(total)))
+    print('\nmodules:')
+    print('  %-50s %10s %10s %10s' % ('name', 'self', 'find', 'inclusive'))
+    for rec in sorted(report['modules'], key=lambda r: -(r['self'] + r['find']))[:top]:
+        print('  %-50s %10s %10s %10s' % (rec['name'][:50], _ms(rec['self']),
+                                          _ms(rec['find']), _ms(rec['inclusive'])))
+    events = [e for e in report['events'] if e['kind'] != 'mark']
+    if events:
+        print('\nevents:')
+        for event in sorted(events, key=lambda e: -e['duration'])[:top]:
+            print('  %-6s %-50s %10s' % (event['kind'], event['name'][:50], _ms(event['duration'])))
+
+
+def diff(before, after, what='modules', top=30):
+    # type: (Dict[str, Any], Dict[str, Any], str, int) -> List[Dict[str, Any]]
+    rows = startuptrace.diffReports(before, after, what=what)
+    print('%-50s %10s %10s %10s' % (what, 'before', 'after', 'delta'))
+    for row in rows[:top]:
+        print('%-50s %10s %10s %+8.1f ms' % (row['name'][:50], _ms(row['before']),
+                                            _ms(row['after']), row['delta'] * 1000))
+    a = before['summary']['importTime']
+    b = after['summary']['importTime']
+    print('\ntotal import time: %s -> %s (%+.1f ms), modules: %d -> %d' % (
+        _ms(a), _ms(b), (b - a) * 1000,
+        before['summary']['modules'], after['summary']['modules']))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='startuptool', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='command')
+    recordParser = subparsers.add_parser(
+        'record', help='trace importing modules in a fresh interpreter')
+    recordParser.add_argument('reportFile')
+    recordParser.add_argument('--module', action='append', dest='modules',
+                              help='module to import (default: pymel.core)')
+    showParser = subparsers.add_parser('show', help='print the summary of a report')
+    showParser.add_argument('reportFile')
+    diffParser = subparsers.add_parser('diff', help='compare two reports')
+    diffParser.add_argument('before')
+    diffParser.add_argument('after')
+    diffParser.add_argument('--by', default='modules', dest='what',
+                            choices=['modules', 'packages', 'cache', 'lazy', 'mark'])
+    diffParser.add_argument('--fail-over', type=float, default=None, dest='failOver',
+                            help='exit with 1 if the import time grew by more seconds')
+    for topParser in (showParser, diffParser):
+        topParser.add_argument('--top', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        parser.print_help()
+        return 1
+    if args.command == 'record':
+        show(record(args.reportFile, args.modules or ('pymel.core',)))
+        return 0
+    if args.command == 'show':
+        show(startuptrace.loadReport(args.reportFile), top=args.top)
+        return 0
+    before = startuptrace.loadReport(args.before)
+    after = startuptrace.loadReport(args.after)
+    diff(before, after, what=args.what, top=args.top)
+    if args.failOver is not None:
+        grown = after['summary']['importTime'] - before['summary']['importTime']
+        if grown > args.failOver:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -31,6 +31,12 @@ from . import mathutils
 from .mathutils import blend, clamp, conjugate, imag, real, round
 from functools import reduce
 
+# optional, only used as storage for VectorArray / MatrixArray
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 if False:
     from typing import *
 
@@ -5559,6 +5565,9 @@ class MatrixN(Array):
             If b is a MatrixN, __mul__ is mapped to matrix multiplication, if b is a VectorN, to MatrixN by VectorN multiplication,
             otherwise, returns the result of the element wise multiplication of a and b if b is convertible to Array,
             multiplies every component of a by b if b is a single numeric value """
+        if isinstance(other, (VectorArray, MatrixArray)):
+            # will defer to the batch type's __rmul__
+            return NotImplemented
         if isinstance(other, MatrixN):
             return self.__class__._convert([[dot(row, col) for col in other.col] for row in self.row])
         elif isinstance(other, VectorN):
@@ -5575,6 +5584,8 @@ class MatrixN(Array):
             If b is a MatrixN, __rmul__ is mapped to matrix multiplication, if b is a VectorN, to VectorN by MatrixN multiplication,
             otherwise, returns the result of the element wise multiplication of a and b if b is convertible to Array,
             multiplies every component of a by b if b is a single numeric value """
+        if isinstance(other, (VectorArray, MatrixArray)):
+            return NotImplemented
         if isinstance(other, MatrixN):
             return MatrixN([[dot(row, col) for col in self.col] for row in other.row])
         elif isinstance(other, VectorN):
@@ -6485,8 +6496,8 @@ class VectorN(Array):
         """
         if isinstance(other, VectorN):
             return self.dot(other)
-        elif isinstance(other, MatrixN):
-            # will defer to MatrixN rmul
+        elif isinstance(other, (MatrixN, VectorArray, MatrixArray)):
+            # will defer to MatrixN (or the batch type's) rmul
             return NotImplemented
         else:
             # will defer to Array.__mul__
@@ -6502,8 +6513,8 @@ class VectorN(Array):
         """
         if isinstance(other, VectorN):
             return self.dot(other)
-        elif isinstance(other, MatrixN):
-            # will defer to MatrixN mul
+        elif isinstance(other, (MatrixN, VectorArray, MatrixArray)):
+            # will defer to MatrixN (or the batch type's) mul
             return NotImplemented
         else:
             # will defer to Array.__rmul__
@@ -6741,6 +6752,447 @@ class VectorN(Array):
     # blend and clamp derived from Array
 
 
+# Batch types: stacks of same sized vectors or matrices, for bulk operations on many
+# points (curve cvs, symmetry maps...). Stored as a numpy array when numpy is available,
+# otherwise as nested lists with the same (pure Python) results.
+
+def _batchData(data, ndim, useNumpy):
+    """ data of a VectorArray (ndim 2) or MatrixArray (ndim 3) in the storage of that backend """
+    if isinstance(data, (VectorArray, MatrixArray)):
+        data = data._data
+    if isinstance(data, Array):
+        data = [data]
+    if useNumpy:
+        result = _np.array(data, dtype=float)
+        if result.size == 0:
+            result = result.reshape((0,) * ndim)
+        if result.ndim != ndim:
+            raise TypeError("cannot initialize a batch of %d dimensional items from data of shape %s"
+                            % (ndim - 1, result.shape))
+        return result
+    if ndim == 2:
+        result = [[float(x) for x in v] for v in data]
+    else:
+        result = [[[float(x) for x in row] for row in m] for m in data]
+    if len(set(len(x) for x in result)) > 1:
+        raise TypeError("all items of a batch must have the same size")
+    return result
+
+
+class VectorArray(object):
+
+    """
+        A stack of VectorN of identical size, for bulk operations on many vectors or points at once.
+
+        The data is stored as a (N, size) numpy array if numpy can be imported (or unless numpy=False),
+        as lists of floats otherwise. Results don't depend on the storage.
+
+        >>> A = VectorArray([[1, 0, 0], [0, 2, 0], [0, 0, 3]])
+        >>> A
+        VectorArray([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+        >>> len(A), A.size
+        (3, 3)
+        >>> A[1]
+        VectorN([0.0, 2.0, 0.0])
+        >>> A.length()
+        [1.0, 2.0, 3.0]
+        >>> A.normal()
+        VectorArray([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+
+        A single VectorN is broadcast against all vectors of the stack
+
+        >>> A.dot(VectorN(1, 1, 1))
+        [1.0, 2.0, 3.0]
+        >>> A.cross(VectorN(1, 0, 0))
+        VectorArray([[0.0, 0.0, 0.0], [0.0, 0.0, -2.0], [0.0, 3.0, 0.0]])
+        >>> A + VectorN(1, 1, 1)
+        VectorArray([[2.0, 1.0, 1.0], [1.0, 3.0, 1.0], [1.0, 1.0, 4.0]])
+
+        Multiplying by a MatrixN (or a MatrixArray of same length) treats each vector as a row vector,
+        like VectorN * MatrixN does
+
+        >>> M = MatrixN([[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+        >>> A * M
+        VectorArray([[0.0, 1.0, 0.0], [-2.0, 0.0, 0.0], [0.0, 0.0, 3.0]])
+
+        and MatrixN * VectorArray treats them as column vectors, like MatrixN * VectorN does
+
+        >>> M * VectorArray([[1, 2, 3], [4, 5, 6]])
+        VectorArray([[2.0, -1.0, 3.0], [5.0, -4.0, 6.0]])
+        >>> VectorN(1, 1, 1) * A
+        VectorArray([[1.0, 0.0, 0.0], [0.0, 2.0, 0.0], [0.0, 0.0, 3.0]])
+
+        Results match the pure Python VectorN / MatrixN methods, whatever the storage
+
+        >>> vectors = [VectorN(i, 2 * i - 3, 5 - i) for i in range(6)]
+        >>> B = VectorArray(vectors)
+        >>> B.toVectors() == vectors
+        True
+        >>> B.cross(A[2]).toVectors() == [cross(v, A[2]) for v in vectors]
+        True
+        >>> (B * M).toVectors() == [v * M for v in vectors]
+        True
+        >>> VectorArray(vectors, numpy=False).dot(B) == [dot(v, v) for v in vectors]
+        True
+        >>> (M * B).toVectors() == (M * VectorArray(vectors, numpy=False)).toVectors() == [M * v for v in vectors]
+        True
+    """
+
+    def __init__(self, data=(), numpy=None):
+        # type: (Any, Optional[bool]) -> None
+        if numpy is None:
+            numpy = data._numpy if isinstance(data, VectorArray) else _np is not None
+        if numpy and _np is None:
+            raise ImportError("numpy is not available")
+        self._numpy = bool(numpy)
+        self._data = _batchData(data, 2, self._numpy)
+
+    def _new(self, data):
+        result = self.__class__.__new__(self.__class__)
+        result._numpy = self._numpy
+        result._data = data
+        return result
+
+    @classmethod
+    def fromVectors(cls, vectors, numpy=None):
+        """ VectorArray from an iterable of VectorN (or any sequences of numbers) """
+        return cls(list(vectors), numpy=numpy)
+
+    @property
+    def size(self):
+        # type: () -> int
+        """ size of the vectors of the stack """
+        if self._numpy:
+            return self._data.shape[1]
+        return len(self._data[0]) if self._data else 0
+
+    @property
+    def shape(self):
+        # type: () -> Tuple[int, int]
+        return (len(self), self.size)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._new(self._data[index])
+        return VectorN(list(self._data[index]))
+
+    def __setitem__(self, index, value):
+        if self._numpy:
+            self._data[index] = value
+        else:
+            self._data[index] = [float(x) for x in value]
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, VectorArray):
+            return False
+        return self.tolist() == other.tolist()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def tolist(self):
+        # type: () -> List[List[float]]
+        """ the vectors as a list of lists of floats """
+        if self._numpy:
+            return self._data.tolist()
+        return [list(v) for v in self._data]
+
+    def toVectors(self):
+        # type: () -> List[VectorN]
+        """ the vectors as a list of VectorN """
+        return [VectorN(v) for v in self.tolist()]
+
+    def asarray(self):
+        """ the underlying (N, size) numpy array, None if not numpy-backed """
+        return self._data if self._numpy else None
+
+    def copy(self):
+        return self._new(self._data.copy() if self._numpy else [list(v) for v in self._data])
+
+    # broadcasting of the other operand
+
+    def _other(self, other):
+        """ other as the backend storage of either a single vector or a stack of len(self) vectors """
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray length mismatch: %d and %d" % (len(self), len(other)))
+            data = other._data if other._numpy == self._numpy else _batchData(other, 2, self._numpy)
+            return data, True
+        vector = [float(x) for x in other]
+        if self._numpy:
+            return _np.array(vector), False
+        return vector, False
+
+    def _pairs(self, other):
+        data, stacked = self._other(other)
+        if stacked:
+            return zip(self._data, data)
+        return ((v, data) for v in self._data)
+
+    def _elementwise(self, other, op):
+        if isNumeric(other):
+            if self._numpy:
+                return self._new(op(self._data, other))
+            return self._new([[op(x, other) for x in v] for v in self._data])
+        if self._numpy:
+            data, stacked = self._other(other)
+            return self._new(op(self._data, data))
+        return self._new([[op(x, y) for x, y in zip(u, v)] for u, v in self._pairs(other)])
+
+    def __add__(self, other):
+        return self._elementwise(other, operator.add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._elementwise(other, operator.sub)
+
+    def __rsub__(self, other):
+        return (-self)._elementwise(other, operator.add)
+
+    def __neg__(self):
+        return self._elementwise(-1.0, operator.mul)
+
+    def __truediv__(self, other):
+        return self._elementwise(other, operator.truediv)
+
+    def __mul__(self, other):
+        if isinstance(other, (MatrixN, MatrixArray)):
+            return self.transform(other)
+        return self._elementwise(other, operator.mul)
+
+    def __rmul__(self, other):
+        if isinstance(other, MatrixN):
+            return MatrixArray([other], numpy=self._numpy) * self
+        return self._elementwise(other, operator.mul)
+
+    # vector methods, same as VectorN ones for every vector of the stack
+
+    def dot(self, other):
+        # type: (Any) -> List[float]
+        """ dot product of each vector with other (a vector or a VectorArray of same length) """
+        if self._numpy:
+            data, stacked = self._other(other)
+            return (self._data * data).sum(axis=1).tolist()
+        return [_sum(x * y for x, y in zip(u, v)) for u, v in self._pairs(other)]
+
+    def cross(self, other):
+        # type: (Any) -> VectorArray
+        """ cross product of each vector with other (a vector or a VectorArray of same length), size 3 only """
+        if self.size != 3:
+            raise TypeError("cross product is only defined for vectors of size 3")
+        if self._numpy:
+            data, stacked = self._other(other)
+            return self._new(_np.cross(self._data, data))
+        return self._new([[u[1] * v[2] - u[2] * v[1],
+                           u[2] * v[0] - u[0] * v[2],
+                           u[0] * v[1] - u[1] * v[0]] for u, v in self._pairs(other)])
+
+    def sqlength(self):
+        # type: () -> List[float]
+        return self.dot(self)
+
+    def length(self):
+        # type: () -> List[float]
+        if self._numpy:
+            return _np.sqrt((self._data * self._data).sum(axis=1)).tolist()
+        return [sqrt(x) for x in self.sqlength()]
+
+    def normal(self):
+        # type: () -> VectorArray
+        """ normalized copy, zero length vectors are left unchanged like VectorN.normal does """
+        if self._numpy:
+            lengths = _np.sqrt((self._data * self._data).sum(axis=1))
+            lengths[lengths == 0.0] = 1.0
+            return self._new(self._data / lengths[:, None])
+        return self._new([[x / l for x in v] if l else list(v)
+                          for v, l in zip(self._data, self.length())])
+
+    unit = normal
+
+    def transform(self, matrix, point=True):
+        # type: (Any, bool) -> VectorArray
+        """ row vectors multiplied by matrix (a MatrixN or a MatrixArray of same length).
+            If the matrix is one size larger than the vectors (3 vectors, 4x4 matrix), the vectors
+            are extended by 1.0 if point is True (so translation applies) or 0.0 otherwise. """
+        matrices = matrix if isinstance(matrix, MatrixArray) else MatrixArray([matrix], numpy=self._numpy)
+        rows, cols = matrices.shape[1:]
+        extend = rows == self.size + 1
+        if not extend and rows != self.size:
+            raise ValueError("cannot multiply vectors of size %d by %dx%d matrices" % (self.size, rows, cols))
+        if len(matrices) not in (1, len(self)):
+            raise ValueError("MatrixArray length mismatch: %d and %d" % (len(self), len(matrices)))
+        w = 1.0 if point else 0.0
+        if self._numpy:
+            data = self._data
+            if extend:
+                data = _np.hstack((data, _np.full((len(data), 1), w)))
+            mdata = _batchData(matrices, 3, True)
+            if len(mdata) == 1:
+                result = data.dot(mdata[0])
+            else:
+                result = _np.einsum('ni,nij->nj', data, mdata)
+            return self._new(result[:, :self.size] if extend else result)
+        mdata = _batchData(matrices, 3, False)
+        result = []
+        for i, v in enumerate(self._data):
+            m = mdata[i] if len(mdata) > 1 else mdata[0]
+            if extend:
+                v = list(v) + [w]
+            row = [_sum(v[k] * m[k][j] for k in range(rows)) for j in range(cols)]
+            result.append(row[:self.size] if extend else row)
+        return self._new(result)
+
+
+class MatrixArray(object):
+
+    """
+        A stack of MatrixN of identical shape, for bulk matrix products.
+
+        The data is stored as a (N, rows, cols) numpy array if numpy can be imported (or unless
+        numpy=False), as nested lists of floats otherwise.
+
+        >>> R = MatrixN([[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+        >>> S = MatrixN([[2, 0, 0], [0, 2, 0], [0, 0, 2]])
+        >>> A = MatrixArray([R, S])
+        >>> len(A), A.shape
+        (2, (2, 3, 3))
+        >>> A[1] == S
+        True
+
+        Products are done item by item, a single MatrixN is broadcast to all items
+
+        >>> (A * R).toMatrices() == [R * R, S * R]
+        True
+        >>> (R * A).toMatrices() == [R * R, R * S]
+        True
+        >>> (A * A).toMatrices() == [R * R, S * S]
+        True
+
+        A MatrixArray multiplied by a VectorArray treats each vector as a column vector,
+        like MatrixN * VectorN does
+
+        >>> V = VectorArray([[1, 2, 3], [1, 2, 3]])
+        >>> (A * V).toVectors() == [R * VectorN(1, 2, 3), S * VectorN(1, 2, 3)]
+        True
+        >>> A.transpose()[0] == R.transpose()
+        True
+    """
+
+    def __init__(self, data=(), numpy=None):
+        # type: (Any, Optional[bool]) -> None
+        if numpy is None:
+            numpy = data._numpy if isinstance(data, MatrixArray) else _np is not None
+        if numpy and _np is None:
+            raise ImportError("numpy is not available")
+        self._numpy = bool(numpy)
+        self._data = _batchData(data, 3, self._numpy)
+
+    _new = VectorArray._new
+
+    @classmethod
+    def fromMatrices(cls, matrices, numpy=None):
+        """ MatrixArray from an iterable of MatrixN (or any nested sequences of numbers) """
+        return cls(list(matrices), numpy=numpy)
+
+    @property
+    def shape(self):
+        # type: () -> Tuple[int, int, int]
+        if self._numpy:
+            return self._data.shape
+        if not self._data:
+            return (0, 0, 0)
+        return (len(self._data), len(self._data[0]), len(self._data[0][0]))
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._new(self._data[index])
+        if self._numpy:
+            return MatrixN(self._data[index].tolist())
+        return MatrixN([list(row) for row in self._data[index]])
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, self.tolist())
+
+    def __eq__(self, other):
+        if not isinstance(other, MatrixArray):
+            return False
+        return self.tolist() == other.tolist()
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def tolist(self):
+        # type: () -> List[List[List[float]]]
+        if self._numpy:
+            return self._data.tolist()
+        return [[list(row) for row in m] for m in self._data]
+
+    def toMatrices(self):
+        # type: () -> List[MatrixN]
+        return [MatrixN(m) for m in self.tolist()]
+
+    def asarray(self):
+        """ the underlying (N, rows, cols) numpy array, None if not numpy-backed """
+        return self._data if self._numpy else None
+
+    def transpose(self):
+        # type: () -> MatrixArray
+        if self._numpy:
+            return self._new(self._data.transpose((0, 2, 1)))
+        return self._new([[list(col) for col in zip(*m)] for m in self._data])
+
+    @staticmethod
+    def _matmul(a, b):
+        return [[_sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+
+    def _product(self, left, right):
+        """ item by item product of two (N, r, c) storages, one of them may hold a single matrix """
+        if len(left) != len(right) and 1 not in (len(left), len(right)):
+            raise ValueError("MatrixArray length mismatch: %d and %d" % (len(left), len(right)))
+        if self._numpy:
+            return self._new(_np.matmul(left, right))
+        count = _max(len(left), len(right))
+        return self._new([self._matmul(left[i if len(left) > 1 else 0], right[i if len(right) > 1 else 0])
+                          for i in range(count)])
+
+    def __mul__(self, other):
+        if isinstance(other, (MatrixArray, MatrixN)):
+            return self._product(self._data, _batchData(other, 3, self._numpy))
+        if isinstance(other, VectorArray):
+            # column vectors: M * v == v * M.transpose()
+            return other.transform(self.transpose())
+        if isNumeric(other):
+            if self._numpy:
+                return self._new(self._data * other)
+            return self._new([[[x * other for x in row] for row in m] for m in self._data])
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, MatrixN):
+            return self._product(_batchData(other, 3, self._numpy), self._data)
+        if isNumeric(other):
+            return self.__mul__(other)
+        return NotImplemented
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod(verbose=True)
@@ -220,3 +220,55 @@ class VectorN(Array):
     def axis(self, other, third: Incomplete | None = ..., normalize: bool = ...): ...
     def cotan(self, other, third: Incomplete | None = ...): ...
     def projectionOnto(self, other): ...
+
+class VectorArray:
+    def __init__(self, data=..., numpy: bool | None = ...) -> None: ...
+    @classmethod
+    def fromVectors(cls, vectors, numpy: bool | None = ...) -> VectorArray: ...
+    @property
+    def size(self) -> int: ...
+    @property
+    def shape(self) -> Tuple[int, int]: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[VectorN]: ...
+    def __getitem__(self, index): ...
+    def __setitem__(self, index, value) -> None: ...
+    def __eq__(self, other): ...
+    def __ne__(self, other): ...
+    def tolist(self) -> List[List[float]]: ...
+    def toVectors(self) -> List[VectorN]: ...
+    def asarray(self): ...
+    def copy(self) -> VectorArray: ...
+    def __add__(self, other) -> VectorArray: ...
+    def __radd__(self, other) -> VectorArray: ...
+    def __sub__(self, other) -> VectorArray: ...
+    def __rsub__(self, other) -> VectorArray: ...
+    def __neg__(self) -> VectorArray: ...
+    def __truediv__(self, other) -> VectorArray: ...
+    def __mul__(self, other): ...
+    def __rmul__(self, other): ...
+    def dot(self, other) -> List[float]: ...
+    def cross(self, other) -> VectorArray: ...
+    def sqlength(self) -> List[float]: ...
+    def length(self) -> List[float]: ...
+    def normal(self) -> VectorArray: ...
+    unit = normal
+    def transform(self, matrix, point: bool = ...) -> VectorArray: ...
+
+class MatrixArray:
+    def __init__(self, data=..., numpy: bool | None = ...) -> None: ...
+    @classmethod
+    def fromMatrices(cls, matrices, numpy: bool | None = ...) -> MatrixArray: ...
+    @property
+    def shape(self) -> Tuple[int, int, int]: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[MatrixN]: ...
+    def __getitem__(self, index): ...
+    def __eq__(self, other): ...
+    def __ne__(self, other): ...
+    def tolist(self) -> List[List[List[float]]]: ...
+    def toMatrices(self) -> List[MatrixN]: ...
+    def asarray(self): ...
+    def transpose(self) -> MatrixArray: ...
+    def __mul__(self, other): ...
+    def __rmul__(self, other): ...
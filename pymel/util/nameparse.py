@@ -1,6 +1,9 @@
 from builtins import input
 from builtins import range
 
+import threading
+from collections import OrderedDict
+
 from pymel.util.objectParser import *
 
 __all__ = [  # 'NameParseError', 'ParsingWarning',
@@ -9,7 +12,7 @@ __all__ = [  # 'NameParseError', 'ParsingWarning',
     'NameAlphaGroup', 'NameNumGroup', 'NameSep', 'MayaName', 'NamespaceSep', 'Namespace',
     'MayaShortName', 'DagPathSep', 'MayaNodePath', 'AttrSep', 'NameIndex', 'NameRangeIndex',
     'Component', 'Attribute', 'AttributePath', 'NodeAttribute', 'MayaObjectName',
-    'getBasicPartList', 'parse']
+    'getBasicPartList', 'parse', 'clearParseCache']
 
 # Parsers deriver from the Parser base class
 # for Maya names parsing
@@ -1573,6 +1576,46 @@ _thisModule = __import__(__name__, globals(), locals(), [''])  # last input must
 # print dir(_thisModule)
 
 
+# Memo of parsed MayaObjectName by input string. Parsed objects are mutable
+# (setNamespace, etc) so only clones of the cached results are handed out.
+PARSE_CACHE_SIZE = 4096
+_parseCache = OrderedDict()
+_parseCacheLock = threading.Lock()
+
+
+def _cloneParsed(parsed):
+    """ copy of a parsed tree that shares no mutable state with the original, without reparsing """
+    if not isinstance(parsed, Parsed):
+        return parsed
+    clone = super(Parsed, type(parsed)).__new__(type(parsed))
+    clone.__dict__.update(parsed.__dict__)
+    clone._sub = tuple(_cloneParsed(x) for x in parsed._sub)
+    return clone
+
+
+def _parseObjectName(name):
+    """ MayaObjectName(name), memoized in a bounded LRU cache """
+    if PARSE_CACHE_SIZE <= 0 or not isinstance(name, str):
+        return MayaObjectName(name)
+    with _parseCacheLock:
+        parsed = _parseCache.get(name)
+        if parsed is not None:
+            _parseCache.move_to_end(name)
+    if parsed is None:
+        parsed = MayaObjectName(name)
+        with _parseCacheLock:
+            _parseCache[name] = parsed
+            while len(_parseCache) > PARSE_CACHE_SIZE:
+                _parseCache.popitem(last=False)
+    return _cloneParsed(parsed)
+
+
+def clearParseCache():
+    """ empty the cache used by `parse` and `getBasicPartList` """
+    with _parseCacheLock:
+        _parseCache.clear()
+
+
 def getBasicPartList(name):
     """
     convenience function for breaking apart a maya object to the appropriate level for pymel name parsing
@@ -1594,13 +1637,13 @@ def getBasicPartList(name):
             # print "deadend", repr(obj)
             pass
 
-    getParts(MayaObjectName(name))
+    getParts(_parseObjectName(name))
     return partList
 
 
 def parse(name):
     """main entry point for parsing a maya node name"""
-    return MayaObjectName(name).object
+    return _parseObjectName(name).object
 
 # restrict visibility to NameParsed classes :
 # __all__ = ParsedClasses().keys()
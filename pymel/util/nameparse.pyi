@@ -353,5 +353,8 @@ class Empty(NameParsed):
     @classmethod
     def default(cls): ...
 
+PARSE_CACHE_SIZE: int
+
+def clearParseCache() -> None: ...
 def getBasicPartList(name): ...
 def parse(name): ...
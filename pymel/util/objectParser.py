@@ -574,7 +574,12 @@ class Parser(object):
     def build(self, **kwargs):
         debug = kwargs.get('debug', verbose())
         start = kwargs.get('start', self.__class__.start)
-        parserspath = kwargs.get('outputdir', tempfile.gettempdir())
+        parserspath = kwargs.get('outputdir', None)
+        tabpackage = None
+        if parserspath is None:
+            # use (and if outdated, update) the tables shipped with pymel
+            parserspath = parserTablesDir()
+            tabpackage = PARSER_TABLES_PACKAGE
         if debug:
             print("nameparse parsers path", parserspath)
         method = kwargs.get('method', 'LALR')
@@ -597,15 +602,116 @@ class Parser(object):
             lkwargs = {'debug': debug, 'lextab': lextab}
             self.lexer = lex.lex(object=self, **lkwargs)
         if self.parser is None:
-            tabmodule = self.__class__.__name__ + "_yacc_" + start
-            pkwargs = {'outputdir': parserspath, 'debug': debug, 'tabmodule': tabmodule, 'start': start, 'method': method}
+            tabmodule = self.tabModuleName(start)
+            if tabpackage:
+                tabmodule = tabpackage + '.' + tabmodule
+            pkwargs = {'outputdir': parserspath, 'debug': debug, 'tabmodule': tabmodule, 'start': start, 'method': method,
+                       'write_tables': kwargs.get('write_tables', True)}
+            if 'errorlog' in kwargs:
+                pkwargs['errorlog'] = kwargs['errorlog']
             self.parser = yacc.yacc(module=self, **pkwargs)
 
+    def tabModuleName(self, start=None):
+        """ name of the module holding the yacc tables for this parser """
+        if start is None:
+            start = self.__class__.start
+        return self.__class__.__name__ + "_yacc_" + start
+
+    def tableSignature(self, start=None):
+        """ the grammar signature yacc stores in (and checks against) the table module,
+            None if yacc can't build a parser from that grammar """
+        if start is None:
+            start = self.__class__.start
+        pdict = dict((k, getattr(self, k)) for k in dir(self))
+        pdict['start'] = start
+        pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+        pinfo.get_all()
+        if pinfo.error or pinfo.validate_all():
+            return None
+        return pinfo.signature()
+
     def parse(self, data, **kwargs):
         self.errorcount = 0
         return self.parser.parse(data, lexer=self.lexer, **kwargs)
 
 
+# yacc tables are shipped pre-generated in this package, see regenerateParserTables
+PARSER_TABLES_PACKAGE = 'pymel.util.parsertabs'
+
+
+def parserTablesDir():
+    """ directory of the shipped yacc table modules """
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsertabs')
+
+
+def _yaccParserClasses(module):
+    """ yacc based Parser classes used by the Parsed classes of module, by name """
+    result = {}
+    for name, obj in vars(module).items():
+        if not isParsedClass(obj):
+            continue
+        parser = obj.__dict__.get('_parser', None)
+        if isinstance(parser, Parser):
+            parser = parser.__class__
+        if (isParserClass(parser)
+                and not issubclass(parser, (TokenParser, EmptyTokenParser))
+                and parser is not EmptyParser
+                and parser.__dict__.get('start')):
+            result[parser.__name__] = parser
+    return result
+
+
+def checkParserTables(module):
+    """ Return the names of the yacc table modules of module's parsers that are
+    missing or outdated (different grammar signature or PLY table version).
+    Parsers whose grammar yacc can't build are ignored. """
+    import importlib
+    stale = []
+    for parsercls in sorted(_yaccParserClasses(module).values(), key=lambda c: c.__name__):
+        parser = parsercls()
+        signature = parser.tableSignature()
+        if signature is None:
+            continue
+        tabname = parser.tabModuleName()
+        try:
+            tabmodule = importlib.import_module(PARSER_TABLES_PACKAGE + '.' + tabname)
+        except ImportError:
+            # only report it if yacc can actually build that grammar
+            try:
+                parser.build(outputdir=tempfile.gettempdir(), write_tables=False,
+                             errorlog=yacc.NullLogger())
+            except Exception:
+                continue
+            stale.append(tabname)
+            continue
+        if (getattr(tabmodule, '_tabversion', None) != yacc.__tabversion__
+                or getattr(tabmodule, '_lr_signature', None) != signature):
+            stale.append(tabname)
+    return stale
+
+
+def regenerateParserTables(module):
+    """ Delete and rebuild the shipped yacc tables of all of module's parsers.
+    Returns a dict {tabModuleName: error or None} """
+    tablesDir = parserTablesDir()
+    for filename in os.listdir(tablesDir):
+        if '_yacc_' in filename and filename.endswith(('.py', '.pyc')):
+            os.remove(os.path.join(tablesDir, filename))
+    # make sure deleted modules are really re-created
+    for modname in list(sys.modules):
+        if modname.startswith(PARSER_TABLES_PACKAGE + '.'):
+            del sys.modules[modname]
+    results = {}
+    for parsercls in sorted(_yaccParserClasses(module).values(), key=lambda c: c.__name__):
+        parser = parsercls()
+        try:
+            parser.build(write_tables=True)
+            results[parser.tabModuleName()] = None
+        except Exception as e:
+            results[parser.tabModuleName()] = e
+    return results
+
+
 class Token(Parsed):
 
     """ A class for token types, allows direct initialization from a string and type without checking
@@ -53,8 +53,16 @@ class Parser:
     @staticmethod
     def getRulesAndTokens(parsercls): ...
     def build(self, **kwargs) -> None: ...
+    def tabModuleName(self, start: Incomplete | None = ...) -> str: ...
+    def tableSignature(self, start: Incomplete | None = ...) -> str | None: ...
     def parse(self, data, **kwargs): ...
 
+PARSER_TABLES_PACKAGE: str
+
+def parserTablesDir() -> str: ...
+def checkParserTables(module) -> list[str]: ...
+def regenerateParserTables(module) -> dict[str, Exception | None]: ...
+
 class Token(Parsed): ...
 
 class TokenParser(Parser):
@@ -0,0 +1,67 @@
+
+# AttributeNameParser_yacc_NodeAttribute.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NodeAttributeleftDotleftPipeleftColonleftUnderscoreleftAlphaNumAlpha Colon Dot Index Num Pipe UnderscoreNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup  NameSep : NameSep Underscore  NameSep : Underscore MayaName : error MayaName : MayaName NameSep NameGroup\n                        | MayaName NameSep  MayaName : NameSep NameGroup\n                    | NameAlphaGroup  NamespaceSep : Colon  Namespace : Namespace MayaName NamespaceSep  Namespace : MayaName NamespaceSep\n                    | NamespaceSep\n                    | Empty  MayaShortName : Namespace MayaName\n                            | MayaName  DagPathSep : Pipe  MayaNodePath : MayaNodePath DagPathSep MayaShortName  MayaNodePath : DagPathSep MayaShortName\n                                | MayaShortName  AttrSep : Dot  NameIndex : Index Attribute : error Attribute : MayaName NameIndex\n                                    | MayaName  AttributePath : AttributePath AttrSep Attribute  AttributePath : Attribute  NodeAttribute : MayaNodePath AttrSep AttributePathEmpty : '
+    
+_lr_action_items = {'Pipe':([0,2,4,7,10,12,14,15,16,20,21,23,24,25,26,27,28,29,30,31,36,38,39,40,],[5,5,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,-14,-6,-7,]),'error':([0,3,5,6,8,9,13,17,18,19,22,37,41,],[10,10,-25,10,-21,-22,-18,34,10,-29,-20,-19,34,]),'Colon':([0,3,5,7,10,12,14,15,16,18,21,23,24,25,26,27,28,29,30,31,38,39,40,],[13,13,-25,13,-13,-17,-12,-5,-1,13,13,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Underscore':([0,3,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,21,22,23,24,25,26,27,28,29,30,31,34,35,37,38,39,40,41,],[14,14,-25,14,14,-21,-22,-13,25,-17,-18,-12,-5,-1,14,14,-29,14,-20,25,-16,-11,-9,-10,-8,-2,-3,-4,-13,14,-19,-14,-6,-7,14,]),'Alpha':([0,3,5,6,8,9,11,12,13,14,15,16,17,18,19,22,23,25,26,27,28,29,30,31,37,39,40,41,],[16,16,-25,16,-21,-22,16,16,-18,-12,-5,-1,16,16,-29,-20,16,-11,16,16,-8,-2,-3,-4,-19,-6,-7,16,]),'$end':([1,12,14,15,16,23,24,25,26,27,28,29,30,31,32,33,34,35,38,39,40,42,43,44,],[0,-17,-12,-5,-1,-15,-16,-11,-9,-10,-8,-2,-3,-4,-36,-35,-13,-33,-14,-6,-7,-32,-30,-34,]),'Dot':([2,4,7,10,12,14,15,16,20,21,23,24,25,26,27,28,29,30,31,32,33,34,35,36,38,39,40,42,43,44,],[19,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,19,-35,-13,-33,-26,-14,-6,-7,-32,-30,-34,]),'Num':([11,12,14,15,16,23,25,26,27,28,29,30,31,39,40,],[29,29,-12,-5,-1,29,-11,29,29,-8,-2,-3,-4,-6,-7,]),'Index':([12,14,15,16,23,24,25,26,27,28,29,30,31,34,35,38,39,40,],[-17,-12,-5,-1,-15,-16,-11,-9,-10,-8,-2,-3,-4,-13,43,-14,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'NodeAttribute':([0,],[1,]),'MayaNodePath':([0,],[2,]),'DagPathSep':([0,2,],[3,18,]),'MayaShortName':([0,3,18,],[4,20,36,]),'Namespace':([0,3,18,],[6,6,6,]),'MayaName':([0,3,6,17,18,41,],[7,7,21,35,7,35,]),'NamespaceSep':([0,3,7,18,21,],[8,8,22,8,37,]),'Empty':([0,3,18,],[9,9,9,]),'NameSep':([0,3,6,7,17,18,21,35,41,],[11,11,11,23,11,11,23,23,11,]),'NameAlphaGroup':([0,3,6,11,17,18,23,41,],[12,12,12,26,12,12,26,12,]),'NameAlphaPart':([0,3,6,11,12,17,18,23,26,27,41,],[15,15,15,15,30,15,15,15,30,39,15,]),'AttrSep':([2,32,],[17,41,]),'NameGroup':([11,23,],[24,38,]),'NameNumGroup':([11,23,],[27,27,]),'NameNumPart':([11,12,23,26,27,],[28,31,28,31,40,]),'AttributePath':([17,],[32,]),'Attribute':([17,41,],[33,44,]),'NameIndex':([35,],[42,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> NodeAttribute","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+  ('NameSep -> NameSep Underscore','NameSep',2,'p_sep_concat','nameparse.py',124),
+  ('NameSep -> Underscore','NameSep',1,'p_sep','nameparse.py',128),
+  ('MayaName -> error','MayaName',1,'p_name_error','nameparse.py',149),
+  ('MayaName -> MayaName NameSep NameGroup','MayaName',3,'p_name_concat','nameparse.py',154),
+  ('MayaName -> MayaName NameSep','MayaName',2,'p_name_concat','nameparse.py',155),
+  ('MayaName -> NameSep NameGroup','MayaName',2,'p_name','nameparse.py',162),
+  ('MayaName -> NameAlphaGroup','MayaName',1,'p_name','nameparse.py',163),
+  ('NamespaceSep -> Colon','NamespaceSep',1,'p_nspace_sep','nameparse.py',178),
+  ('Namespace -> Namespace MayaName NamespaceSep','Namespace',3,'p_nspace_concat','nameparse.py',194),
+  ('Namespace -> MayaName NamespaceSep','Namespace',2,'p_nspace','nameparse.py',198),
+  ('Namespace -> NamespaceSep','Namespace',1,'p_nspace','nameparse.py',199),
+  ('Namespace -> Empty','Namespace',1,'p_nspace','nameparse.py',200),
+  ('MayaShortName -> Namespace MayaName','MayaShortName',2,'p_sname','nameparse.py',214),
+  ('MayaShortName -> MayaName','MayaShortName',1,'p_sname','nameparse.py',215),
+  ('DagPathSep -> Pipe','DagPathSep',1,'p_dpath_sep','nameparse.py',230),
+  ('MayaNodePath -> MayaNodePath DagPathSep MayaShortName','MayaNodePath',3,'p_node_concat','nameparse.py',248),
+  ('MayaNodePath -> DagPathSep MayaShortName','MayaNodePath',2,'p_node','nameparse.py',252),
+  ('MayaNodePath -> MayaShortName','MayaNodePath',1,'p_node','nameparse.py',253),
+  ('AttrSep -> Dot','AttrSep',1,'p_attr_sep','nameparse.py',268),
+  ('NameIndex -> Index','NameIndex',1,'p_index','nameparse.py',287),
+  ('Attribute -> error','Attribute',1,'p_nodeattr_error','nameparse.py',350),
+  ('Attribute -> MayaName NameIndex','Attribute',2,'p_nodeattr','nameparse.py',354),
+  ('Attribute -> MayaName','Attribute',1,'p_nodeattr','nameparse.py',355),
+  ('AttributePath -> AttributePath AttrSep Attribute','AttributePath',3,'p_nodeattrpath_concat','nameparse.py',369),
+  ('AttributePath -> Attribute','AttributePath',1,'p_nodeattrpath','nameparse.py',373),
+  ('NodeAttribute -> MayaNodePath AttrSep AttributePath','NodeAttribute',3,'p_attribute','nameparse.py',384),
+  ('Empty -> <empty>','Empty',0,'p_empty','objectParser.py',751),
+]
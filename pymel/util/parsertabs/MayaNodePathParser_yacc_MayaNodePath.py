@@ -0,0 +1,59 @@
+
+# MayaNodePathParser_yacc_MayaNodePath.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'MayaNodePathleftPipeleftColonleftUnderscoreleftAlphaNumAlpha Colon Num Pipe UnderscoreNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup  NameSep : NameSep Underscore  NameSep : Underscore MayaName : error MayaName : MayaName NameSep NameGroup\n                        | MayaName NameSep  MayaName : NameSep NameGroup\n                    | NameAlphaGroup  NamespaceSep : Colon  Namespace : Namespace MayaName NamespaceSep  Namespace : MayaName NamespaceSep\n                    | NamespaceSep\n                    | Empty  MayaShortName : Namespace MayaName\n                            | MayaName  DagPathSep : Pipe  MayaNodePath : MayaNodePath DagPathSep MayaShortName  MayaNodePath : DagPathSep MayaShortName\n                                | MayaShortName Empty : '
+    
+_lr_action_items = {'Pipe':([0,1,3,6,9,11,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,],[4,4,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,-14,-6,-7,]),'error':([0,2,4,5,7,8,12,16,19,30,],[9,9,-25,9,-21,-22,-18,9,-20,-19,]),'Colon':([0,2,4,6,9,11,13,14,15,16,18,20,21,22,23,24,25,26,27,28,31,32,33,],[12,12,-25,12,-13,-17,-12,-5,-1,12,12,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Underscore':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,18,19,20,21,22,23,24,25,26,27,28,30,31,32,33,],[13,13,-25,13,13,-21,-22,-13,22,-17,-18,-12,-5,-1,13,13,-20,22,-16,-11,-9,-10,-8,-2,-3,-4,-19,-14,-6,-7,]),'Alpha':([0,2,4,5,7,8,10,11,12,13,14,15,16,19,20,22,23,24,25,26,27,28,30,32,33,],[15,15,-25,15,-21,-22,15,15,-18,-12,-5,-1,15,-20,15,-11,15,15,-8,-2,-3,-4,-19,-6,-7,]),'$end':([1,3,6,9,11,13,14,15,17,18,20,21,22,23,24,25,26,27,28,29,31,32,33,],[0,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,-14,-6,-7,]),'Num':([10,11,13,14,15,20,22,23,24,25,26,27,28,32,33,],[26,26,-12,-5,-1,26,-11,26,26,-8,-2,-3,-4,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'MayaNodePath':([0,],[1,]),'DagPathSep':([0,1,],[2,16,]),'MayaShortName':([0,2,16,],[3,17,29,]),'Namespace':([0,2,16,],[5,5,5,]),'MayaName':([0,2,5,16,],[6,6,18,6,]),'NamespaceSep':([0,2,6,16,18,],[7,7,19,7,30,]),'Empty':([0,2,16,],[8,8,8,]),'NameSep':([0,2,5,6,16,18,],[10,10,10,20,10,20,]),'NameAlphaGroup':([0,2,5,10,16,20,],[11,11,11,23,11,23,]),'NameAlphaPart':([0,2,5,10,11,16,20,23,24,],[14,14,14,14,27,14,14,27,32,]),'NameGroup':([10,20,],[21,31,]),'NameNumGroup':([10,20,],[24,24,]),'NameNumPart':([10,11,20,23,24,],[25,28,25,28,33,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> MayaNodePath","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+  ('NameSep -> NameSep Underscore','NameSep',2,'p_sep_concat','nameparse.py',124),
+  ('NameSep -> Underscore','NameSep',1,'p_sep','nameparse.py',128),
+  ('MayaName -> error','MayaName',1,'p_name_error','nameparse.py',149),
+  ('MayaName -> MayaName NameSep NameGroup','MayaName',3,'p_name_concat','nameparse.py',154),
+  ('MayaName -> MayaName NameSep','MayaName',2,'p_name_concat','nameparse.py',155),
+  ('MayaName -> NameSep NameGroup','MayaName',2,'p_name','nameparse.py',162),
+  ('MayaName -> NameAlphaGroup','MayaName',1,'p_name','nameparse.py',163),
+  ('NamespaceSep -> Colon','NamespaceSep',1,'p_nspace_sep','nameparse.py',178),
+  ('Namespace -> Namespace MayaName NamespaceSep','Namespace',3,'p_nspace_concat','nameparse.py',194),
+  ('Namespace -> MayaName NamespaceSep','Namespace',2,'p_nspace','nameparse.py',198),
+  ('Namespace -> NamespaceSep','Namespace',1,'p_nspace','nameparse.py',199),
+  ('Namespace -> Empty','Namespace',1,'p_nspace','nameparse.py',200),
+  ('MayaShortName -> Namespace MayaName','MayaShortName',2,'p_sname','nameparse.py',214),
+  ('MayaShortName -> MayaName','MayaShortName',1,'p_sname','nameparse.py',215),
+  ('DagPathSep -> Pipe','DagPathSep',1,'p_dpath_sep','nameparse.py',230),
+  ('MayaNodePath -> MayaNodePath DagPathSep MayaShortName','MayaNodePath',3,'p_node_concat','nameparse.py',248),
+  ('MayaNodePath -> DagPathSep MayaShortName','MayaNodePath',2,'p_node','nameparse.py',252),
+  ('MayaNodePath -> MayaShortName','MayaNodePath',1,'p_node','nameparse.py',253),
+  ('Empty -> <empty>','Empty',0,'p_empty','objectParser.py',751),
+]
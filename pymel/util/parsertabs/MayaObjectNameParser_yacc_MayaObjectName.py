@@ -0,0 +1,69 @@
+
+# MayaObjectNameParser_yacc_MayaObjectName.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'MayaObjectNameleftDotleftPipeleftColonleftUnderscoreleftAlphaNumAlpha Colon Dot Index Num Pipe UnderscoreNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup  NameSep : NameSep Underscore  NameSep : Underscore MayaName : error MayaName : MayaName NameSep NameGroup\n                        | MayaName NameSep  MayaName : NameSep NameGroup\n                    | NameAlphaGroup  NamespaceSep : Colon  Namespace : Namespace MayaName NamespaceSep  Namespace : MayaName NamespaceSep\n                    | NamespaceSep\n                    | Empty  MayaShortName : Namespace MayaName\n                            | MayaName  DagPathSep : Pipe  MayaNodePath : MayaNodePath DagPathSep MayaShortName  MayaNodePath : DagPathSep MayaShortName\n                                | MayaShortName  AttrSep : Dot  NameIndex : Index Attribute : error Attribute : MayaName NameIndex\n                                    | MayaName  AttributePath : AttributePath AttrSep Attribute  AttributePath : Attribute  NodeAttribute : MayaNodePath AttrSep AttributePath MayaObjectName : MayaNodePath\n                            | NodeAttribute Empty : '
+    
+_lr_action_items = {'Pipe':([0,2,5,8,11,13,15,16,17,21,22,24,25,26,27,28,29,30,31,32,33,39,40,41,],[6,6,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,-14,-6,-7,]),'error':([0,4,6,7,9,10,14,18,19,20,23,38,42,],[11,11,-25,11,-21,-22,-18,11,36,-29,-20,-19,36,]),'Colon':([0,4,6,8,11,13,15,16,17,18,22,24,25,26,27,28,29,30,31,32,39,40,41,],[14,14,-25,14,-13,-17,-12,-5,-1,14,14,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Underscore':([0,4,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,22,23,24,25,26,27,28,29,30,31,32,36,37,38,39,40,41,42,],[15,15,-25,15,15,-21,-22,-13,26,-17,-18,-12,-5,-1,15,15,-29,15,-20,26,-16,-11,-9,-10,-8,-2,-3,-4,-13,15,-19,-14,-6,-7,15,]),'Alpha':([0,4,6,7,9,10,12,13,14,15,16,17,18,19,20,23,24,26,27,28,29,30,31,32,38,40,41,42,],[17,17,-25,17,-21,-22,17,17,-18,-12,-5,-1,17,17,-29,-20,17,-11,17,17,-8,-2,-3,-4,-19,-6,-7,17,]),'$end':([1,2,3,5,8,11,13,15,16,17,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,39,40,41,43,44,45,],[0,-37,-38,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,-36,-35,-13,-33,-14,-6,-7,-32,-30,-34,]),'Dot':([2,5,8,11,13,15,16,17,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,39,40,41,43,44,45,],[20,-28,-24,-13,-17,-12,-5,-1,-27,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-26,20,-35,-13,-33,-14,-6,-7,-32,-30,-34,]),'Num':([12,13,15,16,17,24,26,27,28,29,30,31,32,40,41,],[30,30,-12,-5,-1,30,-11,30,30,-8,-2,-3,-4,-6,-7,]),'Index':([13,15,16,17,24,25,26,27,28,29,30,31,32,36,37,39,40,41,],[-17,-12,-5,-1,-15,-16,-11,-9,-10,-8,-2,-3,-4,-13,44,-14,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'MayaObjectName':([0,],[1,]),'MayaNodePath':([0,],[2,]),'NodeAttribute':([0,],[3,]),'DagPathSep':([0,2,],[4,18,]),'MayaShortName':([0,4,18,],[5,21,33,]),'Namespace':([0,4,18,],[7,7,7,]),'MayaName':([0,4,7,18,19,42,],[8,8,22,8,37,37,]),'NamespaceSep':([0,4,8,18,22,],[9,9,23,9,38,]),'Empty':([0,4,18,],[10,10,10,]),'NameSep':([0,4,7,8,18,19,22,37,42,],[12,12,12,24,12,12,24,24,12,]),'NameAlphaGroup':([0,4,7,12,18,19,24,42,],[13,13,13,27,13,13,27,13,]),'NameAlphaPart':([0,4,7,12,13,18,19,24,27,28,42,],[16,16,16,16,31,16,16,16,31,40,16,]),'AttrSep':([2,34,],[19,42,]),'NameGroup':([12,24,],[25,39,]),'NameNumGroup':([12,24,],[28,28,]),'NameNumPart':([12,13,24,27,28,],[29,32,29,32,41,]),'AttributePath':([19,],[34,]),'Attribute':([19,42,],[35,45,]),'NameIndex':([37,],[43,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> MayaObjectName","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+  ('NameSep -> NameSep Underscore','NameSep',2,'p_sep_concat','nameparse.py',124),
+  ('NameSep -> Underscore','NameSep',1,'p_sep','nameparse.py',128),
+  ('MayaName -> error','MayaName',1,'p_name_error','nameparse.py',149),
+  ('MayaName -> MayaName NameSep NameGroup','MayaName',3,'p_name_concat','nameparse.py',154),
+  ('MayaName -> MayaName NameSep','MayaName',2,'p_name_concat','nameparse.py',155),
+  ('MayaName -> NameSep NameGroup','MayaName',2,'p_name','nameparse.py',162),
+  ('MayaName -> NameAlphaGroup','MayaName',1,'p_name','nameparse.py',163),
+  ('NamespaceSep -> Colon','NamespaceSep',1,'p_nspace_sep','nameparse.py',178),
+  ('Namespace -> Namespace MayaName NamespaceSep','Namespace',3,'p_nspace_concat','nameparse.py',194),
+  ('Namespace -> MayaName NamespaceSep','Namespace',2,'p_nspace','nameparse.py',198),
+  ('Namespace -> NamespaceSep','Namespace',1,'p_nspace','nameparse.py',199),
+  ('Namespace -> Empty','Namespace',1,'p_nspace','nameparse.py',200),
+  ('MayaShortName -> Namespace MayaName','MayaShortName',2,'p_sname','nameparse.py',214),
+  ('MayaShortName -> MayaName','MayaShortName',1,'p_sname','nameparse.py',215),
+  ('DagPathSep -> Pipe','DagPathSep',1,'p_dpath_sep','nameparse.py',230),
+  ('MayaNodePath -> MayaNodePath DagPathSep MayaShortName','MayaNodePath',3,'p_node_concat','nameparse.py',248),
+  ('MayaNodePath -> DagPathSep MayaShortName','MayaNodePath',2,'p_node','nameparse.py',252),
+  ('MayaNodePath -> MayaShortName','MayaNodePath',1,'p_node','nameparse.py',253),
+  ('AttrSep -> Dot','AttrSep',1,'p_attr_sep','nameparse.py',268),
+  ('NameIndex -> Index','NameIndex',1,'p_index','nameparse.py',287),
+  ('Attribute -> error','Attribute',1,'p_nodeattr_error','nameparse.py',350),
+  ('Attribute -> MayaName NameIndex','Attribute',2,'p_nodeattr','nameparse.py',354),
+  ('Attribute -> MayaName','Attribute',1,'p_nodeattr','nameparse.py',355),
+  ('AttributePath -> AttributePath AttrSep Attribute','AttributePath',3,'p_nodeattrpath_concat','nameparse.py',369),
+  ('AttributePath -> Attribute','AttributePath',1,'p_nodeattrpath','nameparse.py',373),
+  ('NodeAttribute -> MayaNodePath AttrSep AttributePath','NodeAttribute',3,'p_attribute','nameparse.py',384),
+  ('MayaObjectName -> MayaNodePath','MayaObjectName',1,'p_mobject','nameparse.py',398),
+  ('MayaObjectName -> NodeAttribute','MayaObjectName',1,'p_mobject','nameparse.py',399),
+  ('Empty -> <empty>','Empty',0,'p_empty','objectParser.py',751),
+]
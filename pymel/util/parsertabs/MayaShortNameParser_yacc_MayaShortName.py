@@ -0,0 +1,55 @@
+
+# MayaShortNameParser_yacc_MayaShortName.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'MayaShortNameleftColonleftUnderscorerightAlphaNumAlpha Colon Num UnderscoreNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup  NameSep : NameSep Underscore  NameSep : Underscore MayaName : error MayaName : MayaName NameSep NameGroup\n                        | MayaName NameSep  MayaName : NameSep NameGroup\n                    | NameAlphaGroup  NamespaceSep : Colon  Namespace : Namespace MayaName NamespaceSep  Namespace : MayaName NamespaceSep\n                    | NamespaceSep\n                    | Empty  MayaShortName : Namespace MayaName\n                            | MayaName Empty : '
+    
+_lr_action_items = {'error':([0,2,4,5,9,14,24,],[6,6,-21,-22,-18,-20,-19,]),'Colon':([0,3,6,8,10,11,12,13,15,16,17,18,19,20,21,22,23,25,26,27,],[9,9,-13,-17,-12,-5,-1,9,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Underscore':([0,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,],[10,10,10,-21,-22,-13,17,-17,-18,-12,-5,-1,10,-20,17,-16,-11,-9,-10,-8,-2,-3,-4,-19,-14,-6,-7,]),'Alpha':([0,2,4,5,7,8,9,10,11,12,14,15,17,18,19,20,21,22,23,24,26,27,],[12,12,-21,-22,12,12,-18,-12,-5,-1,-20,12,-11,12,12,-8,-2,-3,-4,-19,-6,-7,]),'$end':([1,3,6,8,10,11,12,13,15,16,17,18,19,20,21,22,23,25,26,27,],[0,-24,-13,-17,-12,-5,-1,-23,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Num':([7,8,10,11,12,15,17,18,19,20,21,22,23,26,27,],[21,21,-12,-5,-1,21,-11,21,21,-8,-2,-3,-4,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'MayaShortName':([0,],[1,]),'Namespace':([0,],[2,]),'MayaName':([0,2,],[3,13,]),'NamespaceSep':([0,3,13,],[4,14,24,]),'Empty':([0,],[5,]),'NameSep':([0,2,3,13,],[7,7,15,15,]),'NameAlphaGroup':([0,2,7,15,],[8,8,18,18,]),'NameAlphaPart':([0,2,7,8,15,18,19,],[11,11,11,22,11,22,26,]),'NameGroup':([7,15,],[16,25,]),'NameNumGroup':([7,15,],[19,19,]),'NameNumPart':([7,8,15,18,19,],[20,23,20,23,27,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> MayaShortName","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+  ('NameSep -> NameSep Underscore','NameSep',2,'p_sep_concat','nameparse.py',124),
+  ('NameSep -> Underscore','NameSep',1,'p_sep','nameparse.py',128),
+  ('MayaName -> error','MayaName',1,'p_name_error','nameparse.py',149),
+  ('MayaName -> MayaName NameSep NameGroup','MayaName',3,'p_name_concat','nameparse.py',154),
+  ('MayaName -> MayaName NameSep','MayaName',2,'p_name_concat','nameparse.py',155),
+  ('MayaName -> NameSep NameGroup','MayaName',2,'p_name','nameparse.py',162),
+  ('MayaName -> NameAlphaGroup','MayaName',1,'p_name','nameparse.py',163),
+  ('NamespaceSep -> Colon','NamespaceSep',1,'p_nspace_sep','nameparse.py',178),
+  ('Namespace -> Namespace MayaName NamespaceSep','Namespace',3,'p_nspace_concat','nameparse.py',194),
+  ('Namespace -> MayaName NamespaceSep','Namespace',2,'p_nspace','nameparse.py',198),
+  ('Namespace -> NamespaceSep','Namespace',1,'p_nspace','nameparse.py',199),
+  ('Namespace -> Empty','Namespace',1,'p_nspace','nameparse.py',200),
+  ('MayaShortName -> Namespace MayaName','MayaShortName',2,'p_sname','nameparse.py',214),
+  ('MayaShortName -> MayaName','MayaShortName',1,'p_sname','nameparse.py',215),
+  ('Empty -> <empty>','Empty',0,'p_empty','objectParser.py',751),
+]
@@ -0,0 +1,35 @@
+
+# NameAlphaGroupParser_yacc_NameAlphaGroup.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NameAlphaGroupAlpha NumNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart '
+    
+_lr_action_items = {'Alpha':([0,1,2,3,4,5,6,],[3,3,-5,-1,-3,-4,-2,]),'$end':([1,2,3,4,5,6,],[0,-5,-1,-3,-4,-2,]),'Num':([1,2,3,4,5,6,],[6,-5,-1,-3,-4,-2,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'NameAlphaGroup':([0,],[1,]),'NameAlphaPart':([0,1,],[2,4,]),'NameNumPart':([1,],[5,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> NameAlphaGroup","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+]
@@ -0,0 +1,40 @@
+
+# NameGroupParser_yacc_NameGroup.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NameGroupAlpha NumNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup '
+    
+_lr_action_items = {'Alpha':([0,2,3,4,5,6,7,8,9,10,11,],[6,6,6,-5,-8,-1,-2,-3,-4,-6,-7,]),'Num':([0,2,3,4,5,6,7,8,9,10,11,],[7,7,7,-5,-8,-1,-2,-3,-4,-6,-7,]),'$end':([1,2,3,4,5,6,7,8,9,10,11,],[0,-9,-10,-5,-8,-1,-2,-3,-4,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'NameGroup':([0,],[1,]),'NameAlphaGroup':([0,],[2,]),'NameNumGroup':([0,],[3,]),'NameAlphaPart':([0,2,3,],[4,8,10,]),'NameNumPart':([0,2,3,],[5,9,11,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> NameGroup","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+]
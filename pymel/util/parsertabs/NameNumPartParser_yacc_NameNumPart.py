@@ -0,0 +1,31 @@
+
+# NameNumPartParser_yacc_NameNumPart.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NameNumPartAlpha NumNameNumPart : Num'
+    
+_lr_action_items = {'Num':([0,],[2,]),'$end':([1,2,],[0,-1,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'NameNumPart':([0,],[1,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> NameNumPart","S'",1,None,None,None),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+]
@@ -0,0 +1,34 @@
+
+# NamePartParser_yacc_NamePart.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NamePartAlpha NumNameAlphaPart : AlphaNameNumPart : NumNamePart : NameAlphaPart\n                    | NameNumPart'
+    
+_lr_action_items = {'Alpha':([0,],[4,]),'Num':([0,],[5,]),'$end':([1,2,3,4,5,],[0,-3,-4,-1,-2,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'NamePart':([0,],[1,]),'NameAlphaPart':([0,],[2,]),'NameNumPart':([0,],[3,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> NamePart","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NamePart -> NameAlphaPart','NamePart',1,'p_part','nameparse.py',62),
+  ('NamePart -> NameNumPart','NamePart',1,'p_part','nameparse.py',63),
+]
@@ -0,0 +1,53 @@
+
+# NamespaceParser_yacc_Namespace.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'NamespaceleftColonleftUnderscorerightAlphaNumAlpha Colon Num UnderscoreNameAlphaPart : AlphaNameNumPart : Num NameAlphaGroup : NameAlphaGroup NameAlphaPart\n                                |  NameAlphaGroup NameNumPart  NameAlphaGroup : NameAlphaPart  NameNumGroup : NameNumGroup NameAlphaPart\n                                | NameNumGroup NameNumPart  NameNumGroup : NameNumPart  NameGroup : NameAlphaGroup\n                        | NameNumGroup  NameSep : NameSep Underscore  NameSep : Underscore MayaName : error MayaName : MayaName NameSep NameGroup\n                        | MayaName NameSep  MayaName : NameSep NameGroup\n                    | NameAlphaGroup  NamespaceSep : Colon  Namespace : Namespace MayaName NamespaceSep  Namespace : MayaName NamespaceSep\n                    | NamespaceSep\n                    | Empty Empty : '
+    
+_lr_action_items = {'error':([0,1,3,4,8,13,23,],[5,5,-21,-22,-18,-20,-19,]),'Colon':([0,2,5,7,9,10,11,12,14,15,16,17,18,19,20,21,22,24,25,26,],[8,8,-13,-17,-12,-5,-1,8,-15,-16,-11,-9,-10,-8,-2,-3,-4,-14,-6,-7,]),'Underscore':([0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,],[9,9,9,-21,-22,-13,16,-17,-18,-12,-5,-1,9,-20,16,-16,-11,-9,-10,-8,-2,-3,-4,-19,-14,-6,-7,]),'Alpha':([0,1,3,4,6,7,8,9,10,11,13,14,16,17,18,19,20,21,22,23,25,26,],[11,11,-21,-22,11,11,-18,-12,-5,-1,-20,11,-11,11,11,-8,-2,-3,-4,-19,-6,-7,]),'$end':([0,1,3,4,8,13,23,],[-23,0,-21,-22,-18,-20,-19,]),'Num':([6,7,9,10,11,14,16,17,18,19,20,21,22,25,26,],[20,20,-12,-5,-1,20,-11,20,20,-8,-2,-3,-4,-6,-7,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'Namespace':([0,],[1,]),'MayaName':([0,1,],[2,12,]),'NamespaceSep':([0,2,12,],[3,13,23,]),'Empty':([0,],[4,]),'NameSep':([0,1,2,12,],[6,6,14,14,]),'NameAlphaGroup':([0,1,6,14,],[7,7,17,17,]),'NameAlphaPart':([0,1,6,7,14,17,18,],[10,10,10,21,10,21,25,]),'NameGroup':([6,14,],[15,24,]),'NameNumGroup':([6,14,],[18,18,]),'NameNumPart':([6,7,14,17,18,],[19,22,19,22,26,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> Namespace","S'",1,None,None,None),
+  ('NameAlphaPart -> Alpha','NameAlphaPart',1,'p_apart','nameparse.py',42),
+  ('NameNumPart -> Num','NameNumPart',1,'p_npart','nameparse.py',52),
+  ('NameAlphaGroup -> NameAlphaGroup NameAlphaPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',76),
+  ('NameAlphaGroup -> NameAlphaGroup NameNumPart','NameAlphaGroup',2,'p_agroup_concat','nameparse.py',77),
+  ('NameAlphaGroup -> NameAlphaPart','NameAlphaGroup',1,'p_agroup','nameparse.py',81),
+  ('NameNumGroup -> NameNumGroup NameAlphaPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',94),
+  ('NameNumGroup -> NameNumGroup NameNumPart','NameNumGroup',2,'p_ngroup_concat','nameparse.py',95),
+  ('NameNumGroup -> NameNumPart','NameNumGroup',1,'p_ngroup','nameparse.py',99),
+  ('NameGroup -> NameAlphaGroup','NameGroup',1,'p_group','nameparse.py',111),
+  ('NameGroup -> NameNumGroup','NameGroup',1,'p_group','nameparse.py',112),
+  ('NameSep -> NameSep Underscore','NameSep',2,'p_sep_concat','nameparse.py',124),
+  ('NameSep -> Underscore','NameSep',1,'p_sep','nameparse.py',128),
+  ('MayaName -> error','MayaName',1,'p_name_error','nameparse.py',149),
+  ('MayaName -> MayaName NameSep NameGroup','MayaName',3,'p_name_concat','nameparse.py',154),
+  ('MayaName -> MayaName NameSep','MayaName',2,'p_name_concat','nameparse.py',155),
+  ('MayaName -> NameSep NameGroup','MayaName',2,'p_name','nameparse.py',162),
+  ('MayaName -> NameAlphaGroup','MayaName',1,'p_name','nameparse.py',163),
+  ('NamespaceSep -> Colon','NamespaceSep',1,'p_nspace_sep','nameparse.py',178),
+  ('Namespace -> Namespace MayaName NamespaceSep','Namespace',3,'p_nspace_concat','nameparse.py',194),
+  ('Namespace -> MayaName NamespaceSep','Namespace',2,'p_nspace','nameparse.py',198),
+  ('Namespace -> NamespaceSep','Namespace',1,'p_nspace','nameparse.py',199),
+  ('Namespace -> Empty','Namespace',1,'p_nspace','nameparse.py',200),
+  ('Empty -> <empty>','Empty',0,'p_empty','objectParser.py',751),
+]
@@ -0,0 +1,6 @@
+"""
+Pre-generated yacc tables for the parsers of `pymel.util.nameparse`.
+
+Don't edit these modules, they are (re)written by
+``python -m pymel.tools.nameparsetool regen``.
+"""
@@ -111,6 +111,37 @@ def simple_cache(func):
     return wrapper
 
 
+def _scanDir(dirpath):
+    """ List dirpath with os.scandir, returns [(name, isdir, isfile, islink)].
+    The type information comes from the directory listing itself where the
+    platform provides it, so no extra stat call is made per child.
+    """
+    result = []
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            try:
+                isdir = entry.is_dir()
+                isfile = not isdir and entry.is_file()
+                islink = isdir and entry.is_symlink()
+            except OSError:
+                isdir = isfile = islink = False
+            result.append((entry.name, isdir, isfile, islink))
+    return result
+
+
+def _nameMatcher(pattern, module):
+    """ Return a function matching a child name against pattern, with the
+    same rules as :meth:`path.match`, or None if pattern is None.
+    """
+    if pattern is None:
+        return None
+    normcase = getattr(pattern, 'normcase', module.normcase)
+    if isinstance(pattern, RePattern):
+        return lambda name: bool(pattern.match(normcase(name)))
+    pattern = normcase(pattern)
+    return lambda name: fnmatch.fnmatchcase(normcase(name), pattern)
+
+
 class ClassProperty(property):
 
     def __get__(self, cls, owner):
@@ -482,9 +513,9 @@ class path(str):
         directories whose names match the given pattern.  For
         example, ``d.dirs('build-*')``.
         """
-        result = [p for p in self.listdir(pattern) if p.isdir()]
+        result = list(self.iterdirs(pattern))
         if realpath:
-            # don't pass realpath to listdir to avoid wasting time resolving
+            # don't pass realpath to scandir to avoid wasting time resolving
             # filtered paths
             result = [p.realpath() for p in result]
         return result
@@ -499,13 +530,149 @@ class path(str):
         whose names match the given pattern.  For example,
         ``d.files('*.pyc')``.
         """
-        result = [p for p in self.listdir(pattern) if p.isfile()]
+        result = list(self.iterfiles(pattern))
         if realpath:
-            # don't pass realpath to listdir to avoid wasting time resolving
+            # don't pass realpath to scandir to avoid wasting time resolving
             # filtered paths
             result = [p.realpath() for p in result]
         return result
 
+    def scandir(self, pattern=None, realpath=False, kind=None):
+        """ D.scandir() -> iterator over the items in this directory.
+
+        Streaming counterpart of :meth:`listdir` based on :func:`os.scandir`:
+        items are yielded as they are read and the file type comes from the
+        directory listing, so filtering with `kind` ('dirs' or 'files') does
+        not stat every child again.
+
+        .. seealso:: :meth:`iterdirs`, :meth:`iterfiles`, :meth:`scanwalk`
+        """
+        if kind not in (None, 'dirs', 'files'):
+            raise ValueError("invalid kind parameter")
+        matcher = _nameMatcher(pattern, self.module)
+        for name, isdir, isfile, islink in _scanDir(self):
+            if kind == 'dirs' and not isdir or kind == 'files' and not isfile:
+                continue
+            if matcher is None or matcher(name):
+                child = self / name
+                yield child.realpath() if realpath else child
+
+    def iterdirs(self, pattern=None, realpath=False):
+        """ D.iterdirs() -> iterator over this directory's subdirectories.
+        Same as :meth:`dirs`, without building a list.
+        """
+        return self.scandir(pattern, realpath, kind='dirs')
+
+    def iterfiles(self, pattern=None, realpath=False):
+        """ D.iterfiles() -> iterator over the files in this directory.
+        Same as :meth:`files`, without building a list.
+        """
+        return self.scandir(pattern, realpath, kind='files')
+
+    def scanwalk(self, pattern=None, errors='strict', realpath=False, regex=None,
+                 kind=None, prune=False, followlinks=True, workers=0, prefetch=64):
+        """ D.scanwalk() -> iterator over files and subdirs, recursively.
+
+        Streaming tree walk based on :func:`os.scandir`. Like :meth:`walk`
+        it is depth-first and each directory is yielded just before its
+        children, but the file types come from the directory listings so
+        no child is stat'ed again.
+
+        `pattern` (glob string or compiled regex) or `regex` (string)
+        filter the yielded items. All subdirectories are walked unless
+        `prune` is True, in which case subdirectories that don't match are
+        not entered either (the behavior of :meth:`walkdirs`). `kind` can
+        be 'dirs' or 'files' to only yield one type of item.
+
+        Symlinked directories are followed unless `followlinks` is False;
+        links pointing back to one of their parents are skipped.
+
+        With `workers` > 0, subdirectories are listed ahead of time by a
+        pool of that many threads (mostly useful on network shares), with
+        at most `prefetch` listings in flight or waiting. The order of the
+        results is the same as without workers.
+
+        The `errors=` keyword argument controls behavior when an
+        error occurs, see :meth:`walk`.
+        """
+        if errors not in ('strict', 'warn', 'ignore'):
+            raise ValueError("invalid errors parameter")
+        if kind not in (None, 'dirs', 'files'):
+            raise ValueError("invalid kind parameter")
+        if regex is not None:
+            assert pattern is None, "Cannot provide both pattern and regex arguments"
+            pattern = re.compile(regex)
+        matcher = _nameMatcher(pattern, self.module)
+
+        pool = None
+        pending = {}
+        if workers:
+            from concurrent.futures import ThreadPoolExecutor
+            pool = ThreadPoolExecutor(max_workers=workers)
+
+        def request(dirpath):
+            if pool is not None and len(pending) < prefetch:
+                pending[dirpath] = pool.submit(_scanDir, dirpath)
+
+        def listing(dirpath):
+            future = pending.pop(dirpath, None)
+            try:
+                return future.result() if future is not None else _scanDir(dirpath)
+            except Exception:
+                if errors == 'ignore':
+                    return None
+                elif errors == 'warn':
+                    warnings.warn(
+                        "Unable to list directory '%s': %s"
+                        % (dirpath, sys.exc_info()[1]),
+                        TreeWalkWarning)
+                    return None
+                raise
+
+        def walkdir(dirpath, dir_realpath):
+            entries = listing(dirpath)
+            if entries is None:
+                return
+            children = []
+            for name, isdir, isfile, islink in entries:
+                child = dirpath / name
+                matches = matcher is None or matcher(name)
+                enter = isdir and (matches or not prune)
+                child_realpath = None
+                if enter and islink:
+                    if not followlinks:
+                        enter = False
+                    else:
+                        # check for infinite recursion
+                        if dir_realpath is None:
+                            dir_realpath = dirpath.realpath()
+                        child_realpath = child.realpath()
+                        if (child_realpath == dir_realpath
+                                or dir_realpath.startswith(child_realpath + os.path.sep)):
+                            continue
+                if enter:
+                    request(child)
+                children.append((child, isdir, isfile, matches, enter, child_realpath))
+
+            for child, isdir, isfile, matches, enter, child_realpath in children:
+                if matches and (kind is None or kind == 'dirs' and isdir or kind == 'files' and isfile):
+                    if realpath:
+                        yield child_realpath or child.realpath()
+                    else:
+                        yield child
+                if enter:
+                    for item in walkdir(child, child_realpath):
+                        yield item
+
+        try:
+            for item in walkdir(self, None):
+                yield item
+        finally:
+            if pool is not None:
+                for future in pending.values():
+                    future.cancel()
+                pool.shutdown(wait=False)
+
     def walk(self, pattern=None, errors='strict', realpath=False, regex=None):
         """ D.walk() -> iterator over files and subdirs, recursively.
 
@@ -59,6 +59,10 @@ class path(str):
     def listdir(self, pattern: Incomplete | None = ..., realpath: bool = ...): ...
     def dirs(self, pattern: Incomplete | None = ..., realpath: bool = ...): ...
     def files(self, pattern: Incomplete | None = ..., realpath: bool = ...): ...
+    def scandir(self, pattern: Incomplete | None = ..., realpath: bool = ..., kind: str | None = ...) -> Generator[Incomplete, None, None]: ...
+    def iterdirs(self, pattern: Incomplete | None = ..., realpath: bool = ...) -> Generator[Incomplete, None, None]: ...
+    def iterfiles(self, pattern: Incomplete | None = ..., realpath: bool = ...) -> Generator[Incomplete, None, None]: ...
+    def scanwalk(self, pattern: Incomplete | None = ..., errors: str = ..., realpath: bool = ..., regex: Incomplete | None = ..., kind: str | None = ..., prune: bool = ..., followlinks: bool = ..., workers: int = ..., prefetch: int = ...) -> Generator[Incomplete, None, None]: ...
     def walk(self, pattern: Incomplete | None = ..., errors: str = ..., realpath: bool = ..., regex: Incomplete | None = ...) -> Generator[Incomplete, None, None]: ...
     def walkdirs(self, pattern: Incomplete | None = ..., errors: str = ..., realpath: bool = ..., regex: Incomplete | None = ...) -> Generator[Incomplete, None, None]: ...
     def walkfiles(self, pattern: Incomplete | None = ..., errors: str = ..., realpath: bool = ..., regex: Incomplete | None = ...) -> Generator[Incomplete, None, None]: ...
@@ -8,9 +8,12 @@ import inspect
 import types
 import operator
 import sys
+import time
 import warnings
 from collections import defaultdict
 
+from pymel import startuptrace
+
 TYPE_CHECKING = False
 if TYPE_CHECKING:
     from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
@@ -743,7 +746,10 @@ class LazyLoadModule(types.ModuleType):
             # same one will be returned
             if not hasattr(self, 'newobj'):
                 # use the callback to create the object that will replace us
+                start = time.perf_counter()
                 self.newobj = self.creator(*self.args, **self.kwargs)
+                startuptrace.record('lazy', '%s.%s' % (getattr(obj, '__name__', type(obj).__name__), self.name),
+                                    time.perf_counter() - start)
                 if isinstance(obj, types.ModuleType) and hasattr(self.newobj, '__module__'):
                     self.newobj.__module__ = obj.__name__
             # print "Lazy-loaded object:", self.name
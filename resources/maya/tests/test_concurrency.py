@@ -0,0 +1,137 @@
+import os
+from pathlib import Path
+import signal
+import subprocess
+import sys
+import time
+import unittest
+from unittest import mock
+
+from capito.core import concurrency
+from capito.core.concurrency import GB, ConcurrencyController, MemoryInfo, sample_processes
+
+MB = 1_000_000
+
+# synthetic worker: holds MEMORY bytes, optionally starts a child holding as much,
+# then burns cpu for at most a minute
+WORKER = """
+import subprocess, sys, time
+memory = b"x" * int(sys.argv[1])
+child = None
+if sys.argv[2] == "child":
+    child = subprocess.Popen([sys.executable, "-c", sys.argv[3], sys.argv[1], "none", ""])
+print(child.pid if child else 0, flush=True)
+end = time.time() + 60
+while time.time() < end:
+    pass
+"""
+
+SAMPLING = concurrency.psutil is not None or Path("/proc/self/stat").exists()
+
+
+def start_worker(memory: int, child: bool = False) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-c", WORKER, str(memory), "child" if child else "none", WORKER],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    process.child_pid = int(process.stdout.readline())
+    return process
+
+
+def stop_worker(process: subprocess.Popen):
+    if process.child_pid:
+        try:
+            os.kill(process.child_pid, signal.SIGTERM)
+        except OSError:
+            pass
+    process.kill()
+    process.wait()
+    process.stdout.close()
+
+
+@unittest.skipUnless(SAMPLING, "process sampling needs psutil or /proc")
+class SampleProcessesTests(unittest.TestCase):
+    def test_samples_memory_and_cpu_of_worker_and_children(self):
+        worker = start_worker(150 * MB, child=True)
+        try:
+            time.sleep(0.5)  # the child allocates its memory too
+            first = sample_processes([worker.pid])[worker.pid]
+            time.sleep(0.5)
+            second = sample_processes([worker.pid])[worker.pid]
+        finally:
+            stop_worker(worker)
+        self.assertGreater(first.rss, 2 * 150 * MB)
+        self.assertGreater(second.cpu_time, first.cpu_time)
+
+    def test_ignores_ended_processes(self):
+        worker = start_worker(MB)
+        stop_worker(worker)
+        self.assertEqual(sample_processes([worker.pid, 0]), {})
+
+
+class ControllerTests(unittest.TestCase):
+    def setUp(self):
+        self.memory = MemoryInfo(total=64 * GB, available=32 * GB)
+        patcher = mock.patch.object(concurrency, "memory_info", lambda: self.memory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.workers = []
+        self.addCleanup(lambda: [stop_worker(w) for w in self.workers])
+
+    def controller(self, **kwargs):
+        settings = dict(min_workers=1, max_workers=16, memory_reserve=GB, window=10.0)
+        settings.update(kwargs)
+        return ConcurrencyController(**settings)
+
+    def test_recommend_fits_worker_memory(self):
+        controller = self.controller(worker_memory=4 * GB)
+        self.assertEqual(controller.recommend(), 7)
+        self.memory = MemoryInfo(total=64 * GB, available=2 * GB)
+        self.assertEqual(controller.recommend(), 1)
+
+    @unittest.skipUnless(SAMPLING, "process sampling needs psutil or /proc")
+    def test_measures_peak_rss_of_synthetic_workers(self):
+        self.workers = [start_worker(120 * MB) for _ in range(2)]
+        controller = self.controller()
+        controller.update(2, [w.pid for w in self.workers], 0, now=0.0)
+        self.assertGreater(controller.peak_rss, 120 * MB)
+        self.assertLess(controller.peak_rss, 2 * 120 * MB)
+        self.assertEqual(controller.memory_per_worker(), controller.peak_rss)
+
+    def test_steps_down_by_the_overshoot_and_settles(self):
+        controller = self.controller(worker_memory=2 * GB)
+        self.memory = MemoryInfo(total=64 * GB, available=GB - 5 * GB)
+        # 5GB missing at 2GB per worker: three workers less at once
+        self.assertEqual(controller.update(10, [], 0, now=0.0), 7)
+        # the retiring workers still hold their memory meanwhile
+        self.assertEqual(controller.update(7, [], 0, now=5.0), 7)
+        self.assertEqual(controller.update(7, [], 0, now=9.0), 7)
+        # still short after the window
+        self.memory = MemoryInfo(total=64 * GB, available=0)
+        self.assertEqual(controller.update(7, [], 0, now=11.0), 6)
+
+    def test_steps_down_when_swapping(self):
+        controller = self.controller()
+        self.memory = MemoryInfo(total=64 * GB, available=32 * GB, swap_used=0)
+        self.assertEqual(controller.update(4, [], 0, now=0.0), 4)
+        self.memory = MemoryInfo(total=64 * GB, available=32 * GB, swap_used=GB)
+        self.assertEqual(controller.update(4, [], 0, now=1.0), 3)
+
+    def test_never_below_min_workers(self):
+        controller = self.controller(min_workers=2)
+        self.memory = MemoryInfo(total=64 * GB, available=0)
+        self.assertEqual(controller.update(3, [], 0, now=0.0), 2)
+
+    def test_steps_up_while_throughput_grows(self):
+        controller = self.controller(worker_memory=2 * GB)
+        controller.update(2, [], 0, now=0.0)
+        # nothing changes before a throughput was measured over the window
+        self.assertEqual(controller.update(2, [], 5, now=5.0), 2)
+        self.assertEqual(controller.update(2, [], 10, now=10.0), 3)
+        # the third worker raised the throughput from 1 to 1.5 per second
+        self.assertEqual(controller.update(3, [], 25, now=20.0), 4)
+        # the fourth did not: undone and not tried again for a while
+        self.assertEqual(controller.update(4, [], 40, now=30.0), 3)
+        self.assertEqual(controller.update(3, [], 55, now=40.0), 3)
+        self.assertEqual(controller.update(3, [], 70, now=50.0), 3)
@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+import gc
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from capito.core import event
+
+PACKAGE_ROOT = str(Path(event.__file__).resolve().parents[2])
+
+# posts an ASYNC event that takes a while and exits right away
+EXITING_PROCESS = """
+import sys, time
+from capito.core import event
+
+def write(path):
+    time.sleep(0.5)
+    with open(path, "w") as f:
+        f.write("delivered")
+
+event.subscribe("written", write, mode=event.ASYNC)
+event.post("written", sys.argv[1])
+"""
+
+
+@dataclass
+class Version:
+    name: str
+    number: int
+
+
+class Receiver:
+    def __init__(self):
+        self.received = []
+
+    def receive(self, value):
+        self.received.append(value)
+
+
+class EventTests(unittest.TestCase):
+    def setUp(self):
+        self.event_type = f"test_{self.id()}"
+        self.addCleanup(event.subscribers.pop, self.event_type, None)
+        self.addCleanup(event.flush, 5)
+
+    def block_worker(self) -> threading.Event:
+        """Keeps the worker thread busy until the returned event is set."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(5)
+
+        blocker = f"{self.event_type}_blocker"
+        self.addCleanup(event.subscribers.pop, blocker, None)
+        self.addCleanup(release.set)
+        event.subscribe(blocker, blocking, mode=event.ASYNC)
+        event.post(blocker)
+        self.assertTrue(started.wait(5))
+        return release
+
+    def test_sync_delivery_raises(self):
+        def broken():
+            raise RuntimeError("broken")
+
+        event.subscribe(self.event_type, broken)
+        with self.assertRaises(RuntimeError):
+            event.post(self.event_type)
+
+    def test_async_delivers_in_order_on_the_worker(self):
+        received, threads = [], set()
+
+        def receive(value):
+            received.append(value)
+            threads.add(threading.current_thread())
+
+        event.subscribe(self.event_type, receive, mode=event.ASYNC)
+        for value in range(50):
+            event.post(self.event_type, value)
+        self.assertTrue(event.flush(5))
+        self.assertEqual(received, list(range(50)))
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads.pop(), threading.current_thread())
+
+    def test_async_errors_are_logged(self):
+        def broken():
+            raise RuntimeError("broken")
+
+        event.subscribe(self.event_type, broken, mode=event.ASYNC)
+        with self.assertLogs(event.logger, "ERROR"):
+            event.post(self.event_type)
+            self.assertTrue(event.flush(5))
+        self.assertEqual(event.subscribers[self.event_type][0].errors, 1)
+
+    def test_coalesces_identical_pending_posts(self):
+        received = []
+        event.subscribe(self.event_type, received.append, mode=event.ASYNC, coalesce=True)
+        release = self.block_worker()
+        for value in (1, 1, 2, 1):
+            event.post(self.event_type, value)
+        release.set()
+        self.assertTrue(event.flush(5))
+        self.assertEqual(received, [1, 2])
+        # delivered posts do not coalesce anymore
+        event.post(self.event_type, 1)
+        self.assertTrue(event.flush(5))
+        self.assertEqual(received, [1, 2, 1])
+        self.assertEqual(event.subscribers[self.event_type][0].coalesced, 2)
+
+    def test_coalesces_by_key(self):
+        received = []
+        event.subscribe(
+            self.event_type,
+            received.append,
+            mode=event.ASYNC,
+            key=lambda version: (version.name, version.number),
+        )
+        release = self.block_worker()
+        event.post(self.event_type, Version("a", 1))
+        event.post(self.event_type, Version("a", 1))
+        event.post(self.event_type, Version("a", 2))
+        release.set()
+        self.assertTrue(event.flush(5))
+        self.assertEqual(received, [Version("a", 1), Version("a", 2)])
+
+    def test_unhashable_args_are_delivered_without_coalescing(self):
+        received = []
+        event.subscribe(self.event_type, received.append, mode=event.ASYNC, coalesce=True)
+        release = self.block_worker()
+        with self.assertLogs(event.logger, "WARNING"):
+            event.post(self.event_type, Version("a", 1))
+            event.post(self.event_type, Version("a", 1))
+        release.set()
+        self.assertTrue(event.flush(5))
+        self.assertEqual(len(received), 2)
+
+    def test_weak_subscribers_are_removed_when_they_die(self):
+        receiver = Receiver()
+        event.subscribe(self.event_type, receiver.receive, weak=True)
+        event.post(self.event_type, 1)
+        self.assertEqual(receiver.received, [1])
+        del receiver
+        gc.collect()
+        event.post(self.event_type, 2)
+        self.assertEqual(event.subscribers[self.event_type], [])
+
+    def test_strong_subscribers_keep_bound_methods_alive(self):
+        receiver = Receiver()
+        received = receiver.received
+        event.subscribe(self.event_type, receiver.receive)
+        del receiver
+        gc.collect()
+        event.post(self.event_type, 1)
+        self.assertEqual(received, [1])
+
+    def test_flush_times_out(self):
+        release = self.block_worker()
+        self.assertFalse(event.flush(0.05))
+        release.set()
+        self.assertTrue(event.flush(5))
+
+    def test_flush_in_a_subscriber_returns(self):
+        flushed = []
+        event.subscribe(self.event_type, lambda: flushed.append(event.flush(1)), mode=event.ASYNC)
+        event.post(self.event_type)
+        self.assertTrue(event.flush(5))
+        self.assertEqual(flushed, [True])
+
+    def test_flushes_at_exit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "written")
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(p for p in (PACKAGE_ROOT, env.get("PYTHONPATH")) if p)
+            subprocess.run([sys.executable, "-c", EXITING_PROCESS, path], env=env, check=True, timeout=30)
+            self.assertTrue(os.path.exists(path))
@@ -0,0 +1,272 @@
+import os
+from pathlib import Path
+import struct
+import tempfile
+import types
+import unittest
+from unittest import mock
+import zlib
+
+from capito.core.file.images import EXR_MAGIC, PNG_IEND, PNG_SIGNATURE, check_image, check_images
+from capito.haleres import job as job_module
+from capito.haleres.job import MAX_CORRUPT_PULLS, Job
+
+CHUNK_DATA = b"pixels" * 4
+
+
+def exr_attribute(name: str, type_name: str, value: bytes) -> bytes:
+    return name.encode() + b"\0" + type_name.encode() + b"\0" + struct.pack("<i", len(value)) + value
+
+
+def exr_header(width: int, height: int, compression: int = 0, **extra: bytes) -> bytes:
+    """Header attributes checked by read_exr_header (a real file has a few more)."""
+    attributes = [
+        exr_attribute("compression", "compression", bytes([compression])),
+        exr_attribute("dataWindow", "box2i", struct.pack("<4i", 0, 0, width - 1, height - 1)),
+    ]
+    attributes += [exr_attribute(name, "raw", value) for name, value in extra.items()]
+    return b"".join(attributes) + b"\0"
+
+
+def exr_file(headers, chunks, flags: int = 0) -> bytes:
+    """headers: one per part; chunks: per part the chunk headers (without size)."""
+    head = struct.pack("<iI", EXR_MAGIC, 2 | flags) + b"".join(headers)
+    if flags & 0x1000:
+        head += b"\0"
+    offset = len(head) + 8 * sum(len(c) for c in chunks)
+    tables, data = [], b""
+    for part_chunks in chunks:
+        table = []
+        for chunk_head in part_chunks:
+            table.append(offset)
+            if chunk_head.startswith(b"deep"):
+                chunk = chunk_head[4:] + struct.pack("<3Q", 8, len(CHUNK_DATA), len(CHUNK_DATA))
+                chunk += b"\0" * 8 + CHUNK_DATA
+            else:
+                chunk = chunk_head + struct.pack("<i", len(CHUNK_DATA)) + CHUNK_DATA
+            data += chunk
+            offset += len(chunk)
+        tables.append(struct.pack(f"<{len(table)}Q", *table))
+    return head + b"".join(tables) + data
+
+
+def scanline_exr(height: int = 32, compression: int = 3) -> bytes:
+    lines = (1, 1, 1, 16, 32)[compression]
+    return exr_file([exr_header(8, height, compression)], [[struct.pack("<i", y) for y in range(0, height, lines)]])
+
+
+def tiled_exr(mode: int, levels) -> bytes:
+    """8x8 pixels in 4x4 tiles, levels: the (level x, level y, tiles x, tiles y) of the mode."""
+    header = exr_header(8, 8, tiles=struct.pack("<IIB", 4, 4, mode))
+    chunks = [
+        struct.pack("<4i", tx, ty, lx, ly)
+        for lx, ly, tiles_x, tiles_y in levels
+        for ty in range(tiles_y)
+        for tx in range(tiles_x)
+    ]
+    return exr_file([header], [chunks], flags=0x200)
+
+
+def tiff_file(order: str = "<", big: bool = False, num_strips: int = 2) -> bytes:
+    strip_size = len(CHUNK_DATA)
+    if big:
+        head_size, entry_format, count_format, pointer = 16, "HHQ8s", "Q", "Q"
+        head = (b"II" if order == "<" else b"MM") + struct.pack(order + "HHHQ", 43, 8, 0, head_size)
+    else:
+        head_size, entry_format, count_format, pointer = 8, "HHI4s", "H", "I"
+        head = (b"II" if order == "<" else b"MM") + struct.pack(order + "HI", 42, head_size)
+    entry_size = struct.calcsize(order + entry_format)
+    ifd_size = struct.calcsize(order + count_format) + 4 * entry_size + struct.calcsize(order + pointer)
+    arrays_offset = head_size + ifd_size
+    value_type, value_format = (16, "Q") if big else (4, "I")
+    array_size = struct.calcsize(order + value_format) * num_strips
+    data_offset = arrays_offset + 2 * array_size
+    offsets = [data_offset + i * strip_size for i in range(num_strips)]
+
+    def entry(tag, field_type, values, fmt, external_offset=None):
+        inline = struct.pack(order + f"{len(values)}{fmt}", *values)
+        if len(inline) > (8 if big else 4):
+            inline = struct.pack(order + pointer, external_offset)
+        inline = inline.ljust(8 if big else 4, b"\0")
+        return struct.pack(order + entry_format, tag, field_type, len(values), inline)
+
+    ifd = struct.pack(order + count_format, 4)
+    ifd += entry(256, 3, [8], "H") + entry(257, 3, [2 * num_strips], "H")
+    ifd += entry(273, value_type, offsets, value_format, arrays_offset)
+    ifd += entry(279, value_type, [strip_size] * num_strips, value_format, arrays_offset + array_size)
+    ifd += struct.pack(order + pointer, 0)
+    arrays = struct.pack(order + f"{num_strips}{value_format}", *offsets)
+    arrays += struct.pack(order + f"{num_strips}{value_format}", *[strip_size] * num_strips)
+    return head + ifd + arrays + CHUNK_DATA * num_strips
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def png_file() -> bytes:
+    ihdr = png_chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 2, 8, 0, 0, 0, 0))
+    pixels = png_chunk(b"IDAT", zlib.compress(b"\0" + b"\x80" * 8 + b"\0" + b"\x80" * 8))
+    return PNG_SIGNATURE + ihdr + pixels + PNG_IEND
+
+
+class ImageFileTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def check(self, data: bytes, name: str = "image"):
+        path = self.directory / name
+        path.write_bytes(data)
+        return check_image(str(path))
+
+    def assertIntact(self, data: bytes, image_format: str):
+        check = self.check(data)
+        self.assertTrue(check.ok, check.error)
+        self.assertEqual(check.header.format, image_format)
+        self.assertEqual(check.header.data_end, len(data))
+        # any missing byte is noticed
+        truncated = self.check(data[:-1])
+        self.assertFalse(truncated.ok)
+
+    def test_exr_scanline(self):
+        for compression in (0, 3, 4):
+            with self.subTest(compression=compression):
+                data = scanline_exr(compression=compression)
+                self.assertIntact(data, "exr")
+                self.assertEqual((self.check(data).header.width, self.check(data).header.height), (8, 32))
+
+    def test_exr_truncated_in_the_header(self):
+        data = scanline_exr()
+        check = self.check(data[:30])
+        self.assertFalse(check.ok)
+
+    def test_exr_offset_table_not_filled_in(self):
+        data = bytearray(scanline_exr())
+        header_end = 8 + len(exr_header(8, 32, 3))
+        data[header_end:header_end + 16] = bytes(16)
+        check = self.check(bytes(data))
+        self.assertEqual(check.error, "invalid chunk offset 0")
+
+    def test_exr_tiled(self):
+        self.assertIntact(tiled_exr(0, [(0, 0, 2, 2)]), "exr")
+
+    def test_exr_mipmap(self):
+        self.assertIntact(tiled_exr(1, [(0, 0, 2, 2), (1, 1, 1, 1), (2, 2, 1, 1), (3, 3, 1, 1)]), "exr")
+
+    def test_exr_ripmap(self):
+        sizes = [(0, 2), (1, 1), (2, 1), (3, 1)]
+        levels = [(lx, ly, tx, ty) for ly, ty in sizes for lx, tx in sizes]
+        self.assertIntact(tiled_exr(2, levels), "exr")
+
+    def test_exr_multipart(self):
+        headers = [
+            exr_header(8, 16, type=b"scanlineimage\0", name=b"beauty\0", chunkCount=struct.pack("<i", 16)),
+            exr_header(8, 16, 3, type=b"scanlineimage\0", name=b"depth\0", chunkCount=struct.pack("<i", 1)),
+        ]
+        chunks = [
+            [struct.pack("<ii", 0, y) for y in range(16)],
+            [struct.pack("<ii", 1, 0)],
+        ]
+        self.assertIntact(exr_file(headers, chunks, flags=0x1000), "exr")
+
+    def test_exr_deep(self):
+        header = exr_header(8, 4, 2, type=b"deepscanline\0", chunkCount=struct.pack("<i", 4))
+        chunks = [[b"deep" + struct.pack("<i", y) for y in range(4)]]
+        self.assertIntact(exr_file([header], chunks, flags=0x800), "exr")
+
+    def test_tiff(self):
+        for order in ("<", ">"):
+            with self.subTest(order=order):
+                self.assertIntact(tiff_file(order), "tiff")
+
+    def test_tiff_with_one_strip(self):
+        # offset and byte count are stored in the entry itself
+        self.assertIntact(tiff_file(num_strips=1), "tiff")
+
+    def test_bigtiff(self):
+        for order in ("<", ">"):
+            with self.subTest(order=order):
+                self.assertIntact(tiff_file(order, big=True), "tiff")
+
+    def test_tiff_strip_table_not_filled_in(self):
+        data = bytearray(tiff_file())
+        arrays_offset = 8 + 2 + 4 * 12 + 4
+        data[arrays_offset:arrays_offset + 8] = bytes(8)
+        self.assertEqual(self.check(bytes(data)).error, "strip or tile table not filled in")
+
+    def test_png(self):
+        self.assertIntact(png_file(), "png")
+        check = self.check(png_file() + b"trailing")
+        self.assertEqual(check.error, "png does not end with IEND")
+
+    def test_other_formats_pass_unchecked(self):
+        check = self.check(b"\xff\xd8\xff\xe0 jpeg")
+        self.assertTrue(check.ok)
+        self.assertIsNone(check.header)
+
+    def test_missing_file(self):
+        check = check_image(str(self.directory / "missing.exr"))
+        self.assertFalse(check.ok)
+
+    def test_check_images_keeps_the_order(self):
+        paths = []
+        for i, data in enumerate([png_file(), png_file()[:-1], scanline_exr()]):
+            paths.append(self.directory / f"image_{i}")
+            paths[-1].write_bytes(data)
+        self.assertEqual([c.ok for c in check_images([str(p) for p in paths])], [True, False, True])
+
+
+class VerifyPulledImagesTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        # the mounted share
+        (Path(directory.name) / "share" / "hlrs").mkdir(parents=True)
+        settings = types.SimpleNamespace(
+            mount_point=directory.name,
+            workspace_path="/workspace",
+            share_to_letter=lambda share: directory.name,
+        )
+        self.job = Job("share", "job", settings)
+        self.job.create_job_folders()
+        self.images = self.job.get_folder("images")
+        for name in ("shot.0001.png", "shot.0002.png"):
+            (self.job.get_folder("images_rendered") / name).touch()
+
+    def pull(self, name: str, data: bytes):
+        (self.images / name).write_bytes(data)
+
+    def files_to_pull(self):
+        return [Path(f).name for f in self.job.get_files_to_pull()[:-1]]
+
+    def test_moves_corrupt_images_until_max_corrupt_pulls(self):
+        self.pull("shot.0001.png", png_file())
+        self.pull(".shot.0002.png.XYZ123", b"rsync temp file")
+        self.pull("shot.0002.png", png_file()[:-4])
+        moved = self.job.verify_pulled_images()
+        self.assertEqual([p.name for p in moved], ["shot.0002.png"])
+        self.assertTrue((self.job.get_folder("images_corrupt") / "shot.0002.png").exists())
+        self.assertEqual(self.files_to_pull(), ["shot.0002.png"])
+
+        for pulls in range(2, MAX_CORRUPT_PULLS + 1):
+            self.pull("shot.0002.png", png_file()[:-4])
+            self.assertEqual(len(self.job.verify_pulled_images()), 1)
+        # corrupt at the render farm too, not pulled again
+        self.assertEqual(self.files_to_pull(), [])
+        # unless it is rendered again
+        self.job.resubmit_missing_frames()
+        self.assertEqual(self.files_to_pull(), ["shot.0002.png"])
+
+    def test_verified_images_are_not_checked_again(self):
+        self.pull("shot.0001.png", png_file())
+        self.assertEqual(self.job.verify_pulled_images(), [])
+        with mock.patch.object(job_module, "check_images", wraps=check_images) as checks:
+            self.assertEqual(self.job.verify_pulled_images(), [])
+            checks.assert_not_called()
+            # a changed file is checked again
+            self.pull("shot.0001.png", png_file()[:-1])
+            os.utime(self.images / "shot.0001.png", ns=(1, 1))
+            self.assertEqual(len(self.job.verify_pulled_images()), 1)
+            checks.assert_called_once()
@@ -0,0 +1,58 @@
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from capito.core.shapelib import (
+    ShapeLibrary,
+    ShapeLibraryError,
+    load_library,
+    source_hash,
+    write_library,
+)
+
+CIRCLE = {
+    "name": "circle",
+    "degree": 3,
+    "cvs": [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [-1.0, 0.0, 0.0], [0.0, 0.0, -1.0]],
+    "knots": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+}
+
+
+class ShapeLibraryTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.source = self.directory / "icons.json"
+        self.source.write_bytes(b'[{"name": "circle"}]\n')
+        self.library = self.directory / "icons.shapes"
+
+    def test_round_trip(self):
+        entries = {"circle": {"name": "circle", "shapes": [CIRCLE]}, "empty": {"shapes": []}}
+        write_library(self.library, entries, {"circle": {"tooltip": "round"}}, source_hash(self.source))
+        library = ShapeLibrary(self.library)
+        self.assertEqual(library.keys(), ["circle", "empty"])
+        self.assertEqual(library.info("circle"), {"tooltip": "round"})
+        self.assertEqual(library[0], entries["circle"])
+        self.assertEqual(library.get("missing"), None)
+
+    def test_outdated_library_is_not_loaded(self):
+        write_library(self.library, {"circle": CIRCLE}, source=source_hash(self.source))
+        self.assertIsNotNone(load_library(self.library, self.source))
+        self.source.write_bytes(b'[{"name": "square"}]\n')
+        self.assertIsNone(load_library(self.library, self.source))
+
+    def test_crlf_checkout_matches(self):
+        write_library(self.library, {"circle": CIRCLE}, source=source_hash(self.source))
+        self.source.write_bytes(b'[{"name": "circle"}]\r\n')
+        self.assertIsNotNone(load_library(self.library, self.source))
+
+    def test_truncated_library(self):
+        write_library(self.library, {"circle": CIRCLE})
+        size = os.path.getsize(self.library)
+        with open(self.library, "r+b") as f:
+            f.truncate(size - 8)
+        library = load_library(self.library)
+        with self.assertRaises(ShapeLibraryError):
+            library["circle"]
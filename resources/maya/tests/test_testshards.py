@@ -0,0 +1,245 @@
+import json
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import textwrap
+import unittest
+import xml.etree.ElementTree as ET
+
+from capito.core import testshards
+from capito.core.testshards import (
+    Report,
+    ShardedRunner,
+    TestRecord,
+    load_timings,
+    split_tests,
+    write_json_report,
+    write_junit_report,
+)
+
+PACKAGE_ROOT = str(Path(testshards.__file__).resolve().parents[2])
+
+SAMPLE = """
+import unittest
+
+class Outcomes(unittest.TestCase):
+    def test_success(self):
+        pass
+
+    def test_failure(self):
+        self.assertEqual(1, 2)
+
+    def test_error(self):
+        raise RuntimeError("broken")
+
+    @unittest.skip("not today")
+    def test_skipped(self):
+        pass
+
+    @unittest.expectedFailure
+    def test_expected_failure(self):
+        self.fail()
+
+    def test_subtests(self):
+        for i in range(3):
+            with self.subTest(i=i):
+                self.assertLess(i, 2)
+"""
+
+CRASH = """
+import os
+import unittest
+
+class Crash(unittest.TestCase):
+    def test_a_passes(self):
+        pass
+
+    def test_b_passes(self):
+        pass
+
+    def test_c_crashes(self):
+        os._exit(3)
+
+    def test_d_never_runs(self):
+        pass
+"""
+
+FIXTURES = """
+import unittest
+
+class BrokenSetUpClass(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        raise RuntimeError("no setup")
+
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+
+class BrokenTearDownClass(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        raise RuntimeError("no teardown")
+
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+"""
+
+BROKEN_MODULE = """
+import unittest
+
+def setUpModule():
+    raise RuntimeError("no module setup")
+
+class Tests(unittest.TestCase):
+    def test_a(self):
+        pass
+
+    def test_b(self):
+        pass
+"""
+
+
+class SplitTestsTests(unittest.TestCase):
+    def test_balances_by_duration(self):
+        timings = {"m.C.a": 4.0, "m.C.b": 3.0, "m.C.c": 2.0, "m.C.d": 2.0, "m.C.e": 1.0}
+        shards = split_tests(list(timings), timings, 2)
+        self.assertEqual([s.tests for s in shards], [["m.C.a", "m.C.d"], ["m.C.b", "m.C.c", "m.C.e"]])
+        self.assertEqual([s.expected_duration for s in shards], [6.0, 6.0])
+
+    def test_estimates_unknown_tests(self):
+        timings = {"m.Slow.a": 10.0, "m.Slow.b": 6.0, "m.Fast.a": 1.0}
+        shards = split_tests(["m.Slow.a", "m.Slow.c", "m.Fast.a", "m.New.a"], timings, 2)
+        # m.Slow.c like its siblings (8s), m.New.a the median known duration (6s)
+        self.assertEqual([s.tests for s in shards], [["m.Slow.a", "m.Fast.a"], ["m.Slow.c", "m.New.a"]])
+        self.assertEqual([s.expected_duration for s in shards], [11.0, 14.0])
+
+    def test_no_more_shards_than_tests(self):
+        self.assertEqual(len(split_tests(["m.C.a", "m.C.b"], {}, 8)), 2)
+
+
+class ShardedRunnerTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="test_testshards_")
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.timings_file = os.path.join(self.directory, "timings.json")
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (PACKAGE_ROOT, env.get("PYTHONPATH")) if p)
+        self.env = env
+
+    def write_module(self, name, source):
+        with open(os.path.join(self.directory, f"{name}.py"), "w") as f:
+            f.write(textwrap.dedent(source))
+
+    def run_shards(self, ids, processes):
+        runner = ShardedRunner(
+            processes,
+            self.timings_file,
+            work_dir=os.path.join(self.directory, "work"),
+            env=self.env,
+        )
+        return runner.run(ids, [self.directory])
+
+    def outcomes(self, report):
+        return {r.id: r.outcome for r in report.records}
+
+    def outcome_record(self, report, test_id):
+        return next(r for r in report.records if r.id == test_id)
+
+    def test_aggregates_the_shards(self):
+        self.write_module("shards_sample", SAMPLE)
+        names = ["success", "failure", "error", "skipped", "expected_failure", "subtests"]
+        ids = [f"shards_sample.Outcomes.test_{n}" for n in names]
+        report = self.run_shards(ids, 3)
+        self.assertEqual(len(report.shards), 3)
+        self.assertEqual(sorted(t for s in report.shards for t in s.tests), sorted(ids))
+        self.assertEqual(
+            self.outcomes(report),
+            dict(zip(ids, ["success", "failure", "error", "skipped", "expectedFailure", "failure"])),
+        )
+        self.assertFalse(report.successful)
+        self.assertIn("RuntimeError: broken", self.outcome_record(report, ids[2]).message)
+        # skipped tests do not count for the timings
+        self.assertEqual(set(load_timings(self.timings_file)), set(ids) - {ids[3]})
+
+        json_path = os.path.join(self.directory, "report.json")
+        write_json_report(json_path, report)
+        with open(json_path) as f:
+            data = json.load(f)
+        self.assertEqual(
+            data["summary"],
+            {"success": 1, "failure": 2, "error": 1, "skipped": 1, "expectedFailure": 1},
+        )
+        self.assertEqual(len(data["tests"]), 6)
+
+        junit_path = os.path.join(self.directory, "report.xml")
+        write_junit_report(junit_path, report)
+        root = ET.parse(junit_path).getroot()
+        self.assertEqual(
+            (root.get("tests"), root.get("failures"), root.get("errors")), ("6", "2", "1")
+        )
+        self.assertEqual(len(root.findall("testsuite")), 3)
+        self.assertEqual(len(root.findall("testsuite/testcase/skipped")), 1)
+
+    def test_keeps_records_of_a_crashed_shard(self):
+        self.write_module("shards_crash", CRASH)
+        ids = [
+            "shards_crash.Crash.test_a_passes",
+            "shards_crash.Crash.test_b_passes",
+            "shards_crash.Crash.test_c_crashes",
+            "shards_crash.Crash.test_d_never_runs",
+        ]
+        report = self.run_shards(ids, 1)
+        self.assertEqual(report.shards[0].exit_code, 3)
+        self.assertEqual(
+            self.outcomes(report), dict(zip(ids, ["success", "success", "error", "error"]))
+        )
+        message = self.outcome_record(report, ids[2]).message
+        self.assertTrue(message.startswith("not run, shard 0 exited with code 3"))
+        # only the tests that finished are timed
+        self.assertEqual(set(load_timings(self.timings_file)), set(ids[:2]))
+
+    def test_records_fixture_errors_for_their_tests(self):
+        self.write_module("shards_fixtures", FIXTURES)
+        self.write_module("shards_module", BROKEN_MODULE)
+        ids = [
+            "shards_fixtures.BrokenSetUpClass.test_a",
+            "shards_fixtures.BrokenSetUpClass.test_b",
+            "shards_fixtures.BrokenTearDownClass.test_a",
+            "shards_fixtures.BrokenTearDownClass.test_b",
+            "shards_module.Tests.test_a",
+            "shards_module.Tests.test_b",
+        ]
+        report = self.run_shards(ids, 1)
+        self.assertEqual(report.shards[0].exit_code, 1)
+        self.assertEqual(
+            self.outcomes(report),
+            dict(zip(ids, ["error", "error", "success", "error", "error", "error"])),
+        )
+        messages = [self.outcome_record(report, t).message for t in ids]
+        self.assertIn("RuntimeError: no setup", messages[0])
+        self.assertIn("RuntimeError: no setup", messages[1])
+        self.assertIn("RuntimeError: no teardown", messages[3])
+        self.assertIn("RuntimeError: no module setup", messages[4])
+        self.assertNotIn("exited with code", "".join(messages))
+
+
+class ReportTests(unittest.TestCase):
+    def test_summary(self):
+        report = Report(
+            records=[
+                TestRecord("m.C.a", "success"),
+                TestRecord("m.C.b", "skipped"),
+                TestRecord("m.C.c", "success"),
+            ]
+        )
+        self.assertEqual(report.summary(), {"success": 2, "skipped": 1})
+        self.assertTrue(report.successful)
+        report.records.append(TestRecord("m.C.d", "unexpectedSuccess"))
+        self.assertFalse(report.successful)
@@ -0,0 +1,160 @@
+import threading
+import unittest
+
+from capito.core.workpool import LocalChannel, WorkPool
+
+
+class CrashingChannel(LocalChannel):
+    """Fake worker process that dies while working on a unit with "crash" in its payload."""
+
+    def send(self, message):
+        if message["type"] == "unit" and message["payload"].get("crash"):
+            self._pending.append(None)
+            return
+        super().send(message)
+
+    def receive(self):
+        return self._pending.popleft() if self._pending else None
+
+
+def double(payload):
+    return {"value": payload["value"] * 2}
+
+
+class WorkPoolTests(unittest.TestCase):
+    def test_runs_all_units(self):
+        pool = WorkPool(lambda i: LocalChannel(double), num_workers=3)
+        for value in range(10):
+            pool.add({"value": value}, weight=2)
+        units = pool.run()
+        self.assertEqual([u.status for u in units], ["done"] * 10)
+        self.assertEqual([u.result["value"] for u in units], [v * 2 for v in range(10)])
+        self.assertEqual(pool.progress.done_weight, 20)
+        self.assertTrue(pool.progress.finished)
+        self.assertEqual(pool.progress.workers, 0)
+
+    def test_retries_failed_units(self):
+        attempts = []
+
+        def flaky(payload):
+            attempts.append(payload["value"])
+            if attempts.count(payload["value"]) < 2:
+                raise RuntimeError("first attempt fails")
+            return {}
+
+        pool = WorkPool(lambda i: LocalChannel(flaky), num_workers=2, max_attempts=3)
+        pool.add({"value": 1})
+        pool.add({"value": 2})
+        units = pool.run()
+        self.assertEqual([u.status for u in units], ["done", "done"])
+        self.assertEqual([u.attempts for u in units], [2, 2])
+        self.assertEqual(pool.progress.retries, 2)
+        self.assertIn("RuntimeError: first attempt fails", units[0].errors)
+
+    def test_gives_up_after_max_attempts(self):
+        def broken(payload):
+            raise ValueError("broken")
+
+        pool = WorkPool(lambda i: LocalChannel(broken), num_workers=2, max_attempts=2)
+        finished = []
+        pool.finish_callbacks.append(finished.append)
+        unit = pool.add({})
+        pool.run()
+        self.assertEqual(unit.status, "failed")
+        self.assertEqual(unit.attempts, 2)
+        self.assertEqual(pool.failed_units(), [unit])
+        self.assertEqual(len(finished), 1)
+
+    def test_restarts_crashed_workers(self):
+        opened = []
+
+        def factory(index):
+            opened.append(index)
+            return CrashingChannel(double)
+
+        pool = WorkPool(factory, num_workers=1, max_attempts=2, max_restarts=3)
+        crash = pool.add({"value": 1, "crash": True})
+        fine = pool.add({"value": 2})
+        pool.run()
+        self.assertEqual(crash.status, "failed")
+        self.assertEqual(crash.errors, ["worker died", "worker died"])
+        self.assertEqual(fine.status, "done")
+        # the first worker, one restart per crash
+        self.assertEqual(len(opened), 3)
+
+    def test_fails_queued_units_when_no_worker_is_left(self):
+        pool = WorkPool(lambda i: CrashingChannel(double), num_workers=1, max_attempts=5, max_restarts=1)
+        crash = pool.add({"value": 1, "crash": True})
+        fine = pool.add({"value": 2})
+        pool.run()
+        self.assertEqual(fine.status, "done")
+        self.assertEqual(crash.status, "failed")
+        self.assertEqual(crash.errors, ["worker died", "worker died", "no worker left"])
+        self.assertTrue(pool.progress.finished)
+
+    def test_resize(self):
+        release = threading.Event()
+        started = threading.Semaphore(0)
+
+        def blocking(payload):
+            started.release()
+            release.wait(5)
+            return {}
+
+        pool = WorkPool(lambda i: LocalChannel(blocking), num_workers=1)
+        for value in range(6):
+            pool.add({"value": value})
+        pool.start()
+        self.assertTrue(started.acquire(timeout=5))
+        pool.resize(3)
+        for _ in range(2):
+            self.assertTrue(started.acquire(timeout=5))
+        self.assertEqual(pool.progress.workers, 3)
+        self.assertEqual(pool.progress.running, 3)
+        pool.resize(1)
+        release.set()
+        self.assertTrue(pool.wait(5))
+        self.assertEqual([u.status for u in pool.units], ["done"] * 6)
+        self.assertEqual(len({u.worker for u in pool.units[3:]}), 1)
+        self.assertEqual(pool.progress.workers, 0)
+
+    def test_cancel(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(payload):
+            started.set()
+            release.wait(5)
+            return {}
+
+        pool = WorkPool(lambda i: LocalChannel(blocking), num_workers=1)
+        for value in range(4):
+            pool.add({"value": value})
+        notified = []
+        lock_free = []
+
+        def try_lock():
+            if pool._condition.acquire(blocking=False):
+                pool._condition.release()
+                lock_free.append(True)
+            else:
+                lock_free.append(False)
+
+        def unit_callback(unit):
+            notified.append(unit.status)
+            # the pool lock must not be held while callbacks run (checked from another
+            # thread, the lock is reentrant)
+            thread = threading.Thread(target=try_lock)
+            thread.start()
+            thread.join()
+
+        pool.unit_callbacks.append(unit_callback)
+        pool.start()
+        self.assertTrue(started.wait(5))
+        pool.cancel()
+        release.set()
+        self.assertTrue(pool.wait(5))
+        self.assertEqual([u.status for u in pool.units], ["done", "failed", "failed", "failed"])
+        self.assertEqual(pool.units[1].errors, ["cancelled"])
+        self.assertEqual(sorted(notified), ["done", "failed", "failed", "failed"])
+        self.assertTrue(all(lock_free))